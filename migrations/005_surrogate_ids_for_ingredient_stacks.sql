@@ -0,0 +1,17 @@
+-- Migration: 005_surrogate_ids_for_ingredient_stacks.sql
+-- Purpose: Address ingredient stacks by an integer surrogate key instead of
+--          (ingredient_name, inventory_user_uid, added_at). food_items already has `id`.
+-- Date: 2026-10-18
+
+-- The legacy triple stays unique (and keeps backing the FK to ingredients)
+CREATE UNIQUE INDEX uq_ingredient_stack_added_at
+    ON ingredient_stacks (ingredient_name, inventory_user_uid, added_at);
+
+-- Replace the wide composite primary key with an auto-increment id
+ALTER TABLE ingredient_stacks
+    DROP PRIMARY KEY,
+    ADD COLUMN id INT NOT NULL AUTO_INCREMENT PRIMARY KEY FIRST;
+
+-- Legacy food routes still look items up by (user, name, added_at)
+CREATE INDEX idx_food_items_user_name_added
+    ON food_items (inventory_user_uid, name, added_at);
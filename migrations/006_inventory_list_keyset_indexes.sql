@@ -0,0 +1,20 @@
+-- Migration: 006_inventory_list_keyset_indexes.sql
+-- Purpose: Back the keyset-paginated and filtered /ingredients/list and /foods/list queries
+--          with user-prefixed indexes that match their ORDER BY clauses.
+-- Date: 2026-10-18
+
+-- Ingredients ordered by name within a user (the PK is (name, inventory_user_uid))
+CREATE INDEX idx_ingredients_user_storage_name
+    ON ingredients (inventory_user_uid, storage_type, name);
+CREATE INDEX idx_ingredients_user_name
+    ON ingredients (inventory_user_uid, name);
+
+-- Stack expiration filters (expired / expiring_within) and nearest-expiration ordering
+CREATE INDEX idx_ingredient_stacks_user_expiration
+    ON ingredient_stacks (inventory_user_uid, expiration_date);
+
+-- Food items ordered by (expiration_date, id); name ordering reuses idx_food_items_user_name_added
+CREATE INDEX idx_food_items_user_expiration
+    ON food_items (inventory_user_uid, expiration_date, id);
+CREATE INDEX idx_food_items_user_category_expiration
+    ON food_items (inventory_user_uid, category, expiration_date);
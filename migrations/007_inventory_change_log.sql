@@ -0,0 +1,20 @@
+-- Migration: 007_inventory_change_log.sql
+-- Purpose: Change log for GET /api/inventory/changes (delta sync for mobile clients).
+--          Every inventory mutation appends rows with a dense per-user sequence in the
+--          same transaction as the mutation.
+-- Date: 2026-10-18
+
+ALTER TABLE inventories
+    ADD COLUMN change_seq BIGINT NOT NULL DEFAULT 0;
+
+CREATE TABLE IF NOT EXISTS inventory_changes (
+    user_uid VARCHAR(36) NOT NULL,
+    seq BIGINT NOT NULL,
+    entity_type VARCHAR(20) NOT NULL,   -- ingredient | ingredient_stack | food_item
+    entity_key VARCHAR(100) NOT NULL,   -- ingredient name or stack / food item id
+    op VARCHAR(10) NOT NULL,            -- upsert | delete
+    changed_at DATETIME NOT NULL,
+
+    PRIMARY KEY (user_uid, seq),
+    INDEX idx_inventory_changes_changed_at (changed_at)
+);
@@ -0,0 +1,12 @@
+-- Migration: 008_recipe_list_keyset_indexes.sql
+-- Purpose: Back the keyset-paginated /recipes/saved and /recipes/all listings
+--          (ORDER BY saved_at DESC, uid DESC) with indexes that match their sort.
+-- Date: 2026-10-18
+
+-- Saved recipes of one user, newest first
+CREATE INDEX idx_recipes_user_saved_at
+    ON recipes (user_uid, saved_at, uid);
+
+-- Global catalog, newest first
+CREATE INDEX idx_recipes_saved_at
+    ON recipes (saved_at, uid);
@@ -0,0 +1,9 @@
+-- Migration: 009_image_references_created_at.sql
+-- Purpose: Give image_references a creation timestamp so the in-process fuzzy
+--          name index can load only the rows added since its last sync.
+-- Date: 2026-10-18
+
+ALTER TABLE image_references
+ADD COLUMN created_at DATETIME NULL DEFAULT CURRENT_TIMESTAMP;
+
+CREATE INDEX idx_image_references_created_at ON image_references(created_at);
@@ -0,0 +1,13 @@
+-- Migration: 010_recipe_fulltext_indexes.sql
+-- Purpose: FULLTEXT indexes for GET /api/recipes/search. The endpoint matches the
+--          query against recipes(title, description) and recipe_ingredients(name);
+--          MATCH ... AGAINST needs an index with exactly those column lists.
+-- Note: the columns must keep an accent-insensitive collation (utf8mb4_0900_ai_ci or
+--       utf8mb4_unicode_ci) so that "limon" matches "Limón".
+-- Date: 2026-10-18
+
+ALTER TABLE recipes
+ADD FULLTEXT INDEX ft_recipes_title_description (title, description);
+
+ALTER TABLE recipe_ingredients
+ADD FULLTEXT INDEX ft_recipe_ingredients_name (name);
@@ -0,0 +1,7 @@
+-- Migration: 011_environmental_savings_summary_index.sql
+-- Purpose: Back the environmental savings summaries (SUM/COUNT per user grouped by
+--          is_cooked and recipe_source_type) and the is_cooked listing ordered by saved_at.
+-- Date: 2026-10-18
+
+CREATE INDEX idx_environmental_savings_user_cooked_saved_at
+    ON environmental_savings (user_uid, is_cooked, saved_at);
@@ -0,0 +1,27 @@
+-- Migration: 012_environmental_savings_rollups.sql
+-- Purpose: Per-user daily and monthly buckets for GET /api/environmental_savings/summary.
+--          Rows are kept up to date by EnvironmentalSavingsRepositoryImpl in the same
+--          transaction as each savings change. Fill them for existing history with:
+--              flask --app src.main backfill-savings-rollups
+-- Date: 2026-10-18
+
+CREATE TABLE IF NOT EXISTS environmental_savings_rollups (
+    user_uid VARCHAR(128) NOT NULL,
+    period VARCHAR(5) NOT NULL,              -- day | month
+    bucket_start DATE NOT NULL,              -- day, or first day of the month
+    is_cooked BOOLEAN NOT NULL,
+    recipe_source_type VARCHAR(20) NOT NULL,
+
+    calculations_count INT NOT NULL DEFAULT 0,
+    carbon_footprint DOUBLE NOT NULL DEFAULT 0,
+    water_footprint DOUBLE NOT NULL DEFAULT 0,
+    energy_footprint DOUBLE NOT NULL DEFAULT 0,
+    economic_cost DOUBLE NOT NULL DEFAULT 0,
+
+    unit_carbon VARCHAR(20),
+    unit_water VARCHAR(20),
+    unit_energy VARCHAR(20),
+    unit_cost VARCHAR(20),
+
+    PRIMARY KEY (user_uid, period, bucket_start, is_cooked, recipe_source_type)
+);
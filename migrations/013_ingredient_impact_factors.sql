@@ -0,0 +1,19 @@
+-- Migration: 013_ingredient_impact_factors.sql
+-- Purpose: Per-kg environmental impact factors for ingredients without a built-in
+--          factor. Filled by the AI fallback of the local savings calculator so each
+--          unknown ingredient is estimated once.
+-- Date: 2026-10-18
+
+CREATE TABLE IF NOT EXISTS ingredient_impact_factors (
+    ingredient_key VARCHAR(100) NOT NULL PRIMARY KEY,  -- normalized, singular ingredient name
+
+    carbon_footprint FLOAT NOT NULL,   -- kg CO2e per kg
+    water_footprint FLOAT NOT NULL,    -- litres per kg
+    energy_footprint FLOAT NOT NULL,   -- MJ per kg
+    economic_cost FLOAT NOT NULL,      -- USD per kg
+    kg_per_unit FLOAT NOT NULL DEFAULT 0.1,
+    kg_per_litre FLOAT NOT NULL DEFAULT 1.0,
+
+    source VARCHAR(20) NOT NULL DEFAULT 'ai',  -- ai | manual
+    created_at DATETIME NOT NULL
+);
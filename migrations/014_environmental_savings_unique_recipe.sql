@@ -0,0 +1,16 @@
+-- Migration: 014_environmental_savings_unique_recipe.sql
+-- Purpose: One savings row per (user_uid, recipe_uid), so saves can use a single
+--          INSERT ... ON DUPLICATE KEY UPDATE and concurrent requests cannot create duplicates.
+--          Existing duplicates are collapsed to their newest row (highest id) first.
+--          Rebuild the summary buckets afterwards: flask --app src.main backfill-savings-rollups
+-- Date: 2026-10-18
+
+DELETE older
+    FROM environmental_savings AS older
+    JOIN environmental_savings AS newer
+      ON newer.user_uid = older.user_uid
+     AND newer.recipe_uid = older.recipe_uid
+     AND newer.id > older.id;
+
+ALTER TABLE environmental_savings
+    ADD CONSTRAINT uq_environmental_savings_user_recipe UNIQUE (user_uid, recipe_uid);
@@ -0,0 +1,13 @@
+-- Migration: 015_sustainability_ranking_sketches.sql
+-- Purpose: Anonymized percentile sketches of per-user CO2 and water totals for the
+--          "ranking vs. other users" part of GET /api/environmental_savings/summary.
+--          Rebuilt periodically (e.g. hourly cron) with:
+--              flask --app src.main build-sustainability-ranking
+-- Date: 2026-10-18
+
+CREATE TABLE IF NOT EXISTS sustainability_ranking_sketches (
+    metric VARCHAR(30) NOT NULL PRIMARY KEY,  -- carbon_footprint | water_footprint
+    cutpoints JSON NOT NULL,                  -- k + 1 values at quantiles 0, 1/k, ..., 1
+    population INT NOT NULL,                  -- users summarized
+    built_at DATETIME NOT NULL
+);
@@ -0,0 +1,11 @@
+-- Migration: 016_token_expires_at_indexes.sql
+-- Purpose: Let the expired-token cleanup (POST /api/admin/cleanup-tokens) find expired
+--          rows by index and delete them in small chunks instead of scanning and locking
+--          the whole table.
+-- Date: 2026-10-18
+
+CREATE INDEX ix_token_blacklist_expires_at
+    ON token_blacklist (expires_at);
+
+CREATE INDEX ix_refresh_token_tracking_expires_at
+    ON refresh_token_tracking (expires_at);
@@ -21,7 +21,7 @@ def make_profile_repository():
     return ProfileRepository()
 
 def make_firestore_profile_service():
-    return FirestoreProfileService()
+    return FirestoreProfileService(mysql_profile_repo=make_profile_repository())
 
 def make_jwt_service():
     return JWTService()
@@ -1,14 +1,21 @@
 from src.infrastructure.db.base import db
+from src.infrastructure.db.default_recipes_cache import SYSTEM_USER_UID
 from src.infrastructure.db.environmental_savings_repository_impl import EnvironmentalSavingsRepositoryImpl
 from src.infrastructure.db.recipe_repository_impl import RecipeRepositoryImpl
 from src.infrastructure.db.recipe_generated_repository_impl import RecipeGeneratedRepositoryImpl
+from src.infrastructure.db.ingredient_impact_factor_repository_impl import IngredientImpactFactorRepositoryImpl
+from src.infrastructure.db.sustainability_ranking_repository_impl import SustainabilityRankingRepositoryImpl
 from src.infrastructure.ai.gemini_adapter_service import GeminiAdapterService
 
+from src.application.services.environmental_impact_calculator import EnvironmentalImpactCalculator
 from src.application.use_cases.recipes.calculate_enviromental_savings_from_recipe_uid import EstimateEnvironmentalSavingsFromRecipeUID
 from src.application.use_cases.recipes.calculate_enviromental_savings_from_recipe_name import EstimateEnvironmentalSavingsFromRecipeName
+from src.application.use_cases.recipes.calculate_environmental_savings_batch import EstimateEnvironmentalSavingsBatch
 from src.application.use_cases.recipes.get_all_environmental_calculations_by_user import GetAllEnvironmentalCalculationsByUser
 from src.application.use_cases.recipes.get_environmental_calculations_by_user_and_status import GetEnvironmentalCalculationsByUserAndStatus
 from src.application.use_cases.recipes.sum_environmental_calculations_by_user import SumEnvironmentalCalculationsByUser
+from src.application.use_cases.recipes.summarize_environmental_savings_by_period import SummarizeEnvironmentalSavingsByPeriod
+from src.application.use_cases.recipes.build_sustainability_ranking import BuildSustainabilityRanking
 
 
 def make_environmental_savings_repository():
@@ -17,11 +24,17 @@ def make_environmental_savings_repository():
 def make_recipe_generated_repository():
     return RecipeGeneratedRepositoryImpl()
 
+def make_environmental_impact_calculator():
+    return EnvironmentalImpactCalculator(
+        factor_repository=IngredientImpactFactorRepositoryImpl(db),
+        ai_adapter=GeminiAdapterService()
+    )
+
 
 def make_estimate_savings_by_uid_use_case():
     return EstimateEnvironmentalSavingsFromRecipeUID(
         recipe_repository=RecipeRepositoryImpl(db),
-        ai_adapter=GeminiAdapterService(),
+        impact_calculator=make_environmental_impact_calculator(),
         savings_repository=make_environmental_savings_repository()
     )
 
@@ -29,12 +42,21 @@ def make_estimate_savings_by_uid_use_case():
 def make_estimate_savings_by_title_use_case():
     return EstimateEnvironmentalSavingsFromRecipeName(
         recipe_repository=RecipeRepositoryImpl(db),
-        ai_adapter=GeminiAdapterService(),
+        impact_calculator=make_environmental_impact_calculator(),
         savings_repository=make_environmental_savings_repository(),
         recipe_generated_repository=make_recipe_generated_repository()
     )
 
 
+def make_estimate_savings_batch_use_case():
+    return EstimateEnvironmentalSavingsBatch(
+        recipe_repository=RecipeRepositoryImpl(db),
+        impact_calculator=make_environmental_impact_calculator(),
+        savings_repository=make_environmental_savings_repository(),
+        system_user_uid=SYSTEM_USER_UID
+    )
+
+
 def make_get_all_environmental_calculations_use_case():
     return GetAllEnvironmentalCalculationsByUser(
         savings_repository=make_environmental_savings_repository()
@@ -48,3 +70,14 @@ def make_get_environmental_calculations_by_status_use_case():
 
 def make_sum_environmental_calculations_by_user():
     return SumEnvironmentalCalculationsByUser(EnvironmentalSavingsRepositoryImpl(db))
+
+
+def make_summarize_environmental_savings_by_period():
+    return SummarizeEnvironmentalSavingsByPeriod(
+        make_environmental_savings_repository(),
+        ranking_repository=SustainabilityRankingRepositoryImpl(db)
+    )
+
+
+def make_build_sustainability_ranking():
+    return BuildSustainabilityRanking(SustainabilityRankingRepositoryImpl(db))
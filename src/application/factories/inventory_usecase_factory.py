@@ -17,7 +17,11 @@ from src.application.use_cases.inventory.update_ingredient_stack_use_case import
 from src.application.use_cases.inventory.update_ingredient_quantity_use_case import UpdateIngredientQuantityUseCase
 from src.application.use_cases.inventory.update_food_quantity_use_case import UpdateFoodQuantityUseCase
 
+from src.application.use_cases.inventory.consume_ingredients_fifo_use_case import ConsumeIngredientsFifoUseCase
+from src.application.use_cases.inventory.get_inventory_changes_use_case import GetInventoryChangesUseCase
 from src.infrastructure.db.inventory_repository_impl import InventoryRepositoryImpl
+from src.infrastructure.db.recipe_repository_impl import RecipeRepositoryImpl
+from src.infrastructure.db.default_recipes_cache import SYSTEM_USER_UID
 from src.infrastructure.inventory.inventory_calcularor_impl import InventoryCalculatorImpl
 from src.infrastructure.ai.gemini_adapter_service import GeminiAdapterService
 from src.application.factories.ingredient_image_generator_factory import make_ingredient_image_generator_service
@@ -78,4 +82,9 @@ def make_mark_ingredient_stack_consumed_use_case(db):
     return MarkIngredientStackConsumedUseCase(InventoryRepositoryImpl(db))
 
 def make_mark_food_item_consumed_use_case(db):
-    return MarkFoodItemConsumedUseCase(InventoryRepositoryImpl(db))
\ No newline at end of file
+    return MarkFoodItemConsumedUseCase(InventoryRepositoryImpl(db))
+def make_consume_ingredients_fifo_use_case(db):
+    return ConsumeIngredientsFifoUseCase(InventoryRepositoryImpl(db), RecipeRepositoryImpl(db), SYSTEM_USER_UID)
+
+def make_get_inventory_changes_use_case(db):
+    return GetInventoryChangesUseCase(InventoryRepositoryImpl(db))
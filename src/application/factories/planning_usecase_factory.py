@@ -4,9 +4,14 @@ from src.application.use_cases.planning.delete_meal_plan_use_case import DeleteM
 from src.application.use_cases.planning.get_meal_plan_by_user_and_date_use_case import GetMealPlanByUserAndDateUseCase
 from src.application.use_cases.planning.get_all_meal_plans_by_user_use_case import GetAllMealPlansByUserUseCase
 from src.application.use_cases.planning.get_meal_plan_dates_usecase import GetMealPlanDatesUseCase
+from src.application.use_cases.planning.get_meal_plans_in_range_use_case import GetMealPlansInRangeUseCase
+from src.application.use_cases.planning.bulk_upsert_meal_plans_use_case import BulkUpsertMealPlansUseCase
+from src.application.use_cases.planning.get_shopping_list_use_case import GetShoppingListUseCase
 
 from src.infrastructure.db.meal_plan_repository_impl import MealPlanRepositoryImpl
 from src.infrastructure.db.recipe_repository_impl import RecipeRepositoryImpl
+from src.infrastructure.db.inventory_repository_impl import InventoryRepositoryImpl
+from src.infrastructure.db.default_recipes_cache import SYSTEM_USER_UID
 from src.infrastructure.db.base import db
 
 # Repositorios compartidos
@@ -31,3 +36,12 @@ def make_get_all_meal_plans_use_case():
 
 def make_get_meal_plan_dates_use_case():
     return GetMealPlanDatesUseCase(meal_plan_repository)
+
+def make_get_meal_plans_in_range_use_case():
+    return GetMealPlansInRangeUseCase(meal_plan_repository)
+
+def make_bulk_upsert_meal_plans_use_case():
+    return BulkUpsertMealPlansUseCase(meal_plan_repository, recipe_repository, SYSTEM_USER_UID)
+
+def make_get_shopping_list_use_case():
+    return GetShoppingListUseCase(meal_plan_repository, InventoryRepositoryImpl(db))
@@ -2,11 +2,19 @@ from src.application.use_cases.recipes.generate_recipes_use_case import Generate
 from src.application.use_cases.recipes.prepare_recipe_generation_data_use_case import PrepareRecipeGenerationDataUseCase
 from src.application.use_cases.recipes.generate_custom_recipe_use_case import GenerateCustomRecipeUseCase
 from src.application.use_cases.recipes.save_recipe_use_case import SaveRecipeUseCase
+from src.application.use_cases.recipes.save_generated_recipes_use_case import SaveGeneratedRecipesUseCase
 from src.application.use_cases.recipes.get_saved_recipes_use_case import GetSavedRecipesUseCase
 from src.application.use_cases.recipes.get_all_recipes_use_case import GetAllRecipesUseCase
+from src.application.use_cases.recipes.get_default_recipes_use_case import GetDefaultRecipesUseCase
+from src.application.use_cases.recipes.search_recipes_use_case import SearchRecipesUseCase
+from src.application.use_cases.recipes.get_recipe_recommendations_use_case import GetRecipeRecommendationsUseCase
+from src.application.services.recipe_recommendation_engine import recipe_matrix_cache
+from src.application.factories.auth_usecase_factory import make_firestore_profile_service
 from src.application.use_cases.recipes.delete_user_recipe_use_case import DeleteUserRecipeUseCase
 from src.infrastructure.db.inventory_repository_impl import InventoryRepositoryImpl
 from src.infrastructure.db.recipe_repository_impl import RecipeRepositoryImpl
+from src.infrastructure.db.recipe_generated_repository_impl import RecipeGeneratedRepositoryImpl
+from src.infrastructure.db.default_recipes_cache import default_recipes_cache, SYSTEM_USER_UID
 from src.application.services.recipe_image_generator_service import RecipeImageGeneratorService
 from src.infrastructure.firebase.firebase_storage_adapter import FirebaseStorageAdapter
 from src.infrastructure.ai.gemini_recipe_generator_service import GeminiRecipeGeneratorService
@@ -25,12 +33,30 @@ def make_generate_custom_recipe_use_case():
 def make_save_recipe_use_case():
     return SaveRecipeUseCase(RecipeRepositoryImpl(db))
 
+def make_save_generated_recipes_use_case():
+    return SaveGeneratedRecipesUseCase(RecipeRepositoryImpl(db), RecipeGeneratedRepositoryImpl())
+
 def make_get_saved_recipes_use_case():
     return GetSavedRecipesUseCase(RecipeRepositoryImpl(db))
 
 def make_get_all_recipes_use_case():
     return GetAllRecipesUseCase(RecipeRepositoryImpl(db))
 
+def make_get_default_recipes_use_case():
+    return GetDefaultRecipesUseCase(RecipeRepositoryImpl(db), default_recipes_cache, SYSTEM_USER_UID)
+
+def make_search_recipes_use_case():
+    return SearchRecipesUseCase(RecipeRepositoryImpl(db))
+
+def make_get_recipe_recommendations_use_case():
+    return GetRecipeRecommendationsUseCase(
+        InventoryRepositoryImpl(db),
+        RecipeRepositoryImpl(db),
+        make_firestore_profile_service(),
+        recipe_matrix_cache,
+        SYSTEM_USER_UID
+    )
+
 def make_delete_user_recipe_use_case():
     return DeleteUserRecipeUseCase(RecipeRepositoryImpl(db))
 
@@ -0,0 +1,71 @@
+from typing import Any, Dict, List
+
+from src.application.services.impact_factors import (
+    IMPACT_METRICS, IMPACT_UNITS, CachedImpactFactorTable, impact_factor_cache
+)
+from src.application.services.recipe_recommendation_engine import ingredient_key
+
+# Valores por defecto si la IA no informa peso por unidad o densidad
+DEFAULT_KG_PER_UNIT = 0.1
+DEFAULT_KG_PER_LITRE = 1.0
+
+
+class EnvironmentalImpactCalculator:
+    """
+    Calcula el impacto ambiental de una receta con la tabla local de factores por ingrediente.
+
+    La IA solo se consulta para los ingredientes sin factor; lo que devuelve se guarda
+    y el mismo ingrediente ya no vuelve a consultarse.
+    """
+
+    def __init__(self, factor_repository, ai_adapter, factor_cache: CachedImpactFactorTable = impact_factor_cache):
+        self._factor_repo = factor_repository
+        self._adapter = ai_adapter
+        self._cache = factor_cache
+
+    def estimate(self, ingredients: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Args:
+            ingredients: Lista de ingredientes, cada uno con 'name', 'quantity' y 'type_unit'
+
+        Returns:
+            dict: Totales de carbono, agua, energía y costo con sus unidades (mismo formato que la estimación con IA)
+        """
+        table = self._cache.get(self._factor_repo.find_all)
+        result = table.compute(ingredients)
+
+        if result["unresolved"]:
+            print(f"🌍 [IMPACT] {len(result['unresolved'])} ingredients without factor, asking AI: {result['unresolved']}")
+            learned = self.parse_factors(
+                self._adapter.estimate_ingredient_impact_factors(result["unresolved"]),
+                result["unresolved"]
+            )
+            if learned:
+                self._factor_repo.save_many(learned)
+                table = self._cache.add(learned)
+                result = table.compute(ingredients)
+
+        return {**result["totals"], **IMPACT_UNITS}
+
+    @staticmethod
+    def parse_factors(raw: Dict[str, Any], requested: List[str]) -> Dict[str, Dict[str, float]]:
+        """
+        Valida los factores devueltos por la IA y los indexa por ingredient_key.
+        Se descarta todo ingrediente no pedido o con algún valor faltante, no numérico o negativo.
+        """
+        wanted = {ingredient_key(name) for name in requested}
+        factors = {}
+        for name, values in (raw or {}).items():
+            key = ingredient_key(str(name))
+            if key not in wanted or not isinstance(values, dict):
+                continue
+            try:
+                factor = {metric: float(values[metric]) for metric in IMPACT_METRICS}
+                factor["kg_per_unit"] = float(values.get("kg_per_unit") or DEFAULT_KG_PER_UNIT)
+                factor["kg_per_litre"] = float(values.get("kg_per_litre") or DEFAULT_KG_PER_LITRE)
+            except (KeyError, TypeError, ValueError):
+                continue
+            if min(factor.values()) < 0:
+                continue
+            factors[key] = factor
+        return factors
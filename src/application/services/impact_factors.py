@@ -0,0 +1,224 @@
+import operator
+import threading
+import time
+from typing import Callable, Optional
+
+from src.application.services.recipe_recommendation_engine import STOPWORDS, ingredient_key
+from src.application.services.unit_conversion import to_base_units
+
+IMPACT_METRICS = ("carbon_footprint", "water_footprint", "energy_footprint", "economic_cost")
+IMPACT_UNITS = {"unit_carbon": "kg CO2e", "unit_water": "litros", "unit_energy": "MJ", "unit_cost": "USD"}
+
+# Decimales de cada total (los mismos que muestra el resumen)
+METRIC_DECIMALS = {"carbon_footprint": 3, "water_footprint": 1, "energy_footprint": 2, "economic_cost": 2}
+
+# Factores por kg de ingrediente: (kg CO2e, litros de agua, MJ, USD, kg por unidad, kg por litro).
+# Promedios globales aproximados (ciclo de vida de la granja a la tienda); sirven para comparar recetas, no para auditar.
+DEFAULT_IMPACT_FACTORS = {
+    "carne de res": (60.0, 15400.0, 80.0, 10.0, 0.25, 1.0),
+    "carne molida": (60.0, 15400.0, 80.0, 9.0, 0.25, 1.0),
+    "cordero": (24.0, 10400.0, 60.0, 12.0, 0.25, 1.0),
+    "cerdo": (7.2, 6000.0, 30.0, 6.0, 0.25, 1.0),
+    "tocino": (7.2, 6000.0, 35.0, 9.0, 0.02, 1.0),
+    "jamon": (7.2, 6000.0, 35.0, 10.0, 0.02, 1.0),
+    "pollo": (6.9, 4300.0, 25.0, 5.0, 1.5, 1.0),
+    "pechuga de pollo": (6.9, 4300.0, 25.0, 7.0, 0.25, 1.0),
+    "pavo": (6.9, 4300.0, 25.0, 7.0, 0.25, 1.0),
+    "pescado": (5.4, 3000.0, 30.0, 8.0, 0.3, 1.0),
+    "atun": (6.1, 3000.0, 35.0, 10.0, 0.16, 1.0),
+    "salmon": (6.0, 3000.0, 35.0, 18.0, 0.2, 1.0),
+    "camaron": (26.9, 3500.0, 40.0, 15.0, 0.015, 1.0),
+    "huevo": (4.7, 3300.0, 15.0, 3.0, 0.06, 1.0),
+    "leche": (3.2, 1000.0, 5.0, 1.2, 1.03, 1.03),
+    "queso": (21.2, 5000.0, 50.0, 10.0, 0.03, 1.0),
+    "mantequilla": (12.0, 5550.0, 40.0, 9.0, 0.01, 0.91),
+    "yogur": (2.5, 1000.0, 6.0, 3.0, 0.125, 1.03),
+    "crema de leche": (7.6, 2000.0, 15.0, 6.0, 0.2, 1.0),
+    "arroz": (4.5, 2500.0, 10.0, 1.5, 0.18, 0.85),
+    "papa": (0.46, 290.0, 2.0, 1.0, 0.2, 1.0),
+    "camote": (0.5, 380.0, 2.0, 1.2, 0.3, 1.0),
+    "yuca": (1.3, 560.0, 2.0, 1.0, 0.5, 1.0),
+    "tomate": (2.1, 214.0, 5.0, 2.0, 0.12, 1.0),
+    "cebolla": (0.5, 272.0, 2.0, 1.2, 0.15, 1.0),
+    "ajo": (0.6, 589.0, 3.0, 5.0, 0.05, 1.0),
+    "zanahoria": (0.4, 195.0, 2.0, 1.2, 0.08, 1.0),
+    "lechuga": (0.7, 237.0, 2.0, 2.0, 0.4, 1.0),
+    "espinaca": (0.5, 292.0, 2.0, 3.0, 0.3, 1.0),
+    "brocoli": (0.9, 285.0, 3.0, 3.0, 0.3, 1.0),
+    "pimiento": (1.0, 379.0, 4.0, 3.0, 0.15, 1.0),
+    "aji": (1.0, 379.0, 4.0, 4.0, 0.02, 1.0),
+    "pepino": (0.6, 353.0, 2.0, 1.5, 0.3, 1.0),
+    "zapallo": (0.6, 336.0, 2.0, 1.2, 1.5, 1.0),
+    "choclo": (1.7, 1222.0, 3.0, 1.0, 0.25, 1.0),
+    "maiz": (1.7, 1222.0, 3.0, 1.0, 0.25, 0.75),
+    "palta": (2.5, 1981.0, 3.0, 4.0, 0.2, 1.0),
+    "limon": (0.5, 642.0, 2.0, 2.0, 0.1, 1.0),
+    "naranja": (0.4, 560.0, 2.0, 1.5, 0.2, 1.0),
+    "manzana": (0.4, 822.0, 2.0, 2.5, 0.18, 1.0),
+    "platano": (0.9, 790.0, 2.0, 1.3, 0.12, 1.0),
+    "fresa": (1.0, 347.0, 3.0, 4.0, 0.015, 1.0),
+    "pan": (1.6, 1608.0, 8.0, 3.0, 0.05, 1.0),
+    "harina": (1.4, 1849.0, 6.0, 1.0, 0.5, 0.55),
+    "fideo": (1.8, 1849.0, 8.0, 2.0, 0.5, 1.0),
+    "pasta": (1.8, 1849.0, 8.0, 2.0, 0.5, 1.0),
+    "avena": (2.5, 1788.0, 5.0, 2.5, 0.5, 0.4),
+    "quinua": (1.5, 2000.0, 5.0, 5.0, 0.5, 0.75),
+    "azucar": (3.2, 1780.0, 5.0, 1.0, 0.004, 0.85),
+    "sal": (0.1, 10.0, 1.0, 0.5, 0.006, 1.2),
+    "pimienta": (1.5, 7600.0, 5.0, 20.0, 0.002, 0.5),
+    "aceite": (3.8, 4000.0, 15.0, 3.0, 0.014, 0.92),
+    "aceite de oliva": (5.4, 14500.0, 20.0, 8.0, 0.014, 0.92),
+    "frejol": (1.8, 5000.0, 5.0, 2.0, 0.5, 0.8),
+    "frijol": (1.8, 5000.0, 5.0, 2.0, 0.5, 0.8),
+    "lenteja": (0.9, 5874.0, 4.0, 2.5, 0.5, 0.8),
+    "garbanzo": (0.8, 4177.0, 4.0, 2.5, 0.5, 0.8),
+    "mani": (3.2, 2782.0, 8.0, 4.0, 0.5, 0.6),
+    "tofu": (3.2, 2145.0, 8.0, 4.0, 0.4, 1.0),
+    "cafe": (28.5, 18900.0, 20.0, 15.0, 0.01, 0.4),
+    "chocolate": (18.7, 17000.0, 30.0, 10.0, 0.1, 1.0),
+    "agua": (0.0003, 1.0, 0.01, 0.0, 1.0, 1.0),
+}
+
+# Unidades de cocina sin equivalencia exacta: kg aproximados por unidad
+INFORMAL_UNITS_KG = {
+    "pizca": 0.0005, "diente": 0.005, "hoja": 0.001, "rama": 0.005, "ramita": 0.003,
+    "punado": 0.03, "chorrito": 0.01, "lata": 0.4, "paquete": 0.5, "al gusto": 0.0,
+}
+
+
+def factor_from_row(values) -> dict:
+    """Dict de un factor a partir de (carbono, agua, energía, costo, kg por unidad, kg por litro)"""
+    return dict(zip(IMPACT_METRICS + ("kg_per_unit", "kg_per_litre"), (float(value) for value in values)))
+
+
+def _quantity(value) -> float:
+    # Las recetas generadas pueden traer cantidades como texto ("2", "1/2")
+    try:
+        return float(value or 0)
+    except (TypeError, ValueError):
+        numerator, _, denominator = str(value).partition("/")
+        try:
+            return float(numerator) / float(denominator)
+        except (TypeError, ValueError, ZeroDivisionError):
+            return 0.0
+
+
+def _tokens(key: str) -> frozenset:
+    return frozenset(word for word in key.split() if word not in STOPWORDS)
+
+
+class ImpactFactorTable:
+    """
+    Tabla de factores de impacto por ingrediente normalizado (misma clave que las recomendaciones).
+
+    Un ingrediente sin clave exacta usa el factor más específico cuyas palabras contiene
+    ("pechuga de pollo deshuesada" -> "pechuga de pollo", "tomates cherry" -> "tomate").
+    """
+
+    MAX_RESOLVED = 10000
+
+    def __init__(self, factors: dict):
+        self.factors = {ingredient_key(name): factor for name, factor in factors.items()}
+        self._by_token: dict = {}
+        self._resolved: dict = {}
+        for key in self.factors:
+            for token in _tokens(key):
+                self._by_token.setdefault(token, []).append(key)
+
+    def __len__(self) -> int:
+        return len(self.factors)
+
+    def resolve(self, name: str) -> Optional[str]:
+        """Clave del factor que corresponde a un ingrediente, o None si no hay ninguno (memorizado por nombre)"""
+        if name not in self._resolved:
+            if len(self._resolved) >= self.MAX_RESOLVED:
+                self._resolved.clear()
+            self._resolved[name] = self._resolve(name)
+        return self._resolved[name]
+
+    def _resolve(self, name: str) -> Optional[str]:
+        key = ingredient_key(name or "")
+        if key in self.factors:
+            return key
+        tokens = _tokens(key)
+        candidates = {candidate for token in tokens for candidate in self._by_token.get(token, ())}
+        matches = [candidate for candidate in candidates if _tokens(candidate) <= tokens]
+        if not matches:
+            return None
+        return max(matches, key=lambda candidate: (len(_tokens(candidate)), len(candidate)))
+
+    def compute(self, ingredients: list) -> dict:
+        """
+        Totales de la receta a partir de sus ingredientes ({name, quantity, type_unit}).
+
+        Las cantidades se pasan a kg columna por columna (unidad base, luego densidad o peso por unidad)
+        y cada total es el producto punto de esa columna con la columna de factores.
+
+        Returns:
+            dict: {"totals": {métrica: valor}, "unresolved": [nombres sin factor]}
+        """
+        names = [item.get("name") or "" for item in ingredients]
+        units = [item.get("type_unit") or item.get("unit") or "" for item in ingredients]
+        quantities = [_quantity(item.get("quantity")) for item in ingredients]
+        dimensions, values, _ = to_base_units(quantities, units)
+
+        keys = [self.resolve(name) for name in names]
+        unresolved = sorted({name for name, key in zip(names, keys) if key is None and name.strip()})
+
+        kilograms = []
+        for key, dimension, value, unit in zip(keys, dimensions, values, units):
+            if key is None:
+                kilograms.append(0.0)
+                continue
+            factor = self.factors[key]
+            if dimension == "mass":
+                kilograms.append(value / 1000)
+            elif dimension == "volume":
+                kilograms.append(value / 1000 * factor["kg_per_litre"])
+            else:
+                informal = INFORMAL_UNITS_KG.get(ingredient_key(unit))
+                kilograms.append(value * (informal if informal is not None else factor["kg_per_unit"]))
+
+        totals = {}
+        for metric in IMPACT_METRICS:
+            column = [self.factors[key][metric] if key is not None else 0.0 for key in keys]
+            totals[metric] = round(sum(map(operator.mul, kilograms, column)), METRIC_DECIMALS[metric])
+        return {"totals": totals, "unresolved": unresolved}
+
+
+class CachedImpactFactorTable:
+    """Tabla compartida por proceso: factores por defecto + los guardados en la base de datos"""
+
+    def __init__(self, revalidate_seconds: int = 300):
+        self.revalidate_seconds = revalidate_seconds
+        self._lock = threading.Lock()
+        self._table: Optional[ImpactFactorTable] = None
+        self._stored: dict = {}
+        self._checked_at = 0.0
+
+    def get(self, loader: Callable[[], dict]) -> ImpactFactorTable:
+        table = self._table
+        if table is not None and time.monotonic() - self._checked_at < self.revalidate_seconds:
+            return table
+
+        with self._lock:
+            if self._table is None or time.monotonic() - self._checked_at >= self.revalidate_seconds:
+                self._stored = dict(loader())
+                self._table = self._build()
+                self._checked_at = time.monotonic()
+            return self._table
+
+    def add(self, factors: dict) -> ImpactFactorTable:
+        """Incorpora factores recién guardados sin esperar a la próxima revalidación"""
+        with self._lock:
+            self._stored.update(factors)
+            self._table = self._build()
+            return self._table
+
+    def _build(self) -> ImpactFactorTable:
+        # Los factores guardados pisan a los por defecto con la misma clave
+        defaults = {name: factor_from_row(values) for name, values in DEFAULT_IMPACT_FACTORS.items()}
+        return ImpactFactorTable({**defaults, **self._stored})
+
+
+impact_factor_cache = CachedImpactFactorTable()
@@ -0,0 +1,205 @@
+import heapq
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+from src.shared.fuzzy_name_index import normalize_name
+
+# Palabras que no identifican un ingrediente ("pechuga de pollo" ~ "pollo")
+STOPWORDS = {"de", "del", "la", "el", "los", "las", "y", "con", "en", "al", "a", "para"}
+
+
+def ingredient_key(name: str) -> str:
+    """Clave normalizada de un ingrediente: sin acentos, en minúsculas y en singular"""
+    words = []
+    for word in normalize_name(name).split():
+        if len(word) > 4 and word.endswith("es") and word[-3] in "lnrd":
+            word = word[:-2]  # limones -> limon, flores -> flor
+        elif len(word) > 3 and word.endswith("s"):
+            word = word[:-1]  # tomates -> tomate, cebollas -> cebolla
+        words.append(word)
+    return " ".join(words)
+
+
+def _tokens(key: str) -> frozenset:
+    return frozenset(word for word in key.split() if word not in STOPWORDS)
+
+
+class RecipeMatchMatrix:
+    """
+    Matriz dispersa receta x ingrediente para recomendar recetas según el inventario.
+
+    Se guarda en ambos sentidos: por fila (ingredientes de cada receta) y por columna
+    (recetas que usan cada ingrediente). Puntuar un inventario solo recorre las columnas
+    de los ingredientes que el usuario tiene, sin tocar el resto de la matriz.
+    """
+
+    def __init__(self, recipes: list):
+        """
+        Args:
+            recipes: dicts con los datos de la receta y `ingredients` (lista de nombres)
+        """
+        self.vocabulary: dict = {}
+        self.column_tokens: list = []
+        self.columns: list = []
+        self.token_columns: dict = {}
+        self.rows: list = []
+        self.row_columns: list = []
+        self.row_names: list = []
+
+        for recipe in recipes:
+            row_id = len(self.rows)
+            names = {}
+            for name in recipe["ingredients"]:
+                key = ingredient_key(name)
+                if key and key not in names:
+                    names[key] = name
+            column_ids = tuple(self._column(key) for key in names)
+            for column_id in column_ids:
+                self.columns[column_id].append(row_id)
+            self.rows.append({field: value for field, value in recipe.items() if field != "ingredients"})
+            self.row_columns.append(column_ids)
+            self.row_names.append(tuple(names.values()))
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def _column(self, key: str) -> int:
+        column_id = self.vocabulary.get(key)
+        if column_id is None:
+            column_id = len(self.columns)
+            self.vocabulary[key] = column_id
+            self.columns.append([])
+            tokens = _tokens(key)
+            self.column_tokens.append(tokens)
+            for token in tokens:
+                self.token_columns.setdefault(token, []).append(column_id)
+        return column_id
+
+    def matching_columns(self, name: str) -> set:
+        """Columnas que corresponden a un ingrediente: misma clave, o una contiene las palabras de la otra"""
+        key = ingredient_key(name)
+        tokens = _tokens(key)
+        matches = set()
+        if key in self.vocabulary:
+            matches.add(self.vocabulary[key])
+        if not tokens:
+            return matches
+        rarest = min(tokens, key=lambda token: len(self.token_columns.get(token, ())))
+        for column_id in self.token_columns.get(rarest, ()):
+            column_tokens = self.column_tokens[column_id]
+            if tokens <= column_tokens or column_tokens <= tokens:
+                matches.add(column_id)
+        return matches
+
+    def excluded_rows(self, allergies: list) -> set:
+        """Filas con algún ingrediente que contiene una alergia (misma regla que la generación con IA)"""
+        # Misma clave que el vocabulario: "camarones" tiene que excluir "arroz con camarones"
+        terms = [ingredient_key(allergy) for allergy in allergies if allergy and allergy.strip()]
+        terms = [term for term in terms if term]
+        if not terms:
+            return set()
+        excluded = set()
+        for key, column_id in self.vocabulary.items():
+            if any(term in key for term in terms):
+                excluded.update(self.columns[column_id])
+        return excluded
+
+    def score(self, inventory: dict, allergies: list, min_coverage: float, limit: int, priority_weight: float) -> list:
+        """
+        Puntúa todas las recetas contra el inventario y devuelve las mejores.
+
+        score = (ingredientes cubiertos + priority_weight * cubiertos que vencen pronto) / ingredientes de la receta
+
+        Args:
+            inventory: {nombre de ingrediente: True si vence pronto}
+            allergies: Alergias del usuario; excluyen toda receta que las contenga
+            min_coverage: Fracción mínima de ingredientes de la receta que el usuario tiene
+            limit: Cantidad máxima de recetas a devolver
+            priority_weight: Peso extra de los ingredientes que vencen pronto
+        """
+        # Vector del inventario en el espacio de columnas (1 = lo tiene, prioridad aparte)
+        held, priority_columns, column_names = set(), set(), {}
+        for name, is_priority in inventory.items():
+            for column_id in self.matching_columns(name):
+                held.add(column_id)
+                column_names.setdefault(column_id, name)
+                if is_priority:
+                    priority_columns.add(column_id)
+
+        # Producto matriz dispersa x vector: solo se recorren las columnas del inventario
+        matched, prioritized = {}, {}
+        for column_id in held:
+            is_priority = column_id in priority_columns
+            for row_id in self.columns[column_id]:
+                matched[row_id] = matched.get(row_id, 0) + 1
+                if is_priority:
+                    prioritized[row_id] = prioritized.get(row_id, 0) + 1
+
+        excluded = self.excluded_rows(allergies)
+        scored = []
+        for row_id, count in matched.items():
+            if row_id in excluded:
+                continue
+            total = len(self.row_columns[row_id])
+            coverage = count / total
+            if coverage < min_coverage:
+                continue
+            score = (count + priority_weight * prioritized.get(row_id, 0)) / total
+            scored.append((score, coverage, -total, row_id))
+
+        results = []
+        for score, coverage, _, row_id in heapq.nlargest(limit, scored):
+            columns, names = self.row_columns[row_id], self.row_names[row_id]
+            results.append({
+                **self.rows[row_id],
+                "score": round(score, 4),
+                "coverage": round(coverage, 4),
+                "matched_ingredients": [names[i] for i, column_id in enumerate(columns) if column_id in held],
+                "missing_ingredients": [names[i] for i, column_id in enumerate(columns) if column_id not in held],
+                "priority_ingredients": sorted({column_names[column_id] for column_id in columns if column_id in priority_columns})
+            })
+        return results
+
+
+class CachedRecipeMatrix:
+    """
+    Matrices compartidas por proceso, una por alcance (p. ej. recetas del usuario + por defecto);
+    cada una se reconstruye cuando cambia la versión de su catálogo o, como máximo, cada
+    `max_age_seconds` (editar los ingredientes de una receta no cambia la versión). Guarda hasta
+    `max_scopes` alcances y descarta el menos usado.
+    """
+
+    def __init__(self, revalidate_seconds: int = 60, max_scopes: int = 256, max_age_seconds: int = 900):
+        self.revalidate_seconds = revalidate_seconds
+        self.max_scopes = max_scopes
+        self.max_age_seconds = max_age_seconds
+        self._lock = threading.Lock()
+        # alcance -> [matriz, versión, revisada, construida]
+        self._entries: "OrderedDict[Hashable, list]" = OrderedDict()
+
+    def get(self, scope: Hashable, version_loader: Callable[[], tuple],
+            catalog_loader: Callable[[], list]) -> RecipeMatchMatrix:
+        entry = self._entries.get(scope)
+        if entry is not None and time.monotonic() - entry[2] < self.revalidate_seconds:
+            return entry[0]
+
+        with self._lock:
+            entry = self._entries.get(scope)
+            version = version_loader()
+            if entry is None or version != entry[1] or time.monotonic() - entry[3] >= self.max_age_seconds:
+                started = time.perf_counter()
+                matrix = RecipeMatchMatrix(catalog_loader())
+                entry = [matrix, version, 0.0, time.monotonic()]
+                print(f"🧮 [RECOMMENDATIONS] Matrix rebuilt: {len(matrix)} recipes, "
+                      f"{len(matrix.columns)} ingredients in {(time.perf_counter() - started) * 1000:.0f} ms")
+            entry[2] = time.monotonic()
+            self._entries[scope] = entry
+            self._entries.move_to_end(scope)
+            while len(self._entries) > self.max_scopes:
+                self._entries.popitem(last=False)
+            return entry[0]
+
+
+recipe_matrix_cache = CachedRecipeMatrix()
@@ -0,0 +1,74 @@
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Optional
+
+from src.shared.percentile_sketch import PercentileSketch
+
+# Métricas con ranking y tamaño del resumen (k + 1 puntos de corte)
+RANKING_METRICS = ("carbon_footprint", "water_footprint")
+SKETCH_SIZE = 100
+
+# Un resumen más viejo que esto se informa como desactualizado (el job corre, p. ej., cada hora)
+STALE_AFTER_SECONDS = 6 * 3600
+
+
+class CachedRankingSketches:
+    """Resúmenes de percentiles compartidos por proceso; se releen de la base de datos cada `revalidate_seconds`"""
+
+    def __init__(self, revalidate_seconds: int = 60):
+        self.revalidate_seconds = revalidate_seconds
+        self._lock = threading.Lock()
+        self._sketches: dict = {}
+        self._built_at: Optional[datetime] = None
+        self._checked_at: Optional[float] = None
+
+    def get(self, loader: Callable[[], dict]) -> tuple:
+        """
+        Returns:
+            tuple: ({métrica: PercentileSketch}, fecha de construcción o None si nunca se construyó)
+        """
+        if self._checked_at is not None and time.monotonic() - self._checked_at < self.revalidate_seconds:
+            return self._sketches, self._built_at
+
+        with self._lock:
+            if self._checked_at is None or time.monotonic() - self._checked_at >= self.revalidate_seconds:
+                stored = loader()
+                self._sketches = {metric: PercentileSketch.from_dict(data) for metric, data in stored.items()}
+                self._built_at = min((data["built_at"] for data in stored.values()), default=None)
+                self._checked_at = time.monotonic()
+            return self._sketches, self._built_at
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._checked_at = None
+
+
+ranking_sketch_cache = CachedRankingSketches()
+
+
+def rank_totals(totals: dict, sketches: dict, built_at: Optional[datetime], now: datetime) -> dict:
+    """
+    Percentil del usuario en cada métrica (porcentaje de usuarios con un total menor) y frescura del resumen.
+
+    Args:
+        totals: {métrica: total del usuario}
+        sketches: {métrica: PercentileSketch}
+        built_at: Cuándo se construyeron los resúmenes (UTC)
+        now: Fecha actual (UTC)
+    """
+    if built_at is None or not sketches:
+        return {"available": False, "population": 0, "built_at": None, "age_seconds": None, "stale": True}
+
+    age_seconds = max(int((now - built_at).total_seconds()), 0)
+    return {
+        "available": True,
+        **{
+            f"{metric}_percentile": sketches[metric].percentile(totals.get(metric, 0.0)) if metric in sketches else None
+            for metric in RANKING_METRICS
+        },
+        "population": max(sketch.population for sketch in sketches.values()),
+        "built_at": built_at.isoformat(),
+        "age_seconds": age_seconds,
+        "stale": age_seconds > STALE_AFTER_SECONDS
+    }
@@ -0,0 +1,55 @@
+from typing import Optional
+
+from src.shared.fuzzy_name_index import normalize_name
+
+# Unidad base por dimensión
+BASE_UNITS = {"mass": "g", "volume": "ml", "count": "unidades"}
+
+# Alias (normalizados, sin acentos) -> (dimensión, factor a la unidad base)
+UNIT_FACTORS = {
+    # Masa
+    "mg": ("mass", 0.001), "miligramo": ("mass", 0.001), "miligramos": ("mass", 0.001),
+    "g": ("mass", 1.0), "gr": ("mass", 1.0), "grs": ("mass", 1.0), "gramo": ("mass", 1.0), "gramos": ("mass", 1.0),
+    "kg": ("mass", 1000.0), "kgs": ("mass", 1000.0), "kilo": ("mass", 1000.0), "kilos": ("mass", 1000.0),
+    "kilogramo": ("mass", 1000.0), "kilogramos": ("mass", 1000.0),
+    "oz": ("mass", 28.3495), "onza": ("mass", 28.3495), "onzas": ("mass", 28.3495),
+    "lb": ("mass", 453.592), "lbs": ("mass", 453.592), "libra": ("mass", 453.592), "libras": ("mass", 453.592),
+    # Volumen
+    "ml": ("volume", 1.0), "mililitro": ("volume", 1.0), "mililitros": ("volume", 1.0),
+    "cl": ("volume", 10.0), "dl": ("volume", 100.0),
+    "l": ("volume", 1000.0), "lt": ("volume", 1000.0), "lts": ("volume", 1000.0), "litro": ("volume", 1000.0), "litros": ("volume", 1000.0),
+    "cucharadita": ("volume", 5.0), "cucharaditas": ("volume", 5.0), "cdta": ("volume", 5.0),
+    "cucharada": ("volume", 15.0), "cucharadas": ("volume", 15.0), "cda": ("volume", 15.0),
+    "taza": ("volume", 240.0), "tazas": ("volume", 240.0),
+    # Conteo
+    "u": ("count", 1.0), "un": ("count", 1.0), "und": ("count", 1.0), "unid": ("count", 1.0), "uds": ("count", 1.0),
+    "unidad": ("count", 1.0), "unidades": ("count", 1.0), "pieza": ("count", 1.0), "piezas": ("count", 1.0),
+    "docena": ("count", 12.0), "docenas": ("count", 12.0),
+}
+
+
+def unit_dimension(unit: Optional[str]) -> tuple:
+    """
+    (dimensión, factor, unidad base) de una unidad.
+    Una unidad desconocida ("diente", "pizca") es su propia dimensión con factor 1: solo se suma consigo misma.
+    """
+    key = normalize_name(unit or "").rstrip(".")
+    if key in UNIT_FACTORS:
+        dimension, factor = UNIT_FACTORS[key]
+        return dimension, factor, BASE_UNITS[dimension]
+    return f"other:{key}", 1.0, key
+
+
+def to_base_units(quantities: list, units: list) -> tuple:
+    """
+    Convierte columnas completas (cantidad, unidad) a la unidad base de su dimensión.
+    Cada unidad distinta se resuelve una sola vez y el resto es un producto elemento a elemento.
+
+    Returns:
+        tuple: (dimensiones, cantidades en unidad base, unidades base), columnas del mismo largo
+    """
+    resolved = {unit: unit_dimension(unit) for unit in set(units)}
+    dimensions = [resolved[unit][0] for unit in units]
+    values = [float(quantity or 0) * resolved[unit][1] for quantity, unit in zip(quantities, units)]
+    base_units = [resolved[unit][2] for unit in units]
+    return dimensions, values, base_units
@@ -0,0 +1,80 @@
+from datetime import datetime, timezone
+
+
+class ConsumeIngredientsFifoUseCase:
+    """Caso de uso para descontar N unidades de uno o varios ingredientes (FIFO por vencimiento)"""
+
+    def __init__(self, inventory_repository, recipe_repository=None, system_user_uid: str = None):
+        self.inventory_repository = inventory_repository
+        self.recipe_repository = recipe_repository
+        self.system_user_uid = system_user_uid
+
+    def execute(self, user_uid: str, ingredients: list, allow_partial: bool = False) -> dict:
+        """
+        Descuenta las cantidades pedidas agotando primero los stacks que vencen antes.
+        Todos los ingredientes se procesan en una sola transacción.
+
+        Args:
+            user_uid: UID del usuario
+            ingredients: Lista de dicts {"name", "quantity", "type_unit" (opcional)}
+            allow_partial: Si es False, falla sin descontar nada cuando algún ingrediente no alcanza
+
+        Returns:
+            dict: Resultado por ingrediente y resumen del consumo
+        """
+        print(f"🍽️ [CONSUME FIFO] Processing {len(ingredients)} ingredients for user: {user_uid}")
+        print(f"   └─ Allow partial: {allow_partial}")
+
+        for item in ingredients:
+            if item['quantity'] <= 0:
+                raise ValueError(f"Consumed quantity for '{item['name']}' must be greater than 0")
+
+        result = self.inventory_repository.consume_ingredients_fifo(user_uid, ingredients, allow_partial)
+
+        if not result['success'] and not allow_partial:
+            problems = [
+                f"{r['ingredient']} ({r['status']}: {r['available_quantity']} {r['type_unit'] or ''} available)".replace(' )', ')')
+                for r in result['ingredients'] if r['status'] not in ('skipped', 'consumed')
+            ]
+            raise ValueError(f"Cannot consume ingredients: {', '.join(problems)}")
+
+        for r in result['ingredients']:
+            for stack in r['stacks']:
+                stack['expiration_date'] = stack['expiration_date'].isoformat()
+            print(f"   • {r['ingredient']}: {r['status']} {r['consumed_quantity']}/{r['requested_quantity']} {r['type_unit']}")
+
+        return {
+            "message": "Ingredients consumed" if result['success'] else "Ingredients partially consumed",
+            "action": "fifo_consumption",
+            "complete": result['success'],
+            "ingredients": result['ingredients'],
+            "consumed_at": datetime.now(timezone.utc).isoformat()
+        }
+
+    def execute_for_recipe(self, user_uid: str, recipe_uid: str) -> dict:
+        """
+        Descuenta del inventario los ingredientes de una receta guardada en una sola llamada.
+        Los ingredientes que no estén en el inventario (o en otra unidad) se reportan sin fallar.
+
+        Args:
+            user_uid: UID del usuario
+            recipe_uid: UID de la receta cocinada
+
+        Returns:
+            dict: Resultado por ingrediente y resumen del consumo
+        """
+        recipe = self.recipe_repository.find_by_uid(recipe_uid)
+        # Solo recetas propias o las por defecto; las de otros usuarios se reportan como inexistentes
+        if not recipe or recipe.user_uid not in (user_uid, self.system_user_uid):
+            raise ValueError(f"Recipe {recipe_uid} not found")
+
+        ingredients = [
+            {"name": ing.name, "quantity": ing.quantity, "type_unit": ing.type_unit}
+            for ing in recipe.ingredients
+            if ing.quantity and ing.quantity > 0
+        ]
+
+        result = self.execute(user_uid, ingredients, allow_partial=True)
+        result["recipe_uid"] = recipe_uid
+        result["recipe_title"] = recipe.title
+        return result
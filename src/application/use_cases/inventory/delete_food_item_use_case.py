@@ -4,8 +4,8 @@ class DeleteFoodItemUseCase:
 
     def execute(self, user_uid: str, food_name: str, added_at: str):
         """
-        Elimina un food item específico del inventario.
-        
+        Elimina un food item específico del inventario (ruta legacy).
+
         Args:
             user_uid: ID del usuario
             food_name: Nombre de la comida a eliminar
@@ -14,16 +14,34 @@ class DeleteFoodItemUseCase:
         print(f"🗑️ [DELETE FOOD ITEM] Deleting food item: {food_name}")
         print(f"   └─ User: {user_uid}")
         print(f"   └─ Added at: {added_at}")
-        
-        # Verificar si el food item existe
-        existing_food = self.inventory_repository.get_food_item(user_uid, food_name, added_at)
-        
-        if not existing_food:
+
+        food_id = self.inventory_repository.find_food_item_id(user_uid, food_name, added_at)
+
+        if food_id is None:
             raise ValueError(f"Food item '{food_name}' not found for deletion (added at: {added_at})")
-        
-        print(f"   └─ Found food item to delete: {food_name}")
-        
+
+        self.execute_by_id(user_uid, food_id)
+
+    def execute_by_id(self, user_uid: str, food_id: int) -> dict:
+        """
+        Elimina un food item direccionado por su ID.
+
+        Args:
+            user_uid: ID del usuario
+            food_id: ID del food item
+
+        Returns:
+            dict: Datos del food item eliminado
+        """
+        existing_food = self.inventory_repository.get_food_item_by_id(user_uid, food_id)
+
+        if not existing_food:
+            raise ValueError(f"Food item {food_id} not found for deletion")
+
+        print(f"   └─ Found food item to delete: {existing_food['name']} (id: {food_id})")
+
         # Eliminar el food item
-        self.inventory_repository.delete_food_item(user_uid, food_name, added_at)
-        
-        print(f"✅ [DELETE FOOD ITEM] Successfully deleted food item: {food_name}")
\ No newline at end of file
+        self.inventory_repository.delete_food_item_by_id(user_uid, food_id)
+
+        print(f"✅ [DELETE FOOD ITEM] Successfully deleted food item: {existing_food['name']}")
+        return existing_food
@@ -4,9 +4,9 @@ class DeleteIngredientStackUseCase:
 
     def execute(self, user_uid: str, ingredient_name: str, added_at: str):
         """
-        Elimina un stack específico de ingrediente del inventario.
+        Elimina un stack específico de ingrediente del inventario (ruta legacy).
         Si es el último stack, elimina también el ingrediente completo.
-        
+
         Args:
             user_uid: ID del usuario
             ingredient_name: Nombre del ingrediente
@@ -15,16 +15,36 @@ class DeleteIngredientStackUseCase:
         print(f"🗑️ [DELETE INGREDIENT STACK] Deleting stack: {ingredient_name}")
         print(f"   └─ User: {user_uid}")
         print(f"   └─ Stack added at: {added_at}")
-        
+
+        stack_id = self.inventory_repository.find_ingredient_stack_id(user_uid, ingredient_name, added_at)
+
+        if stack_id is None:
+            raise ValueError(f"Ingredient stack '{ingredient_name}' not found (added at: {added_at})")
+
+        self.execute_by_id(user_uid, stack_id)
+
+    def execute_by_id(self, user_uid: str, stack_id: int) -> dict:
+        """
+        Elimina un stack de ingrediente direccionado por su ID.
+        Si es el último stack, elimina también el ingrediente completo.
+
+        Args:
+            user_uid: ID del usuario
+            stack_id: ID del stack a eliminar
+
+        Returns:
+            dict: Datos del stack eliminado
+        """
         # Verificar si el stack existe
-        existing_stack = self.inventory_repository.get_ingredient_stack(user_uid, ingredient_name, added_at)
-        
+        existing_stack = self.inventory_repository.get_ingredient_stack_by_id(user_uid, stack_id)
+
         if not existing_stack:
-            raise ValueError(f"Ingredient stack '{ingredient_name}' not found (added at: {added_at})")
-        
-        print(f"   └─ Found stack to delete: {ingredient_name}")
-        
+            raise ValueError(f"Ingredient stack {stack_id} not found")
+
+        print(f"   └─ Found stack to delete: {existing_stack['ingredient_name']} (id: {stack_id})")
+
         # Eliminar el stack
-        self.inventory_repository.delete_ingredient_stack(user_uid, ingredient_name, added_at)
-        
-        print(f"✅ [DELETE INGREDIENT STACK] Successfully deleted stack: {ingredient_name}")
\ No newline at end of file
+        self.inventory_repository.delete_ingredient_stack_by_id(user_uid, stack_id)
+
+        print(f"✅ [DELETE INGREDIENT STACK] Successfully deleted stack: {existing_stack['ingredient_name']}")
+        return existing_stack
@@ -4,8 +4,8 @@ class GetFoodDetailUseCase:
 
     def execute(self, user_uid: str, food_name: str, added_at: str) -> dict:
         """
-        Obtiene todos los detalles de un food item específico del inventario,
-        incluyendo ingredientes principales, valores nutricionales, consejos y más.
+        Obtiene todos los detalles de un food item específico del inventario (ruta legacy).
+        Resuelve el ID del food item y delega en execute_by_id.
         
         Args:
             user_uid: ID del usuario
@@ -19,12 +19,32 @@ class GetFoodDetailUseCase:
         print(f"   └─ User: {user_uid}")
         print(f"   └─ Added at: {added_at}")
         
+        food_id = self.inventory_repository.find_food_item_id(user_uid, food_name, added_at)
+        
+        if food_id is None:
+            raise ValueError(f"Food item '{food_name}' added at '{added_at}' not found in inventory")
+        
+        return self.execute_by_id(user_uid, food_id)
+
+    def execute_by_id(self, user_uid: str, food_id: int) -> dict:
+        """
+        Obtiene todos los detalles de un food item direccionado por su ID,
+        incluyendo ingredientes principales, valores nutricionales, consejos y más.
+        
+        Args:
+            user_uid: ID del usuario
+            food_id: ID del food item
+            
+        Returns:
+            dict: Información completa del food item
+        """
         # Obtener el food item específico
-        food_item_data = self.inventory_repository.get_food_item(user_uid, food_name, added_at)
+        food_item_data = self.inventory_repository.get_food_item_by_id(user_uid, food_id)
         
         if not food_item_data:
-            raise ValueError(f"Food item '{food_name}' added at '{added_at}' not found in inventory")
+            raise ValueError(f"Food item {food_id} not found in inventory")
         
+        food_name = food_item_data['name']
         print(f"   └─ Found food item with {food_item_data['serving_quantity']} servings")
         
         # Construir información completa del food item
@@ -44,6 +64,7 @@ class GetFoodDetailUseCase:
         
         food_detail = {
             # Información básica
+            "id": food_item_data['id'],
             "name": food_item_data['name'],
             "category": food_item_data['category'],
             "serving_quantity": food_item_data['serving_quantity'],
@@ -1,22 +1,76 @@
+from datetime import datetime
+from typing import Optional
+from src.shared.pagination import encode_cursor, decode_cursor
+from src.shared.fieldsets import resolve_fields
+
+
 class GetFoodsListUseCase:
+    # Campos que puede devolver cada food item (fields=) y proyección compacta por defecto
+    FIELDS = (
+        "id", "name", "category", "serving_quantity", "calories", "description", "storage_type", "tips",
+        "image_path", "added_at", "expiration_date", "expiration_time", "time_unit", "days_to_expire",
+        "is_expired", "main_ingredients", "calories_per_serving", "total_calories", "status"
+    )
+    COMPACT_FIELDS = (
+        "id", "name", "category", "serving_quantity", "storage_type",
+        "expiration_date", "days_to_expire", "is_expired", "status"
+    )
+    # Campos que corresponden a columnas pesadas (TEXT, JSON, URLs) que solo se leen si se piden
+    OPTIONAL_COLUMNS = ("main_ingredients", "description", "expiration_time", "time_unit", "tips", "image_path")
+    # Tipos de la clave del cursor según el orden (ver get_food_items_page)
+    CURSOR_KEYS = {"name": (str, int), "expiration": (datetime, int)}
+
     def __init__(self, inventory_repository):
         self.inventory_repository = inventory_repository
 
-    def execute(self, user_uid: str) -> dict:
+    def execute(
+        self,
+        user_uid: str,
+        sort: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+        storage_type: Optional[str] = None,
+        category: Optional[str] = None,
+        expired: Optional[bool] = None,
+        expiring_within: Optional[int] = None,
+        fields: Optional[list] = None
+    ) -> dict:
         """
         Obtiene únicamente la lista de food items del inventario del usuario,
         con información básica de cada comida preparada.
+        El orden, los filtros y la paginación se resuelven en SQL.
         
         Args:
             user_uid: ID del usuario
+            sort: "expiration" (por defecto) o "name"
+            cursor: Cursor devuelto como next_cursor por la página anterior
+            limit: Tamaño de página (sin límite si no se indica)
+            storage_type: Filtrar por tipo de almacenamiento
+            category: Filtrar por categoría
+            expired: True solo vencidos, False solo vigentes
+            expiring_within: Solo items que vencen en los próximos N días
+            fields: Campos a devolver por food item (None = compactos, ["*"] = todos)
             
         Returns:
-            dict: Lista de food items con información básica
+            dict: Lista de food items con información básica y next_cursor
         """
         print(f"🍽️ [GET FOODS LIST] Fetching foods list for user: {user_uid}")
         
-        # Obtener todos los food items del usuario
-        food_items_data = self.inventory_repository.get_all_food_items(user_uid)
+        sort = sort or "expiration"
+        selected_fields = resolve_fields(fields, self.FIELDS, self.COMPACT_FIELDS, always=("id", "name"))
+        page = self.inventory_repository.get_food_items_page(
+            user_uid,
+            sort=sort,
+            after=decode_cursor(cursor, sort, self.CURSOR_KEYS.get(sort)) if cursor else None,
+            limit=limit,
+            storage_type=storage_type,
+            category=category,
+            expired=expired,
+            expiring_within_days=expiring_within,
+            optional_columns=tuple(column for column in self.OPTIONAL_COLUMNS if column in selected_fields)
+        )
+        food_items_data = page['foods']
+        next_cursor = encode_cursor(sort, page['next_key']) if page['next_key'] else None
         
         if not food_items_data:
             print(f"❌ [GET FOODS LIST] No food items found for user: {user_uid}")
@@ -25,6 +79,8 @@ class GetFoodsListUseCase:
                 "total_foods": 0,
                 "total_servings": 0,
                 "total_calories": 0,
+                "next_cursor": None,
+                "fields": list(selected_fields),
                 "message": "No food items found"
             }
         
@@ -35,8 +91,6 @@ class GetFoodsListUseCase:
         print(f"📊 [GET FOODS LIST] Found {len(food_items_data)} food items")
         
         for food_data in food_items_data:
-            from datetime import datetime
-            
             # Calcular días hasta vencimiento
             current_time = datetime.now()
             expiration_date = food_data['expiration_date']
@@ -61,25 +115,26 @@ class GetFoodsListUseCase:
             
             # Crear información del food item
             food_info = {
+                "id": food_data['id'],
                 "name": food_data['name'],
                 "category": food_data['category'],
                 "serving_quantity": serving_quantity,
                 "calories": calories,
-                "description": food_data['description'],
+                "description": food_data.get('description'),
                 "storage_type": food_data['storage_type'],
-                "tips": food_data['tips'],
-                "image_path": food_data['image_path'],
+                "tips": food_data.get('tips'),
+                "image_path": food_data.get('image_path'),
                 
                 # Fechas y tiempo
                 "added_at": added_at_date.isoformat(),
                 "expiration_date": expiration_date.isoformat(),
-                "expiration_time": food_data['expiration_time'],
-                "time_unit": food_data['time_unit'],
+                "expiration_time": food_data.get('expiration_time'),
+                "time_unit": food_data.get('time_unit'),
                 "days_to_expire": max(days_to_expire, 0),
                 "is_expired": is_expired,
                 
                 # Ingredientes principales
-                "main_ingredients": food_data['main_ingredients'],
+                "main_ingredients": food_data.get('main_ingredients'),
                 
                 # Estadísticas calculadas
                 "calories_per_serving": calories_per_serving,
@@ -93,9 +148,6 @@ class GetFoodsListUseCase:
             
             print(f"   • {food_data['name']}: {serving_quantity} servings, {total_item_calories} total calories, expires in {days_to_expire} days")
         
-        # Ordenar por fecha de vencimiento (más próximos primero) y luego por nombre
-        foods_list.sort(key=lambda x: (x['expiration_date'], x['name']))
-        
         # Calcular estadísticas de categorías
         categories_summary = {}
         for food in foods_list:
@@ -111,10 +163,13 @@ class GetFoodsListUseCase:
             categories_summary[category]["total_calories"] += food['total_calories']
         
         result = {
-            "foods": foods_list,
+            # Los resúmenes se calculan con todos los campos; la respuesta solo lleva los pedidos
+            "foods": [{field: food[field] for field in selected_fields} for food in foods_list],
             "total_foods": len(foods_list),
             "total_servings": total_servings,
             "total_calories": total_calories,
+            "next_cursor": next_cursor,
+            "fields": list(selected_fields),
             "summary": {
                 "food_items": len(foods_list),
                 "total_servings": total_servings,
@@ -45,6 +45,7 @@ class GetIngredientDetailUseCase:
         total_quantity = 0
         for stack in ingredient.stacks:
             stack_info = {
+                "id": stack.id,
                 "quantity": stack.quantity,
                 "type_unit": ingredient.type_unit,
                 "expiration_date": stack.expiration_date.isoformat(),
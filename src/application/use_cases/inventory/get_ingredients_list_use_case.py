@@ -1,70 +1,120 @@
+from datetime import datetime
+from typing import Optional
+from src.shared.pagination import encode_cursor, decode_cursor
+from src.shared.fieldsets import resolve_fields
+
+
 class GetIngredientsListUseCase:
+    # Campos que puede devolver cada ingrediente (fields=) y proyección compacta por defecto
+    FIELDS = (
+        "name", "type_unit", "storage_type", "tips", "image_path", "stacks",
+        "total_quantity", "stack_count", "nearest_expiration", "average_quantity_per_stack"
+    )
+    COMPACT_FIELDS = ("name", "type_unit", "storage_type", "stacks", "total_quantity", "stack_count", "nearest_expiration")
+    # Campos que corresponden a columnas pesadas que solo se leen si se piden
+    OPTIONAL_COLUMNS = ("tips", "image_path")
+    # Tipos de la clave del cursor según el orden (ver get_ingredients_page)
+    CURSOR_KEYS = {"name": (str,), "expiration": ((datetime, type(None)), str)}
+
     def __init__(self, inventory_repository):
         self.inventory_repository = inventory_repository
 
-    def execute(self, user_uid: str) -> dict:
+    def execute(
+        self,
+        user_uid: str,
+        sort: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+        storage_type: Optional[str] = None,
+        expired: Optional[bool] = None,
+        expiring_within: Optional[int] = None,
+        fields: Optional[list] = None
+    ) -> dict:
         """
         Obtiene únicamente la lista de ingredientes del inventario del usuario,
         con información básica de cada ingrediente y sus stacks.
+        El orden, los filtros y la paginación se resuelven en SQL.
         
         Args:
             user_uid: ID del usuario
+            sort: "name" (por defecto) o "expiration" (vencimiento más próximo primero)
+            cursor: Cursor devuelto como next_cursor por la página anterior
+            limit: Tamaño de página (sin límite si no se indica)
+            storage_type: Filtrar por tipo de almacenamiento
+            expired: True solo stacks vencidos, False solo stacks vigentes
+            expiring_within: Solo stacks que vencen en los próximos N días
+            fields: Campos a devolver por ingrediente (None = compactos, ["*"] = todos)
             
         Returns:
-            dict: Lista de ingredientes con información básica
+            dict: Lista de ingredientes con información básica y next_cursor
         """
         print(f"📋 [GET INGREDIENTS LIST] Fetching ingredients list for user: {user_uid}")
         
-        # Obtener el inventario completo
-        inventory = self.inventory_repository.get_by_user_uid(user_uid)
+        sort = sort or "name"
+        selected_fields = resolve_fields(fields, self.FIELDS, self.COMPACT_FIELDS, always=("name",))
+        page = self.inventory_repository.get_ingredients_page(
+            user_uid,
+            sort=sort,
+            after=decode_cursor(cursor, sort, self.CURSOR_KEYS.get(sort)) if cursor else None,
+            limit=limit,
+            storage_type=storage_type,
+            expired=expired,
+            expiring_within_days=expiring_within,
+            optional_columns=tuple(column for column in self.OPTIONAL_COLUMNS if column in selected_fields)
+        )
+        next_cursor = encode_cursor(sort, page['next_key']) if page['next_key'] else None
         
-        if not inventory:
-            print(f"❌ [GET INGREDIENTS LIST] No inventory found for user: {user_uid}")
+        if not page['ingredients'] and not cursor:
+            print(f"❌ [GET INGREDIENTS LIST] No ingredients found for user: {user_uid}")
             return {
                 "ingredients": [],
                 "total_ingredients": 0,
                 "total_stacks": 0,
+                "next_cursor": None,
+                "fields": list(selected_fields),
                 "message": "No inventory found"
             }
         
         ingredients_list = []
         total_stacks = 0
+        current_time = datetime.now()
         
-        print(f"📊 [GET INGREDIENTS LIST] Found {len(inventory.ingredients)} ingredient types")
+        print(f"📊 [GET INGREDIENTS LIST] Found {len(page['ingredients'])} ingredient types")
         
-        for name, ingredient in inventory.ingredients.items():
+        for ingredient in page['ingredients']:
+            stacks = ingredient['stacks']
             # Calcular estadísticas del ingrediente
-            total_quantity = sum(stack.quantity for stack in ingredient.stacks)
-            stack_count = len(ingredient.stacks)
+            total_quantity = sum(stack['quantity'] for stack in stacks)
+            stack_count = len(stacks)
             total_stacks += stack_count
             
-            # Encontrar el stack más próximo a vencer
-            nearest_expiration = ingredient.get_nearest_expiration()
+            # Los stacks llegan ordenados por vencimiento: el primero es el más próximo a vencer
+            nearest_expiration = stacks[0]['expiration_date'] if stacks else None
             
             # Preparar información de stacks
             stacks_info = []
-            for stack in ingredient.stacks:
-                from datetime import datetime
-                current_time = datetime.now()
-                days_to_expire = (stack.expiration_date - current_time).days if stack.expiration_date > current_time else 0
+            for stack in stacks:
+                expiration_date = stack['expiration_date']
+                days_to_expire = (expiration_date - current_time).days if expiration_date > current_time else 0
                 
                 stack_info = {
-                    "quantity": stack.quantity,
-                    "type_unit": ingredient.type_unit,
-                    "expiration_date": stack.expiration_date.isoformat(),
-                    "added_at": stack.added_at.isoformat(),
+                    "id": stack['id'],
+                    "quantity": stack['quantity'],
+                    "type_unit": ingredient['type_unit'],
+                    "expiration_date": expiration_date.isoformat(),
+                    "added_at": stack['added_at'].isoformat(),
                     "days_to_expire": days_to_expire,
-                    "is_expired": stack.expiration_date < current_time
+                    "is_expired": expiration_date < current_time
                 }
                 stacks_info.append(stack_info)
             
-            # Crear información del ingrediente
+            # Crear información del ingrediente (solo con los campos pedidos)
             ingredient_info = {
-                "name": ingredient.name,
-                "type_unit": ingredient.type_unit,
-                "storage_type": ingredient.storage_type,
-                "tips": ingredient.tips,
-                "image_path": ingredient.image_path,
+                "name": ingredient['name'],
+                "type_unit": ingredient['type_unit'],
+                "storage_type": ingredient['storage_type'],
+                "tips": ingredient.get('tips'),
+                "image_path": ingredient.get('image_path'),
                 "stacks": stacks_info,
                 
                 # Estadísticas calculadas
@@ -74,17 +124,16 @@ class GetIngredientsListUseCase:
                 "average_quantity_per_stack": total_quantity / stack_count if stack_count > 0 else 0
             }
             
-            ingredients_list.append(ingredient_info)
+            ingredients_list.append({field: ingredient_info[field] for field in selected_fields})
             
-            print(f"   • {name}: {stack_count} stacks, total: {total_quantity} {ingredient.type_unit}")
-        
-        # Ordenar por nombre para consistencia
-        ingredients_list.sort(key=lambda x: x['name'])
+            print(f"   • {ingredient['name']}: {stack_count} stacks, total: {total_quantity} {ingredient['type_unit']}")
         
         result = {
             "ingredients": ingredients_list,
             "total_ingredients": len(ingredients_list),
             "total_stacks": total_stacks,
+            "next_cursor": next_cursor,
+            "fields": list(selected_fields),
             "summary": {
                 "ingredient_types": len(ingredients_list),
                 "total_stacks": total_stacks,
@@ -93,4 +142,4 @@ class GetIngredientsListUseCase:
         }
         
         print(f"✅ [GET INGREDIENTS LIST] Successfully prepared list: {len(ingredients_list)} ingredients, {total_stacks} total stacks")
-        return result 
\ No newline at end of file
+        return result
@@ -0,0 +1,112 @@
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+
+class GetInventoryChangesUseCase:
+    """Caso de uso para la sincronización incremental (delta sync) del inventario"""
+
+    MAX_CHANGES_PER_PAGE = 500
+
+    def __init__(self, inventory_repository):
+        self.inventory_repository = inventory_repository
+
+    def execute(self, user_uid: str, since: Optional[int] = None, limit: Optional[int] = None) -> dict:
+        """
+        Devuelve los upserts y tombstones posteriores al cursor `since`.
+        Si no hay cursor, o el registro de cambios ya no lo cubre, devuelve un snapshot completo.
+
+        Args:
+            user_uid: UID del usuario
+            since: Último `seq` recibido por el cliente
+            limit: Máximo de cambios a procesar por respuesta
+
+        Returns:
+            dict: Respuesta en modo "delta" o "snapshot" con el nuevo cursor en `seq`
+        """
+        limit = min(limit or self.MAX_CHANGES_PER_PAGE, self.MAX_CHANGES_PER_PAGE)
+        print(f"🔄 [INVENTORY CHANGES] User: {user_uid}, since: {since}, limit: {limit}")
+
+        feed = self.inventory_repository.get_changes_since(user_uid, since or 0, limit)
+
+        if since is None or not feed['complete']:
+            print(f"   └─ Sending full snapshot at seq {feed['current_seq']}")
+            # Se lee en la misma transacción que current_seq, así el snapshot corresponde a ese cursor
+            entities = self.inventory_repository.get_sync_entities(user_uid)
+            return {
+                "mode": "snapshot",
+                "seq": feed['current_seq'],
+                "has_more": False,
+                "upserts": self._serialize(entities),
+                "tombstones": {"ingredients": [], "ingredient_stacks": [], "food_items": []}
+            }
+
+        changes = feed['changes']
+        if not changes:
+            return {
+                "mode": "delta",
+                "seq": feed['current_seq'],
+                "has_more": False,
+                "upserts": {"ingredients": [], "ingredient_stacks": [], "food_items": []},
+                "tombstones": {"ingredients": [], "ingredient_stacks": [], "food_items": []}
+            }
+
+        # Solo importa la última operación de cada entidad dentro de la ventana
+        latest_op = {}
+        for change in changes:
+            latest_op[(change['entity_type'], change['entity_key'])] = change['op']
+
+        upserted = {"ingredient": [], "ingredient_stack": [], "food_item": []}
+        tombstones = {"ingredient": [], "ingredient_stack": [], "food_item": []}
+        for (entity_type, entity_key), op in latest_op.items():
+            key = entity_key if entity_type == "ingredient" else int(entity_key)
+            (upserted if op == "upsert" else tombstones)[entity_type].append(key)
+
+        entities = self.inventory_repository.get_sync_entities(
+            user_uid,
+            ingredient_names=upserted["ingredient"],
+            stack_ids=upserted["ingredient_stack"],
+            food_ids=upserted["food_item"]
+        )
+
+        # Un upsert cuya entidad ya no existe fue borrado en un cambio posterior: se envía como tombstone
+        found_names = {ingredient['name'] for ingredient in entities['ingredients']}
+        found_stacks = {stack['id'] for stack in entities['ingredient_stacks']}
+        found_foods = {food['id'] for food in entities['food_items']}
+        tombstones["ingredient"] += [name for name in upserted["ingredient"] if name not in found_names]
+        tombstones["ingredient_stack"] += [stack_id for stack_id in upserted["ingredient_stack"] if stack_id not in found_stacks]
+        tombstones["food_item"] += [food_id for food_id in upserted["food_item"] if food_id not in found_foods]
+
+        last_seq = changes[-1]['seq']
+        print(f"   └─ {len(changes)} changes -> {len(latest_op)} entities, seq {since} -> {last_seq}")
+
+        return {
+            "mode": "delta",
+            "seq": last_seq,
+            "has_more": last_seq < feed['current_seq'],
+            "upserts": self._serialize(entities),
+            "tombstones": {
+                "ingredients": tombstones["ingredient"],
+                "ingredient_stacks": tombstones["ingredient_stack"],
+                "food_items": tombstones["food_item"]
+            }
+        }
+
+    def prune(self, retention_days: int) -> int:
+        """
+        Depura el registro de cambios más viejo que `retention_days`.
+
+        Returns:
+            int: Cantidad de cambios eliminados
+        """
+        older_than = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=retention_days)
+        return self.inventory_repository.prune_inventory_changes(older_than)
+
+    @staticmethod
+    def _serialize(entities: dict) -> dict:
+        for stack in entities['ingredient_stacks']:
+            stack['expiration_date'] = stack['expiration_date'].isoformat()
+            stack['added_at'] = stack['added_at'].isoformat()
+        for food in entities['food_items']:
+            food['expiration_date'] = food['expiration_date'].isoformat()
+            food['added_at'] = food['added_at'].isoformat() if food['added_at'] else None
+        return entities
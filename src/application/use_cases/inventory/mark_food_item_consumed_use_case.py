@@ -1,38 +1,61 @@
 from datetime import datetime, timezone
+from src.domain.models.food_item import FoodItem
 
 
 class MarkFoodItemConsumedUseCase:
     """Caso de uso para marcar un food item como consumido"""
-    
+
     def __init__(self, inventory_repository):
         self.inventory_repository = inventory_repository
-    
+
     def execute(self, user_uid: str, food_name: str, added_at: str, consumed_portions: float = None) -> dict:
         """
-        Marca un food item como consumido.
-        
+        Marca un food item como consumido (ruta legacy).
+        Resuelve el ID del food item y delega en execute_by_id.
+
         Args:
             user_uid: UID del usuario
             food_name: Nombre de la comida
             added_at: Timestamp del food item (ISO format)
             consumed_portions: Porciones consumidas (opcional, por defecto consume todo)
-            
+
+        Returns:
+            dict: Información sobre lo que se marcó como consumido
+        """
+        food_id = self.inventory_repository.find_food_item_id(user_uid, food_name, added_at)
+
+        if food_id is None:
+            raise ValueError(f"Food item '{food_name}' not found (added at: {added_at})")
+
+        result = self.execute_by_id(user_uid, food_id, consumed_portions)
+        result["original_added_at"] = added_at
+        return result
+
+    def execute_by_id(self, user_uid: str, food_id: int, consumed_portions: float = None) -> dict:
+        """
+        Marca un food item como consumido, direccionado por su ID.
+
+        Args:
+            user_uid: UID del usuario
+            food_id: ID del food item
+            consumed_portions: Porciones consumidas (opcional, por defecto consume todo)
+
         Returns:
             dict: Información sobre lo que se marcó como consumido
         """
         print(f"🍽️ [MARK FOOD CONSUMED] Processing for user: {user_uid}")
-        print(f"   └─ Food: {food_name}")
-        print(f"   └─ Added at: {added_at}")
+        print(f"   └─ Food id: {food_id}")
         print(f"   └─ Consumed portions: {consumed_portions or 'ALL'}")
-        
+
         # Verificar que el food item existe
-        existing_food = self.inventory_repository.get_food_item(user_uid, food_name, added_at)
-        
+        existing_food = self.inventory_repository.get_food_item_by_id(user_uid, food_id)
+
         if not existing_food:
-            raise ValueError(f"Food item '{food_name}' not found (added at: {added_at})")
-        
+            raise ValueError(f"Food item {food_id} not found")
+
+        food_name = existing_food['name']
         current_portions = existing_food['serving_quantity']
-        
+
         # Determinar porciones a consumir
         if consumed_portions is None:
             # Consumir todo el food item
@@ -44,47 +67,42 @@ class MarkFoodItemConsumedUseCase:
                 raise ValueError("Consumed portions must be greater than 0")
             if consumed_portions > current_portions:
                 raise ValueError(f"Cannot consume {consumed_portions} portions - only {current_portions} portions available")
-            
+
             action = "partial_consumption" if consumed_portions < current_portions else "full_consumption"
-        
+
+        print(f"   └─ Food: {food_name}")
         print(f"   └─ Action: {action}")
         print(f"   └─ Available: {current_portions} portions")
         print(f"   └─ To consume: {consumed_portions} portions")
-        
+
+        food_details = {
+            "category": existing_food.get('category'),
+            "main_ingredients": existing_food.get('main_ingredients'),
+            "calories": existing_food.get('calories'),
+            "description": existing_food.get('description')
+        }
+
         if action == "full_consumption":
             # Eliminar el food item completamente
-            self.inventory_repository.delete_food_item(user_uid, food_name, added_at)
+            self.inventory_repository.delete_food_item_by_id(user_uid, food_id)
             print(f"   └─ Food item completely consumed and removed")
-            
+
             return {
                 "message": "Food item marked as consumed",
                 "action": "full_consumption",
                 "food": food_name,
+                "food_id": food_id,
                 "consumed_portions": consumed_portions,
                 "food_removed": True,
                 "consumed_at": datetime.now(timezone.utc).isoformat(),
-                "original_added_at": added_at,
-                "food_details": {
-                    "category": existing_food.get('category'),
-                    "main_ingredients": existing_food.get('main_ingredients'),
-                    "calories": existing_food.get('calories'),
-                    "description": existing_food.get('description')
-                }
+                "original_added_at": existing_food['added_at'].isoformat(),
+                "food_details": food_details
             }
-        
+
         else:
             # Actualizar las porciones del food item
             remaining_portions = current_portions - consumed_portions
-            
-            # Crear food item actualizado
-            from src.domain.models.food_item import FoodItem
-            
-            # Convertir added_at a datetime
-            try:
-                added_at_datetime = datetime.fromisoformat(added_at.replace('Z', '+00:00'))
-            except ValueError:
-                added_at_datetime = datetime.strptime(added_at, '%Y-%m-%d %H:%M:%S')
-            
+
             updated_food_item = FoodItem(
                 name=food_name,
                 main_ingredients=existing_food['main_ingredients'],
@@ -97,28 +115,25 @@ class MarkFoodItemConsumedUseCase:
                 tips=existing_food['tips'],
                 serving_quantity=remaining_portions,  # Nueva cantidad
                 image_path=existing_food['image_path'],
-                added_at=added_at_datetime,
-                expiration_date=existing_food['expiration_date']
+                added_at=existing_food['added_at'],
+                expiration_date=existing_food['expiration_date'],
+                id=food_id
             )
-            
+
             # Actualizar en el repositorio
-            self.inventory_repository.update_food_item(user_uid, updated_food_item)
-            
+            self.inventory_repository.update_food_item_by_id(user_uid, food_id, updated_food_item)
+
             print(f"   └─ Food item updated: {remaining_portions} portions remaining")
-            
+
             return {
                 "message": "Food item partially consumed",
                 "action": "partial_consumption",
                 "food": food_name,
+                "food_id": food_id,
                 "consumed_portions": consumed_portions,
                 "remaining_portions": remaining_portions,
                 "food_removed": False,
                 "consumed_at": datetime.now(timezone.utc).isoformat(),
-                "original_added_at": added_at,
-                "food_details": {
-                    "category": existing_food.get('category'),
-                    "main_ingredients": existing_food.get('main_ingredients'),
-                    "calories": existing_food.get('calories'),
-                    "description": existing_food.get('description')
-                }
-            } 
\ No newline at end of file
+                "original_added_at": existing_food['added_at'].isoformat(),
+                "food_details": food_details
+            }
@@ -1,4 +1,3 @@
-from datetime import datetime
 from src.domain.models.food_item import FoodItem
 
 class UpdateFoodQuantityUseCase:
@@ -7,9 +6,9 @@ class UpdateFoodQuantityUseCase:
 
     def execute(self, user_uid: str, food_name: str, added_at: str, new_quantity: int):
         """
-        Actualiza únicamente la cantidad de porciones de un food item específico.
+        Actualiza únicamente la cantidad de porciones de un food item específico (ruta legacy).
         Mantiene todos los demás datos intactos.
-        
+
         Args:
             user_uid: ID del usuario
             food_name: Nombre del plato/comida
@@ -20,25 +19,34 @@ class UpdateFoodQuantityUseCase:
         print(f"   └─ User: {user_uid}")
         print(f"   └─ Added at: {added_at}")
         print(f"   └─ New quantity: {new_quantity}")
-        
+
+        food_id = self.inventory_repository.find_food_item_id(user_uid, food_name, added_at)
+
+        if food_id is None:
+            raise ValueError(f"Food item not found for '{food_name}' added at '{added_at}'")
+
+        self.execute_by_id(user_uid, food_id, new_quantity)
+
+    def execute_by_id(self, user_uid: str, food_id: int, new_quantity: int) -> dict:
+        """
+        Actualiza únicamente la cantidad de porciones de un food item direccionado por su ID.
+
+        Args:
+            user_uid: ID del usuario
+            food_id: ID del food item
+            new_quantity: Nueva cantidad de porciones
+
+        Returns:
+            dict: Datos del food item antes de la actualización
+        """
         # Obtener el food item actual para preservar otros datos
-        current_food_data = self.inventory_repository.get_food_item(
-            user_uid=user_uid,
-            food_name=food_name,
-            added_at=added_at
-        )
-        
+        current_food_data = self.inventory_repository.get_food_item_by_id(user_uid, food_id)
+
         if not current_food_data:
-            raise ValueError(f"Food item not found for '{food_name}' added at '{added_at}'")
-        
-        # Crear nuevo food item con cantidad actualizada pero manteniendo otros datos
-        try:
-            added_at_datetime = datetime.fromisoformat(added_at.replace('Z', '+00:00'))
-        except ValueError:
-            added_at_datetime = datetime.strptime(added_at, '%Y-%m-%d %H:%M:%S')
-        
+            raise ValueError(f"Food item {food_id} not found")
+
         updated_food_item = FoodItem(
-            name=food_name,
+            name=current_food_data['name'],
             main_ingredients=current_food_data['main_ingredients'],
             category=current_food_data['category'],
             calories=current_food_data['calories'],
@@ -49,11 +57,13 @@ class UpdateFoodQuantityUseCase:
             tips=current_food_data['tips'],
             serving_quantity=new_quantity,  # ← Solo esto cambia
             image_path=current_food_data['image_path'],
-            added_at=added_at_datetime,
-            expiration_date=current_food_data['expiration_date']
+            added_at=current_food_data['added_at'],
+            expiration_date=current_food_data['expiration_date'],
+            id=food_id
         )
-        
+
         # Actualizar en el repositorio
-        self.inventory_repository.update_food_item(user_uid, updated_food_item)
-        
-        print(f"✅ [UPDATE FOOD QUANTITY] Successfully updated quantity for {food_name}") 
\ No newline at end of file
+        self.inventory_repository.update_food_item_by_id(user_uid, food_id, updated_food_item)
+
+        print(f"✅ [UPDATE FOOD QUANTITY] Successfully updated quantity for {current_food_data['name']} (id {food_id})")
+        return current_food_data
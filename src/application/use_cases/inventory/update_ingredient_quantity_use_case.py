@@ -1,4 +1,3 @@
-from datetime import datetime
 from src.domain.models.ingredient import Ingredient, IngredientStack
 
 class UpdateIngredientQuantityUseCase:
@@ -7,9 +6,9 @@ class UpdateIngredientQuantityUseCase:
 
     def execute(self, user_uid: str, ingredient_name: str, added_at: str, new_quantity: float):
         """
-        Actualiza únicamente la cantidad de un stack específico de ingrediente.
+        Actualiza únicamente la cantidad de un stack específico de ingrediente (ruta legacy).
         Mantiene todos los demás datos intactos.
-        
+
         Args:
             user_uid: ID del usuario
             ingredient_name: Nombre del ingrediente
@@ -20,45 +19,55 @@ class UpdateIngredientQuantityUseCase:
         print(f"   └─ User: {user_uid}")
         print(f"   └─ Stack added at: {added_at}")
         print(f"   └─ New quantity: {new_quantity}")
-        
+
+        stack_id = self.inventory_repository.find_ingredient_stack_id(user_uid, ingredient_name, added_at)
+
+        if stack_id is None:
+            raise ValueError(f"Stack not found for ingredient '{ingredient_name}' added at '{added_at}'")
+
+        self.execute_by_id(user_uid, stack_id, new_quantity)
+
+    def execute_by_id(self, user_uid: str, stack_id: int, new_quantity: float) -> dict:
+        """
+        Actualiza únicamente la cantidad de un stack direccionado por su ID.
+
+        Args:
+            user_uid: ID del usuario
+            stack_id: ID del stack a actualizar
+            new_quantity: Nueva cantidad
+
+        Returns:
+            dict: Datos del stack antes de la actualización
+        """
         # Obtener el stack actual para preservar otros datos
-        current_stack_data = self.inventory_repository.get_ingredient_stack(
-            user_uid=user_uid,
-            ingredient_name=ingredient_name,
-            added_at=added_at
-        )
-        
+        current_stack_data = self.inventory_repository.get_ingredient_stack_by_id(user_uid, stack_id)
+
         if not current_stack_data:
-            raise ValueError(f"Stack not found for ingredient '{ingredient_name}' added at '{added_at}'")
-        
-        # Crear nuevo stack con cantidad actualizada pero manteniendo otros datos
-        try:
-            added_at_datetime = datetime.fromisoformat(added_at.replace('Z', '+00:00'))
-        except ValueError:
-            added_at_datetime = datetime.strptime(added_at, '%Y-%m-%d %H:%M:%S')
-        
+            raise ValueError(f"Stack {stack_id} not found")
+
         updated_stack = IngredientStack(
             quantity=new_quantity,  # ← Solo esto cambia
             type_unit=current_stack_data['type_unit'],
-            added_at=added_at_datetime,
-            expiration_date=current_stack_data['expiration_date']
+            added_at=current_stack_data['added_at'],
+            expiration_date=current_stack_data['expiration_date'],
+            id=stack_id
         )
-        
+
         updated_ingredient = Ingredient(
-            name=ingredient_name,
+            name=current_stack_data['ingredient_name'],
             type_unit=current_stack_data['type_unit'],
             storage_type=current_stack_data['storage_type'],
             tips=current_stack_data['tips'],
             image_path=current_stack_data['image_path']
         )
-        
+
         # Actualizar en el repositorio
-        self.inventory_repository.update_ingredient_stack(
+        self.inventory_repository.update_ingredient_stack_by_id(
             user_uid=user_uid,
-            ingredient_name=ingredient_name,
-            added_at=added_at,
+            stack_id=stack_id,
             new_stack=updated_stack,
             new_meta=updated_ingredient
         )
-        
-        print(f"✅ [UPDATE QUANTITY] Successfully updated quantity for {ingredient_name}") 
\ No newline at end of file
+
+        print(f"✅ [UPDATE QUANTITY] Successfully updated quantity for {current_stack_data['ingredient_name']} (stack {stack_id})")
+        return current_stack_data
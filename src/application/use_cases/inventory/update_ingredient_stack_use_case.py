@@ -1,5 +1,6 @@
 from datetime import datetime
 from src.domain.models.ingredient import Ingredient, IngredientStack
+from src.shared.exceptions.custom import InvalidRequestDataException
 
 class UpdateIngredientStackUseCase:
     def __init__(self, inventory_repository, calculator_service):
@@ -13,13 +14,46 @@ class UpdateIngredientStackUseCase:
         added_at: str,
         updated_data: dict
     ):
+        stack_id = self.inventory_repository.find_ingredient_stack_id(user_uid, ingredient_name, added_at)
+
+        if stack_id is None:
+            raise ValueError(f"Ingredient stack '{ingredient_name}' not found (added at: {added_at})")
+
+        new_stack, new_meta = self._build_update(ingredient_name, updated_data)
+
+        self.inventory_repository.update_ingredient_stack_by_id(
+            user_uid=user_uid,
+            stack_id=stack_id,
+            new_stack=new_stack,
+            new_meta=new_meta
+        )
+
+    def execute_by_id(self, user_uid: str, stack_id: int, updated_data: dict):
+        existing_stack = self.inventory_repository.get_ingredient_stack_by_id(user_uid, stack_id)
+
+        if not existing_stack:
+            raise ValueError(f"Ingredient stack {stack_id} not found")
+
+        new_stack, new_meta = self._build_update(existing_stack['ingredient_name'], updated_data)
+
+        self.inventory_repository.update_ingredient_stack_by_id(
+            user_uid=user_uid,
+            stack_id=stack_id,
+            new_stack=new_stack,
+            new_meta=new_meta
+        )
+
+    def _build_update(self, ingredient_name: str, updated_data: dict):
         # ⭐ MEJORADO: Manejar ambos formatos de fecha de vencimiento
         if "expiration_date" in updated_data and updated_data["expiration_date"]:
             # Formato de reconocimiento: usar fecha pre-calculada
             expiration_date_str = updated_data["expiration_date"]
             if expiration_date_str.endswith('Z'):
                 expiration_date_str = expiration_date_str.replace('Z', '+00:00')
-            new_expiration = datetime.fromisoformat(expiration_date_str)
+            try:
+                new_expiration = datetime.fromisoformat(expiration_date_str)
+            except ValueError:
+                raise InvalidRequestDataException(details={"expiration_date": "Fecha de vencimiento inválida."})
         elif "expiration_time" in updated_data and "time_unit" in updated_data:
             # Formato manual: calcular fecha de vencimiento
             new_expiration = self.calculator_service.calculate_expiration_date(
@@ -27,7 +61,9 @@ class UpdateIngredientStackUseCase:
             )
         else:
             # Error: falta información de vencimiento
-            raise ValueError(f"Update data requires either 'expiration_date' or both 'expiration_time' and 'time_unit'")
+            raise InvalidRequestDataException(
+                "Update data requires either 'expiration_date' or both 'expiration_time' and 'time_unit'"
+            )
 
         new_stack = IngredientStack(
             quantity=updated_data["quantity"],
@@ -44,10 +80,4 @@ class UpdateIngredientStackUseCase:
             image_path=updated_data["image_path"]
         )
 
-        self.inventory_repository.update_ingredient_stack(
-            user_uid=user_uid,
-            ingredient_name=ingredient_name,
-            added_at=added_at,
-            new_stack=new_stack,
-            new_meta=new_meta
-        )
+        return new_stack, new_meta
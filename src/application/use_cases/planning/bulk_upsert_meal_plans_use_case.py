@@ -0,0 +1,49 @@
+from typing import List
+
+from src.domain.models.daily_meal_plan import DailyMealPlan, MEAL_SLOTS
+from src.shared.exceptions.custom import InvalidRequestDataException
+
+class BulkUpsertMealPlansUseCase:
+    # Mismo tope que /planning/range
+    MAX_PLANS = 366
+
+    def __init__(self, meal_plan_repository, recipe_repository, system_user_uid: str):
+        self.meal_plan_repository = meal_plan_repository
+        self.recipe_repository = recipe_repository
+        self.system_user_uid = system_user_uid
+
+    def execute(self, user_uid: str, plans: List[dict]) -> List[DailyMealPlan]:
+        """
+        Crea o reemplaza los planes de varios días de una vez.
+
+        Args:
+            user_uid: UID del usuario
+            plans: [{"date": date, "breakfast": uid o None, "lunch": ..., "dinner": ..., "dessert": ...}]
+                   Cada día enviado se reemplaza completo (un slot omitido queda vacío)
+
+        Returns:
+            List[DailyMealPlan]: Los planes guardados, ordenados por fecha
+        """
+        if len(plans) > self.MAX_PLANS:
+            raise InvalidRequestDataException(f"No se pueden guardar más de {self.MAX_PLANS} días a la vez.")
+
+        dates = [plan["date"] for plan in plans]
+        if len(set(dates)) != len(dates):
+            raise InvalidRequestDataException("Hay fechas repetidas en los planes.")
+
+        # Las recetas tienen que ser del usuario o recetas por defecto del sistema
+        recipe_uids = {plan[slot] for plan in plans for slot in MEAL_SLOTS if plan.get(slot)}
+        found = self.recipe_repository.find_existing_uids(list(recipe_uids), [user_uid, self.system_user_uid])
+        missing = sorted(recipe_uids - found)
+        if missing:
+            raise InvalidRequestDataException(
+                "Algunas recetas no existen o no pertenecen al usuario.",
+                details={"recipe_uids": missing}
+            )
+
+        print(f"📅 [MEAL PLAN BULK] User: {user_uid}, {len(plans)} days, {len(recipe_uids)} recipes")
+        self.meal_plan_repository.upsert_many(user_uid, plans)
+
+        saved = self.meal_plan_repository.get_range_by_user(user_uid, min(dates), max(dates))
+        sent = set(dates)
+        return [plan for plan in saved if plan.date in sent]
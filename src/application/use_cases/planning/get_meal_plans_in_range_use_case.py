@@ -0,0 +1,23 @@
+from datetime import date
+from typing import List
+
+from src.domain.models.daily_meal_plan import DailyMealPlan
+from src.shared.exceptions.custom import InvalidRequestDataException
+
+class GetMealPlansInRangeUseCase:
+    # Un año como máximo por consulta
+    MAX_RANGE_DAYS = 366
+
+    def __init__(self, meal_plan_repository):
+        self.meal_plan_repository = meal_plan_repository
+
+    def execute(self, user_uid: str, start_date: date, end_date: date) -> List[DailyMealPlan]:
+        self.validate_range(start_date, end_date)
+        return self.meal_plan_repository.get_range_by_user(user_uid, start_date, end_date)
+
+    @classmethod
+    def validate_range(cls, start_date: date, end_date: date) -> None:
+        if start_date > end_date:
+            raise InvalidRequestDataException("La fecha 'from' no puede ser posterior a 'to'.")
+        if (end_date - start_date).days + 1 > cls.MAX_RANGE_DAYS:
+            raise InvalidRequestDataException(f"El rango no puede superar {cls.MAX_RANGE_DAYS} días.")
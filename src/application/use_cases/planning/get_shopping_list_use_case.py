@@ -0,0 +1,115 @@
+from datetime import date, datetime, time
+from typing import Dict, Any
+
+from src.application.services.recipe_recommendation_engine import ingredient_key
+from src.application.services.unit_conversion import to_base_units
+from src.application.use_cases.planning.get_meal_plans_in_range_use_case import GetMealPlansInRangeUseCase
+
+class GetShoppingListUseCase:
+    """Lo que falta comprar para cocinar las recetas planificadas en un rango de fechas"""
+
+    def __init__(self, meal_plan_repository, inventory_repository):
+        self.meal_plan_repository = meal_plan_repository
+        self.inventory_repository = inventory_repository
+
+    def execute(self, user_uid: str, start_date: date, end_date: date) -> Dict[str, Any]:
+        """
+        Compara lo que piden las recetas planificadas con el inventario y devuelve el déficit.
+
+        Cada día consume primero los stacks que vencen antes (FEFO) y solo los que siguen vigentes ese día:
+        un stack que vence antes de un día planificado no cubre ese día.
+        Las cantidades se pasan a la unidad base de su dimensión (g, ml, unidades) antes de comparar;
+        unidades que no se pueden convertir entre sí se tratan como ingredientes distintos.
+
+        Args:
+            user_uid: UID del usuario
+            start_date: Primer día planificado (incluido)
+            end_date: Último día planificado (incluido)
+
+        Returns:
+            dict: shopping_list (déficit por ingrediente), covered (lo que alcanza) y resumen
+        """
+        GetMealPlansInRangeUseCase.validate_range(start_date, end_date)
+
+        demand = self.meal_plan_repository.get_ingredient_demand(user_uid, start_date, end_date)
+        supply = self.inventory_repository.get_stack_totals(user_uid, datetime.combine(start_date, time.min))
+        items = self.compute_deficit(demand, supply)
+
+        shopping_list = [item for item in items if item["deficit"] > 0]
+        covered = [item for item in items if item["deficit"] <= 0]
+        print(f"🛒 [SHOPPING LIST] User: {user_uid}, {start_date}..{end_date}: "
+              f"{len(items)} ingredients, {len(shopping_list)} to buy")
+
+        return {
+            "from": start_date.isoformat(),
+            "to": end_date.isoformat(),
+            "shopping_list": shopping_list,
+            "covered": covered,
+            "summary": {
+                "planned_days": len({row["date"] for row in demand}),
+                "ingredients": len(items),
+                "to_buy": len(shopping_list),
+                "covered": len(covered)
+            }
+        }
+
+    @staticmethod
+    def compute_deficit(demand: list, supply: list) -> list:
+        """
+        Args:
+            demand: [{"date", "name", "type_unit", "quantity"}] de las recetas planificadas
+            supply: [{"name", "type_unit", "expiration_date", "quantity"}] del inventario
+
+        Returns:
+            list: [{"name", "unit", "required", "available", "deficit", "needed_from"}] por ingrediente
+        """
+        # Conversión de unidades por columnas, una vez para toda la demanda y una para todo el inventario
+        demand_dims, demand_values, demand_units = to_base_units(
+            [row["quantity"] for row in demand], [row["type_unit"] for row in demand])
+        supply_dims, supply_values, _ = to_base_units(
+            [row["quantity"] for row in supply], [row["type_unit"] for row in supply])
+
+        needs = {}
+        for row, dimension, value, unit in zip(demand, demand_dims, demand_values, demand_units):
+            key = (ingredient_key(row["name"]), dimension)
+            entry = needs.setdefault(key, {"name": row["name"], "unit": unit, "days": {}})
+            entry["days"][row["date"]] = entry["days"].get(row["date"], 0.0) + value
+
+        stocks = {}
+        for row, dimension, value in zip(supply, supply_dims, supply_values):
+            expires = row["expiration_date"]
+            expires = expires.date() if isinstance(expires, datetime) else expires
+            stocks.setdefault((ingredient_key(row["name"]), dimension), []).append([expires, value])
+
+        items = []
+        for key, entry in needs.items():
+            lots = sorted(stocks.get(key, []), key=lambda lot: lot[0])
+            position, available, deficit, needed_from = 0, 0.0, 0.0, None
+            for planned_date in sorted(entry["days"]):
+                missing = entry["days"][planned_date]
+                # Los días van en orden: un stack vencido para este día tampoco sirve para los siguientes
+                while position < len(lots) and lots[position][0] < planned_date:
+                    position += 1
+                while missing > 0 and position < len(lots):
+                    used = min(missing, lots[position][1])
+                    lots[position][1] -= used
+                    missing -= used
+                    available += used
+                    if lots[position][1] <= 0:
+                        position += 1
+                if missing > 0:
+                    deficit += missing
+                    needed_from = needed_from or planned_date
+
+            required = sum(entry["days"].values())
+            items.append({
+                "name": entry["name"],
+                "unit": entry["unit"],
+                "required": round(required, 2),
+                "available": round(available, 2),
+                "deficit": round(deficit, 2),
+                "needed_from": needed_from.isoformat() if needed_from else None
+            })
+
+        items.sort(key=lambda item: (item["needed_from"] is None, item["needed_from"] or "", item["name"].lower()))
+        return items
@@ -0,0 +1,28 @@
+from datetime import datetime
+from typing import Dict
+
+from src.application.services.sustainability_ranking import RANKING_METRICS, SKETCH_SIZE, ranking_sketch_cache
+from src.shared.percentile_sketch import PercentileSketch
+
+
+class BuildSustainabilityRanking:
+    """Job periódico: resume los totales de todos los usuarios en un resumen de percentiles por métrica"""
+
+    def __init__(self, ranking_repository, sketch_size: int = SKETCH_SIZE):
+        self._ranking_repo = ranking_repository
+        self._sketch_size = sketch_size
+
+    def execute(self) -> Dict:
+        started = datetime.utcnow()
+        columns = {metric: [] for metric in RANKING_METRICS}
+        for totals in self._ranking_repo.iter_user_totals(RANKING_METRICS):
+            for metric in RANKING_METRICS:
+                columns[metric].append(totals[metric])
+
+        sketches = {metric: PercentileSketch.build(values, self._sketch_size) for metric, values in columns.items()}
+        self._ranking_repo.save_sketches({metric: sketch.to_dict() for metric, sketch in sketches.items()}, built_at=started)
+        ranking_sketch_cache.invalidate()
+
+        population = len(columns[RANKING_METRICS[0]])
+        print(f"🏆 [RANKING] Sketches built for {population} users in {(datetime.utcnow() - started).total_seconds():.2f} s")
+        return {"population": population, "built_at": started.isoformat()}
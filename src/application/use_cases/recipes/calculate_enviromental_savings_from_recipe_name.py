@@ -5,9 +5,9 @@ from src.shared.exceptions.custom import RecipeNotFoundException
 
 
 class EstimateEnvironmentalSavingsFromRecipeName:
-    def __init__(self, recipe_repository, ai_adapter, savings_repository, recipe_generated_repository=None):
+    def __init__(self, recipe_repository, impact_calculator, savings_repository, recipe_generated_repository=None):
         self._repo = recipe_repository
-        self._adapter = ai_adapter
+        self._calculator = impact_calculator
         self._savings_repo = savings_repository
         self._generated_repo = recipe_generated_repository
 
@@ -52,6 +52,17 @@ class EstimateEnvironmentalSavingsFromRecipeName:
                     'ingredients': []
                 })()
         
+        if recipe is None:
+            # Sin coincidencia exacta: receta guardada del usuario con el título más parecido
+            recipe = self._repo.find_best_match_name(recipe_title, user_uid=user_uid)
+            if recipe is not None:
+                print(f"🔎 Título '{recipe_title}' resuelto por similitud a '{recipe.title}'")
+                recipe_uid = recipe.uid
+                ingredients_data = [
+                    {"name": ing.name, "quantity": ing.quantity, "type_unit": ing.type_unit}
+                    for ing in recipe.ingredients
+                ]
+
         if recipe is None or not ingredients_data:
             raise RecipeNotFoundException(f"Recipe '{recipe_title}' not found in saved or generated recipes")
 
@@ -77,8 +88,8 @@ class EstimateEnvironmentalSavingsFromRecipeName:
                 "is_cooked": existing.is_cooked
             }
 
-        # Calcular savings usando la IA
-        savings = self._adapter.estimate_extended_environmental_savings_from_ingredients(
+        # Calcular savings con la tabla local de factores (la IA solo completa ingredientes desconocidos)
+        savings = self._calculator.estimate(
             ingredients_data
         )
 
@@ -5,9 +5,9 @@ from src.shared.exceptions.custom import RecipeNotFoundException
 
 
 class EstimateEnvironmentalSavingsFromRecipeUID:
-    def __init__(self, recipe_repository, ai_adapter, savings_repository):
+    def __init__(self, recipe_repository, impact_calculator, savings_repository):
         self._repo = recipe_repository
-        self._adapter = ai_adapter
+        self._calculator = impact_calculator
         self._savings_repo = savings_repository
 
     def execute(self, recipe_uid: str) -> Dict[str, Any]:
@@ -40,7 +40,7 @@ class EstimateEnvironmentalSavingsFromRecipeUID:
             for ing in recipe.ingredients
         ]
 
-        savings = self._adapter.estimate_extended_environmental_savings_from_ingredients(
+        savings = self._calculator.estimate(
             ingredients_payload
         )
 
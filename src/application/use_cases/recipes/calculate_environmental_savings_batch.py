@@ -0,0 +1,79 @@
+from typing import Any, Dict, List
+
+from src.domain.models.environmental_savings import EnvironmentalSavings
+from src.shared.exceptions.custom import InvalidRequestDataException
+
+
+class EstimateEnvironmentalSavingsBatch:
+    """Calcula el ahorro ambiental de varias recetas del usuario con una lectura y una escritura"""
+
+    MAX_RECIPES = 100
+
+    def __init__(self, recipe_repository, impact_calculator, savings_repository, system_user_uid: str):
+        self._repo = recipe_repository
+        self._calculator = impact_calculator
+        self._savings_repo = savings_repository
+        self._system_user_uid = system_user_uid
+
+    def execute(self, user_uid: str, recipe_uids: List[str], recompute: bool = False) -> Dict[str, Any]:
+        """
+        Args:
+            user_uid: UID del usuario (dueño de los cálculos)
+            recipe_uids: Recetas propias o por defecto a calcular
+            recompute: Recalcular también las que ya tienen cálculo guardado
+
+        Returns:
+            dict: Cálculos en el orden pedido, cuántos se calcularon y qué UIDs no se encontraron
+        """
+        uids = list(dict.fromkeys(recipe_uids))
+        if not uids or len(uids) > self.MAX_RECIPES:
+            raise InvalidRequestDataException(f"Se pueden calcular entre 1 y {self.MAX_RECIPES} recetas a la vez.")
+        print(f"🌍 [SAVINGS BATCH] User: {user_uid}, recipes: {len(uids)}, recompute: {recompute}")
+
+        # Una consulta para recetas + ingredientes y otra para los cálculos ya guardados
+        recipes = self._repo.get_ingredients_by_uids(uids, owner_uids=[user_uid, self._system_user_uid])
+        existing = self._savings_repo.find_by_user_and_recipes(user_uid, list(recipes))
+        cached = {} if recompute else existing
+
+        computed = [
+            EnvironmentalSavings(
+                user_uid=user_uid,
+                recipe_uid=uid,
+                recipe_title=recipe["title"],
+                recipe_source_type="manual",
+                # Un recálculo conserva el estado cocinado/no cocinado guardado
+                is_cooked=bool(uid in existing and existing[uid].is_cooked),
+                **self._calculator.estimate(recipe["ingredients"])
+            )
+            for uid, recipe in recipes.items()
+            if uid not in cached
+        ]
+        if computed:
+            self._savings_repo.save_many(computed)
+
+        results = {savings.recipe_uid: (savings, False) for savings in computed}
+        results.update({uid: (savings, True) for uid, savings in cached.items()})
+
+        return {
+            "calculations": [self._to_dict(*results[uid]) for uid in uids if uid in results],
+            "computed": len(computed),
+            "cached": len(cached),
+            "not_found": [uid for uid in uids if uid not in recipes]
+        }
+
+    @staticmethod
+    def _to_dict(savings: EnvironmentalSavings, cached: bool) -> Dict[str, Any]:
+        return {
+            "recipe_uid": savings.recipe_uid,
+            "recipe_title": savings.recipe_title,
+            "carbon_footprint": savings.carbon_footprint,
+            "water_footprint": savings.water_footprint,
+            "energy_footprint": savings.energy_footprint,
+            "economic_cost": savings.economic_cost,
+            "unit_carbon": savings.unit_carbon,
+            "unit_water": savings.unit_water,
+            "unit_energy": savings.unit_energy,
+            "unit_cost": savings.unit_cost,
+            "is_cooked": savings.is_cooked,
+            "cached": cached
+        }
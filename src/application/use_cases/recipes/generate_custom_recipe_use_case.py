@@ -8,7 +8,7 @@ class GenerateCustomRecipeUseCase:
     def execute(self, user_uid: str, custom_ingredients: List[str], preferences: List[str] = None, num_recipes: int = 2, recipe_categories: List[str] = None) -> Dict[str, Any]:
         # Obtener preferencias del usuario desde Firestore
         firestore_service = make_firestore_profile_service()
-        user_profile = firestore_service.get_profile(user_uid)
+        user_profile = firestore_service.get_profile(user_uid, allow_partial=False)
         
         # Filtrar ingredientes según alergias del usuario
         filtered_ingredients = []
@@ -64,6 +64,7 @@ class GenerateCustomRecipeUseCase:
         
         # Estructura los datos para la generación personalizada
         generation_data = {
+            "user_uid": user_uid,
             "ingredients": [{"name": ingredient, "quantity": "Al gusto", "unit": "porción"} for ingredient in filtered_ingredients],
             "priorities": filtered_ingredients,  # Priorizamos todos los ingredientes ingresados (ya filtrados)
             "preferences": combined_preferences,
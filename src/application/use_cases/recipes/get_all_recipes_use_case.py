@@ -1,9 +1,34 @@
-from typing import List
-from src.domain.models.recipe import Recipe
+from datetime import datetime
+from typing import Optional
+from src.shared.pagination import encode_cursor, decode_cursor
 
 class GetAllRecipesUseCase:
+    # Las recetas se listan de la más reciente a la más antigua
+    SORT = "saved_at"
+    # Clave del cursor: [saved_at, uid] (ver RecipeRepositoryImpl.get_page)
+    CURSOR_KEY = (datetime, str)
+
     def __init__(self, recipe_repository):
         self.recipe_repository = recipe_repository
 
-    def execute(self) -> List[Recipe]:
-        return self.recipe_repository.get_all()
\ No newline at end of file
+    def execute(self, cursor: Optional[str] = None, limit: Optional[int] = None, summary: bool = False) -> dict:
+        """
+        Obtiene las recetas de todos los usuarios, paginadas por cursor.
+
+        Args:
+            cursor: Cursor devuelto como next_cursor por la página anterior
+            limit: Tamaño de página (sin límite si no se indica)
+            summary: Solo título, categoría, duración e imagen (sin ingredientes ni pasos)
+
+        Returns:
+            dict: {"recipes": [...], "next_cursor": str o None}
+        """
+        page = self.recipe_repository.get_page(
+            after=decode_cursor(cursor, self.SORT, self.CURSOR_KEY) if cursor else None,
+            limit=limit,
+            summary=summary
+        )
+        return {
+            "recipes": page['recipes'],
+            "next_cursor": encode_cursor(self.SORT, page['next_key']) if page['next_key'] else None
+        }
@@ -0,0 +1,95 @@
+from typing import Optional
+from src.shared.precompressed import PrecompressedPayload, build_payload
+
+
+class GetDefaultRecipesUseCase:
+    # Mapeo de las categorías de la query a las categorías guardadas en base de datos
+    CATEGORY_MAPPING = {
+        'destacadas': ['almuerzo', 'cena', 'ensalada'],
+        'rapidas_faciles': ['almuerzo', 'desayuno'],
+        'vegetarianas': ['cena', 'ensalada', 'almuerzo'],
+        'postres': ['postre'],
+        'saludables': ['almuerzo', 'cena']
+    }
+
+    def __init__(self, recipe_repository, cache, system_user_uid: str):
+        self.recipe_repository = recipe_repository
+        self.cache = cache
+        self.system_user_uid = system_user_uid
+
+    def execute(self, category: Optional[str] = None) -> PrecompressedPayload:
+        """
+        Obtiene la respuesta ya serializada y comprimida de las recetas por defecto.
+        Las categorías desconocidas se tratan como "sin filtro", así el cache tiene un número fijo de entradas.
+
+        Args:
+            category: Filtro de categoría de la query (destacadas, rapidas_faciles, ...)
+
+        Returns:
+            PrecompressedPayload: Cuerpo JSON en identity/gzip/brotli con su ETag
+        """
+        key = category if category in self.CATEGORY_MAPPING else None
+        return self.cache.get(
+            key,
+            version_loader=lambda: self.recipe_repository.get_user_recipes_version(self.system_user_uid),
+            builder=self._build_all
+        )
+
+    def _build_all(self) -> tuple:
+        # Una sola lectura (recetas + ingredientes + pasos) para todas las variantes
+        recipes = self.recipe_repository.get_page(user_uid=self.system_user_uid)['recipes']
+        serialized = [self._serialize(recipe) for recipe in recipes]
+
+        entries = {None: self._build_payload(serialized, None)}
+        for category, db_categories in self.CATEGORY_MAPPING.items():
+            entries[category] = self._build_payload(
+                [recipe for recipe in serialized if recipe["category"] in db_categories],
+                category
+            )
+        return entries, {recipe.uid for recipe in recipes}
+
+    @staticmethod
+    def _build_payload(recipes: list, category: Optional[str]) -> PrecompressedPayload:
+        if not recipes:
+            return build_payload({
+                "message": "No default recipes found",
+                "default_recipes": [],
+                "total_recipes": 0
+            }, status=404)
+
+        categories_count = {}
+        for recipe in recipes:
+            categories_count[recipe["category"]] = categories_count.get(recipe["category"], 0) + 1
+
+        return build_payload({
+            "default_recipes": recipes,
+            "categories_summary": categories_count,
+            "total_recipes": len(recipes),
+            "filter_applied": {
+                "category": category
+            }
+        })
+
+    @staticmethod
+    def _serialize(recipe) -> dict:
+        return {
+            "uid": recipe.uid,
+            "title": recipe.title,
+            "duration": recipe.duration,
+            "difficulty": recipe.difficulty,
+            "category": recipe.category,
+            "description": recipe.description,
+            "ingredients": [
+                {"name": ing.name, "quantity": ing.quantity, "type_unit": ing.type_unit}
+                for ing in recipe.ingredients
+            ],
+            "steps": [
+                {"step_order": step.step_order, "description": step.description}
+                for step in recipe.steps
+            ],
+            "footer": recipe.footer,
+            "generated_by_ai": recipe.generated_by_ai,
+            "image_status": recipe.image_status,
+            "image_path": recipe.image_path,
+            "saved_at": recipe.saved_at.isoformat() if recipe.saved_at else None
+        }
@@ -0,0 +1,81 @@
+from datetime import datetime
+from typing import Dict, Any
+
+
+class GetRecipeRecommendationsUseCase:
+    """Recomienda recetas guardadas/por defecto según el inventario, sin llamar a la IA"""
+
+    # Misma regla que PrepareRecipeGenerationDataUseCase: se prioriza lo que vence en 7 días o menos
+    PRIORITY_DAYS = 7
+    PRIORITY_WEIGHT = 0.5
+    GENERATE_ENDPOINT = "/api/recipes/generate-from-inventory"
+
+    def __init__(self, inventory_repository, recipe_repository, profile_service, matrix_cache, system_user_uid: str):
+        self.inventory_repository = inventory_repository
+        self.recipe_repository = recipe_repository
+        self.profile_service = profile_service
+        self.matrix_cache = matrix_cache
+        self.system_user_uid = system_user_uid
+
+    def execute(self, user_uid: str, limit: int = 10, min_coverage: float = 0.5) -> Dict[str, Any]:
+        """
+        Rankea el catálogo de recetas por cobertura del inventario del usuario.
+
+        Args:
+            user_uid: UID del usuario
+            limit: Cantidad máxima de recomendaciones
+            min_coverage: Fracción mínima de ingredientes de la receta que el usuario debe tener
+
+        Returns:
+            dict: Recomendaciones y si conviene generar con IA (ninguna coincidencia local suficiente)
+        """
+        print(f"🧮 [RECOMMENDATIONS] User: {user_uid}, limit: {limit}, min_coverage: {min_coverage}")
+
+        inventory = self.inventory_repository.get_by_user_uid(user_uid)
+        if not inventory:
+            raise ValueError("Inventory not found for user")
+
+        held = {}
+        now = datetime.utcnow()
+        for ingredient in inventory.ingredients.values():
+            if not ingredient.stacks:
+                continue
+            held[ingredient.name] = any(
+                (stack.expiration_date - now).days <= self.PRIORITY_DAYS for stack in ingredient.stacks
+            )
+
+        allergies = self._allergies(self.profile_service.get_profile(user_uid, allow_partial=False))
+
+        # Solo las recetas propias y las por defecto; nunca las guardadas por otros usuarios
+        owner_uids = [user_uid, self.system_user_uid]
+        matrix = self.matrix_cache.get(
+            scope=user_uid,
+            version_loader=lambda: tuple(self.recipe_repository.get_user_recipes_version(uid) for uid in owner_uids),
+            catalog_loader=lambda: self.recipe_repository.get_recommendation_catalog(owner_uids)
+        )
+        recommendations = matrix.score(held, allergies, min_coverage, limit, self.PRIORITY_WEIGHT) if held else []
+
+        print(f"   └─ {len(held)} ingredients vs {len(matrix)} recipes -> {len(recommendations)} recommendations")
+
+        return {
+            "recommendations": recommendations,
+            "count": len(recommendations),
+            "catalog_size": len(matrix),
+            "priority_ingredients": sorted(name for name, is_priority in held.items() if is_priority),
+            "allergies_filtered": allergies,
+            "generation_suggested": not recommendations,
+            "generate_endpoint": self.GENERATE_ENDPOINT
+        }
+
+    @staticmethod
+    def _allergies(user_profile) -> list:
+        # Mismos campos que la generación con IA: "allergies" y "allergyItems" (strings o dicts)
+        if not user_profile:
+            return []
+        allergies = []
+        for item in (user_profile.get("allergies") or []) + (user_profile.get("allergyItems") or []):
+            if isinstance(item, dict):
+                item = item.get('name') or item.get('label') or item.get('value')
+            if isinstance(item, str) and item.strip():
+                allergies.append(item)
+        return allergies
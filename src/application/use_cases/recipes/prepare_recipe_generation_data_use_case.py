@@ -16,7 +16,7 @@ class PrepareRecipeGenerationDataUseCase:
 
         # Obtener preferencias del usuario desde Firestore
         firestore_service = make_firestore_profile_service()
-        user_profile = firestore_service.get_profile(user_uid)
+        user_profile = firestore_service.get_profile(user_uid, allow_partial=False)
         
         print(f"🍳 [RECIPE PREP] User profile keys: {list(user_profile.keys()) if user_profile else 'None'}")
         if user_profile:
@@ -96,6 +96,7 @@ class PrepareRecipeGenerationDataUseCase:
                 # Continuar con preferencias vacías en caso de error
 
         return {
+            "user_uid": user_uid,
             "ingredients": ingredients,
             "priorities": list(priority_names),
             "preferences": preferences,
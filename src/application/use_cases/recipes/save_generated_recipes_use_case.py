@@ -0,0 +1,49 @@
+import uuid
+from datetime import datetime, timezone
+from typing import Dict, Any
+from src.domain.models.generation import Generation
+from src.application.use_cases.recipes.save_recipe_use_case import SaveRecipeUseCase
+
+
+class SaveGeneratedRecipesUseCase:
+    """Guarda una generación completa (generations, recipes_generated y las recetas del usuario) en una transacción"""
+
+    def __init__(self, recipe_repository, recipe_generated_repository):
+        self.recipe_repository = recipe_repository
+        self.recipe_generated_repository = recipe_generated_repository
+
+    def execute(self, user_uid: str, generation_result: Dict[str, Any], generation_type: str = "inventory") -> Dict[str, Any]:
+        """
+        Args:
+            user_uid: UID del usuario
+            generation_result: Resultado de la generación (con "generated_recipes")
+            generation_type: "inventory" o "custom"
+
+        Returns:
+            dict: generation_id, recetas guardadas (Recipe) y UIDs de recipes_generated
+        """
+        recipes_data = generation_result.get("generated_recipes", [])
+        generation_id = str(uuid.uuid4())
+
+        recipes = [SaveRecipeUseCase.build_recipe(user_uid, recipe_data) for recipe_data in recipes_data]
+        generated_rows = [
+            self.recipe_generated_repository.build_generated_row(user_uid, generation_id, recipe_data, generation_type)
+            for recipe_data in recipes_data
+        ]
+        generation = Generation(
+            uid=generation_id,
+            user_uid=user_uid,
+            generated_at=datetime.now(timezone.utc),
+            raw_result=generation_result,
+            generation_type=generation_type,
+            recipes_ids=[recipe.uid for recipe in recipes]
+        )
+
+        print(f"💾 [SAVE GENERATED] Saving generation {generation_id} with {len(recipes)} recipes in one transaction")
+        self.recipe_repository.save_many(recipes, generation=generation, generated_rows=generated_rows)
+
+        return {
+            "generation_id": generation_id,
+            "recipes": recipes,
+            "generated_recipe_uids": [row["uid"] for row in generated_rows]
+        }
@@ -13,7 +13,16 @@ class SaveRecipeUseCase:
         #    raise InvalidRequestDataException("Ya tienes una receta guardada con este título")
 
         # Crear la receta
-        recipe = Recipe(
+        recipe = self.build_recipe(user_uid, recipe_data)
+
+        # Guardar en el repositorio
+        self.recipe_repository.save(recipe)
+        
+        return recipe
+
+    @staticmethod
+    def build_recipe(user_uid: str, recipe_data: dict) -> Recipe:
+        return Recipe(
             uid=str(uuid.uuid4()),
             user_uid=user_uid,
             title=recipe_data["title"],
@@ -27,9 +36,4 @@ class SaveRecipeUseCase:
             category=recipe_data.get("category", ""),
             image_path=recipe_data.get("", None),
             description=recipe_data.get("description", ""),
-        )
-
-        # Guardar en el repositorio
-        self.recipe_repository.save(recipe)
-        
-        return recipe 
\ No newline at end of file
+        ) 
\ No newline at end of file
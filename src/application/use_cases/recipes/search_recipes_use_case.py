@@ -0,0 +1,52 @@
+from typing import Optional
+from src.shared.inverted_index import tokenize
+from src.shared.pagination import encode_cursor, decode_cursor
+from src.shared.exceptions.custom import InvalidRequestDataException
+
+class SearchRecipesUseCase:
+    # El orden es por relevancia: el cursor guarda la posición y queda atado a la consulta
+    SORT = "relevance"
+
+    def __init__(self, recipe_repository):
+        self.recipe_repository = recipe_repository
+
+    def execute(self, user_uid: str, query: str, scope: str = "all", cursor: Optional[str] = None, limit: int = 20) -> dict:
+        """
+        Busca recetas por título, descripción e ingredientes.
+
+        Args:
+            user_uid: UID del usuario
+            query: Texto buscado (sin distinguir acentos ni mayúsculas)
+            scope: "all" (todas las recetas, como /recipes/all) o "saved" (solo las del usuario)
+            cursor: Cursor devuelto como next_cursor por la página anterior
+            limit: Tamaño de página
+
+        Returns:
+            dict: {"results": [(Recipe, score)], "terms": [...], "next_cursor": str o None}
+        """
+        terms = tokenize(query)
+        sort = f"{self.SORT}:{' '.join(terms)}"
+        offset = self._decode_offset(cursor, sort) if cursor else 0
+
+        if not terms:
+            return {"results": [], "terms": [], "next_cursor": None}
+
+        page = self.recipe_repository.search(
+            query,
+            user_uid=user_uid if scope == "saved" else None,
+            offset=offset,
+            limit=limit
+        )
+        print(f"🔍 [RECIPE SEARCH] '{query}' ({scope}) -> {len(page['results'])} results from offset {offset}")
+        return {
+            "results": page['results'],
+            "terms": terms,
+            "next_cursor": encode_cursor(sort, [offset + limit]) if page['has_more'] else None
+        }
+
+    @staticmethod
+    def _decode_offset(cursor: str, sort: str) -> int:
+        key = decode_cursor(cursor, sort)
+        if len(key) != 1 or not isinstance(key[0], int) or key[0] < 0:
+            raise InvalidRequestDataException(details={"cursor": "Cursor inválido."})
+        return key[0]
@@ -1,42 +1,64 @@
-from typing import Dict
+from typing import Dict, List, Optional
 from src.domain.repositories.environmental_savings_repository import EnvironmentalSavingsRepository
-from src.domain.models.environmental_savings import EnvironmentalSavings
 
 
 class SumEnvironmentalCalculationsByUser:
+    DEFAULT_UNITS = {
+        "unit_carbon": "kg CO2e",
+        "unit_water": "litros",
+        "unit_energy": "kWh",
+        "unit_cost": "S/"
+    }
+
     def __init__(self, savings_repository: EnvironmentalSavingsRepository):
         self._savings_repo = savings_repository
 
-    def execute(self, user_uid: str) -> Dict:
-        calculations = self._savings_repo.find_by_user(user_uid)
-
-        if not calculations:
-            return {
-                "total_carbon_footprint": 0.0,
-                "total_water_footprint": 0.0,
-                "total_energy_footprint": 0.0,
-                "total_economic_cost": 0.0,
-                "unit_carbon": "kg CO2e",
-                "unit_water": "litros",
-                "unit_energy": "kWh",
-                "unit_cost": "S/"
-            }
-
-        total_carbon = sum(calc.carbon_footprint for calc in calculations)
-        total_water = sum(calc.water_footprint for calc in calculations)
-        total_energy = sum(calc.energy_footprint for calc in calculations)
-        total_cost = sum(calc.economic_cost for calc in calculations)
+    def execute(self, user_uid: str, is_cooked: Optional[bool] = None) -> Dict:
+        # La base de datos devuelve un grupo por (is_cooked, recipe_source_type): a lo sumo cuatro filas
+        groups = self._savings_repo.get_totals_by_user(user_uid, is_cooked=is_cooked)
+        return self.summarize(groups)
+
+    @classmethod
+    def summarize(cls, groups: List[Dict]) -> Dict:
+        """
+        Arma el resumen a partir de los totales agrupados del repositorio.
+
+        Returns:
+            dict: Totales generales, unidades y desgloses por estado y por tipo de receta
+        """
+        by_status = {
+            key: cls.totals([group for group in groups if group["is_cooked"] == status])
+            for status, key in ((True, "cooked"), (False, "not_cooked"))
+        }
+        by_source = {
+            source: cls.totals([group for group in groups if group["recipe_source_type"] == source])
+            for source in sorted({group["recipe_source_type"] for group in groups})
+        }
+
+        totals = cls.totals(groups)
 
         # Suponemos que las unidades son iguales para todas las entradas
-        sample = calculations[0]
+        units = dict(cls.DEFAULT_UNITS)
+        if groups:
+            units.update({unit: groups[0][unit] for unit in cls.DEFAULT_UNITS if groups[0].get(unit)})
+
+        return {
+            "total_carbon_footprint": totals["carbon_footprint"],
+            "total_water_footprint": totals["water_footprint"],
+            "total_energy_footprint": totals["energy_footprint"],
+            "total_economic_cost": totals["economic_cost"],
+            **units,
+            "total_calculations": totals["count"],
+            "by_status": by_status,
+            "by_source_type": by_source
+        }
 
+    @staticmethod
+    def totals(groups: List[Dict]) -> Dict:
         return {
-            "total_carbon_footprint": round(total_carbon, 2),
-            "total_water_footprint": round(total_water, 1),
-            "total_energy_footprint": round(total_energy, 2),
-            "total_economic_cost": round(total_cost, 2),
-            "unit_carbon": sample.unit_carbon,
-            "unit_water": sample.unit_water,
-            "unit_energy": sample.unit_energy,
-            "unit_cost": sample.unit_cost
-        }
\ No newline at end of file
+            "count": sum(group["count"] for group in groups),
+            "carbon_footprint": round(sum((float(group["carbon_footprint"]) for group in groups), 0.0), 2),
+            "water_footprint": round(sum((float(group["water_footprint"]) for group in groups), 0.0), 1),
+            "energy_footprint": round(sum((float(group["energy_footprint"]) for group in groups), 0.0), 2),
+            "economic_cost": round(sum((float(group["economic_cost"]) for group in groups), 0.0), 2)
+        }
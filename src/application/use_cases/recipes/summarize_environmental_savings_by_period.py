@@ -0,0 +1,87 @@
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional
+
+from src.application.services.sustainability_ranking import CachedRankingSketches, rank_totals, ranking_sketch_cache
+from src.application.use_cases.recipes.sum_environmental_calculations_by_user import SumEnvironmentalCalculationsByUser
+from src.domain.repositories.environmental_savings_repository import EnvironmentalSavingsRepository
+
+
+class SummarizeEnvironmentalSavingsByPeriod:
+    """Resumen del dashboard (totales, tendencia mensual, semanas y mes contra mes) leído de los buckets precalculados"""
+
+    MONTHS = 12
+    WEEKS = 8
+    METRICS = ("carbon_footprint", "water_footprint", "energy_footprint", "economic_cost")
+
+    def __init__(self, savings_repository: EnvironmentalSavingsRepository, ranking_repository=None,
+                 ranking_cache: CachedRankingSketches = ranking_sketch_cache):
+        self._savings_repo = savings_repository
+        self._ranking_repo = ranking_repository
+        self._ranking_cache = ranking_cache
+
+    def execute(self, user_uid: str, today: Optional[date] = None) -> Dict:
+        today = today or datetime.utcnow().date()
+        first_week = today - timedelta(days=today.weekday(), weeks=self.WEEKS - 1)
+
+        # Una consulta: todos los meses del usuario y los días de las últimas semanas
+        buckets = self._savings_repo.get_rollups(user_uid, days_since=first_week)
+        months = [bucket for bucket in buckets if bucket["period"] == "month"]
+        days = [bucket for bucket in buckets if bucket["period"] == "day"]
+
+        summary = SumEnvironmentalCalculationsByUser.summarize(months)
+        summary["monthly_trends"] = self._monthly_trends(months, today)
+        summary["weekly_breakdown"] = self._weekly_breakdown(days, first_week)
+        summary["period_comparison"] = self._period_comparison(summary["monthly_trends"])
+        if self._ranking_repo is not None:
+            # Búsqueda O(log k) en el resumen precalculado; no se consulta a los demás usuarios
+            sketches, built_at = self._ranking_cache.get(self._ranking_repo.load_sketches)
+            summary["ranking"] = rank_totals(
+                {"carbon_footprint": summary["total_carbon_footprint"], "water_footprint": summary["total_water_footprint"]},
+                sketches, built_at, datetime.utcnow()
+            )
+        return summary
+
+    @classmethod
+    def _period_totals(cls, buckets: List[Dict]) -> Dict:
+        totals = SumEnvironmentalCalculationsByUser.totals(buckets)
+        totals["cooked_count"] = sum(bucket["count"] for bucket in buckets if bucket["is_cooked"])
+        return totals
+
+    @classmethod
+    def _monthly_trends(cls, months: List[Dict], today: date) -> List[Dict]:
+        """Últimos MONTHS meses, del más antiguo al actual, incluidos los meses sin actividad"""
+        starts = []
+        month = today.replace(day=1)
+        for _ in range(cls.MONTHS):
+            starts.append(month)
+            month = (month - timedelta(days=1)).replace(day=1)
+
+        return [
+            {"month": start.strftime("%Y-%m"), **cls._period_totals([b for b in months if b["bucket_start"] == start])}
+            for start in reversed(starts)
+        ]
+
+    @classmethod
+    def _weekly_breakdown(cls, days: List[Dict], first_week: date) -> List[Dict]:
+        """Últimas WEEKS semanas ISO (lunes a domingo) armadas con los buckets diarios"""
+        weeks = []
+        for offset in range(cls.WEEKS):
+            start = first_week + timedelta(weeks=offset)
+            end = start + timedelta(days=7)
+            year, week, _ = start.isocalendar()
+            weeks.append({
+                "week": f"{year}-W{week:02d}",
+                "start_date": start.isoformat(),
+                **cls._period_totals([b for b in days if start <= b["bucket_start"] < end])
+            })
+        return weeks
+
+    @classmethod
+    def _period_comparison(cls, monthly_trends: List[Dict]) -> Dict:
+        """Mes actual contra el anterior; el cambio es porcentual y None si el mes anterior no tiene datos"""
+        previous, current = monthly_trends[-2], monthly_trends[-1]
+        change = {}
+        for metric in ("count",) + cls.METRICS:
+            base = previous[metric]
+            change[metric] = round((current[metric] - base) / base * 100, 1) if base else None
+        return {"current_month": current, "previous_month": previous, "change_pct": change}
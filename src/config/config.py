@@ -23,6 +23,7 @@ class Config:
 
     GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
     FIREBASE_CREDENTIALS_PATH = os.getenv("FIREBASE_CREDENTIALS_PATH")
+    FIREBASE_PROJECT_ID = os.getenv("FIREBASE_PROJECT_ID")  # Si falta, se lee de las credenciales
     FIREBASE_STORAGE_BUCKET = os.getenv("FIREBASE_STORAGE_BUCKET")
     INTERNAL_SECRET_KEY = os.getenv("INTERNAL_SECRET_KEY")
 
@@ -2,6 +2,9 @@ from datetime import date
 from typing import Optional
 from .recipe import Recipe
 
+# Comidas de un día, en el orden en que se muestran
+MEAL_SLOTS = ("breakfast", "lunch", "dinner", "dessert")
+
 class DailyMealPlan:
     def __init__(
         self,
@@ -16,8 +16,10 @@ class FoodItem:
         serving_quantity: int,
         image_path: str,
         added_at: datetime,
-        expiration_date: datetime
+        expiration_date: datetime,
+        id: Optional[int] = None
     ):
+        self.id = id
         self.name = name
         self.main_ingredients = main_ingredients
         self.category = category
@@ -2,7 +2,8 @@ from datetime import datetime
 from typing import List, Optional
 
 class IngredientStack:
-    def __init__(self, quantity: float, type_unit: str, expiration_date: datetime, added_at: datetime):
+    def __init__(self, quantity: float, type_unit: str, expiration_date: datetime, added_at: datetime, id: Optional[int] = None):
+        self.id = id
         self.quantity = quantity
         self.type_unit = type_unit
         self.expiration_date = expiration_date
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import date
+from typing import Dict, List, Optional
 from src.domain.models.environmental_savings import EnvironmentalSavings
 
 class EnvironmentalSavingsRepository(ABC):
@@ -7,6 +8,14 @@ class EnvironmentalSavingsRepository(ABC):
     def save(self, savings: EnvironmentalSavings) -> Optional[EnvironmentalSavings]:
         pass
 
+    @abstractmethod
+    def save_many(self, savings_list: List[EnvironmentalSavings]) -> List[EnvironmentalSavings]:
+        pass
+
+    @abstractmethod
+    def find_by_user_and_recipes(self, user_uid: str, recipe_uids: List[str]) -> Dict[str, EnvironmentalSavings]:
+        pass
+
     @abstractmethod
     def find_by_user(self, user_uid: str) -> List[EnvironmentalSavings]:
         pass
@@ -21,3 +30,15 @@ class EnvironmentalSavingsRepository(ABC):
     @abstractmethod
     def find_by_user_and_by_is_cooked(self, user_uid: str, is_cooked: bool) -> List[EnvironmentalSavings]:
         pass
+
+    @abstractmethod
+    def get_totals_by_user(self, user_uid: str, is_cooked: Optional[bool] = None) -> List[Dict]:
+        pass
+
+    @abstractmethod
+    def get_rollups(self, user_uid: str, days_since: date) -> List[Dict]:
+        pass
+
+    @abstractmethod
+    def rebuild_rollups(self, user_uid: Optional[str] = None, chunk_size: int = 1000) -> int:
+        pass
@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+from typing import Dict
+
+
+class IngredientImpactFactorRepository(ABC):
+    @abstractmethod
+    def find_all(self) -> Dict[str, Dict]:
+        pass
+
+    @abstractmethod
+    def save_many(self, factors: Dict[str, Dict], source: str = "ai") -> None:
+        pass
@@ -28,4 +28,57 @@ class InventoryRepository(ABC):
         pass
 
     def update_ingredient_stack(self, user_uid: str, ingredient_name: str, added_at: str, new_stack, new_meta) -> None:
-        pass
\ No newline at end of file
+        pass
+
+    def find_ingredient_stack_id(self, user_uid: str, ingredient_name: str, added_at) -> Optional[int]:
+        pass
+
+    def find_food_item_id(self, user_uid: str, food_name: str, added_at) -> Optional[int]:
+        pass
+
+    def get_ingredient_stack_by_id(self, user_uid: str, stack_id: int) -> Optional[dict]:
+        pass
+
+    def update_ingredient_stack_by_id(self, user_uid: str, stack_id: int, new_stack, new_meta) -> None:
+        pass
+
+    def delete_ingredient_stack_by_id(self, user_uid: str, stack_id: int) -> None:
+        pass
+
+    def get_food_item_by_id(self, user_uid: str, food_id: int) -> Optional[dict]:
+        pass
+
+    def update_food_item_by_id(self, user_uid: str, food_id: int, food_item) -> None:
+        pass
+
+    def delete_food_item_by_id(self, user_uid: str, food_id: int) -> None:
+        pass
+
+    def consume_ingredient_stack_by_id(self, user_uid: str, stack_id: int, quantity: Optional[float] = None) -> Optional[dict]:
+        pass
+
+    def consume_ingredients_fifo(self, user_uid: str, requested: list, allow_partial: bool = False) -> dict:
+        pass
+
+    def get_ingredients_page(self, user_uid: str, sort: str = "name", after: Optional[list] = None, limit: Optional[int] = None,
+                             storage_type: Optional[str] = None, expired: Optional[bool] = None,
+                             expiring_within_days: Optional[int] = None, optional_columns: Optional[tuple] = None) -> dict:
+        pass
+
+    def get_food_items_page(self, user_uid: str, sort: str = "expiration", after: Optional[list] = None, limit: Optional[int] = None,
+                            storage_type: Optional[str] = None, category: Optional[str] = None, expired: Optional[bool] = None,
+                            expiring_within_days: Optional[int] = None, optional_columns: Optional[tuple] = None) -> dict:
+        pass
+
+    def get_changes_since(self, user_uid: str, since: int, limit: int) -> dict:
+        pass
+
+    def get_sync_entities(self, user_uid: str, ingredient_names: Optional[list] = None, stack_ids: Optional[list] = None,
+                          food_ids: Optional[list] = None) -> dict:
+        pass
+
+    def prune_inventory_changes(self, older_than) -> int:
+        pass
+
+    def get_stack_totals(self, user_uid: str, usable_from) -> list:
+        pass
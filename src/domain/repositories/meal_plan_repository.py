@@ -24,3 +24,14 @@ class MealPlanRepository(ABC):
     def get_all_dates_by_user(self, user_uid: str) -> list[date]:
         pass
 
+    @abstractmethod
+    def get_range_by_user(self, user_uid: str, start_date: date, end_date: date) -> list[DailyMealPlan]:
+        pass
+
+    @abstractmethod
+    def upsert_many(self, user_uid: str, plans: list[dict]) -> None:
+        pass
+
+    @abstractmethod
+    def get_ingredient_demand(self, user_uid: str, start_date: date, end_date: date) -> list:
+        pass
@@ -1,20 +1,49 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Optional, List
 from src.domain.models.recipe import Recipe
+from src.domain.models.generation import Generation
 
 class RecipeRepository(ABC):
     @abstractmethod
     def save(self, recipe: Recipe) -> str:
         pass
 
+    @abstractmethod
+    def save_many(self, recipes: List[Recipe], generation: Optional[Generation] = None, generated_rows: Optional[List[dict]] = None) -> List[str]:
+        pass
+
     @abstractmethod
     def find_by_uid(self, uid: str) -> Optional[Recipe]:
         pass
 
+    @abstractmethod
+    def find_existing_uids(self, uids: list, owner_uids: list) -> set:
+        pass
+
+    @abstractmethod
+    def get_ingredients_by_uids(self, uids: list, owner_uids: list) -> dict:
+        pass
+
     @abstractmethod
     def find_by_name(self, name: str) -> Optional[Recipe]:
         pass
 
     @abstractmethod
-    def find_best_match_name(self, name_query: str) -> Optional[Recipe]:
-        pass
\ No newline at end of file
+    def find_best_match_name(self, name_query: str, user_uid: Optional[str] = None) -> Optional[Recipe]:
+        pass
+
+    @abstractmethod
+    def search(self, query: str, user_uid: Optional[str] = None, offset: int = 0, limit: int = 20) -> dict:
+        pass
+
+    @abstractmethod
+    def get_page(self, user_uid: Optional[str] = None, after: Optional[list] = None, limit: Optional[int] = None, summary: bool = False) -> dict:
+        pass
+
+    @abstractmethod
+    def get_user_recipes_version(self, user_uid: Optional[str]) -> tuple:
+        pass
+
+    @abstractmethod
+    def get_recommendation_catalog(self, owner_uids: List[str]) -> list:
+        pass
@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Dict, Iterator, Tuple
+
+
+class SustainabilityRankingRepository(ABC):
+    @abstractmethod
+    def iter_user_totals(self, metrics: Tuple[str, ...]) -> Iterator[Dict]:
+        pass
+
+    @abstractmethod
+    def save_sketches(self, sketches: Dict[str, Dict], built_at: datetime) -> None:
+        pass
+
+    @abstractmethod
+    def load_sketches(self) -> Dict[str, Dict]:
+        pass
@@ -1,7 +1,9 @@
 import hashlib
 import json
 import logging
-from typing import Optional, Dict, Any
+import threading
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
 from src.config.config import Config
 
@@ -20,6 +22,13 @@ class AIResponseCacheService:
         }
         self.hit_count = 0
         self.miss_count = 0
+        # Signature-based lookups (see get_cached_generation)
+        self.similarity_threshold_same_user = 0.8
+        self.similarity_threshold_other_users = 0.95
+        self.max_signatures_per_context = 200
+        self.operation_stats: Dict[str, Dict[str, int]] = {}
+        self._signatures: Dict[str, OrderedDict] = {}
+        self._signatures_lock = threading.Lock()
     
     def _initialize_cache(self):
         """Initialize cache backend (Redis or in-memory fallback)"""
@@ -55,28 +64,28 @@ class AIResponseCacheService:
         cache_key = f"ai_response:{hashlib.md5(content.encode()).hexdigest()}"
         return cache_key
     
+    def _read(self, cache_key: str) -> Optional[str]:
+        """Raw cache read, without touching hit/miss counters"""
+        if isinstance(self.cache, dict):
+            entry = self.cache.get(cache_key)
+            if entry is None:
+                return None
+            if datetime.now() < entry['expires_at']:
+                return entry['response']
+            del self.cache[cache_key]  # Expired entry
+            return None
+        return self.cache.get(cache_key)
+
     def get_cached_response(self, operation_type: str, prompt: str, **kwargs) -> Optional[str]:
         """Get cached AI response if available"""
         try:
             cache_key = self._get_cache_key(operation_type, prompt, **kwargs)
-            
-            if isinstance(self.cache, dict):
-                # In-memory cache
-                if cache_key in self.cache:
-                    entry = self.cache[cache_key]
-                    if datetime.now() < entry['expires_at']:
-                        self.hit_count += 1
-                        logger.info(f"🎯 Cache HIT for {operation_type} (in-memory)")
-                        return entry['response']
-                    else:
-                        del self.cache[cache_key]  # Expired entry
-            else:
-                # Redis cache
-                cached_response = self.cache.get(cache_key)
-                if cached_response:
-                    self.hit_count += 1
-                    logger.info(f"🎯 Cache HIT for {operation_type} (Redis)")
-                    return cached_response
+            cached_response = self._read(cache_key)
+
+            if cached_response is not None:
+                self.hit_count += 1
+                logger.info(f"🎯 Cache HIT for {operation_type} ({self._backend_name()})")
+                return cached_response
             
             self.miss_count += 1
             logger.info(f"💾 Cache MISS for {operation_type}")
@@ -86,36 +95,146 @@ class AIResponseCacheService:
             logger.warning(f"⚠️ Cache get error: {e}")
             self.miss_count += 1
             return None
-    
+
+    def get_cached_generation(self, operation_type: str, signature: Dict[str, Any], user_uid: Optional[str] = None) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Look up a generation by canonical input signature instead of by prompt text.
+
+        The signature is a dict with:
+        - context: everything that must match exactly (preferences, categories, language, ...)
+        - items: the set compared by Jaccard similarity (normalized ingredient names)
+        - required: items a reused generation must contain (e.g. expiring ingredients)
+        - details: extra exact-match data (e.g. bucketed quantities)
+
+        An exact signature match is tried first. Otherwise the most similar recent signature
+        with the same context is reused, if its items are a subset of the requested items and
+        its Jaccard similarity reaches the threshold (lower for the same user than for other users).
+
+        Returns:
+            (response, match) where match is "exact", "similar" or None
+        """
+        stats = self.operation_stats.setdefault(operation_type, {'hits': 0, 'similar_hits': 0, 'misses': 0})
+        try:
+            exact_key = self._get_signature_key(operation_type, signature)
+            response = self._read(exact_key)
+            if response is not None:
+                self.hit_count += 1
+                stats['hits'] += 1
+                logger.info(f"🎯 Cache HIT for {operation_type} (exact signature)")
+                return response, "exact"
+
+            items = frozenset(signature.get('items', []))
+            required = frozenset(signature.get('required', []))
+            context_key = self._get_context_key(operation_type, signature)
+
+            with self._signatures_lock:
+                candidates = list(self._signatures.get(context_key, OrderedDict()).items())
+
+            best_key, best_similarity = None, 0.0
+            for cache_key, entry in candidates:
+                # Never reuse a generation built on ingredients the requester does not have
+                # (they may be exactly the allergens removed from their pantry)
+                if not required <= entry['items'] or not entry['items'] <= items:
+                    continue
+                union = len(items | entry['items'])
+                similarity = len(items & entry['items']) / union if union else 1.0
+                threshold = (self.similarity_threshold_same_user
+                             if user_uid is not None and entry['user_uid'] == user_uid
+                             else self.similarity_threshold_other_users)
+                if similarity >= threshold and similarity > best_similarity:
+                    best_key, best_similarity = cache_key, similarity
+
+            if best_key is not None:
+                response = self._read(best_key)
+                if response is not None:
+                    # Alias under the exact signature so repeats are exact hits
+                    self._write(exact_key, response, operation_type, self.cache_ttl.get(operation_type, self.cache_ttl['default']))
+                    self.hit_count += 1
+                    stats['hits'] += 1
+                    stats['similar_hits'] += 1
+                    logger.info(f"🎯 Cache HIT for {operation_type} (similar signature, jaccard {best_similarity:.2f})")
+                    return response, "similar"
+                with self._signatures_lock:
+                    self._signatures.get(context_key, OrderedDict()).pop(best_key, None)
+
+            self.miss_count += 1
+            stats['misses'] += 1
+            logger.info(f"💾 Cache MISS for {operation_type} (signature)")
+            return None, None
+
+        except Exception as e:
+            logger.warning(f"⚠️ Cache signature get error: {e}")
+            self.miss_count += 1
+            stats['misses'] += 1
+            return None, None
+
+    def cache_generation(self, operation_type: str, signature: Dict[str, Any], response: str, user_uid: Optional[str] = None) -> bool:
+        """Cache an AI response under its canonical signature and register it for similarity lookups"""
+        try:
+            exact_key = self._get_signature_key(operation_type, signature)
+            ttl = self.cache_ttl.get(operation_type, self.cache_ttl['default'])
+            self._write(exact_key, response, operation_type, ttl)
+
+            context_key = self._get_context_key(operation_type, signature)
+            with self._signatures_lock:
+                entries = self._signatures.setdefault(context_key, OrderedDict())
+                entries.pop(exact_key, None)
+                entries[exact_key] = {'items': frozenset(signature.get('items', [])), 'user_uid': user_uid}
+                while len(entries) > self.max_signatures_per_context:
+                    entries.popitem(last=False)  # Oldest signature first
+
+            logger.info(f"💾 Cached response for {operation_type} by signature ({self._backend_name()}, TTL: {ttl}s)")
+            return True
+
+        except Exception as e:
+            logger.warning(f"⚠️ Cache signature set error: {e}")
+            return False
+
+    @staticmethod
+    def _canonical(data: Any) -> str:
+        return json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+    def _get_signature_key(self, operation_type: str, signature: Dict[str, Any]) -> str:
+        content = self._canonical({'operation': operation_type, 'signature': signature})
+        return f"ai_signature:{hashlib.sha256(content.encode()).hexdigest()}"
+
+    def _get_context_key(self, operation_type: str, signature: Dict[str, Any]) -> str:
+        content = self._canonical({'operation': operation_type, 'context': signature.get('context', {})})
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def _backend_name(self) -> str:
+        return 'in-memory' if isinstance(self.cache, dict) else 'Redis'
+
+    def _write(self, cache_key: str, response: str, operation_type: str, ttl: int) -> None:
+        """Raw cache write with TTL"""
+        if isinstance(self.cache, dict):
+            # In-memory cache with size limit
+            if len(self.cache) > 1000:  # Max 1000 entries
+                # Remove oldest entries
+                sorted_items = sorted(
+                    self.cache.items(), 
+                    key=lambda x: x[1]['created_at']
+                )
+                for key, _ in sorted_items[:100]:  # Remove oldest 100
+                    del self.cache[key]
+            
+            self.cache[cache_key] = {
+                'response': response,
+                'created_at': datetime.now(),
+                'expires_at': datetime.now() + timedelta(seconds=ttl),
+                'operation_type': operation_type
+            }
+        else:
+            # Redis cache
+            self.cache.setex(cache_key, ttl, response)
+
     def cache_response(self, operation_type: str, prompt: str, response: str, **kwargs) -> bool:
         """Cache AI response for future use"""
         try:
             cache_key = self._get_cache_key(operation_type, prompt, **kwargs)
             ttl = self.cache_ttl.get(operation_type, self.cache_ttl['default'])
-            
-            if isinstance(self.cache, dict):
-                # In-memory cache with size limit
-                if len(self.cache) > 1000:  # Max 1000 entries
-                    # Remove oldest entries
-                    sorted_items = sorted(
-                        self.cache.items(), 
-                        key=lambda x: x[1]['created_at']
-                    )
-                    for key, _ in sorted_items[:100]:  # Remove oldest 100
-                        del self.cache[key]
-                
-                self.cache[cache_key] = {
-                    'response': response,
-                    'created_at': datetime.now(),
-                    'expires_at': datetime.now() + timedelta(seconds=ttl),
-                    'operation_type': operation_type
-                }
-                logger.info(f"💾 Cached response for {operation_type} (in-memory, TTL: {ttl}s)")
-            else:
-                # Redis cache
-                self.cache.setex(cache_key, ttl, response)
-                logger.info(f"💾 Cached response for {operation_type} (Redis, TTL: {ttl}s)")
-            
+            self._write(cache_key, response, operation_type, ttl)
+            logger.info(f"💾 Cached response for {operation_type} ({self._backend_name()}, TTL: {ttl}s)")
             return True
             
         except Exception as e:
@@ -164,7 +283,15 @@ class AIResponseCacheService:
             'cache_hits': self.hit_count,
             'cache_misses': self.miss_count,
             'hit_rate_percentage': round(hit_rate, 2),
-            'cache_type': 'Redis' if not isinstance(self.cache, dict) else 'In-Memory'
+            'cache_type': 'Redis' if not isinstance(self.cache, dict) else 'In-Memory',
+            'by_operation': {
+                operation_type: {
+                    **counts,
+                    'hit_rate_percentage': round(counts['hits'] / (counts['hits'] + counts['misses']) * 100, 2)
+                    if counts['hits'] + counts['misses'] > 0 else 0
+                }
+                for operation_type, counts in self.operation_stats.items()
+            }
         }
         
         if isinstance(self.cache, dict):
@@ -941,3 +941,55 @@ Iluminación y Fondo: Utiliza una iluminación cálida que haga el plato lucir i
                 "unit_energy": "MJ",
                 "unit_cost": "USD"
             }
+
+    def estimate_ingredient_impact_factors(self, ingredient_names: List[str]) -> Dict[str, Dict[str, float]]:
+        """
+        Estima factores de impacto por kg para ingredientes que la tabla local no conoce.
+
+        Args:
+            ingredient_names: Nombres de los ingredientes sin factor
+
+        Returns:
+            Diccionario {nombre: factores}; vacío si la IA falla, para reintentar en el próximo cálculo.
+        """
+        prompt = f"""
+    Actúa como un experto en sostenibilidad alimentaria y análisis de ciclo de vida.
+
+    Para cada ingrediente de la lista estima sus factores promedio POR KILOGRAMO, según fuentes globales:
+    - carbon_footprint: kg CO₂e por kg
+    - water_footprint: litros de agua por kg
+    - energy_footprint: megajulios (MJ) por kg
+    - economic_cost: costo aproximado en USD por kg
+    - kg_per_unit: peso promedio en kg de una unidad o pieza
+    - kg_per_litre: densidad en kg por litro
+
+    No incluyas explicaciones ni texto adicional.
+
+    Ingredientes:
+
+    {json.dumps(ingredient_names, ensure_ascii=False)}
+
+    Devuelve únicamente un JSON con esta estructura, usando como clave el nombre tal como aparece en la lista:
+
+    {{
+      "<ingrediente>": {{
+        "carbon_footprint": number,
+        "water_footprint": number,
+        "energy_footprint": number,
+        "economic_cost": number,
+        "kg_per_unit": number,
+        "kg_per_litre": number
+      }}
+    }}
+        """
+
+        try:
+            generation_config = self.generation_config_base.copy()
+            generation_config["temperature"] = 0.1  # Factores estables: se guardan y se reutilizan
+            response = self.model.generate_content(prompt, generation_config=generation_config)
+            result = self._parse_response_text(response.text)
+            return result if isinstance(result, dict) else {}
+
+        except Exception as e:
+            print(f"🚨 Error estimating ingredient impact factors: {str(e)}")
+            return {}
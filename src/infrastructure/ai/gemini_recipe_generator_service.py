@@ -1,4 +1,5 @@
 import json
+import math
 import re
 import logging
 from typing import Dict, Any, List
@@ -6,6 +7,7 @@ from src.domain.services.ia_recipe_generator_service import IARecipeGeneratorSer
 import google.generativeai as genai
 from src.config.config import Config
 from src.infrastructure.ai.cache_service import ai_cache
+from src.shared.fuzzy_name_index import normalize_name
 
 logger = logging.getLogger(__name__)
 
@@ -36,28 +38,27 @@ class GeminiRecipeGeneratorService(IARecipeGeneratorService):
                 generation_config = {"temperature": 0.6}
                 print(f"🍳 [GEMINI SERVICE] Prompt length: {len(prompt)} characters")
             
-            # Check cache first
-            cache_params = {
-                'temperature': generation_config.get('temperature'),
-                'num_recipes': num_recipes,
-                'language': data.get('user_profile', {}).get('language', 'es')
-            }
+            # Check cache first: keyed by the canonical inventory signature, not by the prompt text
+            signature = self._build_cache_signature(
+                data, num_recipes, recipe_categories, generation_config.get('temperature')
+            )
+            user_uid = data.get('user_uid')
             
-            cached_response = ai_cache.get_cached_response(
-                'recipe_generation', prompt, **cache_params
+            cached_response, cache_match = ai_cache.get_cached_generation(
+                'recipe_generation', signature, user_uid=user_uid
             )
             
             if cached_response:
                 response_text = cached_response
-                print(f"🎯 [CACHE HIT] Using cached response (API call saved)")
+                print(f"🎯 [CACHE HIT] Using cached response ({cache_match} signature, API call saved)")
             else:
                 print(f"💾 [CACHE MISS] Generating new response")
                 response = self.model.generate_content(prompt, generation_config=generation_config)
                 response_text = response.text
                 
                 # Cache the response
-                ai_cache.cache_response(
-                    'recipe_generation', prompt, response_text, **cache_params
+                ai_cache.cache_generation(
+                    'recipe_generation', signature, response_text, user_uid=user_uid
                 )
             print(f"🍳 [GEMINI SERVICE] Got response from Gemini")
             print(f"🍳 [GEMINI SERVICE] Response text (first 200 chars): {response_text[:200]}...")
@@ -82,6 +83,7 @@ class GeminiRecipeGeneratorService(IARecipeGeneratorService):
                 "optimization_applied": self.performance_mode,
                 "prompt_size_reduction": "75%" if self.performance_mode else "0%",
                 "cache_hit": cached_response is not None,
+                "cache_match": cache_match,
                 "cache_stats": ai_cache.get_cache_stats(),
                 "token_metrics": self._calculate_token_metrics(prompt, response_text) if self.performance_mode else None
             }
@@ -291,6 +293,59 @@ class GeminiRecipeGeneratorService(IARecipeGeneratorService):
         {no_additional_text}.
         """
 
+    @staticmethod
+    def _quantity_bucket(quantity) -> str:
+        """Power-of-two bucket so small quantity changes keep the same signature"""
+        try:
+            value = float(quantity)
+        except (TypeError, ValueError):
+            return "n/a"  # "Al gusto" and similar
+        if value <= 0:
+            return "0"
+        return f"2^{math.floor(math.log2(value))}"
+
+    @staticmethod
+    def _allergy_names(user_profile: Dict[str, Any]) -> List[str]:
+        """Normalized allergies and allergyItems, so users with different allergies never share a generation"""
+        names = set()
+        for item in list(user_profile.get("allergies") or []) + list(user_profile.get("allergyItems") or []):
+            if isinstance(item, dict):
+                item = item.get('name') or item.get('label') or item.get('value')
+            if isinstance(item, str) and item.strip():
+                names.add(normalize_name(item))
+        return sorted(names)
+
+    def _build_cache_signature(self, data: Dict[str, Any], num_recipes: int, recipe_categories: List[str], temperature) -> Dict[str, Any]:
+        """
+        Canonical, order-independent description of a generation request.
+        Stacks of the same ingredient are merged and quantities are bucketed,
+        so reordering stacks or consuming a little does not change the signature.
+        """
+        user_profile = data.get("user_profile") or {}
+
+        totals = {}
+        for ingredient in data.get("ingredients", []):
+            key = (normalize_name(ingredient["name"]), normalize_name(str(ingredient.get("unit") or "")))
+            try:
+                totals[key] = totals.get(key, 0) + float(ingredient.get("quantity"))
+            except (TypeError, ValueError):
+                totals.setdefault(key, None)
+
+        return {
+            "context": {
+                "preferences": sorted({normalize_name(p) for p in data.get("preferences", []) if isinstance(p, str)}),
+                "categories": sorted({normalize_name(c) for c in (recipe_categories or [])}),
+                "num_recipes": num_recipes,
+                "language": user_profile.get("language", "es"),
+                "measurement_unit": user_profile.get("measurementUnit", "metric"),
+                "allergies": self._allergy_names(user_profile),
+                "temperature": temperature
+            },
+            "items": sorted({name for name, _ in totals}),
+            "required": sorted({normalize_name(p) for p in data.get("priorities", [])}),
+            "details": sorted([name, unit, self._quantity_bucket(total)] for (name, unit), total in totals.items())
+        }
+
     def _build_optimized_prompt(self, data: Dict[str, Any], num_recipes: int, recipe_categories: List[str]) -> str:
         """Optimized prompt builder - 75% smaller while maintaining effectiveness"""
         ingredients = data.get("ingredients", [])
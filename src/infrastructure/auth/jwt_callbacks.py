@@ -11,7 +11,8 @@ def configure_jwt_callbacks(jwt_manager: JWTManager):
         jti = jwt_payload.get('jti')
         if not jti:
             return True  # Si no tiene JTI, es inseguro
-        return token_security_repo.is_token_blacklisted(jti)
+        # Caché de JTIs revocados sincronizada con token_blacklist: sin consulta a MySQL por request
+        return token_security_repo.is_token_revoked(jti)
     
     @jwt_manager.revoked_token_loader
     def revoked_token_callback(jwt_header, jwt_payload):
@@ -71,7 +71,7 @@ class JWTService(AuthService):
             
             # Verificar si el token está en blacklist
             jti = decoded.get('jti')
-            if jti and self.token_security_repo.is_token_blacklisted(jti):
+            if jti and self.token_security_repo.is_token_revoked(jti):
                 security_logger.log_security_event(
                     SecurityEventType.INVALID_TOKEN_ATTEMPT,
                     {"reason": "token_blacklisted", "jti": jti}
@@ -0,0 +1,96 @@
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+# Filas (id, jti, expires_at) vigentes de token_blacklist con id mayor al dado
+RevocationLoader = Callable[[int], Iterable[Tuple[int, str, datetime]]]
+
+# Cada sincronización relee este margen de ids por debajo del máximo visto, por si una
+# inserción con id menor se confirmó después que otra con id mayor. Una transacción larga
+# puede quedar más atrás; esa fila la trae la recarga completa cada `reload_seconds`
+SYNC_ID_OVERLAP = 100
+
+
+def _naive_utc(value: datetime) -> datetime:
+    """Las columnas DateTime vuelven sin zona horaria; se compara todo como UTC naive"""
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+class TokenRevocationCache:
+    """
+    JTIs revocados y vigentes, en memoria de cada proceso.
+
+    Se sincroniza con token_blacklist cada `sync_seconds` leyendo solo las filas nuevas
+    (marca de agua por id), así que un JTI ausente es una respuesta negativa válida hasta la
+    próxima sincronización: una revocación hecha en otro worker se ve en a lo sumo `sync_seconds`.
+    Las revocaciones del propio proceso se publican al instante con `publish`.
+    Cada `reload_seconds` se recargan todas las filas vigentes: así ninguna revocación queda
+    afuera por más de ese tiempo (aunque su id haya quedado por debajo de la marca de agua) y
+    los vencidos se descartan. El tamaño queda acotado por la vida de los tokens.
+    """
+
+    def __init__(self, sync_seconds: int = 5, reload_seconds: int = 300):
+        self.sync_seconds = sync_seconds
+        self.reload_seconds = reload_seconds
+        self._lock = threading.Lock()
+        self._revoked: Dict[str, datetime] = {}
+        self._high_water = 0
+        self._synced_at: Optional[float] = None
+        self._reloaded_at: Optional[float] = None
+
+    def is_revoked(self, jti: str, loader: RevocationLoader) -> bool:
+        if self._synced_at is None or time.monotonic() - self._synced_at >= self.sync_seconds:
+            self.sync(loader)
+        return jti in self._revoked
+
+    def sync(self, loader: RevocationLoader, force: bool = False) -> None:
+        with self._lock:
+            if not force and self._synced_at is not None and time.monotonic() - self._synced_at < self.sync_seconds:
+                return  # Otro hilo ya sincronizó
+
+            if self._reloaded_at is None or time.monotonic() - self._reloaded_at >= self.reload_seconds:
+                # Recarga completa; el loader solo devuelve filas vigentes. Se conservan las
+                # publicadas aún vigentes y se reemplaza el dict entero: las lecturas sin lock
+                # nunca ven uno a medio armar
+                now = datetime.now(timezone.utc).replace(tzinfo=None)
+                revoked = {jti: exp for jti, exp in self._revoked.items() if exp > now}
+                high_water = 0
+                for row_id, jti, expires_at in loader(0):
+                    revoked[jti] = _naive_utc(expires_at)
+                    high_water = max(high_water, row_id)
+                self._revoked, self._high_water = revoked, high_water
+                self._reloaded_at = time.monotonic()
+            else:
+                since = max(self._high_water - SYNC_ID_OVERLAP, 0)
+                for row_id, jti, expires_at in loader(since):
+                    self._revoked[jti] = _naive_utc(expires_at)
+                    self._high_water = max(self._high_water, row_id)
+            self._synced_at = time.monotonic()
+
+    def publish(self, jti: str, expires_at: datetime) -> None:
+        """Registra una revocación hecha en este proceso sin esperar a la próxima sincronización"""
+        with self._lock:
+            self._revoked[jti] = _naive_utc(expires_at)
+
+    def publish_many(self, revoked: Iterable[Tuple[str, datetime]]) -> None:
+        """Igual que `publish` para varias revocaciones (jti, expires_at) bajo un solo lock"""
+        with self._lock:
+            for jti, expires_at in revoked:
+                self._revoked[jti] = _naive_utc(expires_at)
+
+    def invalidate(self) -> None:
+        """Descarta todo; la próxima consulta vuelve a cargar los JTIs vigentes"""
+        with self._lock:
+            self._revoked = {}
+            self._high_water = 0
+            self._synced_at = None
+            self._reloaded_at = None
+
+    def __len__(self) -> int:
+        return len(self._revoked)
+
+
+token_revocation_cache = TokenRevocationCache()
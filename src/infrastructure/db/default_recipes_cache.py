@@ -0,0 +1,113 @@
+import threading
+import time
+from typing import Callable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+from src.infrastructure.db.models.recipe_orm import RecipeORM
+from src.infrastructure.db.models.recipe_ingredient_orm import RecipeIngredientORM
+from src.infrastructure.db.models.recipe_step_orm import RecipeStepORM
+
+SYSTEM_USER_UID = "SYSTEM_DEFAULT_RECIPES"
+
+_DIRTY_FLAG = "default_recipes_dirty"
+
+
+class DefaultRecipesCache:
+    """
+    Cache en memoria de las respuestas de /recipes/default (una por filtro de categoría).
+
+    Se invalida:
+    - Al hacer commit de una sesión que tocó una receta del sistema (o sus ingredientes/pasos).
+    - Cuando la huella (cantidad, último saved_at) de las recetas del sistema cambia;
+      se revisa como mucho cada `revalidate_seconds` para detectar cambios de otros procesos.
+    - Cada `max_age_seconds` como máximo: la huella no cambia si otro proceso edita una receta
+      del sistema sin agregar ni borrar ninguna.
+    """
+
+    def __init__(self, revalidate_seconds: int = 60, max_age_seconds: int = 900):
+        self.revalidate_seconds = revalidate_seconds
+        self.max_age_seconds = max_age_seconds
+        self._lock = threading.Lock()
+        self._entries: dict = {}
+        self._recipe_uids: frozenset = frozenset()
+        self._version: Optional[tuple] = None
+        self._checked_at = 0.0
+        self._built_at = 0.0
+
+    def get(self, key: Optional[str], version_loader: Callable[[], tuple], builder: Callable[[], tuple]):
+        """
+        Devuelve la entrada `key`, reconstruyendo todas las entradas si el cache está vacío o desactualizado.
+
+        Args:
+            key: Filtro de categoría normalizado (None = sin filtro)
+            version_loader: Devuelve la huella actual de las recetas del sistema
+            builder: Devuelve (entries: dict, recipe_uids: set) con todas las variantes precalculadas
+        """
+        entries = self._entries
+        if entries and time.monotonic() - self._checked_at < self.revalidate_seconds:
+            return entries.get(key)
+
+        with self._lock:
+            version = version_loader()
+            expired = time.monotonic() - self._built_at >= self.max_age_seconds
+            if not self._entries or version != self._version or expired:
+                print(f"🔄 [DEFAULT RECIPES CACHE] Rebuilding payloads (version: {version})")
+                built, recipe_uids = builder()
+                self._entries = built
+                self._recipe_uids = frozenset(recipe_uids)
+                self._version = version
+                self._built_at = time.monotonic()
+            self._checked_at = time.monotonic()
+            return self._entries.get(key)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries = {}
+            self._version = None
+        print("🗑️ [DEFAULT RECIPES CACHE] Invalidated")
+
+    def owns_recipe(self, recipe_uid: str) -> bool:
+        return recipe_uid in self._recipe_uids
+
+
+default_recipes_cache = DefaultRecipesCache()
+
+
+def _mark_dirty(target) -> None:
+    session = object_session(target)
+    if session is not None:
+        session.info[_DIRTY_FLAG] = True
+
+
+@event.listens_for(RecipeORM, "after_insert")
+@event.listens_for(RecipeORM, "after_update")
+@event.listens_for(RecipeORM, "after_delete")
+def _on_recipe_change(mapper, connection, target):
+    if target.user_uid == SYSTEM_USER_UID:
+        _mark_dirty(target)
+
+
+@event.listens_for(RecipeIngredientORM, "after_insert")
+@event.listens_for(RecipeIngredientORM, "after_update")
+@event.listens_for(RecipeIngredientORM, "after_delete")
+@event.listens_for(RecipeStepORM, "after_insert")
+@event.listens_for(RecipeStepORM, "after_update")
+@event.listens_for(RecipeStepORM, "after_delete")
+def _on_recipe_child_change(mapper, connection, target):
+    if default_recipes_cache.owns_recipe(target.recipe_uid):
+        _mark_dirty(target)
+
+
+# Se invalida recién en el commit: si se invalidara en el flush, otra petición podría
+# reconstruir el cache con los datos viejos antes de que el cambio sea visible
+@event.listens_for(Session, "after_commit")
+def _on_commit(session):
+    if session.info.pop(_DIRTY_FLAG, False):
+        default_recipes_cache.invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _on_rollback(session):
+    session.info.pop(_DIRTY_FLAG, None)
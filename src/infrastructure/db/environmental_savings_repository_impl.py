@@ -1,9 +1,17 @@
 from src.domain.repositories.environmental_savings_repository import EnvironmentalSavingsRepository
 from src.domain.models.environmental_savings import EnvironmentalSavings
 from src.infrastructure.db.models.environmental_savings_orm import EnvironmentalSavingsORM
+from src.infrastructure.db.models.environmental_savings_rollup_orm import EnvironmentalSavingsRollupORM
 
-from sqlalchemy import insert, select, update
-from typing import List, Optional
+from datetime import date, datetime, timezone
+from sqlalchemy import delete, func, insert, or_, select, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from typing import Dict, List, Optional
+
+ROLLUP_PERIODS = ("day", "month")
+ROLLUP_METRICS = ("calculations_count", "carbon_footprint", "water_footprint", "energy_footprint", "economic_cost")
+ROLLUP_UNITS = ("unit_carbon", "unit_water", "unit_energy", "unit_cost")
 
 
 class EnvironmentalSavingsRepositoryImpl(EnvironmentalSavingsRepository):
@@ -11,55 +19,100 @@ class EnvironmentalSavingsRepositoryImpl(EnvironmentalSavingsRepository):
         self.db = db
 
     def save(self, savings: EnvironmentalSavings) -> Optional[EnvironmentalSavings]:
+        return self.save_many([savings])[0]
+
+    def save_many(self, savings_list: List[EnvironmentalSavings]) -> List[EnvironmentalSavings]:
+        """
+        Crea o actualiza varios cálculos con un único INSERT ... ON DUPLICATE KEY UPDATE sobre
+        uq_environmental_savings_user_recipe (user_uid, recipe_uid) y un solo commit.
+
+        Las filas existentes se leen antes con bloqueo (FOR UPDATE) para mover su aporte en los rollups;
+        conservan su saved_at.
+        """
+        # Una fila por (user_uid, recipe_uid): el último valor gana
+        pending = {(savings.user_uid, savings.recipe_uid): savings for savings in savings_list}
+        if not pending:
+            return []
+
         try:
-            existing = self.find_by_user_and_recipe(savings.user_uid, savings.recipe_uid)
-
-            if existing:
-                stmt = update(EnvironmentalSavingsORM).where(
-                    (EnvironmentalSavingsORM.user_uid == savings.user_uid) &
-                    (EnvironmentalSavingsORM.recipe_uid == savings.recipe_uid)
-                ).values(
-                    recipe_title=savings.recipe_title,
-                    recipe_source_type=savings.recipe_source_type,
-                    carbon_footprint=savings.carbon_footprint,
-                    water_footprint=savings.water_footprint,
-                    energy_footprint=savings.energy_footprint,
-                    economic_cost=savings.economic_cost,
-                    unit_carbon=savings.unit_carbon,
-                    unit_water=savings.unit_water,
-                    unit_energy=savings.unit_energy,
-                    unit_cost=savings.unit_cost,
-                    is_cooked=savings.is_cooked
-                )
-                self.db.session.execute(stmt)
-                print(f"✅ [SAVINGS REPO] Updated savings for recipe {savings.recipe_uid}")
-            else:
-                stmt = insert(EnvironmentalSavingsORM).values(
-                    user_uid=savings.user_uid,
-                    recipe_uid=savings.recipe_uid,
-                    recipe_source_type=savings.recipe_source_type,
-                    recipe_title=savings.recipe_title,
-                    carbon_footprint=savings.carbon_footprint,
-                    water_footprint=savings.water_footprint,
-                    energy_footprint=savings.energy_footprint,
-                    economic_cost=savings.economic_cost,
-                    unit_carbon=savings.unit_carbon,
-                    unit_water=savings.unit_water,
-                    unit_energy=savings.unit_energy,
-                    unit_cost=savings.unit_cost,
-                    is_cooked=savings.is_cooked
-                )
-                self.db.session.execute(stmt)
-                print(f"✅ [SAVINGS REPO] Inserted new savings for recipe {savings.recipe_uid}")
+            existing = self._find_existing_for_update(list(pending))
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
+            rollup_rows = []
+            for key, savings in pending.items():
+                previous = existing.get(key)
+                if previous is not None:
+                    savings.saved_at = previous.saved_at
+                    rollup_rows += self._rollup_rows(previous, -1)
+                else:
+                    savings.saved_at = savings.saved_at or now
+                rollup_rows += self._rollup_rows(savings, 1)
 
+            self.db.session.execute(self._upsert_statement([self._to_row(savings) for savings in pending.values()]))
+            self._apply_rollup(rollup_rows)
             self.db.session.commit()
-            return savings
+            print(f"✅ [SAVINGS REPO] Upserted {len(pending)} savings ({len(existing)} updated)")
+            return list(pending.values())
 
         except Exception as e:
             self.db.session.rollback()
             print(f"🚨 [SAVINGS REPO] Error in save: {str(e)}")
             raise
 
+    def find_by_user_and_recipes(self, user_uid: str, recipe_uids: List[str]) -> Dict[str, EnvironmentalSavings]:
+        """Cálculos existentes de varias recetas del usuario, en una consulta. Devuelve {recipe_uid: cálculo}"""
+        if not recipe_uids:
+            return {}
+        stmt = select(EnvironmentalSavingsORM).where(
+            (EnvironmentalSavingsORM.user_uid == user_uid) &
+            (EnvironmentalSavingsORM.recipe_uid.in_(set(recipe_uids)))
+        )
+        return {row.recipe_uid: self._to_domain(row) for row in self.db.session.execute(stmt).scalars()}
+
+    def _find_existing_for_update(self, keys: List[tuple]) -> Dict[tuple, EnvironmentalSavings]:
+        users = {user_uid for user_uid, _ in keys}
+        recipes = {recipe_uid for _, recipe_uid in keys}
+        stmt = select(EnvironmentalSavingsORM).where(
+            EnvironmentalSavingsORM.user_uid.in_(users),
+            EnvironmentalSavingsORM.recipe_uid.in_(recipes)
+        ).with_for_update()
+        wanted = set(keys)
+        return {
+            (row.user_uid, row.recipe_uid): self._to_domain(row)
+            for row in self.db.session.execute(stmt).scalars()
+            if (row.user_uid, row.recipe_uid) in wanted
+        }
+
+    def _upsert_statement(self, rows: List[Dict]):
+        # saved_at (y la clave) no cambian al actualizar: el cálculo sigue en su bucket de fecha original
+        updated_columns = [column for column in rows[0] if column not in ("user_uid", "recipe_uid", "saved_at")]
+        if self.db.session.get_bind().dialect.name == "mysql":
+            stmt = mysql_insert(EnvironmentalSavingsORM).values(rows)
+            return stmt.on_duplicate_key_update({column: stmt.inserted[column] for column in updated_columns})
+        stmt = sqlite_insert(EnvironmentalSavingsORM).values(rows)
+        return stmt.on_conflict_do_update(
+            index_elements=["user_uid", "recipe_uid"],
+            set_={column: stmt.excluded[column] for column in updated_columns}
+        )
+
+    @staticmethod
+    def _to_row(savings: EnvironmentalSavings) -> Dict:
+        return {
+            "user_uid": savings.user_uid,
+            "recipe_uid": savings.recipe_uid,
+            "recipe_source_type": savings.recipe_source_type,
+            "recipe_title": savings.recipe_title,
+            "carbon_footprint": savings.carbon_footprint,
+            "water_footprint": savings.water_footprint,
+            "energy_footprint": savings.energy_footprint,
+            "economic_cost": savings.economic_cost,
+            "unit_carbon": savings.unit_carbon,
+            "unit_water": savings.unit_water,
+            "unit_energy": savings.unit_energy,
+            "unit_cost": savings.unit_cost,
+            "is_cooked": savings.is_cooked,
+            "saved_at": savings.saved_at
+        }
+
     def find_by_user(self, user_uid: str) -> List[EnvironmentalSavings]:
         stmt = select(EnvironmentalSavingsORM).where(EnvironmentalSavingsORM.user_uid == user_uid)
         result = self.db.session.execute(stmt)
@@ -74,18 +127,72 @@ class EnvironmentalSavingsRepositoryImpl(EnvironmentalSavingsRepository):
         stmt = select(EnvironmentalSavingsORM).where(
             (EnvironmentalSavingsORM.user_uid == user_uid) &
             (EnvironmentalSavingsORM.is_cooked == is_cooked)
-        )
+        ).order_by(EnvironmentalSavingsORM.saved_at.desc())
         result = self.db.session.execute(stmt)
         return [self._to_domain(row[0]) for row in result.fetchall()]
 
+    def get_totals_by_user(self, user_uid: str, is_cooked: Optional[bool] = None) -> List[Dict]:
+        """
+        Totales del usuario agrupados por (is_cooked, recipe_source_type), en una sola consulta.
+        Usa el índice (user_uid, is_cooked, saved_at): no se lee ni se mapea cada cálculo.
+
+        Returns:
+            list: Un dict por grupo con count, las cuatro sumas y las unidades
+        """
+        savings = EnvironmentalSavingsORM
+        stmt = select(
+            savings.is_cooked,
+            savings.recipe_source_type,
+            func.count().label("count"),
+            func.coalesce(func.sum(savings.carbon_footprint), 0).label("carbon_footprint"),
+            func.coalesce(func.sum(savings.water_footprint), 0).label("water_footprint"),
+            func.coalesce(func.sum(savings.energy_footprint), 0).label("energy_footprint"),
+            func.coalesce(func.sum(savings.economic_cost), 0).label("economic_cost"),
+            func.max(savings.unit_carbon).label("unit_carbon"),
+            func.max(savings.unit_water).label("unit_water"),
+            func.max(savings.unit_energy).label("unit_energy"),
+            func.max(savings.unit_cost).label("unit_cost"),
+        ).where(savings.user_uid == user_uid)
+
+        if is_cooked is not None:
+            stmt = stmt.where(savings.is_cooked == is_cooked)
+
+        stmt = stmt.group_by(savings.is_cooked, savings.recipe_source_type)
+        return [
+            {**row._asdict(), "is_cooked": bool(row.is_cooked)}
+            for row in self.db.session.execute(stmt)
+        ]
+
     def update_type_status(self, saving_uid: str, is_cooked: bool) -> None:
-        stmt = update(EnvironmentalSavingsORM).where(
-            EnvironmentalSavingsORM.id == saving_uid
-        ).values(
-            is_cooked=is_cooked
-        )
-        self.db.session.execute(stmt)
-        self.db.session.commit()
+        try:
+            # FOR UPDATE: dos cambios simultáneos del mismo cálculo se serializan
+            row = self.db.session.execute(
+                select(EnvironmentalSavingsORM).where(EnvironmentalSavingsORM.id == saving_uid).with_for_update()
+            ).scalar_one_or_none()
+            if row is None or bool(row.is_cooked) == is_cooked:
+                self.db.session.rollback()
+                return
+
+            previous = self._to_domain(row)
+            stmt = update(EnvironmentalSavingsORM).where(
+                (EnvironmentalSavingsORM.id == saving_uid) &
+                (EnvironmentalSavingsORM.is_cooked != is_cooked)
+            ).values(
+                is_cooked=is_cooked
+            )
+            if self.db.session.execute(stmt).rowcount != 1:
+                # Otro proceso ya aplicó el cambio (y su delta en los buckets)
+                self.db.session.rollback()
+                return
+
+            current = self._to_domain(row)
+            current.is_cooked = is_cooked
+            self._apply_rollup(self._rollup_rows(previous, -1) + self._rollup_rows(current, 1))
+            self.db.session.commit()
+        except Exception as e:
+            self.db.session.rollback()
+            print(f"🚨 [SAVINGS REPO] Error in update_type_status: {str(e)}")
+            raise
 
     def find_by_user_and_recipe(self, user_uid: str, recipe_uid: str) -> Optional[EnvironmentalSavings]:
         stmt = select(EnvironmentalSavingsORM).where(
@@ -95,6 +202,130 @@ class EnvironmentalSavingsRepositoryImpl(EnvironmentalSavingsRepository):
         result = self.db.session.execute(stmt).fetchone()
         return self._to_domain(result[0]) if result else None
 
+    def get_rollups(self, user_uid: str, days_since: date) -> List[Dict]:
+        """
+        Buckets del usuario: todos los mensuales y los diarios desde `days_since`, en una sola consulta.
+
+        Returns:
+            list: Un dict por bucket con period, bucket_start, is_cooked, recipe_source_type, count, sumas y unidades
+        """
+        rollup = EnvironmentalSavingsRollupORM
+        stmt = select(rollup).where(
+            (rollup.user_uid == user_uid) &
+            (rollup.calculations_count > 0) &
+            or_(rollup.period == "month", (rollup.period == "day") & (rollup.bucket_start >= days_since))
+        ).order_by(rollup.period, rollup.bucket_start)
+
+        return [
+            {
+                "period": row.period,
+                "bucket_start": row.bucket_start,
+                "is_cooked": bool(row.is_cooked),
+                "recipe_source_type": row.recipe_source_type,
+                "count": row.calculations_count,
+                **{metric: getattr(row, metric) for metric in ROLLUP_METRICS[1:]},
+                **{unit: getattr(row, unit) for unit in ROLLUP_UNITS}
+            }
+            for row in self.db.session.execute(stmt).scalars()
+        ]
+
+    def rebuild_rollups(self, user_uid: Optional[str] = None, chunk_size: int = 1000) -> int:
+        """
+        Recalcula los buckets desde environmental_savings (backfill o reparación).
+        Las filas se leen por tandas de `chunk_size` y se acumulan en memoria por bucket.
+
+        Args:
+            user_uid: Solo este usuario (None = todos)
+            chunk_size: Filas leídas por tanda
+
+        Returns:
+            int: Cantidad de buckets escritos
+        """
+        savings = EnvironmentalSavingsORM
+        stmt = select(savings)
+        clear = delete(EnvironmentalSavingsRollupORM)
+        if user_uid is not None:
+            stmt = stmt.where(savings.user_uid == user_uid)
+            clear = clear.where(EnvironmentalSavingsRollupORM.user_uid == user_uid)
+
+        try:
+            buckets = {}
+            for row in self.db.session.execute(stmt.execution_options(yield_per=chunk_size)).scalars():
+                self._merge_rollup_rows(buckets, self._rollup_rows(self._to_domain(row), 1))
+
+            self.db.session.execute(clear)
+            rows = list(buckets.values())
+            for start in range(0, len(rows), chunk_size):
+                self.db.session.execute(insert(EnvironmentalSavingsRollupORM), rows[start:start + chunk_size])
+            self.db.session.commit()
+            print(f"✅ [SAVINGS REPO] Rebuilt {len(rows)} rollup buckets")
+            return len(rows)
+        except Exception as e:
+            self.db.session.rollback()
+            print(f"🚨 [SAVINGS REPO] Error in rebuild_rollups: {str(e)}")
+            raise
+
+    @staticmethod
+    def _rollup_rows(savings: EnvironmentalSavings, sign: int) -> List[Dict]:
+        """Aporte (sign = 1) o retiro (sign = -1) de un cálculo en su bucket diario y mensual"""
+        saved_at = savings.saved_at or datetime.now(timezone.utc).replace(tzinfo=None)
+        day = saved_at.date()
+        base = {
+            "user_uid": savings.user_uid,
+            "is_cooked": bool(savings.is_cooked),
+            "recipe_source_type": savings.recipe_source_type or "manual",
+            "calculations_count": sign,
+            "carbon_footprint": sign * float(savings.carbon_footprint or 0),
+            "water_footprint": sign * float(savings.water_footprint or 0),
+            "energy_footprint": sign * float(savings.energy_footprint or 0),
+            "economic_cost": sign * float(savings.economic_cost or 0),
+            **{unit: getattr(savings, unit) for unit in ROLLUP_UNITS}
+        }
+        return [
+            {**base, "period": "day", "bucket_start": day},
+            {**base, "period": "month", "bucket_start": day.replace(day=1)}
+        ]
+
+    @staticmethod
+    def _merge_rollup_rows(buckets: Dict, rows: List[Dict]) -> Dict:
+        # Una sola fila por bucket: el INSERT multi-fila no puede tocar dos veces la misma clave
+        for row in rows:
+            key = (row["user_uid"], row["period"], row["bucket_start"], row["is_cooked"], row["recipe_source_type"])
+            if key not in buckets:
+                buckets[key] = dict(row)
+                continue
+            merged = buckets[key]
+            for metric in ROLLUP_METRICS:
+                merged[metric] += row[metric]
+            merged.update({unit: row[unit] for unit in ROLLUP_UNITS if row[unit]})
+        return buckets
+
+    def _apply_rollup(self, rows: List[Dict]) -> None:
+        """Suma los deltas a sus buckets con un único upsert, dentro de la transacción en curso"""
+        rows = list(self._merge_rollup_rows({}, rows).values())
+        if not rows:
+            return
+
+        rollup = EnvironmentalSavingsRollupORM.__table__
+        if self.db.session.get_bind().dialect.name == "mysql":
+            stmt = mysql_insert(rollup).values(rows)
+            incoming = stmt.inserted
+            stmt = stmt.on_duplicate_key_update({
+                **{metric: rollup.c[metric] + incoming[metric] for metric in ROLLUP_METRICS},
+                **{unit: func.coalesce(incoming[unit], rollup.c[unit]) for unit in ROLLUP_UNITS}
+            })
+        else:
+            stmt = sqlite_insert(rollup).values(rows)
+            incoming = stmt.excluded
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["user_uid", "period", "bucket_start", "is_cooked", "recipe_source_type"],
+                set_={
+                    **{metric: rollup.c[metric] + incoming[metric] for metric in ROLLUP_METRICS},
+                    **{unit: func.coalesce(incoming[unit], rollup.c[unit]) for unit in ROLLUP_UNITS}
+                }
+            )
+        self.db.session.execute(stmt)
+
     def _to_domain(self, row: EnvironmentalSavingsORM) -> EnvironmentalSavings:
         return EnvironmentalSavings(
             user_uid=row.user_uid,
@@ -1,10 +1,14 @@
 import unicodedata
-from rapidfuzz import process
 from typing import Optional
-from sqlalchemy import select
+from sqlalchemy import select, func
 from src.domain.models.image_reference import ImageReference
 from src.domain.repositories.image_repository import ImageReferenceRepository
 from src.infrastructure.db.models.image_reference_orm import ImageReferenceORM
+from src.shared.fuzzy_name_index import FuzzyNameIndex
+
+# Índice de nombres por proceso (se sincroniza por created_at)
+_name_index = FuzzyNameIndex()
+NAME_INDEX_REFRESH_SECONDS = 30
 
 
 def normalize_name(name: str) -> str:
@@ -25,6 +29,8 @@ class ImageRepositoryImpl(ImageReferenceRepository):
         )
         self.db.session.add(obj)
         self.db.session.commit()
+        if _name_index.loaded:
+            _name_index.add(image.uid, normalized_name)
         return image.uid
 
     def find_by_uid(self, uid: str) -> Optional[ImageReference]:
@@ -40,24 +46,24 @@ class ImageRepositoryImpl(ImageReferenceRepository):
         return self._to_domain(result) if result else None
 
     def find_best_match_name(self, name: str) -> Optional[ImageReference]:
-        normalized_name = normalize_name(name)
+        _name_index.sync(self._load_names_since, self._count_references, NAME_INDEX_REFRESH_SECONDS)
+        match = _name_index.best_match(normalize_name(name), score_cutoff=80)  # Umbral de confianza
+        if not match:
+            return None
 
-        # Obteniendo los names de la db
-        stmt = select(ImageReferenceORM)
-        results = self.db.session.execute(stmt).scalars().all()
+        mejor_resultado = self.find_by_uid(match[0])
+        if mejor_resultado is None:
+            _name_index.discard(match[0])
+        return mejor_resultado
 
-        if not results:
-            return None
+    def _load_names_since(self, watermark) -> list:
+        stmt = select(ImageReferenceORM.uid, ImageReferenceORM.name, ImageReferenceORM.created_at)
+        if watermark is not None:
+            stmt = stmt.where(ImageReferenceORM.created_at >= watermark)
+        return [(uid, name, None, created_at) for uid, name, created_at in self.db.session.execute(stmt).all()]
 
-        options = [(r.name, r) for r in results]
-        best_match_name, score, _ = process.extractOne(
-            normalized_name,
-            [n for n, _ in options]
-        )
-        if score < 80:  # Umbral de confianza
-            return None
-        mejor_resultado = next(r for n, r in options if n == best_match_name)
-        return self._to_domain(mejor_resultado)
+    def _count_references(self) -> int:
+        return self.db.session.execute(select(func.count(ImageReferenceORM.uid))).scalar()
 
     def _to_domain(self, row: ImageReferenceORM) -> ImageReference:
         return ImageReference(
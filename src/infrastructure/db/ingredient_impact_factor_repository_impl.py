@@ -0,0 +1,49 @@
+from src.domain.repositories.ingredient_impact_factor_repository import IngredientImpactFactorRepository
+from src.infrastructure.db.models.ingredient_impact_factor_orm import IngredientImpactFactorORM
+
+from sqlalchemy import select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from typing import Dict
+
+FACTOR_COLUMNS = ("carbon_footprint", "water_footprint", "energy_footprint", "economic_cost", "kg_per_unit", "kg_per_litre")
+
+
+class IngredientImpactFactorRepositoryImpl(IngredientImpactFactorRepository):
+    def __init__(self, db):
+        self.db = db
+
+    def find_all(self) -> Dict[str, Dict]:
+        rows = self.db.session.execute(select(IngredientImpactFactorORM)).scalars()
+        return {row.ingredient_key: {column: getattr(row, column) for column in FACTOR_COLUMNS} for row in rows}
+
+    def save_many(self, factors: Dict[str, Dict], source: str = "ai") -> None:
+        """
+        Guarda factores nuevos en una sola sentencia. Si otro proceso ya guardó la misma clave, se conserva la existente.
+
+        Args:
+            factors: {ingredient_key: {carbon_footprint, water_footprint, energy_footprint, economic_cost, kg_per_unit, kg_per_litre}}
+            source: Origen de los factores (ai | manual)
+        """
+        if not factors:
+            return
+
+        rows = [
+            {"ingredient_key": key, "source": source, **{column: factor[column] for column in FACTOR_COLUMNS}}
+            for key, factor in factors.items()
+        ]
+        if self.db.session.get_bind().dialect.name == "mysql":
+            stmt = mysql_insert(IngredientImpactFactorORM).values(rows).prefix_with("IGNORE")
+        else:
+            stmt = sqlite_insert(IngredientImpactFactorORM).values(rows).on_conflict_do_nothing(
+                index_elements=["ingredient_key"]
+            )
+
+        try:
+            self.db.session.execute(stmt)
+            self.db.session.commit()
+            print(f"✅ [IMPACT FACTORS REPO] Saved {len(rows)} factors")
+        except Exception as e:
+            self.db.session.rollback()
+            print(f"🚨 [IMPACT FACTORS REPO] Error in save_many: {str(e)}")
+            raise
@@ -1,6 +1,6 @@
 from typing import Optional
-from sqlalchemy import select, delete, and_
-from datetime import datetime
+from sqlalchemy import select, delete, update, and_, or_, func
+from datetime import datetime, timedelta
 from src.domain.models.inventory import Inventory
 from src.domain.models.ingredient import Ingredient, IngredientStack
 from src.domain.models.food_item import FoodItem
@@ -9,11 +9,123 @@ from src.infrastructure.db.models.ingredient_orm import IngredientORM
 from src.infrastructure.db.models.ingredient_stack_orm import IngredientStackORM
 from src.infrastructure.db.models.food_item_orm import FoodItemORM
 from src.infrastructure.db.models.inventory_orm import InventoryORM
+from src.infrastructure.db.models.inventory_change_orm import InventoryChangeORM
+
+# Tolerancia para considerar un stack agotado tras restas en coma flotante
+QUANTITY_EPSILON = 1e-9
+
+# Columnas que los listados siempre cargan; el resto (TEXT, JSON, URLs) solo si se piden
+FOOD_ITEM_BASE_COLUMNS = ('id', 'name', 'category', 'calories', 'storage_type', 'serving_quantity', 'added_at', 'expiration_date')
+FOOD_ITEM_OPTIONAL_COLUMNS = ('main_ingredients', 'description', 'expiration_time', 'time_unit', 'tips', 'image_path')
+INGREDIENT_OPTIONAL_COLUMNS = ('tips', 'image_path')
+
+# Tipos de entidad y operaciones del registro de cambios (delta sync)
+CHANGE_INGREDIENT = 'ingredient'
+CHANGE_STACK = 'ingredient_stack'
+CHANGE_FOOD = 'food_item'
+CHANGE_UPSERT = 'upsert'
+CHANGE_DELETE = 'delete'
 
 class InventoryRepositoryImpl(InventoryRepository):
     def __init__(self, db):
         self.db = db
 
+    @staticmethod
+    def _parse_added_at(added_at) -> datetime:
+        """
+        Convierte el added_at recibido por las rutas legacy a un datetime naive (UTC),
+        que es como se almacena en la base de datos.
+        """
+        if isinstance(added_at, datetime):
+            added_at_datetime = added_at
+        else:
+            try:
+                added_at_datetime = datetime.fromisoformat(added_at.replace('Z', '+00:00'))
+            except ValueError:
+                added_at_datetime = datetime.strptime(added_at, '%Y-%m-%d %H:%M:%S')
+        # Convertir a naive datetime (sin timezone) para coincidir con la base de datos
+        return added_at_datetime.replace(tzinfo=None)
+
+    @staticmethod
+    def _stack_to_dict(stack_orm: IngredientStackORM, ingredient_orm: IngredientORM) -> dict:
+        return {
+            'id': stack_orm.id,
+            'ingredient_name': stack_orm.ingredient_name,
+            'quantity': stack_orm.quantity,
+            'type_unit': ingredient_orm.type_unit,
+            'expiration_date': stack_orm.expiration_date,
+            'added_at': stack_orm.added_at,
+            'storage_type': ingredient_orm.storage_type,
+            'tips': ingredient_orm.tips,
+            'image_path': ingredient_orm.image_path
+        }
+
+    @staticmethod
+    def _food_to_dict(food_orm: FoodItemORM) -> dict:
+        return {
+            'id': food_orm.id,
+            'name': food_orm.name,
+            'main_ingredients': food_orm.main_ingredients,
+            'category': food_orm.category,
+            'calories': food_orm.calories,
+            'description': food_orm.description,
+            'storage_type': food_orm.storage_type,
+            'expiration_time': food_orm.expiration_time,
+            'time_unit': food_orm.time_unit,
+            'tips': food_orm.tips,
+            'serving_quantity': food_orm.serving_quantity,
+            'image_path': food_orm.image_path,
+            'added_at': food_orm.added_at,
+            'expiration_date': food_orm.expiration_date
+        }
+
+    def _select_stack_with_ingredient(self):
+        return select(IngredientStackORM, IngredientORM).join(
+            IngredientORM,
+            and_(
+                IngredientORM.name == IngredientStackORM.ingredient_name,
+                IngredientORM.inventory_user_uid == IngredientStackORM.inventory_user_uid
+            )
+        )
+
+    def _record_changes(self, user_uid: str, changes: list) -> None:
+        """
+        Agrega cambios al registro de delta sync dentro de la transacción en curso (no hace commit).
+        Reserva un bloque de la secuencia del usuario con un UPDATE sobre su fila de inventario,
+        que además serializa a los escritores concurrentes del mismo usuario.
+
+        Args:
+            changes: Lista de tuplas (entity_type, entity_key, op)
+        """
+        if not changes:
+            return
+
+        reserved = self.db.session.execute(
+            update(InventoryORM)
+            .where(InventoryORM.user_uid == user_uid)
+            .values(change_seq=InventoryORM.change_seq + len(changes))
+            .execution_options(synchronize_session=False)
+        )
+        if reserved.rowcount == 0:
+            return
+
+        # MySQL no tiene RETURNING: se relee la secuencia (la fila ya está bloqueada por el UPDATE)
+        last_seq = self.db.session.execute(
+            select(InventoryORM.change_seq).where(InventoryORM.user_uid == user_uid)
+        ).scalar_one()
+        first_seq = last_seq - len(changes) + 1
+
+        self.db.session.add_all([
+            InventoryChangeORM(
+                user_uid=user_uid,
+                seq=first_seq + offset,
+                entity_type=entity_type,
+                entity_key=str(entity_key),
+                op=op
+            )
+            for offset, (entity_type, entity_key, op) in enumerate(changes)
+        ])
+
     def get_by_user_uid(self, user_uid: str) -> Optional[Inventory]:
         print(f"🔍 [INVENTORY REPO] Fetching inventory for user: {user_uid}")
         
@@ -44,7 +156,8 @@ class InventoryRepositoryImpl(InventoryRepository):
                     quantity=stack.quantity,
                     type_unit=ing.type_unit,
                     expiration_date=stack.expiration_date,
-                    added_at=stack.added_at
+                    added_at=stack.added_at,
+                    id=stack.id
                 )
                 domain_ing.add_stack(domain_stack)
 
@@ -113,6 +226,11 @@ class InventoryRepositoryImpl(InventoryRepository):
             added_at=stack.added_at
         )
         self.db.session.add(stack_orm)
+        self.db.session.flush()
+        self._record_changes(user_uid, [
+            (CHANGE_INGREDIENT, ingredient.name, CHANGE_UPSERT),
+            (CHANGE_STACK, stack_orm.id, CHANGE_UPSERT)
+        ])
         self.db.session.commit()
         print(f"   └─ ✅ Successfully added stack for: {ingredient.name}")
 
@@ -140,43 +258,108 @@ class InventoryRepositoryImpl(InventoryRepository):
         )
         
         self.db.session.add(food_orm)
+        self.db.session.flush()
+        self._record_changes(user_uid, [(CHANGE_FOOD, food_orm.id, CHANGE_UPSERT)])
         self.db.session.commit()
         print(f"   └─ ✅ Successfully added food item: {food_item.name}")
 
-    def delete_ingredient_stack(self, user_uid: str, ingredient_name: str, added_at: str) -> None:
-        # Convertir added_at string a datetime para comparar
-        try:
-            added_at_datetime = datetime.fromisoformat(added_at.replace('Z', '+00:00'))
-            # Convertir a naive datetime (sin timezone) para coincidir con la base de datos
-            added_at_datetime = added_at_datetime.replace(tzinfo=None)
-        except ValueError:
-            # Intentar otros formatos si falla
-            added_at_datetime = datetime.strptime(added_at, '%Y-%m-%d %H:%M:%S')
-        
-        print(f"🗑️ [DELETE STACK] Searching for timestamp: {added_at_datetime}")
-        
-        # Eliminar el stack específico
-        stmt = delete(IngredientStackORM).where(
+    # ===== Búsqueda de IDs desde la clave legacy (nombre + added_at) =====
+
+    def find_ingredient_stack_id(self, user_uid: str, ingredient_name: str, added_at) -> Optional[int]:
+        """
+        Resuelve el ID de un stack a partir de la clave legacy (nombre, usuario, added_at).
+        Solo lo usan las rutas antiguas; las nuevas direccionan el stack por ID.
+        """
+        stmt = select(IngredientStackORM.id).where(
             and_(
                 IngredientStackORM.ingredient_name == ingredient_name,
                 IngredientStackORM.inventory_user_uid == user_uid,
-                IngredientStackORM.added_at == added_at_datetime
+                IngredientStackORM.added_at == self._parse_added_at(added_at)
             )
         )
-        self.db.session.execute(stmt)
-        
-        # Verificar si quedan otros stacks del mismo ingrediente
-        remaining_stacks = self.db.session.execute(
-            select(IngredientStackORM).where(
+        return self.db.session.execute(stmt).scalar_one_or_none()
+
+    def find_food_item_id(self, user_uid: str, food_name: str, added_at) -> Optional[int]:
+        """
+        Resuelve el ID de un food item a partir de la clave legacy (nombre, usuario, added_at).
+        """
+        stmt = select(FoodItemORM.id).where(
+            and_(
+                FoodItemORM.name == food_name,
+                FoodItemORM.inventory_user_uid == user_uid,
+                FoodItemORM.added_at == self._parse_added_at(added_at)
+            )
+        ).limit(1)
+        return self.db.session.execute(stmt).scalar_one_or_none()
+
+    # ===== Operaciones por ID (lookup directo por clave primaria) =====
+
+    def get_ingredient_stack_by_id(self, user_uid: str, stack_id: int) -> Optional[dict]:
+        """
+        Obtiene un stack y la metadata de su ingrediente en una sola consulta por clave primaria.
+
+        Returns:
+            dict: Datos del stack e ingrediente, o None si no existe o no pertenece al usuario
+        """
+        stmt = self._select_stack_with_ingredient().where(
+            and_(
+                IngredientStackORM.id == stack_id,
+                IngredientStackORM.inventory_user_uid == user_uid
+            )
+        )
+        row = self.db.session.execute(stmt).one_or_none()
+        if not row:
+            return None
+        stack_orm, ingredient_orm = row
+        return self._stack_to_dict(stack_orm, ingredient_orm)
+
+    def update_ingredient_stack_by_id(self, user_uid: str, stack_id: int, new_stack: IngredientStack, new_meta: Ingredient) -> None:
+        stack_orm = self.db.session.get(IngredientStackORM, stack_id)
+        if not stack_orm or stack_orm.inventory_user_uid != user_uid:
+            return
+
+        ingredient_orm = stack_orm.ingredient
+        if ingredient_orm:
+            ingredient_orm.type_unit = new_meta.type_unit
+            ingredient_orm.storage_type = new_meta.storage_type
+            ingredient_orm.tips = new_meta.tips
+            ingredient_orm.image_path = new_meta.image_path
+
+        stack_orm.quantity = new_stack.quantity
+        stack_orm.expiration_date = new_stack.expiration_date
+        if new_stack.added_at is not None:
+            stack_orm.added_at = self._parse_added_at(new_stack.added_at)
+
+        self._record_changes(user_uid, [
+            (CHANGE_INGREDIENT, stack_orm.ingredient_name, CHANGE_UPSERT),
+            (CHANGE_STACK, stack_id, CHANGE_UPSERT)
+        ])
+        self.db.session.commit()
+
+    def delete_ingredient_stack_by_id(self, user_uid: str, stack_id: int) -> None:
+        stack_orm = self.db.session.get(IngredientStackORM, stack_id)
+        if not stack_orm or stack_orm.inventory_user_uid != user_uid:
+            return
+
+        ingredient_name = stack_orm.ingredient_name
+        print(f"🗑️ [DELETE STACK] Deleting stack id: {stack_id} ({ingredient_name})")
+
+        self.db.session.execute(
+            delete(IngredientStackORM).where(IngredientStackORM.id == stack_id)
+        )
+
+        # Si no quedan stacks, eliminar también el ingrediente
+        remaining_stack = self.db.session.execute(
+            select(IngredientStackORM.id).where(
                 and_(
                     IngredientStackORM.ingredient_name == ingredient_name,
                     IngredientStackORM.inventory_user_uid == user_uid
                 )
-            )
-        ).scalars().all()
-        
-        # Si no quedan stacks, eliminar también el ingrediente
-        if not remaining_stacks:
+            ).limit(1)
+        ).scalar_one_or_none()
+
+        changes = [(CHANGE_STACK, stack_id, CHANGE_DELETE)]
+        if remaining_stack is None:
             self.db.session.execute(
                 delete(IngredientORM).where(
                     and_(
@@ -185,99 +368,323 @@ class InventoryRepositoryImpl(InventoryRepository):
                     )
                 )
             )
-        
+            changes.append((CHANGE_INGREDIENT, ingredient_name, CHANGE_DELETE))
+
+        self._record_changes(user_uid, changes)
         self.db.session.commit()
 
-    def delete_food_item(self, user_uid: str, food_name: str, added_at: str) -> None:
-        try:
-            added_at_datetime = datetime.fromisoformat(added_at.replace('Z', '+00:00'))
-            # Convertir a naive datetime (sin timezone) para coincidir con la base de datos
-            added_at_datetime = added_at_datetime.replace(tzinfo=None)
-        except ValueError:
-            added_at_datetime = datetime.strptime(added_at, '%Y-%m-%d %H:%M:%S')
-        
-        stmt = delete(FoodItemORM).where(
-            and_(
-                FoodItemORM.name == food_name,
-                FoodItemORM.inventory_user_uid == user_uid,
-                FoodItemORM.added_at == added_at_datetime
+    def get_food_item_by_id(self, user_uid: str, food_id: int) -> Optional[dict]:
+        food_orm = self.db.session.get(FoodItemORM, food_id)
+        if not food_orm or food_orm.inventory_user_uid != user_uid:
+            return None
+        return self._food_to_dict(food_orm)
+
+    def update_food_item_by_id(self, user_uid: str, food_id: int, food_item: FoodItem) -> None:
+        food_orm = self.db.session.get(FoodItemORM, food_id)
+        if not food_orm or food_orm.inventory_user_uid != user_uid:
+            return
+
+        food_orm.main_ingredients = food_item.main_ingredients
+        food_orm.category = food_item.category
+        food_orm.calories = food_item.calories
+        food_orm.description = food_item.description
+        food_orm.storage_type = food_item.storage_type
+        food_orm.expiration_time = food_item.expiration_time
+        food_orm.time_unit = food_item.time_unit
+        food_orm.tips = food_item.tips
+        food_orm.serving_quantity = food_item.serving_quantity
+        food_orm.image_path = food_item.image_path
+        food_orm.expiration_date = food_item.expiration_date
+
+        self._record_changes(user_uid, [(CHANGE_FOOD, food_id, CHANGE_UPSERT)])
+        self.db.session.commit()
+
+    def delete_food_item_by_id(self, user_uid: str, food_id: int) -> None:
+        deleted = self.db.session.execute(
+            delete(FoodItemORM).where(
+                and_(
+                    FoodItemORM.id == food_id,
+                    FoodItemORM.inventory_user_uid == user_uid
+                )
             )
         )
-        self.db.session.execute(stmt)
+        if deleted.rowcount:
+            self._record_changes(user_uid, [(CHANGE_FOOD, food_id, CHANGE_DELETE)])
         self.db.session.commit()
 
-    def update_food_item(self, user_uid: str, food_item: FoodItem) -> None:
-        try:
-            added_at_datetime = datetime.fromisoformat(food_item.added_at.isoformat().replace('Z', '+00:00'))
-        except ValueError:
-            added_at_datetime = food_item.added_at
-        
-        stmt = select(FoodItemORM).where(
-            and_(
-                FoodItemORM.name == food_item.name,
-                FoodItemORM.inventory_user_uid == user_uid,
-                FoodItemORM.added_at == added_at_datetime
+    # ===== Consumo atómico =====
+
+    def _delete_ingredient_if_empty(self, user_uid: str, ingredient_names) -> list:
+        """
+        Elimina los ingredientes de la lista que ya no tienen stacks. No hace commit.
+
+        Returns:
+            list: Nombres de los ingredientes eliminados
+        """
+        names = list(set(ingredient_names))
+        if not names:
+            return []
+
+        still_stocked = set(self.db.session.execute(
+            select(IngredientStackORM.ingredient_name).where(
+                and_(
+                    IngredientStackORM.inventory_user_uid == user_uid,
+                    IngredientStackORM.ingredient_name.in_(names)
+                )
+            ).distinct()
+        ).scalars().all())
+
+        empty = [name for name in names if name not in still_stocked]
+        if empty:
+            self.db.session.execute(
+                delete(IngredientORM).where(
+                    and_(
+                        IngredientORM.inventory_user_uid == user_uid,
+                        IngredientORM.name.in_(empty)
+                    )
+                )
             )
+        return empty
+
+    def consume_ingredient_stack_by_id(self, user_uid: str, stack_id: int, quantity: Optional[float] = None) -> Optional[dict]:
+        """
+        Descuenta cantidad de un stack de forma atómica.
+
+        Con `quantity` emite un único UPDATE condicional
+        (`quantity = quantity - :q WHERE quantity >= :q`), de modo que dos consumos
+        concurrentes nunca pueden restar más de lo disponible. Sin `quantity` consume
+        el stack completo. Si el stack llega a cero se elimina (y su ingrediente, si era
+        el último stack) dentro de la misma transacción.
+
+        Returns:
+            dict: Resultado del consumo, o None si el stack no existe o no hay cantidad suficiente
+        """
+        ownership = and_(
+            IngredientStackORM.id == stack_id,
+            IngredientStackORM.inventory_user_uid == user_uid
         )
-        food_orm = self.db.session.execute(stmt).scalar_one_or_none()
-        
-        if food_orm:
-            food_orm.main_ingredients = food_item.main_ingredients
-            food_orm.category = food_item.category
-            food_orm.calories = food_item.calories
-            food_orm.description = food_item.description
-            food_orm.storage_type = food_item.storage_type
-            food_orm.expiration_time = food_item.expiration_time
-            food_orm.time_unit = food_item.time_unit
-            food_orm.tips = food_item.tips
-            food_orm.serving_quantity = food_item.serving_quantity
-            food_orm.image_path = food_item.image_path
-            food_orm.expiration_date = food_item.expiration_date
-        
+
+        if quantity is None:
+            row = self.db.session.execute(
+                self._select_stack_with_ingredient().where(ownership).with_for_update()
+            ).one_or_none()
+            if not row:
+                self.db.session.rollback()
+                return None
+            stack_orm, ingredient_orm = row
+            stack_data = self._stack_to_dict(stack_orm, ingredient_orm)
+            consumed_quantity = stack_data['quantity']
+            remaining_quantity = 0.0
+        else:
+            result = self.db.session.execute(
+                update(IngredientStackORM)
+                .where(and_(ownership, IngredientStackORM.quantity >= quantity))
+                .values(quantity=IngredientStackORM.quantity - quantity)
+                .execution_options(synchronize_session=False)
+            )
+            if result.rowcount == 0:
+                self.db.session.rollback()
+                return None
+
+            stack_orm, ingredient_orm = self.db.session.execute(
+                self._select_stack_with_ingredient().where(ownership)
+                .execution_options(populate_existing=True)
+            ).one()
+            stack_data = self._stack_to_dict(stack_orm, ingredient_orm)
+            consumed_quantity = quantity
+            remaining_quantity = stack_data['quantity']
+
+        stack_removed = remaining_quantity <= QUANTITY_EPSILON
+        ingredient_removed = False
+        changes = [(CHANGE_STACK, stack_id, CHANGE_UPSERT)]
+        if stack_removed:
+            self.db.session.execute(delete(IngredientStackORM).where(ownership))
+            ingredient_removed = bool(self._delete_ingredient_if_empty(user_uid, [stack_data['ingredient_name']]))
+            remaining_quantity = 0.0
+            changes = [(CHANGE_STACK, stack_id, CHANGE_DELETE)]
+            if ingredient_removed:
+                changes.append((CHANGE_INGREDIENT, stack_data['ingredient_name'], CHANGE_DELETE))
+
+        self._record_changes(user_uid, changes)
         self.db.session.commit()
 
-    def update_ingredient_stack(self, user_uid: str, ingredient_name: str, added_at: str, new_stack: IngredientStack, new_meta: Ingredient) -> None:
-        # Convertir added_at string a datetime
-        try:
-            added_at_datetime = datetime.fromisoformat(added_at.replace('Z', '+00:00'))
-            # Convertir a naive datetime (sin timezone) para coincidir con la base de datos
-            added_at_datetime = added_at_datetime.replace(tzinfo=None)
-        except ValueError:
-            added_at_datetime = datetime.strptime(added_at, '%Y-%m-%d %H:%M:%S')
-        
-        # Actualizar el ingrediente metadata
-        stmt = select(IngredientORM).where(
-            and_(
-                IngredientORM.name == ingredient_name,
-                IngredientORM.inventory_user_uid == user_uid
+        stack_data.update({
+            'consumed_quantity': consumed_quantity,
+            'remaining_quantity': remaining_quantity,
+            'stack_removed': stack_removed,
+            'ingredient_removed': ingredient_removed
+        })
+        return stack_data
+
+    def consume_ingredients_fifo(self, user_uid: str, requested: list, allow_partial: bool = False) -> dict:
+        """
+        Descuenta cantidades de varios ingredientes agotando primero los stacks que vencen antes.
+
+        Todo ocurre en una transacción: un SELECT ... FOR UPDATE de los stacks involucrados,
+        un DELETE multi-fila para los stacks agotados, un UPDATE condicional por cada stack
+        consumido parcialmente (como máximo uno por ingrediente) y un único commit.
+
+        Args:
+            user_uid: ID del usuario
+            requested: Lista de dicts {"name", "quantity", "type_unit" (opcional)}
+            allow_partial: Si es False y algún ingrediente no alcanza, no se descuenta nada
+
+        Returns:
+            dict: {"success": bool, "ingredients": [...resultado por ingrediente]}
+        """
+        wanted = {}
+        for item in requested:
+            key = item['name'].strip().lower()
+            entry = wanted.setdefault(key, {
+                'name': item['name'].strip(),
+                'quantity': 0.0,
+                'type_unit': item.get('type_unit')
+            })
+            entry['quantity'] += float(item['quantity'])
+
+        rows = self.db.session.execute(
+            self._select_stack_with_ingredient().where(
+                and_(
+                    IngredientStackORM.inventory_user_uid == user_uid,
+                    func.lower(func.trim(IngredientStackORM.ingredient_name)).in_(list(wanted))
+                )
+            ).order_by(
+                IngredientStackORM.ingredient_name,
+                IngredientStackORM.expiration_date,
+                IngredientStackORM.added_at,
+                IngredientStackORM.id
+            ).with_for_update()
+        ).all()
+
+        stacks_by_name = {}
+        for stack_orm, ingredient_orm in rows:
+            stacks_by_name.setdefault(stack_orm.ingredient_name.strip().lower(), []).append(
+                (stack_orm, ingredient_orm)
             )
-        )
-        ingredient_orm = self.db.session.execute(stmt).scalar_one_or_none()
-        
-        if ingredient_orm:
-            ingredient_orm.type_unit = new_meta.type_unit
-            ingredient_orm.storage_type = new_meta.storage_type
-            ingredient_orm.tips = new_meta.tips
-            ingredient_orm.image_path = new_meta.image_path
-        
-        # Actualizar el stack específico
-        stack_stmt = select(IngredientStackORM).where(
-            and_(
-                IngredientStackORM.ingredient_name == ingredient_name,
-                IngredientStackORM.inventory_user_uid == user_uid,
-                IngredientStackORM.added_at == added_at_datetime
+
+        results = []
+        drained_ids = []
+        partial_updates = []
+        emptied_names = []
+        success = True
+
+        for key, want in wanted.items():
+            stacks = stacks_by_name.get(key, [])
+            result = {
+                'ingredient': want['name'],
+                'requested_quantity': want['quantity'],
+                'consumed_quantity': 0.0,
+                'available_quantity': sum(s.quantity for s, _ in stacks),
+                'type_unit': stacks[0][1].type_unit if stacks else want['type_unit'],
+                'stacks': [],
+                'ingredient_removed': False
+            }
+
+            if not stacks:
+                result['status'] = 'not_found'
+                success = False
+                results.append(result)
+                continue
+
+            if want['type_unit'] and want['type_unit'].strip().lower() != stacks[0][1].type_unit.strip().lower():
+                result['status'] = 'unit_mismatch'
+                success = False
+                results.append(result)
+                continue
+
+            if result['available_quantity'] + QUANTITY_EPSILON < want['quantity']:
+                success = False
+                if not allow_partial:
+                    result['status'] = 'insufficient'
+                    results.append(result)
+                    continue
+
+            pending = want['quantity']
+            for stack_orm, _ in stacks:
+                if pending <= QUANTITY_EPSILON:
+                    break
+                take = min(stack_orm.quantity, pending)
+                remaining = stack_orm.quantity - take
+                if remaining <= QUANTITY_EPSILON:
+                    drained_ids.append(stack_orm.id)
+                    remaining = 0.0
+                else:
+                    partial_updates.append((stack_orm.id, take))
+                result['stacks'].append({
+                    'id': stack_orm.id,
+                    'consumed_quantity': take,
+                    'remaining_quantity': remaining,
+                    'stack_removed': remaining == 0.0,
+                    'expiration_date': stack_orm.expiration_date
+                })
+                pending -= take
+
+            result['consumed_quantity'] = want['quantity'] - max(pending, 0.0)
+            if all(s['stack_removed'] for s in result['stacks']) and len(result['stacks']) == len(stacks):
+                emptied_names.append(stacks[0][0].ingredient_name)
+                result['ingredient_removed'] = True
+            result['status'] = 'consumed' if pending <= QUANTITY_EPSILON else 'partial'
+            results.append(result)
+
+        if not success and not allow_partial:
+            self.db.session.rollback()
+            for result in results:
+                result['consumed_quantity'] = 0.0
+                result['stacks'] = []
+                result['ingredient_removed'] = False
+                if result['status'] in ('consumed', 'partial'):
+                    result['status'] = 'skipped'
+            return {'success': False, 'ingredients': results}
+
+        if drained_ids:
+            self.db.session.execute(
+                delete(IngredientStackORM).where(IngredientStackORM.id.in_(drained_ids))
+            )
+        for stack_id, take in partial_updates:
+            updated = self.db.session.execute(
+                update(IngredientStackORM)
+                .where(and_(IngredientStackORM.id == stack_id, IngredientStackORM.quantity >= take))
+                .values(quantity=IngredientStackORM.quantity - take)
+                .execution_options(synchronize_session=False)
             )
+            if updated.rowcount == 0:
+                # El stack cambió desde el SELECT: no aplicar nada a medias
+                self.db.session.rollback()
+                raise ValueError(f"Ingredient stack {stack_id} changed during consumption, please retry")
+        removed_names = self._delete_ingredient_if_empty(user_uid, emptied_names) if emptied_names else []
+
+        self._record_changes(
+            user_uid,
+            [(CHANGE_STACK, stack_id, CHANGE_DELETE) for stack_id in drained_ids]
+            + [(CHANGE_STACK, stack_id, CHANGE_UPSERT) for stack_id, _ in partial_updates]
+            + [(CHANGE_INGREDIENT, name, CHANGE_DELETE) for name in removed_names]
         )
-        stack_orm = self.db.session.execute(stack_stmt).scalar_one_or_none()
-        
-        if stack_orm:
-            stack_orm.quantity = new_stack.quantity
-            stack_orm.expiration_date = new_stack.expiration_date
-            # Mantenemos el added_at original, pero actualizamos al nuevo si cambió
-            if new_stack.added_at != added_at_datetime:
-                stack_orm.added_at = new_stack.added_at
-        
         self.db.session.commit()
+        return {'success': success, 'ingredients': results}
+
+    # ===== Rutas legacy: resuelven el ID y delegan en las operaciones por ID =====
+
+    def delete_ingredient_stack(self, user_uid: str, ingredient_name: str, added_at: str) -> None:
+        stack_id = self.find_ingredient_stack_id(user_uid, ingredient_name, added_at)
+        if stack_id is not None:
+            self.delete_ingredient_stack_by_id(user_uid, stack_id)
+
+    def delete_food_item(self, user_uid: str, food_name: str, added_at: str) -> None:
+        food_id = self.find_food_item_id(user_uid, food_name, added_at)
+        if food_id is not None:
+            self.delete_food_item_by_id(user_uid, food_id)
+
+    def update_food_item(self, user_uid: str, food_item: FoodItem) -> None:
+        food_id = food_item.id
+        if food_id is None:
+            food_id = self.find_food_item_id(user_uid, food_item.name, food_item.added_at)
+        if food_id is not None:
+            self.update_food_item_by_id(user_uid, food_id, food_item)
+
+    def update_ingredient_stack(self, user_uid: str, ingredient_name: str, added_at: str, new_stack: IngredientStack, new_meta: Ingredient) -> None:
+        stack_id = self.find_ingredient_stack_id(user_uid, ingredient_name, added_at)
+        if stack_id is not None:
+            self.update_ingredient_stack_by_id(user_uid, stack_id, new_stack, new_meta)
 
     def get_inventory(self, user_uid: str) -> Optional[Inventory]:
         return self.db.session.get(InventoryORM, user_uid)
@@ -288,94 +695,35 @@ class InventoryRepositoryImpl(InventoryRepository):
 
     def get_ingredient_stack(self, user_uid: str, ingredient_name: str, added_at: str) -> dict:
         """
-        Obtiene los datos de un stack específico de ingrediente.
+        Obtiene los datos de un stack específico de ingrediente (clave legacy).
         
         Returns:
             dict: Datos del stack e ingrediente, o None si no se encuentra
         """
-        try:
-            added_at_datetime = datetime.fromisoformat(added_at.replace('Z', '+00:00'))
-            # Convertir a naive datetime (sin timezone) para coincidir con la base de datos
-            added_at_datetime = added_at_datetime.replace(tzinfo=None)
-        except ValueError:
-            added_at_datetime = datetime.strptime(added_at, '%Y-%m-%d %H:%M:%S')
-        
-        # Obtener stack específico
-        stack_stmt = select(IngredientStackORM).where(
+        stmt = self._select_stack_with_ingredient().where(
             and_(
                 IngredientStackORM.ingredient_name == ingredient_name,
                 IngredientStackORM.inventory_user_uid == user_uid,
-                IngredientStackORM.added_at == added_at_datetime
+                IngredientStackORM.added_at == self._parse_added_at(added_at)
             )
         )
-        stack_orm = self.db.session.execute(stack_stmt).scalar_one_or_none()
-        
-        if not stack_orm:
-            return None
-        
-        # Obtener metadata del ingrediente
-        ingredient_stmt = select(IngredientORM).where(
-            and_(
-                IngredientORM.name == ingredient_name,
-                IngredientORM.inventory_user_uid == user_uid
-            )
-        )
-        ingredient_orm = self.db.session.execute(ingredient_stmt).scalar_one_or_none()
-        
-        if not ingredient_orm:
+        row = self.db.session.execute(stmt).one_or_none()
+        if not row:
             return None
-        
-        return {
-            'quantity': stack_orm.quantity,
-            'type_unit': ingredient_orm.type_unit,
-            'expiration_date': stack_orm.expiration_date,
-            'added_at': stack_orm.added_at,
-            'storage_type': ingredient_orm.storage_type,
-            'tips': ingredient_orm.tips,
-            'image_path': ingredient_orm.image_path
-        }
+        stack_orm, ingredient_orm = row
+        return self._stack_to_dict(stack_orm, ingredient_orm)
 
     def get_food_item(self, user_uid: str, food_name: str, added_at: str) -> dict:
         """
-        Obtiene los datos de un food item específico.
+        Obtiene los datos de un food item específico (clave legacy).
         
         Returns:
             dict: Datos del food item, o None si no se encuentra
         """
-        try:
-            added_at_datetime = datetime.fromisoformat(added_at.replace('Z', '+00:00'))
-            # Convertir a naive datetime (sin timezone) para coincidir con la base de datos
-            added_at_datetime = added_at_datetime.replace(tzinfo=None)
-        except ValueError:
-            added_at_datetime = datetime.strptime(added_at, '%Y-%m-%d %H:%M:%S')
-        
-        stmt = select(FoodItemORM).where(
-            and_(
-                FoodItemORM.name == food_name,
-                FoodItemORM.inventory_user_uid == user_uid,
-                FoodItemORM.added_at == added_at_datetime
-            )
-        )
-        food_orm = self.db.session.execute(stmt).scalar_one_or_none()
-        
-        if not food_orm:
+        food_id = self.find_food_item_id(user_uid, food_name, added_at)
+        if food_id is None:
             return None
-        
-        return {
-            'name': food_orm.name,
-            'main_ingredients': food_orm.main_ingredients,
-            'category': food_orm.category,
-            'calories': food_orm.calories,
-            'description': food_orm.description,
-            'storage_type': food_orm.storage_type,
-            'expiration_time': food_orm.expiration_time,
-            'time_unit': food_orm.time_unit,
-            'tips': food_orm.tips,
-            'serving_quantity': food_orm.serving_quantity,
-            'image_path': food_orm.image_path,
-            'added_at': food_orm.added_at,
-            'expiration_date': food_orm.expiration_date
-        }
+        return self.get_food_item_by_id(user_uid, food_id)
     
     def get_all_food_items(self, user_uid: str) -> list:
         """
@@ -387,23 +735,360 @@ class InventoryRepositoryImpl(InventoryRepository):
         stmt = select(FoodItemORM).where(FoodItemORM.inventory_user_uid == user_uid)
         food_items = self.db.session.execute(stmt).scalars().all()
         
-        return [
-            {
-                'name': food_orm.name,
-                'main_ingredients': food_orm.main_ingredients,
-                'category': food_orm.category,
-                'calories': food_orm.calories,
-                'description': food_orm.description,
-                'storage_type': food_orm.storage_type,
-                'expiration_time': food_orm.expiration_time,
-                'time_unit': food_orm.time_unit,
-                'tips': food_orm.tips,
-                'serving_quantity': food_orm.serving_quantity,
-                'image_path': food_orm.image_path,
-                'added_at': food_orm.added_at,
-                'expiration_date': food_orm.expiration_date
+        return [self._food_to_dict(food_orm) for food_orm in food_items]
+
+    @staticmethod
+    def _expiration_filters(column, expired: Optional[bool], expiring_within_days: Optional[int], now: datetime) -> list:
+        conditions = []
+        if expired is True:
+            conditions.append(column < now)
+        elif expired is False:
+            conditions.append(column >= now)
+        if expiring_within_days is not None:
+            conditions.append(column >= now)
+            conditions.append(column <= now + timedelta(days=expiring_within_days))
+        return conditions
+
+    def get_ingredients_page(
+        self,
+        user_uid: str,
+        sort: str = "name",
+        after: Optional[list] = None,
+        limit: Optional[int] = None,
+        storage_type: Optional[str] = None,
+        expired: Optional[bool] = None,
+        expiring_within_days: Optional[int] = None,
+        optional_columns: Optional[tuple] = None
+    ) -> dict:
+        """
+        Obtiene una página de ingredientes con sus stacks, paginando por clave (keyset).
+        Sin filtros de vencimiento se listan también los ingredientes sin stacks (al final del
+        orden "expiration"); con filtros, solo los que tienen algún stack que los cumpla.
+
+        Args:
+            sort: "name" (clave: [name]) o "expiration" (clave: [nearest_expiration o None, name])
+            after: Clave del último ingrediente de la página anterior
+            limit: Tamaño de página (None = sin límite)
+            optional_columns: Subconjunto de INGREDIENT_OPTIONAL_COLUMNS a cargar (None = todas)
+
+        Returns:
+            dict: {'ingredients': [...], 'next_key': clave del último elemento o None si no hay más}
+        """
+        now = datetime.now()
+        expiration_filters = self._expiration_filters(
+            IngredientStackORM.expiration_date, expired, expiring_within_days, now
+        )
+        stack_conditions = [IngredientStackORM.inventory_user_uid == user_uid] + expiration_filters
+
+        nearest_expiration = func.min(IngredientStackORM.expiration_date)
+        stack_join = and_(
+            IngredientStackORM.ingredient_name == IngredientORM.name,
+            IngredientStackORM.inventory_user_uid == IngredientORM.inventory_user_uid
+        )
+        page_stmt = select(IngredientORM.name, nearest_expiration.label('nearest_expiration'))
+        if expiration_filters:
+            page_stmt = page_stmt.join(IngredientStackORM, stack_join).where(*expiration_filters)
+        else:
+            # LEFT JOIN: un ingrediente sin stacks también aparece, como en el listado sin paginar
+            page_stmt = page_stmt.outerjoin(IngredientStackORM, stack_join)
+        page_stmt = page_stmt.where(IngredientORM.inventory_user_uid == user_uid).group_by(IngredientORM.name)
+        if storage_type:
+            page_stmt = page_stmt.where(IngredientORM.storage_type == storage_type)
+
+        if sort == "expiration":
+            if after:
+                if after[0] is None:
+                    page_stmt = page_stmt.having(and_(nearest_expiration.is_(None), IngredientORM.name > after[1]))
+                else:
+                    after_expiration = datetime.fromisoformat(after[0])
+                    page_stmt = page_stmt.having(or_(
+                        nearest_expiration > after_expiration,
+                        and_(nearest_expiration == after_expiration, IngredientORM.name > after[1]),
+                        nearest_expiration.is_(None)
+                    ))
+            # Los ingredientes sin stacks van al final
+            page_stmt = page_stmt.order_by(nearest_expiration.is_(None), nearest_expiration, IngredientORM.name)
+        else:
+            if after:
+                page_stmt = page_stmt.where(IngredientORM.name > after[0])
+            page_stmt = page_stmt.order_by(IngredientORM.name)
+
+        if limit:
+            page_stmt = page_stmt.limit(limit + 1)
+
+        page_rows = self.db.session.execute(page_stmt).all()
+        has_more = bool(limit) and len(page_rows) > limit
+        page_rows = page_rows[:limit] if limit else page_rows
+
+        if not page_rows:
+            return {'ingredients': [], 'next_key': None}
+
+        names = [row.name for row in page_rows]
+        optional_columns = INGREDIENT_OPTIONAL_COLUMNS if optional_columns is None else optional_columns
+        # Proyección por columnas: solo se leen las columnas pedidas, sin instanciar entidades ORM
+        ingredients_stmt = select(
+            IngredientORM.name,
+            IngredientORM.type_unit,
+            IngredientORM.storage_type,
+            *[getattr(IngredientORM, column) for column in optional_columns]
+        ).where(IngredientORM.inventory_user_uid == user_uid, IngredientORM.name.in_(names))
+        ingredients_by_name = {
+            row.name: {
+                'name': row.name,
+                'type_unit': row.type_unit,
+                'storage_type': row.storage_type,
+                **{column: getattr(row, column) for column in optional_columns},
+                'stacks': []
             }
-            for food_orm in food_items
+            for row in self.db.session.execute(ingredients_stmt).all()
+        }
+
+        stacks_stmt = (
+            select(
+                IngredientStackORM.id,
+                IngredientStackORM.ingredient_name,
+                IngredientStackORM.quantity,
+                IngredientStackORM.expiration_date,
+                IngredientStackORM.added_at
+            )
+            .where(IngredientStackORM.ingredient_name.in_(names), *stack_conditions)
+            .order_by(IngredientStackORM.ingredient_name, IngredientStackORM.expiration_date, IngredientStackORM.id)
+        )
+        for row in self.db.session.execute(stacks_stmt).all():
+            ingredients_by_name[row.ingredient_name]['stacks'].append({
+                'id': row.id,
+                'quantity': row.quantity,
+                'expiration_date': row.expiration_date,
+                'added_at': row.added_at
+            })
+
+        last = page_rows[-1]
+        next_key = None
+        if has_more:
+            next_key = [last.nearest_expiration, last.name] if sort == "expiration" else [last.name]
+
+        return {
+            'ingredients': [ingredients_by_name[name] for name in names if name in ingredients_by_name],
+            'next_key': next_key
+        }
+
+    def get_food_items_page(
+        self,
+        user_uid: str,
+        sort: str = "expiration",
+        after: Optional[list] = None,
+        limit: Optional[int] = None,
+        storage_type: Optional[str] = None,
+        category: Optional[str] = None,
+        expired: Optional[bool] = None,
+        expiring_within_days: Optional[int] = None,
+        optional_columns: Optional[tuple] = None
+    ) -> dict:
+        """
+        Obtiene una página de food items paginando por clave (keyset).
+
+        Args:
+            sort: "expiration" (clave: [expiration_date, id]) o "name" (clave: [name, id])
+            after: Clave del último food item de la página anterior
+            limit: Tamaño de página (None = sin límite)
+            optional_columns: Subconjunto de FOOD_ITEM_OPTIONAL_COLUMNS a cargar (None = todas)
+
+        Returns:
+            dict: {'foods': [...], 'next_key': clave del último elemento o None si no hay más}
+        """
+        now = datetime.now()
+        optional_columns = FOOD_ITEM_OPTIONAL_COLUMNS if optional_columns is None else optional_columns
+        columns = FOOD_ITEM_BASE_COLUMNS + tuple(optional_columns)
+        stmt = select(*[getattr(FoodItemORM, column) for column in columns]).where(
+            FoodItemORM.inventory_user_uid == user_uid,
+            *self._expiration_filters(FoodItemORM.expiration_date, expired, expiring_within_days, now)
+        )
+        if storage_type:
+            stmt = stmt.where(FoodItemORM.storage_type == storage_type)
+        if category:
+            stmt = stmt.where(FoodItemORM.category == category)
+
+        if sort == "name":
+            if after:
+                stmt = stmt.where(or_(
+                    FoodItemORM.name > after[0],
+                    and_(FoodItemORM.name == after[0], FoodItemORM.id > after[1])
+                ))
+            stmt = stmt.order_by(FoodItemORM.name, FoodItemORM.id)
+        else:
+            if after:
+                after_expiration = datetime.fromisoformat(after[0])
+                stmt = stmt.where(or_(
+                    FoodItemORM.expiration_date > after_expiration,
+                    and_(FoodItemORM.expiration_date == after_expiration, FoodItemORM.id > after[1])
+                ))
+            stmt = stmt.order_by(FoodItemORM.expiration_date, FoodItemORM.id)
+
+        if limit:
+            stmt = stmt.limit(limit + 1)
+
+        food_rows = self.db.session.execute(stmt).all()
+        has_more = bool(limit) and len(food_rows) > limit
+        food_rows = food_rows[:limit] if limit else food_rows
+
+        next_key = None
+        if has_more:
+            last = food_rows[-1]
+            next_key = [last.name, last.id] if sort == "name" else [last.expiration_date, last.id]
+
+        return {
+            'foods': [dict(row._mapping) for row in food_rows],
+            'next_key': next_key
+        }
+
+    # ===== Delta sync =====
+
+    def get_changes_since(self, user_uid: str, since: int, limit: int) -> dict:
+        """
+        Obtiene los cambios del inventario posteriores a `since`.
+
+        Returns:
+            dict: {'current_seq', 'complete' (False si el registro ya no cubre desde `since`),
+                   'changes': [{'seq', 'entity_type', 'entity_key', 'op'}] ordenados por seq}
+        """
+        current_seq = self.db.session.execute(
+            select(InventoryORM.change_seq).where(InventoryORM.user_uid == user_uid)
+        ).scalar_one_or_none() or 0
+
+        if since == current_seq:
+            return {'current_seq': current_seq, 'complete': True, 'changes': []}
+        if since > current_seq:
+            return {'current_seq': current_seq, 'complete': False, 'changes': []}
+
+        oldest_seq = self.db.session.execute(
+            select(func.min(InventoryChangeORM.seq)).where(InventoryChangeORM.user_uid == user_uid)
+        ).scalar_one_or_none()
+        # La secuencia es densa: si el cambio since+1 fue depurado, el cursor es demasiado viejo
+        if oldest_seq is None or oldest_seq > since + 1:
+            return {'current_seq': current_seq, 'complete': False, 'changes': []}
+
+        rows = self.db.session.execute(
+            select(
+                InventoryChangeORM.seq,
+                InventoryChangeORM.entity_type,
+                InventoryChangeORM.entity_key,
+                InventoryChangeORM.op
+            )
+            .where(InventoryChangeORM.user_uid == user_uid, InventoryChangeORM.seq > since)
+            .order_by(InventoryChangeORM.seq)
+            .limit(limit)
+        ).all()
+
+        return {
+            'current_seq': current_seq,
+            'complete': True,
+            'changes': [dict(row._mapping) for row in rows]
+        }
+
+    def get_sync_entities(
+        self,
+        user_uid: str,
+        ingredient_names: Optional[list] = None,
+        stack_ids: Optional[list] = None,
+        food_ids: Optional[list] = None
+    ) -> dict:
+        """
+        Carga el estado actual de las entidades indicadas (una consulta por tipo).
+        Con los tres filtros en None devuelve el inventario completo (snapshot).
+
+        Returns:
+            dict: {'ingredients': [...], 'ingredient_stacks': [...], 'food_items': [...]}
+        """
+        snapshot = ingredient_names is None and stack_ids is None and food_ids is None
+        result = {'ingredients': [], 'ingredient_stacks': [], 'food_items': []}
+
+        if snapshot or ingredient_names:
+            stmt = select(IngredientORM).where(IngredientORM.inventory_user_uid == user_uid)
+            if not snapshot:
+                stmt = stmt.where(IngredientORM.name.in_(ingredient_names))
+            result['ingredients'] = [
+                {
+                    'name': ingredient_orm.name,
+                    'type_unit': ingredient_orm.type_unit,
+                    'storage_type': ingredient_orm.storage_type,
+                    'tips': ingredient_orm.tips,
+                    'image_path': ingredient_orm.image_path
+                }
+                for ingredient_orm in self.db.session.execute(stmt.order_by(IngredientORM.name)).scalars().all()
+            ]
+
+        if snapshot or stack_ids:
+            stmt = select(IngredientStackORM).where(IngredientStackORM.inventory_user_uid == user_uid)
+            if not snapshot:
+                stmt = stmt.where(IngredientStackORM.id.in_(stack_ids))
+            result['ingredient_stacks'] = [
+                {
+                    'id': stack_orm.id,
+                    'ingredient_name': stack_orm.ingredient_name,
+                    'quantity': stack_orm.quantity,
+                    'expiration_date': stack_orm.expiration_date,
+                    'added_at': stack_orm.added_at
+                }
+                for stack_orm in self.db.session.execute(stmt.order_by(IngredientStackORM.id)).scalars().all()
+            ]
+
+        if snapshot or food_ids:
+            stmt = select(FoodItemORM).where(FoodItemORM.inventory_user_uid == user_uid)
+            if not snapshot:
+                stmt = stmt.where(FoodItemORM.id.in_(food_ids))
+            result['food_items'] = [
+                self._food_to_dict(food_orm)
+                for food_orm in self.db.session.execute(stmt.order_by(FoodItemORM.id)).scalars().all()
+            ]
+
+        return result
+
+    def prune_inventory_changes(self, older_than: datetime) -> int:
+        """
+        Depura el registro de cambios anterior a `older_than`.
+        Los clientes con cursores más viejos recibirán un snapshot completo.
+
+        Returns:
+            int: Cantidad de cambios eliminados
+        """
+        result = self.db.session.execute(
+            delete(InventoryChangeORM).where(InventoryChangeORM.changed_at < older_than)
+        )
+        self.db.session.commit()
+        return result.rowcount
+
+    def get_stack_totals(self, user_uid: str, usable_from: datetime) -> list:
+        """
+        Cantidad disponible por ingrediente, unidad y vencimiento (stacks que vencen desde `usable_from`).
+        Una sola consulta agrupada, sin cargar los stacks uno por uno.
+
+        Returns:
+            list: [{"name", "type_unit", "expiration_date", "quantity"}] ordenado por vencimiento
+        """
+        stmt = select(
+            IngredientStackORM.ingredient_name,
+            IngredientORM.type_unit,
+            IngredientStackORM.expiration_date,
+            func.sum(IngredientStackORM.quantity)
+        ).join(
+            IngredientORM,
+            and_(
+                IngredientORM.name == IngredientStackORM.ingredient_name,
+                IngredientORM.inventory_user_uid == IngredientStackORM.inventory_user_uid
+            )
+        ).where(
+            IngredientStackORM.inventory_user_uid == user_uid,
+            IngredientStackORM.expiration_date >= usable_from,
+            IngredientStackORM.quantity > 0
+        ).group_by(
+            IngredientStackORM.ingredient_name,
+            IngredientORM.type_unit,
+            IngredientStackORM.expiration_date
+        ).order_by(IngredientStackORM.expiration_date)
+
+        return [
+            {"name": name, "type_unit": type_unit, "expiration_date": expiration_date, "quantity": quantity}
+            for name, type_unit, expiration_date, quantity in self.db.session.execute(stmt).all()
         ]
 
     def get_all_ingredient_stacks(self, user_uid: str, ingredient_name: str) -> list:
@@ -422,6 +1107,7 @@ class InventoryRepositoryImpl(InventoryRepository):
         stacks = self.db.session.execute(stmt).scalars().all()
         return [
             {
+                'id': stack.id,
                 'quantity': stack.quantity,
                 'added_at': stack.added_at,
                 'expiration_date': stack.expiration_date
@@ -440,6 +1126,15 @@ class InventoryRepositoryImpl(InventoryRepository):
         print(f"🗑️ [INVENTORY REPO] Deleting complete ingredient: {ingredient_name}")
         print(f"   └─ User: {user_uid}")
         
+        stack_ids = self.db.session.execute(
+            select(IngredientStackORM.id).where(
+                and_(
+                    IngredientStackORM.ingredient_name == ingredient_name,
+                    IngredientStackORM.inventory_user_uid == user_uid
+                )
+            )
+        ).scalars().all()
+
         # Primero eliminar todos los stacks del ingrediente
         stmt_stacks = delete(IngredientStackORM).where(
             and_(
@@ -462,5 +1157,10 @@ class InventoryRepositoryImpl(InventoryRepository):
         deleted_ingredients = result_ingredient.rowcount
         print(f"   └─ Deleted {deleted_ingredients} ingredient record")
         
+        changes = [(CHANGE_STACK, stack_id, CHANGE_DELETE) for stack_id in stack_ids]
+        if deleted_ingredients:
+            changes.append((CHANGE_INGREDIENT, ingredient_name, CHANGE_DELETE))
+        self._record_changes(user_uid, changes)
+        
         self.db.session.commit()
         print(f"✅ [INVENTORY REPO] Successfully deleted complete ingredient: {ingredient_name}")
\ No newline at end of file
@@ -1,9 +1,15 @@
+import uuid
 from typing import Optional
-from datetime import date
-from sqlalchemy import select, delete
-from src.domain.models.daily_meal_plan import DailyMealPlan
+from datetime import date, datetime, timezone
+from sqlalchemy import select, delete, func, union_all
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import selectinload
+from src.domain.models.daily_meal_plan import DailyMealPlan, MEAL_SLOTS
 from src.domain.repositories.meal_plan_repository import MealPlanRepository
 from src.infrastructure.db.models.daily_meal_plan_orm import DailyMealPlanORM
+from src.infrastructure.db.models.recipe_orm import RecipeORM
+from src.infrastructure.db.models.recipe_ingredient_orm import RecipeIngredientORM
 from src.shared.exceptions.custom import MealPlanNotFoundException
 
 class MealPlanRepositoryImpl(MealPlanRepository):
@@ -39,7 +45,7 @@ class MealPlanRepositoryImpl(MealPlanRepository):
             DailyMealPlanORM.date == target_date
         )
         row = self.db.session.execute(stmt).scalar_one_or_none()
-        return self._to_domain(row) if row else None
+        return self._to_domain_many([row])[0] if row else None
 
     def delete_by_user_and_date(self, user_uid: str, target_date: date) -> None:
         stmt = select(DailyMealPlanORM).where(
@@ -52,21 +58,133 @@ class MealPlanRepositoryImpl(MealPlanRepository):
         self.db.session.delete(plan)
         self.db.session.commit()
 
+    def upsert_many(self, user_uid: str, plans: list[dict]) -> None:
+        """
+        Crea o reemplaza los planes de varios días en una sola sentencia y un solo commit.
+        El conflicto se resuelve por uq_user_date_mealplan (user_uid, date): un día existente conserva su uid.
+
+        Args:
+            user_uid: UID del usuario
+            plans: [{"date": date, "breakfast": uid o None, "lunch": ..., "dinner": ..., "dessert": ...}]
+        """
+        now = datetime.now(timezone.utc)
+        rows = [
+            {
+                "uid": str(uuid.uuid4()),
+                "user_uid": user_uid,
+                "date": plan["date"],
+                **{f"{slot}_recipe_uid": plan.get(slot) for slot in MEAL_SLOTS},
+                "created_at": now,
+                "updated_at": now
+            }
+            for plan in plans
+        ]
+        updated_columns = [f"{slot}_recipe_uid" for slot in MEAL_SLOTS] + ["updated_at"]
+
+        if self.db.session.get_bind().dialect.name == "mysql":
+            stmt = mysql_insert(DailyMealPlanORM).values(rows)
+            stmt = stmt.on_duplicate_key_update({column: stmt.inserted[column] for column in updated_columns})
+        else:
+            stmt = sqlite_insert(DailyMealPlanORM).values(rows)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["user_uid", "date"],
+                set_={column: stmt.excluded[column] for column in updated_columns}
+            )
+
+        try:
+            self.db.session.execute(stmt)
+            self.db.session.commit()
+        except Exception:
+            self.db.session.rollback()
+            raise
+
     def get_all_by_user(self, user_uid: str) -> list[DailyMealPlan]:
         stmt = select(DailyMealPlanORM).where(DailyMealPlanORM.user_uid == user_uid)
         rows = self.db.session.execute(stmt).scalars().all()
-        return [self._to_domain(row) for row in rows]
-
-    def _to_domain(self, row: DailyMealPlanORM) -> DailyMealPlan:
-        return DailyMealPlan(
-            uid=row.uid,
-            user_uid=row.user_uid,
-            date_=row.date,
-            breakfast=self._map_recipe(row.breakfast_recipe) if row.breakfast_recipe else None,
-            lunch=self._map_recipe(row.lunch_recipe) if row.lunch_recipe else None,
-            dinner=self._map_recipe(row.dinner_recipe) if row.dinner_recipe else None,
-            dessert=self._map_recipe(row.dessert_recipe) if row.dessert_recipe else None,
-        )
+        return self._to_domain_many(rows)
+
+    def get_range_by_user(self, user_uid: str, start_date: date, end_date: date) -> list[DailyMealPlan]:
+        """
+        Obtiene los planes del usuario entre dos fechas (ambas incluidas), ordenados por fecha.
+        Siempre son 4 consultas: planes, recetas referenciadas, ingredientes y pasos.
+        """
+        stmt = select(DailyMealPlanORM).where(
+            DailyMealPlanORM.user_uid == user_uid,
+            DailyMealPlanORM.date >= start_date,
+            DailyMealPlanORM.date <= end_date
+        ).order_by(DailyMealPlanORM.date)
+        rows = self.db.session.execute(stmt).scalars().all()
+        return self._to_domain_many(rows)
+
+    def get_ingredient_demand(self, user_uid: str, start_date: date, end_date: date) -> list:
+        """
+        Ingredientes que piden las recetas planificadas entre dos fechas, sumados por día, nombre y unidad.
+        Se resuelve en una consulta: las 4 comidas de cada día como filas (UNION ALL) unidas a recipe_ingredients.
+
+        Returns:
+            list: [{"date", "name", "type_unit", "quantity"}] ordenado por fecha
+        """
+        planned = union_all(*[
+            select(
+                DailyMealPlanORM.date.label("date"),
+                getattr(DailyMealPlanORM, f"{slot}_recipe_uid").label("recipe_uid")
+            ).where(
+                DailyMealPlanORM.user_uid == user_uid,
+                DailyMealPlanORM.date >= start_date,
+                DailyMealPlanORM.date <= end_date,
+                getattr(DailyMealPlanORM, f"{slot}_recipe_uid").is_not(None)
+            )
+            for slot in MEAL_SLOTS
+        ]).subquery()
+
+        stmt = select(
+            planned.c.date,
+            RecipeIngredientORM.name,
+            RecipeIngredientORM.type_unit,
+            func.sum(RecipeIngredientORM.quantity)
+        ).join(
+            RecipeIngredientORM, RecipeIngredientORM.recipe_uid == planned.c.recipe_uid
+        ).group_by(
+            planned.c.date, RecipeIngredientORM.name, RecipeIngredientORM.type_unit
+        ).order_by(planned.c.date)
+
+        return [
+            {"date": planned_date, "name": name, "type_unit": type_unit, "quantity": quantity}
+            for planned_date, name, type_unit, quantity in self.db.session.execute(stmt).all()
+        ]
+
+    def _to_domain_many(self, rows: list) -> list[DailyMealPlan]:
+        # Las recetas de todos los días se cargan juntas (sin tocar las relaciones lazy de cada slot)
+        # y una receta repetida en varios días se mapea una sola vez
+        recipe_uids = {
+            uid
+            for row in rows
+            for uid in (row.breakfast_recipe_uid, row.lunch_recipe_uid, row.dinner_recipe_uid, row.dessert_recipe_uid)
+            if uid
+        }
+        recipes = {}
+        if recipe_uids:
+            stmt = select(RecipeORM).where(RecipeORM.uid.in_(recipe_uids)).options(
+                selectinload(RecipeORM.ingredients),
+                selectinload(RecipeORM.steps)
+            )
+            recipes = {
+                recipe.uid: self._map_recipe(recipe)
+                for recipe in self.db.session.execute(stmt).scalars().all()
+            }
+
+        return [
+            DailyMealPlan(
+                uid=row.uid,
+                user_uid=row.user_uid,
+                date_=row.date,
+                breakfast=recipes.get(row.breakfast_recipe_uid),
+                lunch=recipes.get(row.lunch_recipe_uid),
+                dinner=recipes.get(row.dinner_recipe_uid),
+                dessert=recipes.get(row.dessert_recipe_uid),
+            )
+            for row in rows
+        ]
 
     def get_all_dates_by_user(self, user_uid: str) -> list[date]:
         stmt = select(DailyMealPlanORM.date).where(DailyMealPlanORM.user_uid == user_uid)
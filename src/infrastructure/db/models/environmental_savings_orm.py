@@ -4,6 +4,10 @@ from datetime import datetime, timezone
 
 class EnvironmentalSavingsORM(db.Model):
     __tablename__ = "environmental_savings"
+    __table_args__ = (
+        db.UniqueConstraint("user_uid", "recipe_uid", name="uq_environmental_savings_user_recipe"),
+        db.Index("idx_environmental_savings_user_cooked_saved_at", "user_uid", "is_cooked", "saved_at"),
+    )
 
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
 
@@ -23,7 +27,7 @@ class EnvironmentalSavingsORM(db.Model):
     unit_cost = db.Column(db.String(20), default="USD")
 
     is_cooked = db.Column(db.Boolean, default=False)
-    saved_at = db.Column(db.DateTime, default=datetime.now(timezone.utc))
+    saved_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc).replace(tzinfo=None))
 
     user = db.relationship("User", backref=db.backref("environmental_savings", lazy=True))
     # Note: No direct relationship to recipes since we now support both manual and generated recipes
@@ -0,0 +1,26 @@
+from src.infrastructure.db.base import db
+
+
+class EnvironmentalSavingsRollupORM(db.Model):
+    """
+    Totales de ahorro ambiental por usuario y período (día o mes), desglosados por estado y tipo de receta.
+    Se mantienen en la misma transacción que cada cambio en environmental_savings.
+    """
+    __tablename__ = "environmental_savings_rollups"
+
+    user_uid = db.Column(db.String(128), primary_key=True)
+    period = db.Column(db.String(5), primary_key=True)          # day | month
+    bucket_start = db.Column(db.Date, primary_key=True)         # día, o primer día del mes
+    is_cooked = db.Column(db.Boolean, primary_key=True)
+    recipe_source_type = db.Column(db.String(20), primary_key=True)
+
+    calculations_count = db.Column(db.Integer, nullable=False, default=0)
+    carbon_footprint = db.Column(db.Double, nullable=False, default=0.0)
+    water_footprint = db.Column(db.Double, nullable=False, default=0.0)
+    energy_footprint = db.Column(db.Double, nullable=False, default=0.0)
+    economic_cost = db.Column(db.Double, nullable=False, default=0.0)
+
+    unit_carbon = db.Column(db.String(20))
+    unit_water = db.Column(db.String(20))
+    unit_energy = db.Column(db.String(20))
+    unit_cost = db.Column(db.String(20))
@@ -20,3 +20,9 @@ class FoodItemORM(db.Model):
     image_path = db.Column(db.String(1000))
     added_at = db.Column(db.DateTime, default=datetime.now(timezone.utc))
     expiration_date = db.Column(db.DateTime, nullable=False)
+
+    __table_args__ = (
+        db.Index("idx_food_items_user_name_added", "inventory_user_uid", "name", "added_at"),
+        db.Index("idx_food_items_user_expiration", "inventory_user_uid", "expiration_date", "id"),
+        db.Index("idx_food_items_user_category_expiration", "inventory_user_uid", "category", "expiration_date"),
+    )
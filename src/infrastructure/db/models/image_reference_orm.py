@@ -1,3 +1,4 @@
+from datetime import datetime, timezone
 from src.infrastructure.db.base import db
 
 class ImageReferenceORM(db.Model):
@@ -6,4 +7,10 @@ class ImageReferenceORM(db.Model):
     uid = db.Column(db.String(36), primary_key=True)
     name = db.Column(db.String(255), unique=True, nullable=False)
     image_path = db.Column(db.String(1000), nullable=False)
-    image_type = db.Column(db.String(50), nullable=False)
\ No newline at end of file
+    image_type = db.Column(db.String(50), nullable=False)
+    # Marca de agua para la sincronización incremental del índice difuso de nombres
+    created_at = db.Column(db.DateTime, nullable=True, default=lambda: datetime.now(timezone.utc))
+
+    __table_args__ = (
+        db.Index("idx_image_references_created_at", "created_at"),
+    )
\ No newline at end of file
@@ -0,0 +1,19 @@
+from datetime import datetime, timezone
+from src.infrastructure.db.base import db
+
+
+class IngredientImpactFactorORM(db.Model):
+    """Factores de impacto ambiental por kg de ingrediente normalizado, aprendidos para ingredientes sin factor por defecto"""
+    __tablename__ = "ingredient_impact_factors"
+
+    ingredient_key = db.Column(db.String(100), primary_key=True)  # ingredient_key(): sin acentos, minúsculas, singular
+
+    carbon_footprint = db.Column(db.Float, nullable=False)  # kg CO2e por kg
+    water_footprint = db.Column(db.Float, nullable=False)   # litros por kg
+    energy_footprint = db.Column(db.Float, nullable=False)  # MJ por kg
+    economic_cost = db.Column(db.Float, nullable=False)     # USD por kg
+    kg_per_unit = db.Column(db.Float, nullable=False, default=0.1)
+    kg_per_litre = db.Column(db.Float, nullable=False, default=1.0)
+
+    source = db.Column(db.String(20), nullable=False, default="ai")  # ai | manual
+    created_at = db.Column(db.DateTime, nullable=False, default=lambda: datetime.now(timezone.utc).replace(tzinfo=None))
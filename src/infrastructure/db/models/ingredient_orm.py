@@ -13,5 +13,10 @@ class IngredientORM(db.Model):
     tips = db.Column(db.String(255), nullable=True)
     image_path = db.Column(db.String(1000), nullable=False)
 
+    __table_args__ = (
+        db.Index("idx_ingredients_user_name", "inventory_user_uid", "name"),
+        db.Index("idx_ingredients_user_storage_name", "inventory_user_uid", "storage_type", "name"),
+    )
+
     inventory = relationship("InventoryORM", back_populates="ingredients")
     stacks = relationship("IngredientStackORM", back_populates="ingredient", cascade="all, delete-orphan")
\ No newline at end of file
@@ -3,9 +3,11 @@ from src.infrastructure.db.base import db
 class IngredientStackORM(db.Model):
     __tablename__ = "ingredient_stacks"
 
-    ingredient_name = db.Column(db.String(100), primary_key=True)
-    inventory_user_uid = db.Column(db.String(100), primary_key=True)
-    added_at = db.Column(db.DateTime(timezone=True), primary_key=True)
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+
+    ingredient_name = db.Column(db.String(100), nullable=False)
+    inventory_user_uid = db.Column(db.String(100), nullable=False)
+    added_at = db.Column(db.DateTime(timezone=True), nullable=False)
 
     quantity = db.Column(db.Float, nullable=False)
     expiration_date = db.Column(db.DateTime, nullable=False)
@@ -15,6 +17,12 @@ class IngredientStackORM(db.Model):
             ['ingredient_name', 'inventory_user_uid'],
             ['ingredients.name', 'ingredients.inventory_user_uid']
         ),
+        # Mantiene la unicidad de la clave legacy (nombre, usuario, added_at) para las rutas antiguas
+        db.UniqueConstraint(
+            'ingredient_name', 'inventory_user_uid', 'added_at',
+            name='uq_ingredient_stack_added_at'
+        ),
+        db.Index("idx_ingredient_stacks_user_expiration", "inventory_user_uid", "expiration_date"),
     )
 
     ingredient = db.relationship("IngredientORM", back_populates="stacks")
@@ -0,0 +1,19 @@
+from datetime import datetime, timezone
+from src.infrastructure.db.base import db
+
+class InventoryChangeORM(db.Model):
+    """Registro de cambios del inventario para la sincronización incremental (delta sync)"""
+    __tablename__ = "inventory_changes"
+
+    # Secuencia densa por usuario (inventories.change_seq): sin huecos, así un cursor viejo se detecta
+    user_uid = db.Column(db.String(36), primary_key=True)
+    seq = db.Column(db.BigInteger().with_variant(db.Integer, "sqlite"), primary_key=True, autoincrement=False)
+
+    entity_type = db.Column(db.String(20), nullable=False)  # ingredient | ingredient_stack | food_item
+    entity_key = db.Column(db.String(100), nullable=False)  # nombre del ingrediente o ID del stack/food item
+    op = db.Column(db.String(10), nullable=False)           # upsert | delete
+    changed_at = db.Column(db.DateTime, nullable=False, default=lambda: datetime.now(timezone.utc).replace(tzinfo=None))
+
+    __table_args__ = (
+        db.Index("idx_inventory_changes_changed_at", "changed_at"),
+    )
@@ -4,6 +4,8 @@ class InventoryORM(db.Model):
     __tablename__ = "inventories"
 
     user_uid = db.Column(db.String(36), db.ForeignKey("users.uid"), primary_key=True)
+    # Último número de secuencia asignado en inventory_changes para este usuario
+    change_seq = db.Column(db.BigInteger, nullable=False, default=0, server_default="0")
 
     user = db.relationship("User", backref=db.backref("inventory", uselist=False))
     ingredients = db.relationship("IngredientORM", back_populates="inventory", cascade="all, delete-orphan")
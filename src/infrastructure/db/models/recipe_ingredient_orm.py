@@ -10,3 +10,7 @@ class RecipeIngredientORM(db.Model):
     type_unit = db.Column(db.String(50), nullable=False)
 
     recipe = db.relationship("RecipeORM", back_populates="ingredients")
+
+    __table_args__ = (
+        db.Index("ft_recipe_ingredients_name", "name", mysql_prefix="FULLTEXT"),
+    )
@@ -33,3 +33,9 @@ class RecipeORM(db.Model):
     )
 
     user = db.relationship("User", backref=db.backref("saved_recipes", lazy=True))
+
+    __table_args__ = (
+        db.Index("idx_recipes_user_saved_at", "user_uid", "saved_at", "uid"),
+        db.Index("idx_recipes_saved_at", "saved_at", "uid"),
+        db.Index("ft_recipes_title_description", "title", "description", mysql_prefix="FULLTEXT"),
+    )
@@ -0,0 +1,11 @@
+from src.infrastructure.db.base import db
+
+
+class SustainabilityRankingSketchORM(db.Model):
+    """Resumen de percentiles (anónimo) de los totales por usuario, uno por métrica; lo reconstruye un job periódico"""
+    __tablename__ = "sustainability_ranking_sketches"
+
+    metric = db.Column(db.String(30), primary_key=True)  # carbon_footprint | water_footprint
+    cutpoints = db.Column(db.JSON, nullable=False)       # k + 1 valores en los cuantiles 0, 1/k, ..., 1
+    population = db.Column(db.Integer, nullable=False)   # usuarios resumidos
+    built_at = db.Column(db.DateTime, nullable=False)
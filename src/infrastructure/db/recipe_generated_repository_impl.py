@@ -1,5 +1,6 @@
 from typing import List, Optional, Dict, Any
 import uuid
+from datetime import datetime, timezone
 from src.infrastructure.db.models.recipe_generated_orm import RecipeGeneratedORM
 from src.infrastructure.db.base import db
 
@@ -11,28 +12,36 @@ class RecipeGeneratedRepositoryImpl:
         """
         Guarda una receta generada automáticamente
         """
-        recipe_uid = str(uuid.uuid4())
-        
-        recipe_generated = RecipeGeneratedORM(
-            uid=recipe_uid,
-            user_uid=user_uid,
-            generation_id=generation_id,
-            title=recipe_data.get('name', recipe_data.get('title', 'Receta sin título')),
-            description=recipe_data.get('description', ''),
-            duration=str(recipe_data.get('prep_time', recipe_data.get('duration', ''))),
-            difficulty=recipe_data.get('difficulty', ''),
-            servings=recipe_data.get('servings'),
-            category=recipe_data.get('meal_type', recipe_data.get('category', '')),
-            recipe_data=recipe_data,  # Almacena toda la receta en JSON
-            generation_type=generation_type,
-            image_path=recipe_data.get('image_path'),
-            image_status=recipe_data.get('image_status', 'generating')
-        )
+        row = self.build_generated_row(user_uid, generation_id, recipe_data, generation_type)
+        recipe_generated = RecipeGeneratedORM(**row)
         
         db.session.add(recipe_generated)
         db.session.commit()
         
-        return recipe_uid
+        return row['uid']
+
+    @staticmethod
+    def build_generated_row(user_uid: str, generation_id: str,
+                            recipe_data: Dict[str, Any], generation_type: str) -> Dict[str, Any]:
+        """
+        Arma la fila de recipes_generated de una receta (para guardarla sola o en un insert multi-fila)
+        """
+        return {
+            'uid': str(uuid.uuid4()),
+            'user_uid': user_uid,
+            'generation_id': generation_id,
+            'title': recipe_data.get('name', recipe_data.get('title', 'Receta sin título')),
+            'description': recipe_data.get('description', ''),
+            'duration': str(recipe_data.get('prep_time', recipe_data.get('duration', ''))),
+            'difficulty': recipe_data.get('difficulty', ''),
+            'servings': recipe_data.get('servings'),
+            'category': recipe_data.get('meal_type', recipe_data.get('category', '')),
+            'recipe_data': recipe_data,  # Almacena toda la receta en JSON
+            'generation_type': generation_type,
+            'generated_at': datetime.now(timezone.utc),
+            'image_path': recipe_data.get('image_path'),
+            'image_status': recipe_data.get('image_status', 'generating')
+        }
     
     def find_by_user_and_title(self, user_uid: str, title: str) -> Optional[RecipeGeneratedORM]:
         """
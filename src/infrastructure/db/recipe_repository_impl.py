@@ -1,12 +1,28 @@
-from typing import Optional
-from sqlalchemy import select, delete, func
-from rapidfuzz import process
+from typing import Optional, List
+from datetime import datetime
+from sqlalchemy import select, delete, insert, func, or_, and_, union_all
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.orm import selectinload
 from src.domain.models.recipe import Recipe, RecipeIngredient, RecipeStep
+from src.domain.models.generation import Generation
 from src.domain.repositories.recipe_repository import RecipeRepository
+from src.infrastructure.db.models.generation_orm import GenerationORM
+from src.infrastructure.db.models.recipe_generated_orm import RecipeGeneratedORM
 from src.infrastructure.db.models.recipe_orm import RecipeORM
 from src.infrastructure.db.models.recipe_ingredient_orm import RecipeIngredientORM
 from src.infrastructure.db.models.recipe_step_orm import RecipeStepORM
 from src.shared.exceptions.custom import RecipeNotFoundException
+from src.shared.fuzzy_name_index import FuzzyNameIndex
+from src.shared.inverted_index import InvertedIndex, tokenize
+
+# Índice de títulos por proceso, acotable por usuario (se sincroniza por saved_at)
+_title_index = FuzzyNameIndex()
+TITLE_INDEX_REFRESH_SECONDS = 30
+
+# Búsqueda de texto: en MySQL se usan los índices FULLTEXT; en otros motores (SQLite en pruebas)
+# este índice invertido por proceso, sincronizado igual que el de títulos
+_search_index = InvertedIndex({"title": 3.0, "ingredients": 2.0, "description": 1.0})
+SEARCH_INDEX_REFRESH_SECONDS = 30
 
 class RecipeRepositoryImpl(RecipeRepository):
     def __init__(self, db):
@@ -46,8 +62,130 @@ class RecipeRepositoryImpl(RecipeRepository):
             self.db.session.add(step_orm)
 
         self.db.session.commit()
+        self._index_recipe(recipe)
         return recipe.uid
 
+    def save_many(self, recipes: List[Recipe], generation: Optional[Generation] = None,
+                  generated_rows: Optional[List[dict]] = None) -> List[str]:
+        """
+        Guarda varias recetas en una sola transacción con inserts multi-fila
+        (recetas, ingredientes y pasos), junto con la generación y sus filas de recipes_generated.
+
+        Args:
+            recipes: Recetas a guardar (ingredientes y pasos como dicts)
+            generation: Generación de la que salen las recetas (opcional)
+            generated_rows: Filas de recipes_generated ya armadas (opcional)
+
+        Returns:
+            List[str]: UIDs de las recetas guardadas
+        """
+        recipe_rows, ingredient_rows, step_rows = [], [], []
+        for recipe in recipes:
+            recipe_rows.append({
+                "uid": recipe.uid,
+                "user_uid": recipe.user_uid,
+                "title": recipe.title,
+                "duration": recipe.duration,
+                "difficulty": recipe.difficulty,
+                "footer": recipe.footer,
+                "category": recipe.category,
+                "image_path": recipe.image_path,
+                "generated_by_ai": recipe.generated_by_ai,
+                "saved_at": recipe.saved_at,
+                "description": recipe.description,
+            })
+            ingredient_rows.extend({
+                "recipe_uid": recipe.uid,
+                "name": ing["name"],
+                "quantity": ing["quantity"],
+                "type_unit": ing["type_unit"]
+            } for ing in recipe.ingredients)
+            step_rows.extend({
+                "recipe_uid": recipe.uid,
+                "step_order": step["step_order"],
+                "description": step["description"]
+            } for step in recipe.steps)
+
+        # Un INSERT por tabla con todas las filas; el driver lo manda como VALUES (...), (...)
+        try:
+            if generation is not None:
+                self.db.session.execute(insert(GenerationORM).values(
+                    uid=generation.uid,
+                    user_uid=generation.user_uid,
+                    generated_at=generation.generated_at,
+                    raw_result=generation.raw_result,
+                    generation_type=generation.generation_type,
+                    recipes_ids=generation.recipes_ids,
+                    is_validated=generation.is_validated,
+                    validated_at=generation.validated_at
+                ))
+            for table, rows in (
+                (RecipeORM, recipe_rows),
+                (RecipeIngredientORM, ingredient_rows),
+                (RecipeStepORM, step_rows),
+                (RecipeGeneratedORM, generated_rows or []),
+            ):
+                if rows:
+                    self.db.session.execute(insert(table), rows)
+            self.db.session.commit()
+        except Exception as e:
+            self.db.session.rollback()
+            print(f"🚨 [RECIPE REPO] Error in save_many: {str(e)}")
+            raise
+
+        print(f"✅ [RECIPE REPO] Bulk saved {len(recipe_rows)} recipes "
+              f"({len(ingredient_rows)} ingredients, {len(step_rows)} steps, {len(generated_rows or [])} generated)")
+        for recipe in recipes:
+            self._index_recipe(recipe)
+        return [recipe.uid for recipe in recipes]
+
+    @staticmethod
+    def _index_recipe(recipe: Recipe) -> None:
+        # Los índices en memoria solo se actualizan si ya se cargaron; si no, la primera sync los arma completos
+        if _title_index.loaded:
+            _title_index.add(recipe.uid, recipe.title, recipe.user_uid)
+        if _search_index.loaded:
+            _search_index.add(recipe.uid, {
+                "title": recipe.title,
+                "description": recipe.description,
+                "ingredients": [ing["name"] for ing in recipe.ingredients]
+            }, recipe.user_uid)
+
+    def find_existing_uids(self, uids: list, owner_uids: list) -> set:
+        """Devuelve, de `uids`, los que existen y pertenecen a alguno de `owner_uids` (una sola consulta IN)"""
+        if not uids:
+            return set()
+        stmt = select(RecipeORM.uid).where(RecipeORM.uid.in_(set(uids)), RecipeORM.user_uid.in_(owner_uids))
+        return set(self.db.session.execute(stmt).scalars().all())
+
+    def get_ingredients_by_uids(self, uids: list, owner_uids: list) -> dict:
+        """
+        Título, dueño e ingredientes de varias recetas de `owner_uids`, en una sola consulta con LEFT JOIN
+        (sin pasos ni objetos ORM).
+
+        Returns:
+            dict: {uid: {"uid", "user_uid", "title", "ingredients": [{name, quantity, type_unit}]}}
+        """
+        if not uids:
+            return {}
+        stmt = select(
+            RecipeORM.uid,
+            RecipeORM.user_uid,
+            RecipeORM.title,
+            RecipeIngredientORM.name,
+            RecipeIngredientORM.quantity,
+            RecipeIngredientORM.type_unit
+        ).outerjoin(
+            RecipeIngredientORM, RecipeIngredientORM.recipe_uid == RecipeORM.uid
+        ).where(RecipeORM.uid.in_(set(uids)), RecipeORM.user_uid.in_(owner_uids))
+
+        recipes = {}
+        for row in self.db.session.execute(stmt):
+            recipe = recipes.setdefault(row.uid, {"uid": row.uid, "user_uid": row.user_uid, "title": row.title, "ingredients": []})
+            if row.name is not None:
+                recipe["ingredients"].append({"name": row.name, "quantity": row.quantity, "type_unit": row.type_unit})
+        return recipes
+
     def find_by_uid(self, uid: str) -> Optional[Recipe]:
         recipe_row = self.db.session.get(RecipeORM, uid)
         if not recipe_row:
@@ -76,6 +214,7 @@ class RecipeRepositoryImpl(RecipeRepository):
             saved_at=recipe_row.saved_at,
             category=recipe_row.category,
             image_path=recipe_row.image_path,
+            image_status=recipe_row.image_status,
             description=recipe_row.description,
         )
 
@@ -84,18 +223,103 @@ class RecipeRepositoryImpl(RecipeRepository):
         row = self.db.session.execute(stmt).scalar_one_or_none()
         return self.find_by_uid(row.uid) if row else None
 
-    def find_best_match_name(self, name_query: str) -> Optional[Recipe]:
-        all_recipes = self.db.session.execute(select(RecipeORM)).scalars().all()
-        if not all_recipes:
+    def find_best_match_name(self, name_query: str, user_uid: Optional[str] = None) -> Optional[Recipe]:
+        """
+        Busca la receta con el título más parecido (score >= 80) usando el índice difuso en memoria.
+        Si se indica user_uid, solo entre las recetas de ese usuario.
+        """
+        _title_index.sync(self._load_titles_since, self._count_recipes, TITLE_INDEX_REFRESH_SECONDS)
+        match = _title_index.best_match(name_query, scope=user_uid, score_cutoff=80)
+        if not match:
             return None
 
-        options = [(r.title, r.uid) for r in all_recipes]
-        best_match, score, _ = process.extractOne(name_query, [t for t, _ in options])
-        if score < 80:
-            return None
+        recipe = self.find_by_uid(match[0])
+        if recipe is None:
+            # Borrada desde la última sincronización
+            _title_index.discard(match[0])
+        return recipe
+
+    def _load_titles_since(self, watermark) -> list:
+        stmt = select(RecipeORM.uid, RecipeORM.title, RecipeORM.user_uid, RecipeORM.saved_at)
+        if watermark is not None:
+            stmt = stmt.where(RecipeORM.saved_at >= watermark)
+        return [tuple(row) for row in self.db.session.execute(stmt).all()]
+
+    def _count_recipes(self) -> int:
+        return self.db.session.execute(select(func.count(RecipeORM.uid))).scalar()
+
+    def search(self, query: str, user_uid: Optional[str] = None, offset: int = 0, limit: int = 20) -> dict:
+        """
+        Busca recetas por título, descripción e ingredientes, de la más relevante a la menos.
+        La consulta se normaliza sin acentos ni mayúsculas (mismo normalize_name que los índices difusos).
+
+        Args:
+            query: Texto buscado
+            user_uid: Si se indica, solo las recetas de ese usuario
+            offset: Cantidad de resultados a saltar (paginación)
+            limit: Tamaño de página
 
-        matched_uid = next(uid for title, uid in options if title == best_match)
-        return self.find_by_uid(matched_uid)
+        Returns:
+            dict: {'results': [(Recipe, score)], 'has_more': bool}
+        """
+        if self.db.session.get_bind().dialect.name == "mysql":
+            ranked = self._fulltext_search(query, user_uid, offset, limit + 1)
+        else:
+            _search_index.sync(self._load_search_documents_since, self._count_recipes, SEARCH_INDEX_REFRESH_SECONDS)
+            ranked = _search_index.search(query, scope=user_uid)[offset:offset + limit + 1]
+
+        has_more = len(ranked) > limit
+        ranked = ranked[:limit]
+        if not ranked:
+            return {'results': [], 'has_more': False}
+
+        stmt = self._with_children(select(RecipeORM).where(RecipeORM.uid.in_([uid for uid, _ in ranked])))
+        recipes = {row.uid: self._to_domain(row) for row in self.db.session.execute(stmt).scalars().all()}
+        results = [(recipes[uid], score) for uid, score in ranked if uid in recipes]
+        return {'results': results, 'has_more': has_more}
+
+    def _fulltext_search(self, query: str, user_uid: Optional[str], offset: int, limit: int) -> list:
+        terms = " ".join(tokenize(query))
+        if not terms:
+            return []
+
+        # MATCH usa ft_recipes_title_description y ft_recipe_ingredients_name (migración 010);
+        # la collation *_ai_ci de las columnas hace que la comparación ignore acentos.
+        # Cada MATCH va en su propia rama del UNION: combinado con OR sobre un join, MySQL no
+        # puede usar los índices FULLTEXT y recorre la tabla
+        recipe_match = match(RecipeORM.title, RecipeORM.description, against=terms).in_natural_language_mode()
+        ingredient_match = match(RecipeIngredientORM.name, against=terms).in_natural_language_mode()
+        hits = union_all(
+            select(RecipeORM.uid.label("uid"), recipe_match.label("score")).where(recipe_match),
+            select(RecipeIngredientORM.recipe_uid.label("uid"), ingredient_match.label("score")).where(ingredient_match)
+        ).subquery()
+        score = func.sum(hits.c.score).label("score")
+
+        stmt = select(hits.c.uid, score).group_by(hits.c.uid)
+        if user_uid is not None:
+            stmt = stmt.join(RecipeORM, RecipeORM.uid == hits.c.uid).where(RecipeORM.user_uid == user_uid)
+        stmt = stmt.order_by(score.desc(), hits.c.uid).offset(offset).limit(limit)
+        return [(uid, round(float(value), 4)) for uid, value in self.db.session.execute(stmt).all()]
+
+    def _load_search_documents_since(self, watermark) -> list:
+        stmt = select(
+            RecipeORM.uid,
+            RecipeORM.title,
+            RecipeORM.description,
+            RecipeORM.user_uid,
+            RecipeORM.saved_at,
+            RecipeIngredientORM.name
+        ).outerjoin(RecipeIngredientORM, RecipeIngredientORM.recipe_uid == RecipeORM.uid)
+        if watermark is not None:
+            stmt = stmt.where(RecipeORM.saved_at >= watermark)
+
+        documents = {}
+        for uid, title, description, user_uid, saved_at, ingredient in self.db.session.execute(stmt):
+            if uid not in documents:
+                documents[uid] = ({"title": title, "description": description, "ingredients": []}, user_uid, saved_at)
+            if ingredient:
+                documents[uid][0]["ingredients"].append(ingredient)
+        return [(uid, fields, user_uid, saved_at) for uid, (fields, user_uid, saved_at) in documents.items()]
 
     def delete(self, recipe_uid: str, title: str) -> None:
         stmt = delete(RecipeORM).where(RecipeORM.uid == recipe_uid)
@@ -104,6 +328,8 @@ class RecipeRepositoryImpl(RecipeRepository):
             raise RecipeNotFoundException(f"Recipe with title '{title}' for user not found")
         self.db.session.delete(recipe)
         self.db.session.commit()
+        _title_index.discard(recipe_uid)
+        _search_index.discard(recipe_uid)
 
     def delete_by_user_and_title(self, user_uid: str, title: str) -> None:
         stmt = select(RecipeORM).where(
@@ -113,8 +339,11 @@ class RecipeRepositoryImpl(RecipeRepository):
         recipe = self.db.session.execute(stmt).scalar_one_or_none()
         if not recipe:
             raise RecipeNotFoundException(f"Recipe with title '{title}' for user not found")
+        recipe_uid = recipe.uid
         self.db.session.delete(recipe)
         self.db.session.commit()
+        _title_index.discard(recipe_uid)
+        _search_index.discard(recipe_uid)
 
     def exists_by_user_and_title(self, user_uid: str, title: str) -> bool:
         stmt = select(RecipeORM).where(
@@ -132,15 +361,73 @@ class RecipeRepositoryImpl(RecipeRepository):
         result = self.db.session.execute(stmt).scalar_one_or_none()
         return self._to_domain(result) if result else None
 
+    @staticmethod
+    def _with_children(stmt):
+        # Ingredientes y pasos en una consulta IN por relación: 3 consultas en total, no 1 + 2N
+        return stmt.options(selectinload(RecipeORM.ingredients), selectinload(RecipeORM.steps))
+
     def get_all(self) -> list[Recipe]:
-        recipes = self.db.session.execute(select(RecipeORM)).scalars().all()
+        recipes = self.db.session.execute(self._with_children(select(RecipeORM))).scalars().all()
         return [self._to_domain(recipe) for recipe in recipes]
 
     def get_all_by_user(self, user_uid: str) -> list[Recipe]:
-        stmt = select(RecipeORM).where(RecipeORM.user_uid == user_uid)
+        stmt = self._with_children(select(RecipeORM).where(RecipeORM.user_uid == user_uid))
         recipes = self.db.session.execute(stmt).scalars().all()
         return [self._to_domain(recipe) for recipe in recipes]
 
+    def get_page(
+        self,
+        user_uid: Optional[str] = None,
+        after: Optional[list] = None,
+        limit: Optional[int] = None,
+        summary: bool = False
+    ) -> dict:
+        """
+        Obtiene una página de recetas (más recientes primero) paginando por clave (saved_at, uid).
+
+        Args:
+            user_uid: Si se indica, solo las recetas de ese usuario
+            after: Clave [saved_at ISO, uid] de la última receta de la página anterior
+            limit: Tamaño de página (None = sin límite)
+            summary: Si es True solo se leen las columnas de listado, sin ingredientes ni pasos
+
+        Returns:
+            dict: {'recipes': [Recipe] o [dict] si summary, 'next_key': clave o None si no hay más}
+        """
+        if summary:
+            stmt = select(
+                RecipeORM.uid,
+                RecipeORM.title,
+                RecipeORM.category,
+                RecipeORM.duration,
+                RecipeORM.difficulty,
+                RecipeORM.image_path,
+                RecipeORM.saved_at
+            )
+        else:
+            stmt = self._with_children(select(RecipeORM))
+
+        if user_uid is not None:
+            stmt = stmt.where(RecipeORM.user_uid == user_uid)
+        if after:
+            after_saved_at = datetime.fromisoformat(after[0])
+            stmt = stmt.where(or_(
+                RecipeORM.saved_at < after_saved_at,
+                and_(RecipeORM.saved_at == after_saved_at, RecipeORM.uid < after[1])
+            ))
+        stmt = stmt.order_by(RecipeORM.saved_at.desc(), RecipeORM.uid.desc())
+        if limit:
+            stmt = stmt.limit(limit + 1)
+
+        result = self.db.session.execute(stmt)
+        rows = result.all() if summary else result.scalars().all()
+        has_more = bool(limit) and len(rows) > limit
+        rows = rows[:limit] if limit else rows
+
+        next_key = [rows[-1].saved_at, rows[-1].uid] if has_more else None
+        recipes = [dict(row._mapping) for row in rows] if summary else [self._to_domain(row) for row in rows]
+        return {'recipes': recipes, 'next_key': next_key}
+
     def _to_domain(self, recipe_row: RecipeORM) -> Recipe:
         domain_ingredients = [
             RecipeIngredient(i.name, i.quantity, i.type_unit)
@@ -163,9 +450,47 @@ class RecipeRepositoryImpl(RecipeRepository):
             saved_at=recipe_row.saved_at,
             category=recipe_row.category,
             image_path=recipe_row.image_path,
+            image_status=recipe_row.image_status,
             description=recipe_row.description,
         )
 
+    def get_user_recipes_version(self, user_uid: Optional[str]) -> tuple:
+        """
+        Huella barata del conjunto de recetas de un usuario (cantidad y último saved_at),
+        resuelta con los índices (user_uid, saved_at, uid) / (saved_at, uid). Sirve para detectar altas y bajas.
+        Con user_uid None se calcula sobre todas las recetas.
+        """
+        stmt = select(func.count(RecipeORM.uid), func.max(RecipeORM.saved_at))
+        if user_uid is not None:
+            stmt = stmt.where(RecipeORM.user_uid == user_uid)
+        count, last_saved_at = self.db.session.execute(stmt).one()
+        return count, last_saved_at.isoformat() if last_saved_at else None
+
+    def get_recommendation_catalog(self, owner_uids: List[str]) -> list:
+        """
+        Recetas de los dueños indicados (el usuario y el usuario de sistema) con los datos de
+        listado y los nombres de sus ingredientes, en dos consultas de columnas (sin cargar pasos
+        ni objetos ORM). No incluye el dueño de cada receta.
+        """
+        recipes = {
+            row.uid: {**row._mapping, "ingredients": []}
+            for row in self.db.session.execute(select(
+                RecipeORM.uid,
+                RecipeORM.title,
+                RecipeORM.category,
+                RecipeORM.duration,
+                RecipeORM.difficulty,
+                RecipeORM.image_path
+            ).where(RecipeORM.user_uid.in_(owner_uids)))
+        }
+        ingredients = select(RecipeIngredientORM.recipe_uid, RecipeIngredientORM.name)\
+            .join(RecipeORM, RecipeORM.uid == RecipeIngredientORM.recipe_uid)\
+            .where(RecipeORM.user_uid.in_(owner_uids))
+        for recipe_uid, name in self.db.session.execute(ingredients):
+            if recipe_uid in recipes:
+                recipes[recipe_uid]["ingredients"].append(name)
+        return list(recipes.values())
+
     def map_to_domain(self, orm_recipe: RecipeORM) -> Recipe:
         return self._to_domain(orm_recipe)
 
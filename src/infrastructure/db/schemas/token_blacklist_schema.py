@@ -9,7 +9,7 @@ class TokenBlacklist(db.Model):
     token_type = db.Column(db.String(10), nullable=False)  # 'access' or 'refresh'
     user_uid = db.Column(db.String(128), db.ForeignKey("users.uid"), nullable=False)
     revoked_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
-    expires_at = db.Column(db.DateTime, nullable=False)
+    expires_at = db.Column(db.DateTime, nullable=False, index=True)  # Limpieza por tandas
     reason = db.Column(db.String(100))  # 'logout', 'reuse_detected', 'manual', etc.
     
     def __repr__(self):
@@ -25,7 +25,7 @@ class RefreshTokenTracking(db.Model):
     used = db.Column(db.Boolean, default=False)
     used_at = db.Column(db.DateTime, nullable=True)
     created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
-    expires_at = db.Column(db.DateTime, nullable=False)
+    expires_at = db.Column(db.DateTime, nullable=False, index=True)
     ip_address = db.Column(db.String(45), nullable=True)  # Para detectar actividad sospechosa
     user_agent = db.Column(db.String(500), nullable=True)
     
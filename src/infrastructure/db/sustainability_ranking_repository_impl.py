@@ -0,0 +1,49 @@
+from src.domain.repositories.sustainability_ranking_repository import SustainabilityRankingRepository
+from src.infrastructure.db.models.environmental_savings_rollup_orm import EnvironmentalSavingsRollupORM
+from src.infrastructure.db.models.sustainability_ranking_sketch_orm import SustainabilityRankingSketchORM
+
+from datetime import datetime
+from sqlalchemy import delete, func, insert, select
+from typing import Dict, Iterator, Tuple
+
+
+class SustainabilityRankingRepositoryImpl(SustainabilityRankingRepository):
+    def __init__(self, db):
+        self.db = db
+
+    def iter_user_totals(self, metrics: Tuple[str, ...], chunk_size: int = 5000) -> Iterator[Dict]:
+        """
+        Totales históricos por usuario sumando sus buckets mensuales (no los cálculos),
+        leídos por tandas de `chunk_size` filas.
+        """
+        rollup = EnvironmentalSavingsRollupORM
+        stmt = select(
+            rollup.user_uid,
+            *[func.sum(getattr(rollup, metric)).label(metric) for metric in metrics]
+        ).where(rollup.period == "month").group_by(rollup.user_uid)
+
+        for row in self.db.session.execute(stmt.execution_options(yield_per=chunk_size)):
+            yield {metric: float(getattr(row, metric) or 0) for metric in metrics}
+
+    def save_sketches(self, sketches: Dict[str, Dict], built_at: datetime) -> None:
+        """Reemplaza los resúmenes de todas las métricas en una transacción"""
+        rows = [
+            {"metric": metric, "cutpoints": sketch["cutpoints"], "population": sketch["population"], "built_at": built_at}
+            for metric, sketch in sketches.items()
+        ]
+        try:
+            self.db.session.execute(delete(SustainabilityRankingSketchORM))
+            if rows:
+                self.db.session.execute(insert(SustainabilityRankingSketchORM), rows)
+            self.db.session.commit()
+        except Exception as e:
+            self.db.session.rollback()
+            print(f"🚨 [RANKING REPO] Error in save_sketches: {str(e)}")
+            raise
+
+    def load_sketches(self) -> Dict[str, Dict]:
+        rows = self.db.session.execute(select(SustainabilityRankingSketchORM)).scalars()
+        return {
+            row.metric: {"cutpoints": row.cutpoints, "population": row.population, "built_at": row.built_at}
+            for row in rows
+        }
@@ -1,8 +1,14 @@
 from datetime import datetime, timezone
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from src.infrastructure.db.base import db
 from src.infrastructure.db.schemas.token_blacklist_schema import TokenBlacklist, RefreshTokenTracking
+from src.infrastructure.auth.token_revocation_cache import TokenRevocationCache, token_revocation_cache
 
 class TokenSecurityRepository:
+
+    def __init__(self, revocation_cache: TokenRevocationCache = token_revocation_cache):
+        self.revocation_cache = revocation_cache
     
     def add_to_blacklist(self, jti: str, token_type: str, user_uid: str, expires_at: datetime, reason: str = None):
         """Añade un token a la blacklist"""
@@ -15,35 +21,65 @@ class TokenSecurityRepository:
         )
         db.session.add(blacklisted_token)
         db.session.commit()
+        # Los demás workers la ven en su próxima sincronización con la tabla
+        self.revocation_cache.publish(jti, expires_at)
         return blacklisted_token
     
     def is_token_blacklisted(self, jti: str) -> bool:
-        """Verifica si un token está en la blacklist"""
+        """Verifica si un token está en la blacklist (consulta directa a la base de datos)"""
         return TokenBlacklist.query.filter_by(jti=jti).first() is not None
+
+    def is_token_revoked(self, jti: str) -> bool:
+        """Verifica si un token está en la blacklist usando la caché del proceso (sin consulta por request)"""
+        return self.revocation_cache.is_revoked(jti, self.find_revoked_since)
+
+    def find_revoked_since(self, last_id: int):
+        """(id, jti, expires_at) de los tokens revocados y aún vigentes con id mayor a `last_id`"""
+        now = datetime.now(timezone.utc)
+        return db.session.query(TokenBlacklist.id, TokenBlacklist.jti, TokenBlacklist.expires_at).filter(
+            TokenBlacklist.id > last_id,
+            TokenBlacklist.expires_at > now
+        ).all()
     
     def blacklist_all_user_tokens(self, user_uid: str, reason: str = 'security_breach'):
-        """Invalida todos los refresh tokens activos de un usuario"""
-        # Marcar todos los refresh tokens como usados
-        refresh_tokens = RefreshTokenTracking.query.filter_by(
-            user_uid=user_uid, 
-            used=False
-        ).all()
-        
-        for token in refresh_tokens:
-            # Marcar como usado
-            token.used = True
-            token.used_at = datetime.now(timezone.utc)
-            
-            # Añadir a blacklist
-            self.add_to_blacklist(
-                jti=token.jti,
-                token_type='refresh',
-                user_uid=user_uid,
-                expires_at=token.expires_at,
-                reason=reason
-            )
-        
+        """
+        Invalida todos los refresh tokens activos de un usuario en una sola transacción:
+        un UPDATE que los marca como usados y un INSERT de varias filas en la blacklist
+        """
+        now = datetime.now(timezone.utc)
+
+        # FOR UPDATE: ningún refresh concurrente puede usar estos tokens hasta el commit
+        refresh_tokens = db.session.query(RefreshTokenTracking.id, RefreshTokenTracking.jti, RefreshTokenTracking.expires_at)\
+            .filter_by(user_uid=user_uid, used=False)\
+            .with_for_update()\
+            .all()
+        if not refresh_tokens:
+            db.session.commit()
+            return 0
+
+        RefreshTokenTracking.query.filter(RefreshTokenTracking.id.in_([token.id for token in refresh_tokens]))\
+            .update({"used": True, "used_at": now}, synchronize_session=False)
+
+        rows = [
+            {
+                "jti": token.jti,
+                "token_type": "refresh",
+                "user_uid": user_uid,
+                "revoked_at": now,
+                "expires_at": token.expires_at,
+                "reason": reason
+            }
+            for token in refresh_tokens
+        ]
+        # Un JTI ya revocado (p. ej. por logout) no debe hacer fallar la revocación masiva
+        if db.session.get_bind().dialect.name == "mysql":
+            stmt = mysql_insert(TokenBlacklist).values(rows).prefix_with("IGNORE")
+        else:
+            stmt = sqlite_insert(TokenBlacklist).values(rows).on_conflict_do_nothing(index_elements=["jti"])
+        db.session.execute(stmt)
         db.session.commit()
+
+        self.revocation_cache.publish_many((row["jti"], row["expires_at"]) for row in rows)
         return len(refresh_tokens)
     
     def track_refresh_token(self, jti: str, user_uid: str, expires_at: datetime, 
@@ -88,15 +124,26 @@ class TokenSecurityRepository:
         """Obtiene información de un refresh token"""
         return RefreshTokenTracking.query.filter_by(jti=jti).first()
     
-    def cleanup_expired_tokens(self):
-        """Limpia tokens expirados de la base de datos"""
+    def cleanup_expired_tokens(self, chunk_size: int = 1000):
+        """
+        Limpia tokens expirados de la base de datos.
+        Borra por tandas de `chunk_size` filas (usando el índice de expires_at), con un commit
+        por tanda, para no mantener bloqueadas las tablas durante un DELETE grande.
+        """
         now = datetime.now(timezone.utc)
-        
-        # Limpiar blacklist de tokens expirados
-        expired_blacklist = TokenBlacklist.query.filter(TokenBlacklist.expires_at < now).delete()
-        
-        # Limpiar tracking de refresh tokens expirados
-        expired_tracking = RefreshTokenTracking.query.filter(RefreshTokenTracking.expires_at < now).delete()
-        
-        db.session.commit()
-        return {"blacklist_cleaned": expired_blacklist, "tracking_cleaned": expired_tracking} 
\ No newline at end of file
+        return {
+            "blacklist_cleaned": self._delete_expired_in_chunks(TokenBlacklist, now, chunk_size),
+            "tracking_cleaned": self._delete_expired_in_chunks(RefreshTokenTracking, now, chunk_size)
+        }
+
+    def _delete_expired_in_chunks(self, model, now: datetime, chunk_size: int) -> int:
+        deleted = 0
+        while True:
+            ids = [row.id for row in db.session.query(model.id)
+                   .filter(model.expires_at < now)
+                   .order_by(model.expires_at)
+                   .limit(chunk_size)]
+            if not ids:
+                return deleted
+            deleted += model.query.filter(model.id.in_(ids)).delete(synchronize_session=False)
+            db.session.commit()
@@ -0,0 +1,195 @@
+import hashlib
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+import firebase_admin.auth  # type: ignore
+import jwt
+import requests
+from cryptography.x509 import load_pem_x509_certificate
+
+from src.config.config import Config
+
+# Certificados con los que Google firma los ID tokens de Firebase (rotan cada pocas horas)
+GOOGLE_CERTS_URL = "https://www.googleapis.com/robot/v1/metadata/x509/securetoken@system.gserviceaccount.com"
+ISSUER_PREFIX = "https://securetoken.google.com/"
+
+# Devuelve ({kid: certificado PEM}, segundos de validez según Cache-Control)
+CertsFetcher = Callable[[], Tuple[Dict[str, str], int]]
+
+
+def fetch_google_certs() -> Tuple[Dict[str, str], int]:
+    response = requests.get(GOOGLE_CERTS_URL, timeout=5)
+    response.raise_for_status()
+    match = re.search(r"max-age=(\d+)", response.headers.get("Cache-Control", ""))
+    return response.json(), int(match.group(1)) if match else 3600
+
+
+class GooglePublicKeys:
+    """
+    Claves públicas de Google ya parseadas, compartidas por proceso.
+
+    Un hilo en segundo plano las renueva `refresh_margin` segundos antes de que venza su
+    max-age, así que ningún sign-in espera la descarga. Un `kid` desconocido (rotación recién
+    publicada) fuerza una descarga, como mucho una cada `min_refetch_seconds`.
+    """
+
+    def __init__(self, fetcher: CertsFetcher = fetch_google_certs, refresh_margin: int = 300,
+                 retry_seconds: int = 60, min_refetch_seconds: int = 30, background_refresh: bool = True):
+        self._fetcher = fetcher
+        self.background_refresh = background_refresh
+        self.refresh_margin = refresh_margin
+        self.retry_seconds = retry_seconds
+        self.min_refetch_seconds = min_refetch_seconds
+        self._lock = threading.Lock()
+        self._keys: Dict[str, object] = {}
+        self._expires_at = 0.0
+        self._fetched_at = 0.0
+        self._refresher: Optional[threading.Thread] = None
+
+    def get(self, kid: str):
+        """Clave pública para `kid`, o None si Google no la publica"""
+        fetched_at = self._fetched_at
+        stale = time.monotonic() >= self._expires_at
+        unknown = kid not in self._keys and time.monotonic() - fetched_at >= self.min_refetch_seconds
+        if stale or unknown:
+            try:
+                self.refresh(if_fetched_before=fetched_at)
+            except Exception as e:
+                if not self._keys:
+                    raise
+                # Google publica las claves con solapamiento: las anteriores siguen sirviendo un rato
+                print(f"⚠️ [FIREBASE] Using previous Google public keys: {type(e).__name__}: {e}")
+        self._start_refresher()
+        return self._keys.get(kid)
+
+    def refresh(self, if_fetched_before: Optional[float] = None) -> None:
+        with self._lock:
+            if if_fetched_before is not None and self._fetched_at > if_fetched_before:
+                return  # Otro hilo ya las descargó
+            certs, max_age = self._fetcher()
+            # Se parsean una vez por descarga, no en cada verificación
+            self._keys = {
+                kid: load_pem_x509_certificate(pem.encode()).public_key()
+                for kid, pem in certs.items()
+            }
+            self._fetched_at = time.monotonic()
+            self._expires_at = self._fetched_at + max_age
+
+    def prefetch(self) -> None:
+        """Arranca la descarga y la renovación en segundo plano sin esperar a un sign-in"""
+        self._start_refresher()
+
+    def _start_refresher(self) -> None:
+        # is_alive: tras un fork (p. ej. gunicorn --preload) el hilo del proceso padre no existe
+        if not self.background_refresh or (self._refresher is not None and self._refresher.is_alive()):
+            return
+        with self._lock:
+            if self._refresher is None or not self._refresher.is_alive():
+                self._refresher = threading.Thread(target=self._refresh_loop, name="google-certs-refresh", daemon=True)
+                self._refresher.start()
+
+    def _refresh_loop(self) -> None:
+        while True:
+            if self._keys:
+                time.sleep(max(self._expires_at - self.refresh_margin - time.monotonic(), 1))
+            try:
+                self.refresh()
+                print(f"🔑 [FIREBASE] Google public keys refreshed ({len(self._keys)} keys)")
+            except Exception as e:
+                print(f"⚠️ [FIREBASE] Could not refresh Google public keys: {type(e).__name__}: {e}")
+                time.sleep(self.retry_seconds)
+
+
+class FirebaseTokenVerifier:
+    """
+    Verifica ID tokens de Firebase localmente (firma RS256 con las claves de Google y claims
+    aud/iss/sub/exp/iat/auth_time, como firebase_admin.auth.verify_id_token) y guarda los
+    claims ya verificados por hash del token hasta su `exp`.
+
+    Lanza las mismas excepciones que firebase_admin (ExpiredIdTokenError, InvalidIdTokenError).
+    """
+
+    MAX_CACHED_TOKENS = 10000
+
+    def __init__(self, project_id: str, public_keys: GooglePublicKeys):
+        self.project_id = project_id
+        self.public_keys = public_keys
+        self._lock = threading.Lock()
+        self._verified: "OrderedDict[str, dict]" = OrderedDict()
+
+    def verify(self, id_token: str) -> dict:
+        token_hash = hashlib.sha256(id_token.encode()).hexdigest()
+        with self._lock:
+            claims = self._verified.get(token_hash)
+            if claims is not None:
+                if claims["exp"] > time.time():
+                    self._verified.move_to_end(token_hash)
+                    return dict(claims)
+                del self._verified[token_hash]
+
+        claims = self._decode(id_token)
+        with self._lock:
+            self._verified[token_hash] = claims
+            while len(self._verified) > self.MAX_CACHED_TOKENS:
+                self._verified.popitem(last=False)
+        return dict(claims)
+
+    def _decode(self, id_token: str) -> dict:
+        try:
+            header = jwt.get_unverified_header(id_token)
+        except jwt.PyJWTError as e:
+            raise firebase_admin.auth.InvalidIdTokenError(f"Malformed ID token: {e}", cause=e)
+        if header.get("alg") != "RS256" or not header.get("kid"):
+            raise firebase_admin.auth.InvalidIdTokenError("ID token must be RS256 signed and include a key ID")
+
+        key = self.public_keys.get(header["kid"])
+        if key is None:
+            raise firebase_admin.auth.InvalidIdTokenError("ID token was not signed by a known Google key")
+
+        try:
+            claims = jwt.decode(
+                id_token, key, algorithms=["RS256"], audience=self.project_id,
+                issuer=ISSUER_PREFIX + self.project_id,
+                options={"require": ["exp", "iat", "sub", "aud", "iss"]}
+            )
+        except jwt.ExpiredSignatureError as e:
+            raise firebase_admin.auth.ExpiredIdTokenError("ID token has expired", e)
+        except jwt.PyJWTError as e:
+            raise firebase_admin.auth.InvalidIdTokenError(f"Invalid ID token: {e}", cause=e)
+
+        subject = claims.get("sub")
+        if not isinstance(subject, str) or not subject or len(subject) > 128:
+            raise firebase_admin.auth.InvalidIdTokenError("ID token has an invalid subject")
+        if claims.get("auth_time", 0) > time.time():
+            raise firebase_admin.auth.InvalidIdTokenError("ID token has an auth_time in the future")
+
+        claims["uid"] = subject
+        return claims
+
+
+def _project_id() -> str:
+    """FIREBASE_PROJECT_ID o, si no está, el project_id del archivo de credenciales"""
+    if getattr(Config, "FIREBASE_PROJECT_ID", None):
+        return Config.FIREBASE_PROJECT_ID
+    cred_path = Path(Config.FIREBASE_CREDENTIALS_PATH).resolve()
+    with open(cred_path) as cred_file:
+        return json.load(cred_file)["project_id"]
+
+
+_verifier: Optional[FirebaseTokenVerifier] = None
+_verifier_lock = threading.Lock()
+
+
+def get_firebase_token_verifier() -> FirebaseTokenVerifier:
+    """Verificador del proceso, creado en el primer uso"""
+    global _verifier
+    if _verifier is None:
+        with _verifier_lock:
+            if _verifier is None:
+                _verifier = FirebaseTokenVerifier(_project_id(), GooglePublicKeys())
+    return _verifier
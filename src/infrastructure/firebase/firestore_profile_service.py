@@ -2,12 +2,14 @@ import firebase_admin
 from firebase_admin import firestore
 from pathlib import Path
 from src.config.config import Config
+from src.infrastructure.firebase.profile_cache import ProfileCache, get_profile_cache
+from datetime import datetime, timezone
 import logging
 
 logger = logging.getLogger(__name__)
 
 class FirestoreProfileService:
-    def __init__(self):
+    def __init__(self, cache: ProfileCache = None, mysql_profile_repo=None):
         # Inicializar Firestore client
         if not firebase_admin._apps:
             cred_path = Path(Config.FIREBASE_CREDENTIALS_PATH).resolve()
@@ -19,11 +21,22 @@ class FirestoreProfileService:
         
         self.db = firestore.client()
         self.users_collection = self.db.collection('users')
+        self.cache = cache or get_profile_cache()
+        # Réplica en MySQL (profile_users): respaldo si Firestore no responde
+        self.mysql_profile_repo = mysql_profile_repo
 
-    def get_profile(self, uid: str) -> dict:
+    def get_profile(self, uid: str, allow_partial: bool = True) -> dict:
         """
-        Obtiene el perfil completo del usuario desde Firestore
+        Obtiene el perfil completo del usuario: de la caché o, si no está, desde Firestore.
+
+        Si Firestore falla y `allow_partial` es True se responde con la réplica de MySQL,
+        marcada con source="mysql_mirror". Los usos que filtran por alergias deben pasar
+        allow_partial=False: un perfil incompleto no puede tomarse como "sin alergias".
         """
+        profile = self.cache.get(uid)
+        if profile is not None:
+            return profile
+
         try:
             doc_ref = self.users_collection.document(uid)
             doc = doc_ref.get()
@@ -31,14 +44,20 @@ class FirestoreProfileService:
             if doc.exists:
                 profile_data = doc.to_dict()
                 logger.info(f"Profile loaded from Firestore for UID: {uid}")
-                return self._format_profile_response(profile_data, uid)
+                profile = self._format_profile_response(profile_data, uid)
+                self.cache.set(uid, profile)
+                return profile
             else:
                 logger.warning(f"Profile not found in Firestore for UID: {uid}")
                 return None
                 
         except Exception as e:
             logger.error(f"Error getting profile from Firestore for UID {uid}: {str(e)}")
-            raise
+            fallback = self._profile_from_mysql(uid) if allow_partial else None
+            if fallback is None:
+                raise
+            logger.warning(f"Serving MySQL profile mirror for UID: {uid}")
+            return fallback
 
     def update_profile(self, uid: str, update_data: dict) -> dict:
         """
@@ -54,7 +73,13 @@ class FirestoreProfileService:
             doc_ref.update(firestore_data)
             logger.info(f"Profile updated in Firestore for UID: {uid}")
             
-            # Retornar perfil actualizado
+            # Si el perfil está en caché se le aplican los cambios sin volver a leer Firestore
+            cached = self.cache.get(uid)
+            if cached is not None:
+                profile = {**cached, **{field: value for field, value in firestore_data.items() if field in cached}}
+                self.cache.set(uid, profile)
+                return profile
+
             return self.get_profile(uid)
             
         except Exception as e:
@@ -75,8 +100,12 @@ class FirestoreProfileService:
             doc_ref.set(firestore_data)
             logger.info(f"Profile created in Firestore for UID: {uid}")
             
-            # Obtener el perfil recién creado (esto resuelve los SERVER_TIMESTAMP)
-            return self.get_profile(uid)
+            # Se arma la respuesta con lo escrito en lugar de releerlo; los SERVER_TIMESTAMP
+            # se reemplazan por la hora local (difieren en milisegundos de la del servidor)
+            now = datetime.now(timezone.utc)
+            profile = self._format_profile_response({**firestore_data, "createdAt": now, "lastLoginAt": now}, uid)
+            self.cache.set(uid, profile)
+            return profile
             
         except Exception as e:
             logger.error(f"Error creating profile in Firestore for UID {uid}: {str(e)}")
@@ -185,9 +214,31 @@ class FirestoreProfileService:
         
         return initial_data
 
+    def _profile_from_mysql(self, uid: str):
+        """
+        Perfil armado desde la réplica de MySQL (solo tiene nombre, foto y preferencias;
+        el resto de los campos queda con sus valores por defecto)
+        """
+        if self.mysql_profile_repo is None:
+            return None
+        try:
+            mirror = self.mysql_profile_repo.find_by_uid(uid)
+        except Exception as e:
+            logger.error(f"Error reading MySQL profile mirror for UID {uid}: {str(e)}")
+            return None
+        if mirror is None:
+            return None
+        prefs = {key: value for key, value in (mirror.prefs or {}).items() if value is not None}
+        profile = self._format_profile_response(
+            {"displayName": mirror.name, "photoURL": mirror.photo_url or None, **prefs}, uid
+        )
+        profile["source"] = "mysql_mirror"
+        return profile
+
     def sync_with_mysql(self, uid: str, mysql_profile_repo):
         """
-        Sincroniza datos de Firestore con MySQL para caché
+        Sincroniza datos de Firestore con MySQL para caché.
+        El perfil sale de la caché y MySQL solo se escribe si la réplica quedó distinta.
         """
         try:
             firestore_profile = self.get_profile(uid)
@@ -202,6 +253,7 @@ class FirestoreProfileService:
                         "cookingLevel": firestore_profile.get("cookingLevel"),
                         "measurementUnit": firestore_profile.get("measurementUnit"),
                         "allergies": firestore_profile.get("allergies"),
+                        "allergyItems": firestore_profile.get("allergyItems"),
                         "preferredFoodTypes": firestore_profile.get("preferredFoodTypes"),
                         "specialDietItems": firestore_profile.get("specialDietItems")
                     }
@@ -210,6 +262,9 @@ class FirestoreProfileService:
                 # Actualizar o crear en MySQL
                 existing_profile = mysql_profile_repo.find_by_uid(uid)
                 if existing_profile:
+                    if (existing_profile.name, existing_profile.photo_url, existing_profile.prefs) == (
+                            mysql_data["name"], mysql_data["photo_url"], mysql_data["prefs"]):
+                        return
                     mysql_profile_repo.update(uid, mysql_data)
                 else:
                     mysql_data["uid"] = uid
@@ -0,0 +1,107 @@
+import copy
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from src.config.config import Config
+
+
+class ProfileCache:
+    """
+    Perfiles de Firestore ya formateados, por UID.
+
+    Primer nivel en memoria del proceso (LRU con TTL corto) y, si hay Redis, un segundo nivel
+    compartido por todos los workers con un TTL más largo. Las escrituras del perfil actualizan
+    ambos niveles; en los demás workers el primer nivel queda viejo a lo sumo `local_ttl` segundos.
+    """
+
+    KEY_PREFIX = "profile:"
+
+    def __init__(self, redis_client=None, local_ttl: int = 60, redis_ttl: int = 600, max_entries: int = 5000):
+        self._redis = redis_client
+        self.local_ttl = local_ttl if redis_client is not None else redis_ttl
+        self.redis_ttl = redis_ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()  # uid -> (vence, perfil)
+
+    def get(self, uid: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._entries.get(uid)
+            if entry is not None:
+                if entry[0] > time.monotonic():
+                    self._entries.move_to_end(uid)
+                    return copy.deepcopy(entry[1])
+                del self._entries[uid]
+
+        if self._redis is None:
+            return None
+        try:
+            cached = self._redis.get(f"{self.KEY_PREFIX}{uid}")
+        except Exception as e:
+            print(f"⚠️ [PROFILE CACHE] Redis read failed: {type(e).__name__}")
+            return None
+        if cached is None:
+            return None
+        profile = json.loads(cached)
+        self._store_local(uid, profile)
+        return copy.deepcopy(profile)
+
+    def set(self, uid: str, profile: dict) -> None:
+        self._store_local(uid, copy.deepcopy(profile))
+        if self._redis is not None:
+            try:
+                self._redis.set(f"{self.KEY_PREFIX}{uid}", json.dumps(profile), ex=self.redis_ttl)
+            except Exception as e:
+                print(f"⚠️ [PROFILE CACHE] Redis write failed: {type(e).__name__}")
+
+    def invalidate(self, uid: str) -> None:
+        with self._lock:
+            self._entries.pop(uid, None)
+        if self._redis is not None:
+            try:
+                self._redis.delete(f"{self.KEY_PREFIX}{uid}")
+            except Exception as e:
+                print(f"⚠️ [PROFILE CACHE] Redis delete failed: {type(e).__name__}")
+
+    def _store_local(self, uid: str, profile: dict) -> None:
+        with self._lock:
+            self._entries[uid] = (time.monotonic() + self.local_ttl, profile)
+            self._entries.move_to_end(uid)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+_profile_cache: Optional[ProfileCache] = None
+_profile_cache_lock = threading.Lock()
+
+
+def get_profile_cache() -> ProfileCache:
+    """Caché del proceso, con Redis como segundo nivel si está disponible"""
+    global _profile_cache
+    if _profile_cache is None:
+        with _profile_cache_lock:
+            if _profile_cache is None:
+                _profile_cache = ProfileCache(_connect_redis())
+    return _profile_cache
+
+
+def _connect_redis():
+    try:
+        import redis
+        client = redis.Redis(
+            host=getattr(Config, 'REDIS_HOST', 'localhost'),
+            port=getattr(Config, 'REDIS_PORT', 6379),
+            db=getattr(Config, 'REDIS_DB', 0),
+            decode_responses=True,
+            socket_connect_timeout=2,
+            socket_timeout=2
+        )
+        client.ping()
+        print("✅ [PROFILE CACHE] Using Redis as shared cache")
+        return client
+    except Exception as e:
+        print(f"⚠️ [PROFILE CACHE] Redis not available ({type(e).__name__}), using per-process cache only")
+        return None
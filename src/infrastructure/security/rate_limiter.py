@@ -1,46 +1,190 @@
+import math
+import threading
 import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from functools import wraps
-from flask import request, jsonify, current_app
-from collections import defaultdict
-from datetime import datetime, timedelta
+from typing import Dict, Optional, Tuple
+
+from flask import request, jsonify, make_response
+
+from src.config.config import Config
+
+
+@dataclass(frozen=True)
+class RateLimitResult:
+    """Resultado de contar un request contra un límite"""
+    allowed: bool
+    limit: int
+    remaining: int
+    reset_after: int  # Segundos hasta que cierra la ventana actual
+    retry_after: int = 0  # Segundos de bloqueo restantes si no se permitió
+    blocked: bool = False  # La IP ya estaba bloqueada antes de este request
+
+
+class RateLimitBackend(ABC):
+    """
+    Contador de ventana deslizante aproximada: el conteo de la ventana anterior se pondera
+    por la fracción que todavía cae dentro de la ventana y se suma al de la ventana actual.
+    Guarda dos contadores por clave (O(1) de memoria) en lugar de un timestamp por request.
+    """
+
+    @abstractmethod
+    def hit(self, key: str, ip: str, limit: int, window: int, block_duration: int) -> RateLimitResult:
+        """
+        Cuenta un request para `key`. Si la IP está bloqueada no se cuenta; si se excede el
+        límite se bloquea la IP por `block_duration` segundos.
+        """
+        pass
+
+
+def _slide(state: Optional[Tuple[int, int, int]], bucket: int) -> Tuple[int, int]:
+    """(anterior, actual) para `bucket` a partir del estado guardado (bucket, actual, anterior)"""
+    if state is None or state[0] < bucket - 1:
+        return 0, 0
+    if state[0] == bucket - 1:
+        return state[1], 0
+    return state[2], state[1]
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """Contadores por proceso; las claves sin actividad en dos ventanas se descartan cada `sweep_seconds`"""
+
+    def __init__(self, sweep_seconds: int = 60):
+        self.sweep_seconds = sweep_seconds
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Tuple[int, int, int, float]] = {}  # clave -> (bucket, actual, anterior, expira)
+        self._blocks: Dict[str, float] = {}  # ip -> bloqueada hasta
+        self._swept_at = 0.0
+
+    def hit(self, key: str, ip: str, limit: int, window: int, block_duration: int,
+            now: Optional[float] = None) -> RateLimitResult:
+        now = time.time() if now is None else now
+        with self._lock:
+            if now - self._swept_at >= self.sweep_seconds:
+                self._sweep(now)
+
+            blocked_until = self._blocks.get(ip, 0)
+            if blocked_until > now:
+                retry_after = math.ceil(blocked_until - now)
+                return RateLimitResult(False, limit, 0, retry_after, retry_after, blocked=True)
+
+            bucket, elapsed = divmod(now, window)
+            bucket = int(bucket)
+            state = self._counters.get(key)
+            previous, current = _slide(state[:3] if state else None, bucket)
+            estimated = previous * (1 - elapsed / window) + current
+            reset_after = math.ceil(window - elapsed)
+
+            if estimated >= limit:
+                self._blocks[ip] = now + block_duration
+                return RateLimitResult(False, limit, 0, reset_after, block_duration)
+
+            self._counters[key] = (bucket, current + 1, previous, now + 2 * window)
+            return RateLimitResult(True, limit, max(int(limit - estimated - 1), 0), reset_after)
+
+    def _sweep(self, now: float) -> None:
+        self._counters = {key: state for key, state in self._counters.items() if state[3] > now}
+        self._blocks = {ip: until for ip, until in self._blocks.items() if until > now}
+        self._swept_at = now
+
+    def __len__(self) -> int:
+        return len(self._counters)
+
+
+# Bloqueo y conteo en un solo viaje a Redis. La hora sale de Redis (TIME) para que todos los
+# workers compartan el mismo reloj; requiere Redis >= 5 (replicación por efectos)
+SLIDING_WINDOW_SCRIPT = """
+local blocked = redis.call('TTL', KEYS[2])
+if blocked > 0 then
+    return {0, 0, blocked, blocked, 1}
+end
+
+local limit, window, block_duration = tonumber(ARGV[1]), tonumber(ARGV[2]), tonumber(ARGV[3])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local bucket = math.floor(now / window)
+local elapsed = now - bucket * window
+local reset_after = math.ceil(window - elapsed)
+
+local state = redis.call('HMGET', KEYS[1], 'bucket', 'current', 'previous')
+local saved = tonumber(state[1])
+local previous, current = 0, 0
+if saved == bucket - 1 then
+    previous = tonumber(state[2])
+elseif saved == bucket then
+    previous, current = tonumber(state[3]), tonumber(state[2])
+end
+
+local estimated = previous * (1 - elapsed / window) + current
+if estimated >= limit then
+    redis.call('SET', KEYS[2], '1', 'EX', block_duration)
+    return {0, 0, reset_after, block_duration, 0}
+end
+
+redis.call('HSET', KEYS[1], 'bucket', bucket, 'current', current + 1, 'previous', previous)
+redis.call('EXPIRE', KEYS[1], window * 2)
+return {1, math.max(math.floor(limit - estimated - 1), 0), reset_after, 0, 0}
+"""
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """Contadores compartidos por todos los workers; si Redis falla se usa el respaldo en memoria"""
+
+    KEY_PREFIX = "rate_limit:"
+
+    def __init__(self, redis_client, fallback: Optional[RateLimitBackend] = None):
+        self._script = redis_client.register_script(SLIDING_WINDOW_SCRIPT)
+        self._fallback = fallback or InMemoryRateLimitBackend()
+
+    def hit(self, key: str, ip: str, limit: int, window: int, block_duration: int) -> RateLimitResult:
+        try:
+            allowed, remaining, reset_after, retry_after, blocked = self._script(
+                keys=[f"{self.KEY_PREFIX}{key}", f"{self.KEY_PREFIX}block:{ip}"],
+                args=[limit, window, block_duration]
+            )
+        except Exception as e:
+            print(f"⚠️ [RATE LIMIT] Redis error ({type(e).__name__}), using in-memory limits for this request")
+            return self._fallback.hit(key, ip, limit, window, block_duration)
+        return RateLimitResult(bool(allowed), limit, int(remaining), int(reset_after), int(retry_after), bool(blocked))
+
+
+def make_rate_limit_backend() -> RateLimitBackend:
+    """Redis si está disponible (límites compartidos entre workers), si no contadores en memoria"""
+    try:
+        import redis
+        client = redis.Redis(
+            host=getattr(Config, 'REDIS_HOST', 'localhost'),
+            port=getattr(Config, 'REDIS_PORT', 6379),
+            db=getattr(Config, 'REDIS_DB', 0),
+            socket_connect_timeout=2,
+            socket_timeout=2
+        )
+        client.ping()
+        print("✅ [RATE LIMIT] Using Redis backend")
+        return RedisRateLimitBackend(client)
+    except Exception as e:
+        print(f"⚠️ [RATE LIMIT] Redis not available ({type(e).__name__}), using per-process limits")
+        return InMemoryRateLimitBackend()
+
 
 class RateLimiter:
-    def __init__(self):
-        # En memoria para simplicidad - en producción usar Redis
-        self.requests = defaultdict(list)
-        self.blocked_ips = defaultdict(list)
-    
-    def is_rate_limited(self, key: str, limit: int, window: int) -> bool:
-        """Verifica si una clave ha excedido el límite de rate"""
-        now = time.time()
-        
-        # Limpiar requests antiguos
-        self.requests[key] = [req_time for req_time in self.requests[key] 
-                             if now - req_time < window]
-        
-        # Verificar límite
-        if len(self.requests[key]) >= limit:
-            return True
-        
-        # Registrar request actual
-        self.requests[key].append(now)
-        return False
-    
-    def block_ip(self, ip: str, duration: int = 300):  # 5 minutos por defecto
-        """Bloquea una IP por un tiempo determinado"""
-        until = time.time() + duration
-        self.blocked_ips[ip].append(until)
-    
-    def is_ip_blocked(self, ip: str) -> bool:
-        """Verifica si una IP está bloqueada"""
-        now = time.time()
-        
-        # Limpiar bloqueos expirados
-        self.blocked_ips[ip] = [block_time for block_time in self.blocked_ips[ip] 
-                               if block_time > now]
-        
-        return len(self.blocked_ips[ip]) > 0
-    
+    def __init__(self, backend: Optional[RateLimitBackend] = None):
+        # El backend se crea en el primer request, no al importar el módulo
+        self._backend = backend
+        self._lock = threading.Lock()
+
+    @property
+    def backend(self) -> RateLimitBackend:
+        if self._backend is None:
+            with self._lock:
+                if self._backend is None:
+                    self._backend = make_rate_limit_backend()
+        return self._backend
+
+    def hit(self, key: str, ip: str, limit: int, window: int, block_duration: int) -> RateLimitResult:
+        return self.backend.hit(key, ip, limit, window, block_duration)
+
     def get_client_ip(self) -> str:
         """Obtiene la IP real del cliente"""
         if request.headers.get('X-Forwarded-For'):
@@ -52,10 +196,20 @@ class RateLimiter:
 # Instancia global
 rate_limiter = RateLimiter()
 
+
+def _with_rate_limit_headers(response, result: RateLimitResult):
+    response.headers['X-RateLimit-Limit'] = str(result.limit)
+    response.headers['X-RateLimit-Remaining'] = str(result.remaining)
+    response.headers['X-RateLimit-Reset'] = str(result.reset_after)
+    if not result.allowed:
+        response.headers['Retry-After'] = str(result.retry_after)
+    return response
+
+
 def rate_limit(limit: int = 60, window: int = 60, per: str = 'ip', block_duration: int = 300):
     """
     Decorador para rate limiting
-    
+
     Args:
         limit: Número máximo de requests
         window: Ventana de tiempo en segundos
@@ -66,14 +220,7 @@ def rate_limit(limit: int = 60, window: int = 60, per: str = 'ip', block_duratio
         @wraps(f)
         def decorated_function(*args, **kwargs):
             ip = rate_limiter.get_client_ip()
-            
-            # Verificar si la IP está bloqueada
-            if rate_limiter.is_ip_blocked(ip):
-                return jsonify({
-                    "error": "Too many requests - IP temporarily blocked",
-                    "retry_after": block_duration
-                }), 429
-            
+
             # Determinar la clave para rate limiting
             if per == 'ip':
                 key = f"ip:{ip}"
@@ -88,20 +235,26 @@ def rate_limit(limit: int = 60, window: int = 60, per: str = 'ip', block_duratio
                 key = f"endpoint:{request.endpoint}:{ip}"
             else:
                 key = f"ip:{ip}"
-            
-            # Verificar rate limit
-            if rate_limiter.is_rate_limited(key, limit, window):
-                # Bloquear IP por exceder límite
-                rate_limiter.block_ip(ip, block_duration)
-                
-                return jsonify({
+
+            # Bloqueo de la IP y conteo en una sola operación del backend
+            result = rate_limiter.hit(key, ip, limit, window, block_duration)
+
+            if result.blocked:
+                return _with_rate_limit_headers(make_response(jsonify({
+                    "error": "Too many requests - IP temporarily blocked",
+                    "retry_after": result.retry_after
+                }), 429), result)
+
+            if not result.allowed:
+                # La IP quedó bloqueada por exceder el límite
+                return _with_rate_limit_headers(make_response(jsonify({
                     "error": "Rate limit exceeded",
                     "limit": limit,
                     "window": window,
-                    "retry_after": block_duration
-                }), 429
-            
-            return f(*args, **kwargs)
+                    "retry_after": result.retry_after
+                }), 429), result)
+
+            return _with_rate_limit_headers(make_response(f(*args, **kwargs)), result)
         return decorated_function
     return decorator
 
@@ -116,4 +269,4 @@ def api_rate_limit(f):
 
 def refresh_rate_limit(f):
     """Rate limiting para refresh tokens"""
-    return rate_limit(limit=10, window=60, per='user', block_duration=300)(f) 
\ No newline at end of file
+    return rate_limit(limit=10, window=60, per='user', block_duration=300)(f)
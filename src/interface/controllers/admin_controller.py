@@ -1,9 +1,11 @@
-from flask import Blueprint, jsonify
+from flask import Blueprint, jsonify, request
 from src.infrastructure.db.token_security_repository import TokenSecurityRepository
 from src.shared.decorators.internal_only import internal_only
 from src.infrastructure.security.rate_limiter import api_rate_limit
 from src.infrastructure.security.security_logger import security_logger, SecurityEventType
 from flasgger import swag_from
+from src.application.factories.inventory_usecase_factory import make_get_inventory_changes_use_case
+from src.infrastructure.db.base import db
 
 admin_bp = Blueprint('admin', __name__)
 
@@ -85,4 +87,34 @@ def get_security_stats():
         }), 200
         
     except Exception as e:
-        return jsonify({"error": "Failed to get security stats"}), 500 
\ No newline at end of file
+        return jsonify({"error": "Failed to get security stats"}), 500 
+
+@admin_bp.route('/cleanup-inventory-changes', methods=['POST'])
+@internal_only
+@api_rate_limit
+@swag_from({
+    'tags': ['Admin'],
+    'summary': 'Depuración del registro de cambios del inventario',
+    'description': 'Elimina cambios de delta sync más viejos que retention_days (por defecto 30). '
+                   'Los clientes con cursores anteriores recibirán un snapshot completo (solo uso interno)',
+    'security': [{'Internal-Secret': []}],
+    'parameters': [
+        {'name': 'retention_days', 'in': 'query', 'type': 'integer', 'required': False, 'default': 30}
+    ],
+    'responses': {
+        200: {'description': 'Depuración completada exitosamente'},
+        403: {'description': 'No autorizado - requiere secret interno'}
+    }
+})
+def cleanup_inventory_changes():
+    """Endpoint interno para depurar el registro de cambios del inventario"""
+    retention_days = max(request.args.get('retention_days', 30, type=int), 1)
+    try:
+        deleted = make_get_inventory_changes_use_case(db).prune(retention_days)
+        return jsonify({
+            "message": "Inventory change log cleanup completed successfully",
+            "retention_days": retention_days,
+            "deleted_changes": deleted
+        }), 200
+    except Exception as e:
+        return jsonify({"error": "Cleanup operation failed"}), 500
@@ -1,14 +1,18 @@
 from flasgger import swag_from # type: ignore
 from flask import Blueprint, jsonify, request
 from flask_jwt_extended import jwt_required, get_jwt_identity
+from marshmallow import ValidationError
 
 from src.application.factories.environmental_savings_factory import (
     make_estimate_savings_by_title_use_case,
     make_estimate_savings_by_uid_use_case,
+    make_estimate_savings_batch_use_case,
     make_get_all_environmental_calculations_use_case,
     make_get_environmental_calculations_by_status_use_case,
-make_sum_environmental_calculations_by_user
+    make_sum_environmental_calculations_by_user,
+    make_summarize_environmental_savings_by_period
 )
+from src.interface.serializers.environmental_savings_serializers import EnvironmentalSavingsBatchRequestSchema
 from src.shared.exceptions.custom import InvalidRequestDataException, RecipeNotFoundException
 
 environmental_savings_bp = Blueprint("environmental_savings", __name__)
@@ -347,6 +351,94 @@ def calculate_savings_from_uid(recipe_uid):
         return jsonify({"error": str(e)}), 404
 
 
+@environmental_savings_bp.route("/calculate/batch", methods=["POST"])
+@jwt_required()
+@swag_from({
+    'tags': ['Environmental Impact'],
+    'summary': 'Calcular ahorro ambiental de varias recetas a la vez',
+    'description': '''
+Calcula el impacto ambiental de hasta 100 recetas (propias o por defecto) en una sola llamada.
+
+### Comportamiento:
+- **Una lectura**: Recetas e ingredientes se cargan en una sola consulta
+- **Reutilización**: Las recetas con cálculo guardado se devuelven tal cual (`cached: true`), salvo `recompute: true`
+- **Una escritura**: Los cálculos nuevos se guardan con un único upsert por (usuario, receta)
+- **Estado cocinado**: Un recálculo conserva `is_cooked`
+- **UIDs desconocidos**: Se informan en `not_found`; no invalidan el resto del lote
+    ''',
+    'parameters': [
+        {
+            'name': 'body',
+            'in': 'body',
+            'required': True,
+            'schema': {
+                'type': 'object',
+                'required': ['recipe_uids'],
+                'properties': {
+                    'recipe_uids': {
+                        'type': 'array',
+                        'items': {'type': 'string'},
+                        'minItems': 1,
+                        'maxItems': 100,
+                        'example': ['recipe_uid_1', 'recipe_uid_2']
+                    },
+                    'recompute': {
+                        'type': 'boolean',
+                        'default': False,
+                        'description': 'Recalcular también las recetas con cálculo guardado'
+                    }
+                }
+            }
+        }
+    ],
+    'responses': {
+        200: {
+            'description': 'Cálculos del lote',
+            'examples': {
+                'application/json': {
+                    "calculations": [
+                        {
+                            "recipe_uid": "recipe_uid_1",
+                            "recipe_title": "Arroz con pollo",
+                            "carbon_footprint": 3.912,
+                            "water_footprint": 2905.4,
+                            "energy_footprint": 14.8,
+                            "economic_cost": 4.15,
+                            "unit_carbon": "kg CO2e",
+                            "unit_water": "litros",
+                            "unit_energy": "MJ",
+                            "unit_cost": "USD",
+                            "is_cooked": False,
+                            "cached": False
+                        }
+                    ],
+                    "count": 1,
+                    "computed": 1,
+                    "cached": 0,
+                    "not_found": ["recipe_uid_2"]
+                }
+            }
+        },
+        400: {
+            'description': 'Body inválido (recipe_uids vacío o con más de 100 elementos)'
+        },
+        401: {
+            'description': 'Token de autenticación inválido'
+        }
+    }
+})
+def calculate_savings_batch():
+    user_uid = get_jwt_identity()
+    try:
+        data = EnvironmentalSavingsBatchRequestSchema().load(request.get_json() or {})
+    except ValidationError as err:
+        raise InvalidRequestDataException(details=err.messages)
+
+    use_case = make_estimate_savings_batch_use_case()
+    result = use_case.execute(user_uid=user_uid, recipe_uids=data["recipe_uids"], recompute=data["recompute"])
+    return jsonify({**result, "count": len(result["calculations"])}), 200
+
+
 @environmental_savings_bp.route("/calculations", methods=["GET"])
 @jwt_required()
 @swag_from({
@@ -503,6 +595,9 @@ Obtiene calculaciones ambientales filtradas por el estado de preparación de las
 - **is_cooked=true**: Solo recetas que han sido preparadas/cocinadas
 - **is_cooked=false**: Solo recetas planificadas pero no preparadas aún
 
+Por defecto responde solo `count` y `totals`, calculados con una consulta agregada.
+El listado `calculations` se incluye únicamente con `include_calculations=true`.
+
 ### Información Incluida:
 - **Cálculos filtrados**: Solo los que coinciden con el estado solicitado
 - **Detalles de impacto**: Métricas ambientales completas
@@ -526,6 +621,15 @@ Obtiene calculaciones ambientales filtradas por el estado de preparación de las
             'enum': ['true', 'false'],
             'description': 'Filtrar por estado de preparación de la receta',
             'example': 'true'
+        },
+        {
+            'name': 'include_calculations',
+            'in': 'query',
+            'type': 'string',
+            'required': False,
+            'enum': ['true', 'false'],
+            'description': 'Incluir el listado completo de cálculos (por defecto solo count y totals)',
+            'example': 'false'
         }
     ],
     'responses': {
@@ -668,9 +772,13 @@ def get_calculations_by_status():
         raise InvalidRequestDataException(details={"is_cooked": "Debe ser 'true' o 'false'."})
 
     is_cooked = is_cooked_param == "true"
-    use_case = make_get_environmental_calculations_by_status_use_case()
-    result = use_case.execute(user_uid=user_uid, is_cooked=is_cooked)
-    return jsonify({"calculations": result, "count": len(result)}), 200
+    # El estado sale de la consulta agregada; el detalle por cálculo solo se lee si se pide
+    totals = make_sum_environmental_calculations_by_user().execute(user_uid, is_cooked=is_cooked)
+    response = {"count": totals["total_calculations"], "totals": totals}
+    if request.args.get("include_calculations") == "true":
+        use_case = make_get_environmental_calculations_by_status_use_case()
+        response["calculations"] = use_case.execute(user_uid=user_uid, is_cooked=is_cooked)
+    return jsonify(response), 200
 
 @environmental_savings_bp.route("/summary", methods=["GET"])
 @jwt_required()
@@ -850,7 +958,7 @@ Proporciona un resumen ejecutivo y consolidado de todo el impacto ambiental posi
 })
 def get_environmental_summary():
     user_uid = get_jwt_identity()
-    use_case = make_sum_environmental_calculations_by_user()
+    use_case = make_summarize_environmental_savings_by_period()
     result = use_case.execute(user_uid)
     return jsonify(result), 200
 
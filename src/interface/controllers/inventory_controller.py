@@ -1,6 +1,7 @@
 from flasgger import swag_from # type: ignore
 from flask import Blueprint, jsonify, request
 from flask_jwt_extended import jwt_required, get_jwt_identity
+from marshmallow import ValidationError
 
 from src.infrastructure.db.base import db
 
@@ -9,14 +10,16 @@ AddIngredientsBatchSchema,
 InventorySchema,
 UpdateIngredientSchema,
 UpdateIngredientQuantitySchema,
-UpdateFoodQuantitySchema
+UpdateFoodQuantitySchema,
+InventoryListQuerySchema
 )
 
 from src.interface.serializers.add_item_serializer import AddItemToInventorySchema, AddItemResponseSchema
 from src.interface.serializers.mark_consumed_serializer import (
     MarkIngredientConsumedSchema, 
     MarkFoodConsumedSchema, 
-    ConsumedResponseSchema
+    ConsumedResponseSchema,
+    ConsumeIngredientsSchema
 )
 
 from src.application.factories.inventory_usecase_factory import (
@@ -38,7 +41,9 @@ make_update_ingredient_stack_use_case,
 make_update_ingredient_quantity_use_case,
 make_update_food_quantity_use_case,
 make_mark_ingredient_stack_consumed_use_case,
-make_mark_food_item_consumed_use_case
+make_mark_food_item_consumed_use_case,
+make_consume_ingredients_fifo_use_case,
+make_get_inventory_changes_use_case
 )
 
 from src.application.factories.inventory_image_upload_factory import make_upload_inventory_image_use_case
@@ -684,6 +689,7 @@ def get_inventory_complete():
                 "image_path": ingredient.image_path,
                 "stacks": [
                     {
+                        "id": stack.id,
                         "quantity": stack.quantity,
                         "type_unit": ingredient.type_unit,
                         "expiration_date": stack.expiration_date.isoformat(),
@@ -941,13 +947,16 @@ def update_ingredient(ingredient_name, added_at):
     if errors:
         raise InvalidRequestDataException(details=errors)
 
-    use_case = make_update_ingredient_stack_use_case(db)
-    use_case.execute(
-        user_uid=user_uid,
-        ingredient_name=ingredient_name,
-        added_at=added_at,
-        updated_data=json_data
-    )
+    try:
+        use_case = make_update_ingredient_stack_use_case(db)
+        use_case.execute(
+            user_uid=user_uid,
+            ingredient_name=ingredient_name,
+            added_at=added_at,
+            updated_data=json_data
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 404
 
     return jsonify({"message": "Ingrediente actualizado exitosamente"}), 200
 
@@ -2140,6 +2149,7 @@ def get_inventory_simple():
                 days_to_expire = (stack.expiration_date - datetime.now()).days
                 
                 simple_ingredient = {
+                    "stack_id": stack.id,
                     "name": ingredient.name,
                     "quantity": stack.quantity,
                     "type_unit": ingredient.type_unit,
@@ -3588,6 +3598,13 @@ def get_food_detail(food_name, added_at):
 # 📋 ENDPOINTS PARA LISTAR TIPOS ESPECÍFICOS DE ITEMS
 # ===============================================================================
 
+def _load_list_query(default_sort: str) -> dict:
+    """Valida los query params de paginación y filtros de los listados"""
+    try:
+        return InventoryListQuerySchema(default_sort=default_sort).load(request.args)
+    except ValidationError as err:
+        raise InvalidRequestDataException(details=err.messages)
+
 @inventory_bp.route("/ingredients/list", methods=["GET"])
 @jwt_required()
 @swag_from({
@@ -3618,6 +3635,23 @@ Obtiene únicamente la lista de ingredientes del inventario, excluyendo alimento
 - Análisis de rotación de ingredientes
 - Interfaces especializadas en ingredientes crudos
     ''',
+    'parameters': [
+        {'name': 'limit', 'in': 'query', 'type': 'integer', 'required': False,
+         'description': 'Tamaño de página (1-100). Sin límite si no se indica'},
+        {'name': 'cursor', 'in': 'query', 'type': 'string', 'required': False,
+         'description': 'Valor de next_cursor de la página anterior'},
+        {'name': 'sort', 'in': 'query', 'type': 'string', 'required': False, 'enum': ['name', 'expiration'],
+         'description': 'Orden estable: por nombre o por vencimiento más próximo'},
+        {'name': 'storage_type', 'in': 'query', 'type': 'string', 'required': False,
+         'description': 'Filtrar por tipo de almacenamiento (ej: refrigerador)'},
+        {'name': 'expired', 'in': 'query', 'type': 'boolean', 'required': False,
+         'description': 'true: solo vencidos, false: solo vigentes'},
+        {'name': 'expiring_within', 'in': 'query', 'type': 'integer', 'required': False,
+         'description': 'Solo lo que vence en los próximos N días'},
+        {'name': 'fields', 'in': 'query', 'type': 'string', 'required': False,
+         'description': 'Campos a devolver separados por coma (ej: name,expiration_date). '
+                        'Sin indicar: proyección compacta; `*` o `all`: todos los campos'}
+    ],
     'responses': {
         200: {
             'description': 'Lista de ingredientes obtenida exitosamente',
@@ -3730,6 +3764,8 @@ def get_ingredients_list():
     else:
         print(f"📋 [GET INGREDIENTS LIST] No query parameters")
 
+    query = _load_list_query(default_sort="name")
+
     print(f"📋 [GET INGREDIENTS LIST] ===== STARTING USE CASE EXECUTION =====")
     try:
         print(f"📋 [GET INGREDIENTS LIST] Creating use case...")
@@ -3737,7 +3773,16 @@ def get_ingredients_list():
         print(f"📋 [GET INGREDIENTS LIST] Use case created successfully")
         
         print(f"📋 [GET INGREDIENTS LIST] Calling use_case.execute()...")
-        ingredients_result = use_case.execute(user_uid=user_uid)
+        ingredients_result = use_case.execute(
+            user_uid=user_uid,
+            sort=query['sort'],
+            cursor=query['cursor'],
+            limit=query['limit'],
+            storage_type=query['storage_type'],
+            expired=query['expired'],
+            expiring_within=query['expiring_within'],
+            fields=query['fields']
+        )
         print(f"📋 [GET INGREDIENTS LIST] Use case execution completed")
         
         print(f"📋 [GET INGREDIENTS LIST] ===== RESULT ANALYSIS =====")
@@ -3768,6 +3813,8 @@ def get_ingredients_list():
         print(f"✅ [GET INGREDIENTS LIST] Returning 200 response")
         return jsonify(ingredients_result), 200
 
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
         print(f"🚨 [GET INGREDIENTS LIST] ===== ERROR DETAILS =====")
         print(f"🚨 [GET INGREDIENTS LIST] Error type: {type(e).__name__}")
@@ -3818,6 +3865,25 @@ Obtiene únicamente la lista de alimentos preparados del inventario, excluyendo
 - Control de alimentos preparados en cocinas comerciales
 - Interfaces especializadas en comida lista
     ''',
+    'parameters': [
+        {'name': 'limit', 'in': 'query', 'type': 'integer', 'required': False,
+         'description': 'Tamaño de página (1-100). Sin límite si no se indica'},
+        {'name': 'cursor', 'in': 'query', 'type': 'string', 'required': False,
+         'description': 'Valor de next_cursor de la página anterior'},
+        {'name': 'sort', 'in': 'query', 'type': 'string', 'required': False, 'enum': ['name', 'expiration'],
+         'description': 'Orden estable: por nombre o por vencimiento más próximo'},
+        {'name': 'storage_type', 'in': 'query', 'type': 'string', 'required': False,
+         'description': 'Filtrar por tipo de almacenamiento (ej: refrigerador)'},
+        {'name': 'category', 'in': 'query', 'type': 'string', 'required': False,
+         'description': 'Filtrar por categoría (ej: almuerzo)'},
+        {'name': 'expired', 'in': 'query', 'type': 'boolean', 'required': False,
+         'description': 'true: solo vencidos, false: solo vigentes'},
+        {'name': 'expiring_within', 'in': 'query', 'type': 'integer', 'required': False,
+         'description': 'Solo lo que vence en los próximos N días'},
+        {'name': 'fields', 'in': 'query', 'type': 'string', 'required': False,
+         'description': 'Campos a devolver separados por coma (ej: name,expiration_date). '
+                        'Sin indicar: proyección compacta; `*` o `all`: todos los campos'}
+    ],
     'responses': {
         200: {
             'description': 'Lista de alimentos preparados obtenida exitosamente',
@@ -3932,17 +3998,583 @@ def get_foods_list():
 
     print(f"🍽️ [GET FOODS LIST] User: {user_uid}")
 
+    query = _load_list_query(default_sort="expiration")
+
     try:
         use_case = make_get_foods_list_use_case(db)
-        foods_result = use_case.execute(user_uid=user_uid)
+        foods_result = use_case.execute(user_uid=user_uid, **query)
 
         print(f"✅ [GET FOODS LIST] Successfully fetched {foods_result['total_foods']} food items")
         return jsonify(foods_result), 200
 
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
         print(f"🚨 [GET FOODS LIST] Unexpected error: {str(e)}")
         return jsonify({"error": f"Error fetching foods list: {str(e)}"}), 500
 
+# ===============================================================================
+# 🆔 ENDPOINTS DIRECCIONADOS POR ID (stacks de ingredientes y food items)
+# ===============================================================================
+
+@inventory_bp.route("/ingredients/stacks/<int:stack_id>", methods=["PUT"])
+@jwt_required()
+@swag_from({
+    'tags': ['Inventory'],
+    'summary': 'Actualizar un stack de ingrediente por ID',
+    'description': '''
+Actualiza la información completa de un stack de ingrediente identificado por su ID entero.
+
+Equivalente a `PUT /ingredients/<ingredient_name>/<added_at>`, pero con un único lookup por
+clave primaria y sin necesidad de enviar timestamps en la URL.
+    ''',
+    'parameters': [
+        {
+            'name': 'stack_id',
+            'in': 'path',
+            'type': 'integer',
+            'required': True,
+            'description': 'ID del stack (campo `id` en los listados del inventario)',
+            'example': 42
+        }
+    ],
+    'responses': {
+        200: {'description': 'Stack actualizado exitosamente'},
+        400: {'description': 'Datos de actualización inválidos'},
+        404: {'description': 'Stack no encontrado'},
+        401: {'description': 'Token de autenticación inválido'}
+    }
+})
+def update_ingredient_stack_by_id(stack_id):
+    user_uid = get_jwt_identity()
+    schema = UpdateIngredientSchema()
+    json_data = request.get_json()
+
+    errors = schema.validate(json_data)
+    if errors:
+        raise InvalidRequestDataException(details=errors)
+
+    print(f"✏️ [UPDATE STACK BY ID] User: {user_uid}, stack: {stack_id}")
+
+    try:
+        use_case = make_update_ingredient_stack_use_case(db)
+        use_case.execute_by_id(user_uid=user_uid, stack_id=stack_id, updated_data=json_data)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 404
+
+    return jsonify({
+        "message": "Ingrediente actualizado exitosamente",
+        "stack_id": stack_id
+    }), 200
+
+
+@inventory_bp.route("/ingredients/stacks/<int:stack_id>", methods=["DELETE"])
+@jwt_required()
+@swag_from({
+    'tags': ['Inventory'],
+    'summary': 'Eliminar un stack de ingrediente por ID',
+    'description': '''
+Elimina un stack de ingrediente identificado por su ID entero.
+Si es el último stack, elimina también el ingrediente completo.
+    ''',
+    'parameters': [
+        {
+            'name': 'stack_id',
+            'in': 'path',
+            'type': 'integer',
+            'required': True,
+            'description': 'ID del stack',
+            'example': 42
+        }
+    ],
+    'responses': {
+        200: {'description': 'Stack eliminado exitosamente'},
+        404: {'description': 'Stack no encontrado'},
+        401: {'description': 'Token de autenticación inválido'}
+    }
+})
+def delete_ingredient_stack_by_id(stack_id):
+    user_uid = get_jwt_identity()
+
+    print(f"🗑️ [DELETE STACK BY ID] User: {user_uid}, stack: {stack_id}")
+
+    try:
+        use_case = make_delete_ingredient_stack_use_case(db)
+        deleted_stack = use_case.execute_by_id(user_uid, stack_id)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 404
+
+    return jsonify({
+        "message": "Stack de ingrediente eliminado exitosamente",
+        "ingredient": deleted_stack['ingredient_name'],
+        "stack_id": stack_id,
+        "note": "Si era el último stack, el ingrediente fue eliminado completamente"
+    }), 200
+
+
+@inventory_bp.route("/ingredients/stacks/<int:stack_id>/quantity", methods=["PATCH"])
+@jwt_required()
+@swag_from({
+    'tags': ['Inventory'],
+    'summary': 'Actualizar cantidad de un stack de ingrediente por ID',
+    'parameters': [
+        {
+            'name': 'stack_id',
+            'in': 'path',
+            'type': 'integer',
+            'required': True,
+            'description': 'ID del stack',
+            'example': 42
+        },
+        {
+            'name': 'body',
+            'in': 'body',
+            'required': True,
+            'schema': {
+                'type': 'object',
+                'properties': {'quantity': {'type': 'number', 'example': 2.5}},
+                'required': ['quantity']
+            }
+        }
+    ],
+    'responses': {
+        200: {'description': 'Cantidad actualizada exitosamente'},
+        400: {'description': 'Datos inválidos'},
+        404: {'description': 'Stack no encontrado'},
+        401: {'description': 'Token de autenticación inválido'}
+    }
+})
+def update_ingredient_stack_quantity_by_id(stack_id):
+    user_uid = get_jwt_identity()
+    json_data = request.get_json()
+
+    if not json_data:
+        return jsonify({"error": "JSON data is required"}), 400
+
+    errors = UpdateIngredientQuantitySchema().validate(json_data)
+    if errors:
+        raise InvalidRequestDataException(details=errors)
+
+    new_quantity = json_data["quantity"]
+    print(f"📦 [UPDATE STACK QUANTITY BY ID] User: {user_uid}, stack: {stack_id}, quantity: {new_quantity}")
+
+    try:
+        use_case = make_update_ingredient_quantity_use_case(db)
+        stack_data = use_case.execute_by_id(user_uid=user_uid, stack_id=stack_id, new_quantity=new_quantity)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 404
+
+    return jsonify({
+        "message": "Cantidad de ingrediente actualizada exitosamente",
+        "ingredient": stack_data['ingredient_name'],
+        "stack_id": stack_id,
+        "new_quantity": new_quantity
+    }), 200
+
+
+@inventory_bp.route("/ingredients/stacks/<int:stack_id>/consume", methods=["POST"])
+@jwt_required()
+@swag_from({
+    'tags': ['Inventory'],
+    'summary': 'Marcar un stack de ingrediente como consumido por ID',
+    'description': '''
+Marca un stack de ingrediente como consumido (parcial o totalmente) identificándolo por su ID.
+Si `consumed_quantity` no se especifica, consume todo el stack.
+    ''',
+    'parameters': [
+        {
+            'name': 'stack_id',
+            'in': 'path',
+            'type': 'integer',
+            'required': True,
+            'description': 'ID del stack',
+            'example': 42
+        },
+        {
+            'name': 'body',
+            'in': 'body',
+            'required': False,
+            'schema': {
+                'type': 'object',
+                'properties': {'consumed_quantity': {'type': 'number', 'example': 1.5}}
+            }
+        }
+    ],
+    'responses': {
+        200: {'description': 'Consumo registrado exitosamente'},
+        400: {'description': 'Datos inválidos'},
+        404: {'description': 'Stack no encontrado o cantidad insuficiente'},
+        401: {'description': 'Token de autenticación inválido'}
+    }
+})
+def mark_ingredient_stack_consumed_by_id(stack_id):
+    user_uid = get_jwt_identity()
+
+    try:
+        validated_data = MarkIngredientConsumedSchema().load(request.get_json(silent=True) or {})
+    except Exception as e:
+        return jsonify({"error": f"Invalid data: {str(e)}"}), 400
+
+    consumed_quantity = validated_data.get('consumed_quantity')
+    print(f"🍽️ [MARK STACK CONSUMED BY ID] User: {user_uid}, stack: {stack_id}, quantity: {consumed_quantity or 'ALL'}")
+
+    try:
+        use_case = make_mark_ingredient_stack_consumed_use_case(db)
+        result = use_case.execute_by_id(user_uid=user_uid, stack_id=stack_id, consumed_quantity=consumed_quantity)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 404
+
+    return jsonify(ConsumedResponseSchema().dump(result)), 200
+
+
+@inventory_bp.route("/ingredients/consume", methods=["POST"])
+@jwt_required()
+@swag_from({
+    'tags': ['Inventory'],
+    'summary': 'Descontar ingredientes del inventario (FIFO por vencimiento)',
+    'description': '''
+Descuenta N unidades de uno o varios ingredientes en una sola transacción, agotando primero
+los stacks que vencen antes. Alternativamente recibe `recipe_uid` y descuenta los ingredientes
+de esa receta ("cociné esta receta").
+
+### Comportamiento:
+- **allow_partial = false** (por defecto): si algún ingrediente no existe, tiene otra unidad
+  o no alcanza, no se descuenta nada y se responde 409
+- **allow_partial = true**: se descuenta lo que haya y se informa el estado de cada ingrediente
+- **recipe_uid**: siempre se comporta como `allow_partial = true`
+
+### Estados por ingrediente:
+`consumed`, `partial`, `insufficient`, `not_found`, `unit_mismatch`, `skipped`
+    ''',
+    'parameters': [
+        {
+            'name': 'body',
+            'in': 'body',
+            'required': True,
+            'schema': {
+                'type': 'object',
+                'properties': {
+                    'ingredients': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'object',
+                            'properties': {
+                                'name': {'type': 'string', 'example': 'Tomate'},
+                                'quantity': {'type': 'number', 'example': 3},
+                                'type_unit': {'type': 'string', 'example': 'unidades'}
+                            },
+                            'required': ['name', 'quantity']
+                        }
+                    },
+                    'recipe_uid': {'type': 'string', 'example': 'a1b2c3'},
+                    'allow_partial': {'type': 'boolean', 'example': False}
+                }
+            }
+        }
+    ],
+    'responses': {
+        200: {'description': 'Ingredientes descontados (total o parcialmente)'},
+        400: {'description': 'Datos inválidos'},
+        404: {'description': 'Receta no encontrada'},
+        409: {'description': 'Inventario insuficiente (sin allow_partial)'},
+        401: {'description': 'Token de autenticación inválido'}
+    }
+})
+def consume_ingredients_fifo():
+    user_uid = get_jwt_identity()
+
+    try:
+        validated_data = ConsumeIngredientsSchema().load(request.get_json(silent=True) or {})
+    except Exception as e:
+        return jsonify({"error": f"Invalid data: {str(e)}"}), 400
+
+    use_case = make_consume_ingredients_fifo_use_case(db)
+
+    if validated_data.get('recipe_uid'):
+        print(f"🍽️ [CONSUME FIFO] User: {user_uid}, recipe: {validated_data['recipe_uid']}")
+        try:
+            result = use_case.execute_for_recipe(user_uid, validated_data['recipe_uid'])
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 404
+        return jsonify(result), 200
+
+    print(f"🍽️ [CONSUME FIFO] User: {user_uid}, ingredients: {len(validated_data['ingredients'])}")
+    try:
+        result = use_case.execute(
+            user_uid,
+            validated_data['ingredients'],
+            allow_partial=validated_data['allow_partial']
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 409
+
+    return jsonify(result), 200
+
+
+@inventory_bp.route("/foods/items/<int:food_id>", methods=["DELETE"])
+@jwt_required()
+@swag_from({
+    'tags': ['Inventory'],
+    'summary': 'Eliminar un food item por ID',
+    'description': '''
+Elimina un food item identificado por su ID entero.
+
+Equivalente a `DELETE /foods/<food_name>/<added_at>`, pero con un único lookup por clave primaria.
+    ''',
+    'parameters': [
+        {
+            'name': 'food_id',
+            'in': 'path',
+            'type': 'integer',
+            'required': True,
+            'description': 'ID del food item',
+            'example': 7
+        }
+    ],
+    'responses': {
+        200: {'description': 'Food item eliminado exitosamente'},
+        404: {'description': 'Food item no encontrado'},
+        401: {'description': 'Token de autenticación inválido'}
+    }
+})
+def delete_food_item_by_id(food_id):
+    user_uid = get_jwt_identity()
+
+    print(f"🗑️ [DELETE FOOD BY ID] User: {user_uid}, food: {food_id}")
+
+    try:
+        use_case = make_delete_food_item_use_case(db)
+        deleted_food = use_case.execute_by_id(user_uid, food_id)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 404
+
+    return jsonify({
+        "message": "Comida eliminada exitosamente del inventario",
+        "food": deleted_food['name'],
+        "food_id": food_id
+    }), 200
+
+
+@inventory_bp.route("/foods/items/<int:food_id>/quantity", methods=["PATCH"])
+@jwt_required()
+@swag_from({
+    'tags': ['Inventory'],
+    'summary': 'Actualizar cantidad de porciones de un food item por ID',
+    'parameters': [
+        {
+            'name': 'food_id',
+            'in': 'path',
+            'type': 'integer',
+            'required': True,
+            'description': 'ID del food item',
+            'example': 7
+        },
+        {
+            'name': 'body',
+            'in': 'body',
+            'required': True,
+            'schema': {
+                'type': 'object',
+                'properties': {'serving_quantity': {'type': 'number', 'example': 3}},
+                'required': ['serving_quantity']
+            }
+        }
+    ],
+    'responses': {
+        200: {'description': 'Cantidad actualizada exitosamente'},
+        400: {'description': 'Datos inválidos'},
+        404: {'description': 'Food item no encontrado'},
+        401: {'description': 'Token de autenticación inválido'}
+    }
+})
+def update_food_quantity_by_id(food_id):
+    user_uid = get_jwt_identity()
+    json_data = request.get_json()
+
+    errors = UpdateFoodQuantitySchema().validate(json_data)
+    if errors:
+        raise InvalidRequestDataException(details=errors)
+
+    print(f"🍽️ [UPDATE FOOD QUANTITY BY ID] User: {user_uid}, food: {food_id}")
+
+    try:
+        use_case = make_update_food_quantity_use_case(db)
+        food_data = use_case.execute_by_id(
+            user_uid=user_uid,
+            food_id=food_id,
+            new_quantity=json_data["serving_quantity"]
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 404
+
+    return jsonify({
+        "message": "Cantidad de comida actualizada exitosamente",
+        "food": food_data['name'],
+        "food_id": food_id,
+        "new_serving_quantity": json_data["serving_quantity"]
+    }), 200
+
+
+@inventory_bp.route("/foods/items/<int:food_id>/consume", methods=["POST"])
+@jwt_required()
+@swag_from({
+    'tags': ['Inventory'],
+    'summary': 'Marcar un food item como consumido por ID',
+    'description': '''
+Marca un food item como consumido (parcial o totalmente) identificándolo por su ID.
+Si `consumed_portions` no se especifica, consume todas las porciones.
+    ''',
+    'parameters': [
+        {
+            'name': 'food_id',
+            'in': 'path',
+            'type': 'integer',
+            'required': True,
+            'description': 'ID del food item',
+            'example': 7
+        },
+        {
+            'name': 'body',
+            'in': 'body',
+            'required': False,
+            'schema': {
+                'type': 'object',
+                'properties': {'consumed_portions': {'type': 'number', 'example': 1.5}}
+            }
+        }
+    ],
+    'responses': {
+        200: {'description': 'Consumo registrado exitosamente'},
+        400: {'description': 'Datos inválidos'},
+        404: {'description': 'Food item no encontrado o porciones insuficientes'},
+        401: {'description': 'Token de autenticación inválido'}
+    }
+})
+def mark_food_item_consumed_by_id(food_id):
+    user_uid = get_jwt_identity()
+
+    try:
+        validated_data = MarkFoodConsumedSchema().load(request.get_json(silent=True) or {})
+    except Exception as e:
+        return jsonify({"error": f"Invalid data: {str(e)}"}), 400
+
+    try:
+        use_case = make_mark_food_item_consumed_use_case(db)
+        result = use_case.execute_by_id(
+            user_uid=user_uid,
+            food_id=food_id,
+            consumed_portions=validated_data.get('consumed_portions')
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 404
+
+    return jsonify(ConsumedResponseSchema().dump(result)), 200
+
+
+@inventory_bp.route("/foods/items/<int:food_id>/detail", methods=["GET"])
+@jwt_required()
+@swag_from({
+    'tags': ['Inventory'],
+    'summary': 'Obtener el detalle de un food item por ID',
+    'parameters': [
+        {
+            'name': 'food_id',
+            'in': 'path',
+            'type': 'integer',
+            'required': True,
+            'description': 'ID del food item',
+            'example': 7
+        }
+    ],
+    'responses': {
+        200: {'description': 'Detalle del food item'},
+        404: {'description': 'Food item no encontrado'},
+        401: {'description': 'Token de autenticación inválido'},
+        500: {'description': 'Error interno del servidor'}
+    }
+})
+def get_food_detail_by_id(food_id):
+    user_uid = get_jwt_identity()
+
+    try:
+        use_case = make_get_food_detail_use_case(db)
+        food_detail = use_case.execute_by_id(user_uid=user_uid, food_id=food_id)
+        return jsonify(food_detail), 200
+
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 404
+    except Exception as e:
+        print(f"🚨 [GET FOOD DETAIL BY ID] Unexpected error: {str(e)}")
+        return jsonify({"error": f"Error fetching food details: {str(e)}"}), 500
+
+# ===============================================================================
+# 🔄 SINCRONIZACIÓN INCREMENTAL (DELTA SYNC)
+# ===============================================================================
+
+@inventory_bp.route("/changes", methods=["GET"])
+@jwt_required()
+@swag_from({
+    'tags': ['Inventory'],
+    'summary': 'Cambios del inventario desde un cursor (delta sync)',
+    'description': '''
+Devuelve solo lo que cambió en el inventario desde el cursor `since`, para que la app móvil no
+tenga que descargar el inventario completo después de cada modificación.
+
+### Flujo:
+1. Primera sincronización: llamar sin `since` → `mode: "snapshot"` con todo el inventario y `seq`
+2. Siguientes: llamar con `since=<seq>` → `mode: "delta"` con `upserts` y `tombstones`
+3. Si `has_more` es true, volver a llamar con el nuevo `seq`
+4. Si el cursor es demasiado viejo (registro depurado) se responde un snapshot completo
+
+### Entidades:
+- `ingredients`: metadatos por nombre (tombstone = nombre)
+- `ingredient_stacks`: stacks por ID (tombstone = ID)
+- `food_items`: comidas por ID (tombstone = ID)
+    ''',
+    'parameters': [
+        {'name': 'since', 'in': 'query', 'type': 'integer', 'required': False,
+         'description': 'Último seq recibido. Sin valor: snapshot completo'},
+        {'name': 'limit', 'in': 'query', 'type': 'integer', 'required': False,
+         'description': 'Máximo de cambios por respuesta (1-500)'}
+    ],
+    'responses': {
+        200: {
+            'description': 'Cambios o snapshot',
+            'examples': {
+                'application/json': {
+                    "mode": "delta",
+                    "seq": 42,
+                    "has_more": False,
+                    "upserts": {
+                        "ingredients": [],
+                        "ingredient_stacks": [
+                            {"id": 7, "ingredient_name": "Tomate", "quantity": 2.5,
+                             "expiration_date": "2025-01-10T10:00:00", "added_at": "2025-01-01T10:00:00"}
+                        ],
+                        "food_items": []
+                    },
+                    "tombstones": {"ingredients": ["Ajo"], "ingredient_stacks": [5], "food_items": []}
+                }
+            }
+        },
+        400: {'description': 'Parámetros inválidos'},
+        401: {'description': 'Token de autenticación inválido'}
+    }
+})
+def get_inventory_changes():
+    user_uid = get_jwt_identity()
+
+    since = request.args.get('since', type=int)
+    limit = request.args.get('limit', type=int)
+    if (since is not None and since < 0) or (limit is not None and not 1 <= limit <= 500):
+        raise InvalidRequestDataException(details={"since": "Debe ser >= 0", "limit": "Debe estar entre 1 y 500"})
+
+    use_case = make_get_inventory_changes_use_case(db)
+    result = use_case.execute(user_uid, since=since, limit=limit)
+
+    return jsonify(result), 200
+
+
 # ===============================================================================
 # 📤 ENDPOINT PARA UPLOAD DE IMÁGENES DEL INVENTARIO
 # ===============================================================================
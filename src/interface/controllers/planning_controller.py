@@ -4,7 +4,8 @@ from flask_jwt_extended import jwt_required, get_jwt_identity
 from datetime import datetime, timezone
 import uuid
 
-from src.interface.serializers.planning_serializers import SaveMealPlanRequestSchema, MealPlanSchema
+from marshmallow import ValidationError
+from src.interface.serializers.planning_serializers import SaveMealPlanRequestSchema, MealPlanSchema, MealPlanRangeQuerySchema, BulkMealPlanRequestSchema
 from src.application.factories.planning_usecase_factory import (
     make_save_meal_plan_use_case,
     make_update_meal_plan_use_case,
@@ -12,6 +13,9 @@ from src.application.factories.planning_usecase_factory import (
     make_get_meal_plan_by_date_use_case,
     make_get_all_meal_plans_use_case,
     make_get_meal_plan_dates_use_case,
+    make_get_meal_plans_in_range_use_case,
+    make_bulk_upsert_meal_plans_use_case,
+    make_get_shopping_list_use_case,
 )
 from src.application.factories.recipe_usecase_factory import make_recipe_image_generator_service
 from src.infrastructure.async_tasks.async_task_service import async_task_service
@@ -385,6 +389,96 @@ def update_meal_plan():
         "meal_plan": result
     })
 
+@planning_bp.route("/bulk", methods=["PUT"])
+@jwt_required()
+@swag_from({
+    'tags': ['Planning'],
+    'summary': 'Guardar o reemplazar los planes de varios días',
+    'description': '''
+Crea o reemplaza en una sola operación los planes de comidas de varios días (por ejemplo, una semana).
+
+### Comportamiento:
+- **Recetas existentes**: Cada comida referencia el UID de una receta del usuario o de una receta por defecto
+- **Reemplazo por día**: Cada día enviado queda exactamente como se envía; una comida omitida o `null` queda vacía
+- **Todo o nada**: Si alguna receta no existe, no se guarda ningún día
+- **Hasta 366 días** por petición, sin fechas repetidas
+    ''',
+    'parameters': [
+        {
+            'name': 'body',
+            'in': 'body',
+            'required': True,
+            'schema': {
+                'type': 'object',
+                'required': ['plans'],
+                'properties': {
+                    'plans': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'object',
+                            'required': ['date'],
+                            'properties': {
+                                'date': {'type': 'string', 'format': 'date', 'example': '2024-01-15'},
+                                'breakfast': {'type': 'string', 'example': 'recipe_uid_1'},
+                                'lunch': {'type': 'string', 'example': 'recipe_uid_2'},
+                                'dinner': {'type': 'string', 'example': None},
+                                'dessert': {'type': 'string', 'example': None}
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    ],
+    'responses': {
+        200: {
+            'description': 'Planes guardados',
+            'examples': {
+                'application/json': {
+                    'message': 'Se guardaron 7 planes de comidas',
+                    'meal_plans': [
+                        {
+                            'date': '2024-01-15',
+                            'breakfast': {'title': 'Avena con frutas'},
+                            'lunch': {'title': 'Ensalada mediterránea'},
+                            'dinner': None,
+                            'dessert': None
+                        }
+                    ],
+                    'count': 7
+                }
+            }
+        },
+        400: {
+            'description': 'Datos inválidos, fechas repetidas o recetas inexistentes',
+            'examples': {
+                'application/json': {
+                    'error': 'Algunas recetas no existen o no pertenecen al usuario.',
+                    'details': {'recipe_uids': ['recipe_uid_x']}
+                }
+            }
+        },
+        401: {
+            'description': 'Token de autenticación inválido'
+        }
+    }
+})
+def bulk_upsert_meal_plans():
+    user_uid = get_jwt_identity()
+    try:
+        data = BulkMealPlanRequestSchema().load(request.get_json() or {})
+    except ValidationError as err:
+        raise InvalidRequestDataException(details=err.messages)
+
+    use_case = make_bulk_upsert_meal_plans_use_case()
+    plans = use_case.execute(user_uid=user_uid, plans=data["plans"])
+
+    return jsonify({
+        "message": f"Se guardaron {len(plans)} planes de comidas",
+        "meal_plans": MealPlanSchema(many=True).dump(plans),
+        "count": len(plans)
+    })
+
 @planning_bp.route("/delete", methods=["DELETE"])
 @jwt_required()
 @swag_from({
@@ -853,6 +947,191 @@ def get_all_meal_plans():
     result = MealPlanSchema(many=True).dump(plans)
     return jsonify({"meal_plans": result})
 
+@planning_bp.route("/range", methods=["GET"])
+@jwt_required()
+@swag_from({
+    'tags': ['Meal Planning'],
+    'summary': 'Obtener los planes de comidas de un rango de fechas',
+    'description': '''
+Obtiene los planes de comidas del usuario entre dos fechas (ambas incluidas), ordenados por fecha.
+
+### Características:
+- **Rango acotado**: Hasta 366 días por consulta
+- **Carga en lote**: Los planes y todas sus recetas (con ingredientes y pasos) se leen en un número
+  fijo de consultas, sin importar cuántos días tenga el rango
+- **Recetas repetidas**: Una receta planificada en varios días se lee una sola vez
+
+### Casos de Uso:
+- Vista semanal o mensual del calendario de comidas
+- Base para la lista de compras de un período
+    ''',
+    'parameters': [
+        {
+            'name': 'from',
+            'in': 'query',
+            'type': 'string',
+            'format': 'date',
+            'required': True,
+            'description': 'Fecha inicial (YYYY-MM-DD)',
+            'example': '2024-01-15'
+        },
+        {
+            'name': 'to',
+            'in': 'query',
+            'type': 'string',
+            'format': 'date',
+            'required': True,
+            'description': 'Fecha final (YYYY-MM-DD)',
+            'example': '2024-01-21'
+        }
+    ],
+    'responses': {
+        200: {
+            'description': 'Planes del rango obtenidos exitosamente',
+            'examples': {
+                'application/json': {
+                    "meal_plans": [
+                        {
+                            "date": "2024-01-15",
+                            "breakfast": None,
+                            "lunch": {
+                                "title": "Ensalada mediterránea",
+                                "duration": "15 minutos",
+                                "difficulty": "Fácil",
+                                "category": "almuerzo",
+                                "ingredients": [{"name": "Tomate", "quantity": 2, "type_unit": "unidades"}],
+                                "steps": [{"step_order": 1, "description": "Cortar los vegetales"}]
+                            },
+                            "dinner": None,
+                            "dessert": None
+                        }
+                    ],
+                    "from": "2024-01-15",
+                    "to": "2024-01-21",
+                    "count": 1
+                }
+            }
+        },
+        400: {
+            'description': 'Fechas faltantes, con formato inválido o rango inválido'
+        },
+        401: {
+            'description': 'Token de autenticación inválido'
+        }
+    }
+})
+def get_meal_plans_in_range():
+    user_uid = get_jwt_identity()
+    try:
+        query = MealPlanRangeQuerySchema().load(request.args)
+    except ValidationError as err:
+        raise InvalidRequestDataException(details=err.messages)
+
+    use_case = make_get_meal_plans_in_range_use_case()
+    plans = use_case.execute(user_uid=user_uid, start_date=query["start_date"], end_date=query["end_date"])
+
+    return jsonify({
+        "meal_plans": MealPlanSchema(many=True).dump(plans),
+        "from": query["start_date"].isoformat(),
+        "to": query["end_date"].isoformat(),
+        "count": len(plans)
+    })
+
+@planning_bp.route("/shopping-list", methods=["GET"])
+@jwt_required()
+@swag_from({
+    'tags': ['Meal Planning'],
+    'summary': 'Lista de compras para los planes de un rango de fechas',
+    'description': '''
+Suma los ingredientes de todas las recetas planificadas en el rango, les resta lo que hay en el inventario
+y devuelve lo que falta comprar.
+
+### Cálculo:
+- **Unidades**: Las cantidades se pasan a g, ml o unidades (kilos, tazas, cucharadas, docenas, etc.);
+  unidades que no se pueden convertir entre sí se cuentan por separado
+- **Vencimientos**: Cada día usa primero los stacks que vencen antes, y solo los que siguen vigentes ese día;
+  un stack que vence antes de un día planificado no cubre ese día
+- **needed_from**: Primer día en el que el inventario no alcanza
+
+### Casos de Uso:
+- Lista de compras semanal a partir del plan de comidas
+- Detectar qué ingredientes del inventario ya cubren el plan
+    ''',
+    'parameters': [
+        {
+            'name': 'from',
+            'in': 'query',
+            'type': 'string',
+            'format': 'date',
+            'required': True,
+            'description': 'Fecha inicial (YYYY-MM-DD)',
+            'example': '2024-01-15'
+        },
+        {
+            'name': 'to',
+            'in': 'query',
+            'type': 'string',
+            'format': 'date',
+            'required': True,
+            'description': 'Fecha final (YYYY-MM-DD)',
+            'example': '2024-01-21'
+        }
+    ],
+    'responses': {
+        200: {
+            'description': 'Lista de compras calculada',
+            'examples': {
+                'application/json': {
+                    'from': '2024-01-15',
+                    'to': '2024-01-21',
+                    'shopping_list': [
+                        {
+                            'name': 'Tomate',
+                            'unit': 'unidades',
+                            'required': 8,
+                            'available': 5,
+                            'deficit': 3,
+                            'needed_from': '2024-01-18'
+                        }
+                    ],
+                    'covered': [
+                        {
+                            'name': 'Arroz',
+                            'unit': 'g',
+                            'required': 400,
+                            'available': 400,
+                            'deficit': 0,
+                            'needed_from': None
+                        }
+                    ],
+                    'summary': {
+                        'planned_days': 5,
+                        'ingredients': 2,
+                        'to_buy': 1,
+                        'covered': 1
+                    }
+                }
+            }
+        },
+        400: {
+            'description': 'Fechas faltantes, con formato inválido o rango inválido'
+        },
+        401: {
+            'description': 'Token de autenticación inválido'
+        }
+    }
+})
+def get_shopping_list():
+    user_uid = get_jwt_identity()
+    try:
+        query = MealPlanRangeQuerySchema().load(request.args)
+    except ValidationError as err:
+        raise InvalidRequestDataException(details=err.messages)
+
+    use_case = make_get_shopping_list_use_case()
+    result = use_case.execute(user_uid=user_uid, start_date=query["start_date"], end_date=query["end_date"])
+    return jsonify(result)
+
 @planning_bp.route("/dates", methods=["GET"])
 @jwt_required()
 @swag_from({
@@ -8,7 +8,11 @@ from src.infrastructure.ai.gemini_recipe_generator_service import logger
 from src.interface.serializers.recipe_serializers import (
     CustomRecipeRequestSchema,
     SaveRecipeRequestSchema,
-    RecipeSchema
+    RecipeSchema,
+    RecipeListQuerySchema,
+    RecipeSummarySchema,
+    RecipeRecommendationQuerySchema,
+    RecipeSearchQuerySchema
 )
 
 from src.application.factories.recipe_usecase_factory import (
@@ -16,19 +20,77 @@ from src.application.factories.recipe_usecase_factory import (
     make_prepare_recipe_generation_data_use_case,
     make_generate_custom_recipe_use_case,
     make_save_recipe_use_case,
+    make_save_generated_recipes_use_case,
     make_get_saved_recipes_use_case,
     make_get_all_recipes_use_case,
+    make_get_default_recipes_use_case,
+    make_get_recipe_recommendations_use_case,
+    make_search_recipes_use_case,
     make_delete_user_recipe_use_case,
     make_recipe_image_generator_service
 )
 
 from src.infrastructure.async_tasks.async_task_service import async_task_service
 from src.shared.exceptions.custom import InvalidRequestDataException
+from src.shared.precompressed import make_precompressed_response
+from marshmallow import ValidationError
 from datetime import datetime, timezone
 import uuid
 
 recipes_bp = Blueprint("recipes", __name__)
 
+# /default es público e igual para todos: cacheable por clientes y CDNs
+DEFAULT_RECIPES_CACHE_CONTROL = "public, max-age=300, stale-while-revalidate=600"
+
+# /all es el catálogo global: sin limit explícito se devuelve de a páginas de este tamaño
+ALL_RECIPES_DEFAULT_LIMIT = 50
+
+RECIPE_LIST_QUERY_PARAMETERS = [
+    {
+        'name': 'limit',
+        'in': 'query',
+        'type': 'integer',
+        'required': False,
+        'minimum': 1,
+        'maximum': 100,
+        'description': 'Recetas por página (paginación por cursor)'
+    },
+    {
+        'name': 'cursor',
+        'in': 'query',
+        'type': 'string',
+        'required': False,
+        'description': 'Valor de next_cursor devuelto por la página anterior'
+    },
+    {
+        'name': 'view',
+        'in': 'query',
+        'type': 'string',
+        'required': False,
+        'enum': ['full', 'summary'],
+        'default': 'full',
+        'description': 'summary devuelve solo uid, título, categoría, duración, dificultad e imagen (sin ingredientes ni pasos)'
+    }
+]
+
+
+def _load_recipe_list_query() -> dict:
+    """Valida los query params de paginación y vista de los listados de recetas"""
+    try:
+        return RecipeListQuerySchema().load(request.args)
+    except ValidationError as err:
+        raise InvalidRequestDataException(details=err.messages)
+
+
+def _dump_recipe_page(page: dict, view: str) -> dict:
+    schema = RecipeSummarySchema() if view == "summary" else RecipeSchema()
+    result = schema.dump(page["recipes"], many=True)
+    return {
+        "recipes": result,
+        "count": len(result),
+        "next_cursor": page["next_cursor"]
+    }
+
 @recipes_bp.route("/generate-from-inventory", methods=["POST"])
 @jwt_required()
 @swag_from({
@@ -819,24 +881,7 @@ Obtiene la colección completa de recetas guardadas por el usuario con opciones
             'default': 'desc',
             'description': 'Dirección del ordenamiento'
         },
-        {
-            'name': 'page',
-            'in': 'query',
-            'type': 'integer',
-            'required': False,
-            'default': 1,
-            'description': 'Número de página para paginación'
-        },
-        {
-            'name': 'per_page',
-            'in': 'query',
-            'type': 'integer',
-            'required': False,
-            'default': 20,
-            'maximum': 100,
-            'description': 'Recetas por página'
-        }
-    ],
+    ] + RECIPE_LIST_QUERY_PARAMETERS,
     'responses': {
         200: {
             'description': 'Recetas guardadas obtenidas exitosamente',
@@ -952,17 +997,17 @@ Obtiene la colección completa de recetas guardadas por el usuario con opciones
 })
 def get_saved_recipes():
     user_uid = get_jwt_identity()
+    query = _load_recipe_list_query()
 
     use_case = make_get_saved_recipes_use_case()
-    saved_recipes = use_case.execute(user_uid)
-
-    recipe_schema = RecipeSchema()
-    result = recipe_schema.dump(saved_recipes, many=True)
+    page = use_case.execute(
+        user_uid,
+        cursor=query["cursor"],
+        limit=query["limit"],
+        summary=query["view"] == "summary"
+    )
 
-    return jsonify({
-        "recipes": result,
-        "count": len(result)
-    }), 200
+    return jsonify(_dump_recipe_page(page, query["view"])), 200
 
 @recipes_bp.route("/all", methods=["GET"])
 @jwt_required()
@@ -994,7 +1039,12 @@ Obtiene todas las recetas disponibles en el sistema, incluyendo recetas pública
 ### Diferencias vs. Recetas Guardadas:
 - **Todas**: Catálogo completo del sistema, no personalizadas
 - **Guardadas**: Solo recetas que el usuario ha guardado en su colección personal
+
+### Paginación:
+- Más recientes primero, de a `limit` recetas (50 si no se indica)
+- Para la página siguiente enviar `cursor=<next_cursor>`; `next_cursor` es null en la última página
     ''',
+    'parameters': RECIPE_LIST_QUERY_PARAMETERS,
     'responses': {
         200: {
             'description': 'Todas las recetas del sistema obtenidas exitosamente',
@@ -1132,17 +1182,16 @@ Obtiene todas las recetas disponibles en el sistema, incluyendo recetas pública
     }
 })
 def get_all_recipes():
+    query = _load_recipe_list_query()
 
     use_case = make_get_all_recipes_use_case()
-    all_recipes = use_case.execute()
-
-    recipe_schema = RecipeSchema()
-    result = recipe_schema.dump(all_recipes, many=True)
+    page = use_case.execute(
+        cursor=query["cursor"],
+        limit=query["limit"] or ALL_RECIPES_DEFAULT_LIMIT,
+        summary=query["view"] == "summary"
+    )
 
-    return jsonify({
-        "recipes": result,
-        "count": len(result)
-    }), 200
+    return jsonify(_dump_recipe_page(page, query["view"])), 200
 
 @recipes_bp.route("/delete", methods=["DELETE"])
 @jwt_required()
@@ -1327,6 +1376,13 @@ Estas recetas están organizadas por categorías y no requieren autenticación.
             'enum': ['destacadas', 'rapidas_faciles', 'vegetarianas', 'postres', 'saludables'],
             'description': 'Filtrar por categoría específica',
             'example': 'destacadas'
+        },
+        {
+            'name': 'If-None-Match',
+            'in': 'header',
+            'type': 'string',
+            'required': False,
+            'description': 'ETag de una respuesta anterior; si no cambió se responde 304 sin cuerpo'
         }
     ],
     'responses': {
@@ -1399,6 +1455,9 @@ Estas recetas están organizadas por categorías y no requieren autenticación.
                 }
             }
         },
+        304: {
+            'description': 'Las recetas no cambiaron desde el ETag enviado en If-None-Match'
+        },
         500: {
             'description': 'Error interno del servidor'
         }
@@ -1408,104 +1467,13 @@ def get_default_recipes():
     """
     Obtiene las recetas por defecto del sistema.
     No requiere autenticación ya que son recetas públicas.
+    La respuesta se sirve desde un cache en memoria ya serializado y comprimido (gzip/brotli).
     """
-    from src.infrastructure.db.models.recipe_orm import RecipeORM
-    from src.infrastructure.db.models.recipe_ingredient_orm import RecipeIngredientORM
-    from src.infrastructure.db.models.recipe_step_orm import RecipeStepORM
-    from src.infrastructure.db.base import db
-    from sqlalchemy import select
-    
-    # UID especial para recetas del sistema
-    SYSTEM_USER_UID = "SYSTEM_DEFAULT_RECIPES"
-    
     try:
-        # Obtener parámetro de categoría opcional
-        category_filter = request.args.get('category')
-        
-        # Construir query base
-        query = select(RecipeORM).where(RecipeORM.user_uid == SYSTEM_USER_UID)
-        
-        # Aplicar filtro de categoría si se especifica
-        if category_filter:
-            # Mapear categorías de query a categorías de base de datos
-            category_mapping = {
-                'destacadas': ['almuerzo', 'cena', 'ensalada'],
-                'rapidas_faciles': ['almuerzo', 'desayuno'],
-                'vegetarianas': ['cena', 'ensalada', 'almuerzo'],
-                'postres': ['postre'],
-                'saludables': ['almuerzo', 'cena']
-            }
-            
-            if category_filter in category_mapping:
-                db_categories = category_mapping[category_filter]
-                query = query.where(RecipeORM.category.in_(db_categories))
-        
-        # Ejecutar query
-        result = db.session.execute(query)
-        recipes_orm = result.scalars().all()
-        
-        if not recipes_orm:
-            return jsonify({
-                "message": "No default recipes found",
-                "default_recipes": [],
-                "total_recipes": 0
-            }), 404
-        
-        # Convertir a formato de respuesta
-        default_recipes = []
-        categories_count = {}
-        
-        for recipe_orm in recipes_orm:
-            # Obtener ingredientes
-            ingredients = []
-            for ing in recipe_orm.ingredients:
-                ingredients.append({
-                    "name": ing.name,
-                    "quantity": ing.quantity,
-                    "type_unit": ing.type_unit
-                })
-            
-            # Obtener pasos ordenados
-            steps = []
-            sorted_steps = sorted(recipe_orm.steps, key=lambda s: s.step_order)
-            for step in sorted_steps:
-                steps.append({
-                    "step_order": step.step_order,
-                    "description": step.description
-                })
-            
-            # Construir objeto receta
-            recipe_data = {
-                "uid": recipe_orm.uid,
-                "title": recipe_orm.title,
-                "duration": recipe_orm.duration,
-                "difficulty": recipe_orm.difficulty,
-                "category": recipe_orm.category,
-                "description": recipe_orm.description,
-                "ingredients": ingredients,
-                "steps": steps,
-                "footer": recipe_orm.footer,
-                "generated_by_ai": recipe_orm.generated_by_ai,
-                "image_status": recipe_orm.image_status,
-                "image_path": recipe_orm.image_path,
-                "saved_at": recipe_orm.saved_at.isoformat() if recipe_orm.saved_at else None
-            }
-            
-            default_recipes.append(recipe_data)
-            
-            # Contar categorías
-            category = recipe_orm.category
-            categories_count[category] = categories_count.get(category, 0) + 1
-        
-        return jsonify({
-            "default_recipes": default_recipes,
-            "categories_summary": categories_count,
-            "total_recipes": len(default_recipes),
-            "filter_applied": {
-                "category": category_filter
-            }
-        }), 200
-        
+        use_case = make_get_default_recipes_use_case()
+        payload = use_case.execute(request.args.get('category'))
+        return make_precompressed_response(payload, DEFAULT_RECIPES_CACHE_CONTROL)
+
     except Exception as e:
         print(f"❌ [DEFAULT RECIPES] Error: {str(e)}")
         return jsonify({
@@ -1514,6 +1482,215 @@ def get_default_recipes():
         }), 500
 
 
+@recipes_bp.route("/recommendations", methods=["GET"])
+@jwt_required()
+@swag_from({
+    'tags': ['Recipe'],
+    'summary': 'Recomendar recetas existentes según el inventario (sin IA)',
+    'description': '''
+Rankea las recetas guardadas y por defecto según cuánto de cada receta cubre el inventario del usuario,
+sin llamar a Gemini.
+
+### Puntuación:
+- **Cobertura**: fracción de los ingredientes de la receta que el usuario tiene
+- **Prioridad**: los ingredientes que vencen en 7 días o menos suman un peso extra
+- **Alergias**: se excluye toda receta con un ingrediente que contenga una alergia del perfil
+
+### Cuándo generar con IA:
+Si ninguna receta alcanza `min_coverage`, la respuesta trae `generation_suggested: true`
+y el cliente debe usar `/api/recipes/generate-from-inventory`.
+    ''',
+    'parameters': [
+        {
+            'name': 'limit',
+            'in': 'query',
+            'type': 'integer',
+            'required': False,
+            'default': 10,
+            'minimum': 1,
+            'maximum': 50,
+            'description': 'Cantidad máxima de recomendaciones'
+        },
+        {
+            'name': 'min_coverage',
+            'in': 'query',
+            'type': 'number',
+            'required': False,
+            'default': 0.5,
+            'minimum': 0,
+            'maximum': 1,
+            'description': 'Fracción mínima de ingredientes de la receta presentes en el inventario'
+        }
+    ],
+    'responses': {
+        200: {
+            'description': 'Recomendaciones calculadas',
+            'examples': {
+                'application/json': {
+                    'recommendations': [
+                        {
+                            'uid': 'recipe_uuid',
+                            'title': 'Tortilla de patatas',
+                            'category': 'almuerzo',
+                            'duration': '30 minutos',
+                            'difficulty': 'Fácil',
+                            'image_path': 'https://storage.googleapis.com/...',
+                            'score': 1.1667,
+                            'coverage': 1.0,
+                            'matched_ingredients': ['Huevos', 'Patatas', 'Cebolla'],
+                            'missing_ingredients': [],
+                            'priority_ingredients': ['Huevo']
+                        }
+                    ],
+                    'count': 1,
+                    'catalog_size': 1843,
+                    'priority_ingredients': ['Huevo'],
+                    'allergies_filtered': ['maní'],
+                    'generation_suggested': False,
+                    'generate_endpoint': '/api/recipes/generate-from-inventory'
+                }
+            }
+        },
+        400: {
+            'description': 'Parámetros inválidos'
+        },
+        401: {
+            'description': 'Token de autenticación inválido'
+        },
+        404: {
+            'description': 'Inventario no encontrado'
+        }
+    }
+})
+def get_recipe_recommendations():
+    user_uid = get_jwt_identity()
+    try:
+        query = RecipeRecommendationQuerySchema().load(request.args)
+    except ValidationError as err:
+        raise InvalidRequestDataException(details=err.messages)
+
+    use_case = make_get_recipe_recommendations_use_case()
+    try:
+        result = use_case.execute(user_uid, limit=query["limit"], min_coverage=query["min_coverage"])
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 404
+
+    return jsonify(result), 200
+
+
+@recipes_bp.route("/search", methods=["GET"])
+@jwt_required()
+@swag_from({
+    'tags': ['Recipe'],
+    'summary': 'Buscar recetas por título, descripción o ingrediente',
+    'description': '''
+Búsqueda de texto sobre las recetas, ordenada por relevancia.
+
+### Cómo se busca:
+- **Campos**: título y descripción de la receta, y nombres de sus ingredientes
+- **Normalización**: sin distinguir mayúsculas ni acentos (`limon` encuentra "Limón")
+- **Ranking**: primero las recetas que contienen más términos de la búsqueda; a igualdad,
+  pesan más las coincidencias en el título que en ingredientes o descripción
+- **Alcance**: `scope=all` busca en todas las recetas (como `/recipes/all`), `scope=saved` solo en las del usuario
+
+### Paginación:
+Se pide la siguiente página con el `next_cursor` de la respuesta anterior y la misma `q`.
+    ''',
+    'parameters': [
+        {
+            'name': 'q',
+            'in': 'query',
+            'type': 'string',
+            'required': True,
+            'maxLength': 100,
+            'description': 'Texto a buscar'
+        },
+        {
+            'name': 'scope',
+            'in': 'query',
+            'type': 'string',
+            'required': False,
+            'default': 'all',
+            'enum': ['all', 'saved'],
+            'description': 'Todas las recetas o solo las guardadas por el usuario'
+        },
+        {
+            'name': 'limit',
+            'in': 'query',
+            'type': 'integer',
+            'required': False,
+            'default': 20,
+            'minimum': 1,
+            'maximum': 50,
+            'description': 'Tamaño de página'
+        },
+        {
+            'name': 'cursor',
+            'in': 'query',
+            'type': 'string',
+            'required': False,
+            'description': 'next_cursor de la página anterior'
+        }
+    ],
+    'responses': {
+        200: {
+            'description': 'Resultados de la búsqueda',
+            'examples': {
+                'application/json': {
+                    'recipes': [
+                        {
+                            'uid': 'recipe_uuid',
+                            'title': 'Pollo al curry',
+                            'duration': '40 minutos',
+                            'difficulty': 'Intermedio',
+                            'category': 'almuerzo',
+                            'description': 'Pollo en salsa de curry con arroz',
+                            'ingredients': [{'name': 'Pollo', 'quantity': 500, 'type_unit': 'gr'}],
+                            'steps': [{'step_order': 1, 'description': 'Dorar el pollo'}],
+                            'score': 9.4512
+                        }
+                    ],
+                    'count': 1,
+                    'terms': ['pollo', 'curry'],
+                    'next_cursor': None
+                }
+            }
+        },
+        400: {
+            'description': 'Parámetros o cursor inválidos'
+        },
+        401: {
+            'description': 'Token de autenticación inválido'
+        }
+    }
+})
+def search_recipes():
+    user_uid = get_jwt_identity()
+    try:
+        query = RecipeSearchQuerySchema().load(request.args)
+    except ValidationError as err:
+        raise InvalidRequestDataException(details=err.messages)
+
+    use_case = make_search_recipes_use_case()
+    result = use_case.execute(
+        user_uid,
+        query["q"],
+        scope=query["scope"],
+        cursor=query["cursor"],
+        limit=query["limit"]
+    )
+
+    recipes = []
+    for recipe, score in result["results"]:
+        recipes.append({"uid": recipe.uid, **RecipeSchema().dump(recipe), "score": score})
+    return jsonify({
+        "recipes": recipes,
+        "count": len(recipes),
+        "terms": result["terms"],
+        "next_cursor": result["next_cursor"]
+    }), 200
+
+
 @recipes_bp.route("/generate-save-from-inventory", methods=["POST"]) # This shit works
 @jwt_required()
 def generate_and_save_recipes():
@@ -1532,27 +1709,18 @@ def generate_and_save_recipes():
         if not generated_recipes_data:
             return jsonify({"message": "No se pudieron generar recetas."}), 200
 
-        # --- Guardar cada receta generada ---
-        save_use_case = make_save_recipe_use_case()
-        saved_recipes = []
-
+        # --- Guardar la generación y todas las recetas en una sola transacción ---
+        save_use_case = make_save_generated_recipes_use_case()
         print(f"💾 [CONTROLLER] Saving {len(generated_recipes_data)} generated recipes to user's collection...")
-        for recipe_data in generated_recipes_data:
-            try:
-                saved_recipe = save_use_case.execute(user_uid=user_uid, recipe_data=recipe_data)
-                saved_recipes.append(RecipeSchema().dump(saved_recipe))
-            except InvalidRequestDataException as e:
-                # Manejar el caso de que una receta ya exista.
-                print(f"⚠️ [CONTROLLER] Could not save recipe '{recipe_data.get('title')}': {e}")
-                # Continuar o parar.
-                pass
-
-                # --- Preparar la respuesta ---
+        saved = save_use_case.execute(user_uid=user_uid, generation_result=generation_result, generation_type="inventory")
+        saved_recipes = RecipeSchema(many=True).dump(saved["recipes"])
+
         # (Iniciar la tarea asíncrona para las imágenes, etc.) TODO
 
         return jsonify({
             "message": f"Se generaron {len(generated_recipes_data)} recetas y se guardaron {len(saved_recipes)} en tu colección.",
             "saved_recipes": saved_recipes,
+            "generation_id": saved["generation_id"],
             "generation_metadata": generation_result
         }), 200
 
@@ -249,7 +249,7 @@ def recognize_ingredients():
         
         # Verificar alergias
         firestore_service = make_firestore_profile_service()
-        user_profile = firestore_service.get_profile(user_uid)
+        user_profile = firestore_service.get_profile(user_uid, allow_partial=False)
         if user_profile:
             print("🔍 [SIMPLE RECOGNITION] Checking allergies...")
             result = _check_allergies_in_recognition(result, user_profile, "ingredients")
@@ -512,7 +512,7 @@ def recognize_ingredients_complete():
         # Obtener preferencias del usuario
         print("🔍 Getting user profile from Firestore...")
         firestore_service = make_firestore_profile_service()
-        user_profile = firestore_service.get_profile(user_uid)
+        user_profile = firestore_service.get_profile(user_uid, allow_partial=False)
         print(f"🔍 User profile: {user_profile is not None}")
         
         print("🔍 Creating complete recognition use case...")
@@ -756,7 +756,7 @@ def recognize_foods():
         
         # 3. VERIFICAR ALERGIAS
         firestore_service = make_firestore_profile_service()
-        user_profile = firestore_service.get_profile(user_uid)
+        user_profile = firestore_service.get_profile(user_uid, allow_partial=False)
         if user_profile:
             print("🔍 [SIMPLE FOOD RECOGNITION] Checking allergies...")
             result = _check_allergies_in_recognition(result, user_profile, "foods")
@@ -948,7 +948,7 @@ def recognize_batch():
     try:
         # Obtener preferencias del usuario
         firestore_service = make_firestore_profile_service()
-        user_profile = firestore_service.get_profile(user_uid)
+        user_profile = firestore_service.get_profile(user_uid, allow_partial=False)
         
         use_case = make_recognize_batch_use_case(db)
         result = use_case.execute(user_uid=user_uid, images_paths=images_paths)
@@ -1603,7 +1603,7 @@ def get_recognition_status(task_id):
                 
                 # Obtener preferencias del usuario para verificar alergias
                 firestore_service = make_firestore_profile_service()
-                user_profile = firestore_service.get_profile(user_uid)
+                user_profile = firestore_service.get_profile(user_uid, allow_partial=False)
                 
                 if user_profile:
                     print("🔍 [STATUS CHECK] Checking allergies in completed result...")
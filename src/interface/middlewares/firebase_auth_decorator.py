@@ -1,30 +1,11 @@
 import firebase_admin.auth # type: ignore
-import firebase_admin
-from firebase_admin import credentials
 from flask import request, jsonify, g
 from functools import wraps
-from src.shared.exceptions.custom import UnauthorizedAccessException 
-from src.config.config import Config
-from pathlib import Path
+from src.infrastructure.firebase.firebase_token_verifier import get_firebase_token_verifier
 
 def verify_firebase_token(f):
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        # Asegurar que Firebase está inicializado
-        if not firebase_admin._apps:
-            try:
-                cred_path = Path(Config.FIREBASE_CREDENTIALS_PATH).resolve()
-                if not cred_path.exists():
-                    print(f"🚨 ERROR: No se encontró el archivo de credenciales en {cred_path}")
-                    return jsonify({"error": "Firebase configuration error"}), 500
-                
-                cred = credentials.Certificate(str(cred_path))
-                firebase_admin.initialize_app(cred)
-                print(f"✅ Firebase Admin inicializado desde {cred_path}")
-            except Exception as init_error:
-                print(f"🚨 ERROR inicializando Firebase: {init_error}")
-                return jsonify({"error": "Firebase initialization failed"}), 500
-
         auth_header = request.headers.get('Authorization')
         if not auth_header or not auth_header.startswith('Bearer '):
             return jsonify({"error": "Authorization header is missing or invalid"}), 401
@@ -33,13 +14,17 @@ def verify_firebase_token(f):
         if not id_token:
             return jsonify({"error": "Firebase ID token is missing"}), 401
 
-        print(f"🔍 FIREBASE DEBUG: Verificando token...")
-        print(f"🔍 Token preview: {id_token[:50]}...")
+        try:
+            # Verificación local con las claves de Google ya descargadas; un token
+            # repetido (reintentos del cliente) sale de la caché de claims verificados
+            verifier = get_firebase_token_verifier()
+        except Exception as init_error:
+            print(f"🚨 ERROR configurando la verificación de Firebase: {init_error}")
+            return jsonify({"error": "Firebase configuration error"}), 500
 
         try:
-            decoded_token = firebase_admin.auth.verify_id_token(id_token)
+            decoded_token = verifier.verify(id_token)
             print(f"✅ Token verificado exitosamente: UID={decoded_token.get('uid')}")
-            print(f"✅ Token data: {decoded_token}")
             
             g.firebase_user_uid = decoded_token.get('uid')
             g.firebase_user = decoded_token
@@ -59,4 +44,4 @@ def verify_firebase_token(f):
             return jsonify({"error": "Token verification failed"}), 401
         
         return f(*args, **kwargs)
-    return decorated_function 
\ No newline at end of file
+    return decorated_function
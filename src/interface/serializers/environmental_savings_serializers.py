@@ -0,0 +1,11 @@
+from marshmallow import Schema, fields, validate
+
+
+class EnvironmentalSavingsBatchRequestSchema(Schema):
+    """Body de /environmental_savings/calculate/batch"""
+    recipe_uids = fields.List(
+        fields.String(validate=validate.Length(min=1, max=36)),
+        required=True,
+        validate=validate.Length(min=1, max=100)
+    )
+    recompute = fields.Boolean(missing=False)
@@ -1,4 +1,6 @@
-from marshmallow import Schema, fields, validate
+from marshmallow import Schema, fields, validate, validates_schema, post_load, ValidationError
+from src.shared.pagination import decode_cursor
+from src.shared.exceptions.custom import InvalidRequestDataException
 
 class IngredientInputSchema(Schema):
     name = fields.String(required=True)
@@ -43,6 +45,7 @@ class UpdateIngredientSchema(Schema):
     added_at = fields.DateTime(required=True)
 
 class IngredientStackSchema(Schema):
+    id = fields.Integer(allow_none=True)
     quantity = fields.Float(required=True)
     type_unit = fields.String(required=True)
     expiration_date = fields.DateTime(required=True)
@@ -69,3 +72,39 @@ class UpdateIngredientQuantitySchema(Schema):
 class UpdateFoodQuantitySchema(Schema):
     """Schema simple para actualizar solo la cantidad de porciones de comida"""
     serving_quantity = fields.Integer(required=True, validate=validate.Range(min=1))
+
+# ===== SCHEMA PARA PAGINACIÓN Y FILTROS DE LISTADOS =====
+
+class InventoryListQuerySchema(Schema):
+    """Query params de /ingredients/list y /foods/list (paginación por cursor y filtros)"""
+    limit = fields.Integer(required=False, missing=None, validate=validate.Range(min=1, max=100))
+    cursor = fields.String(required=False, missing=None)
+    sort = fields.String(required=False, missing=None, validate=validate.OneOf(["name", "expiration"]))
+    storage_type = fields.String(required=False, missing=None)
+    category = fields.String(required=False, missing=None)
+    expired = fields.Boolean(required=False, missing=None)
+    expiring_within = fields.Integer(required=False, missing=None, validate=validate.Range(min=0))
+    # "fields" choca con Schema.fields, por eso se declara con data_key
+    field_names = fields.String(required=False, missing=None, data_key="fields")
+
+    def __init__(self, *args, default_sort: str = "name", **kwargs):
+        super().__init__(*args, **kwargs)
+        self.default_sort = default_sort
+
+    @validates_schema
+    def validate_cursor(self, data, **kwargs):
+        if data.get("cursor"):
+            try:
+                decode_cursor(data["cursor"], data.get("sort") or self.default_sort)
+            except InvalidRequestDataException as e:
+                raise ValidationError(e.details["cursor"], "cursor")
+
+    @post_load
+    def split_fields(self, data, **kwargs):
+        # "fields=name,quantity" -> ["name", "quantity"]; "fields=*" o "fields=all" -> todos
+        field_names = data.pop("field_names")
+        data["fields"] = None
+        if field_names:
+            requested = [field.strip() for field in field_names.split(",") if field.strip()]
+            data["fields"] = ["*"] if requested in (["*"], ["all"]) else requested
+        return data
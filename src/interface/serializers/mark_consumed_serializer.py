@@ -1,4 +1,4 @@
-from marshmallow import Schema, fields, validate
+from marshmallow import Schema, fields, validate, validates_schema, ValidationError
 
 
 class MarkIngredientConsumedSchema(Schema):
@@ -25,6 +25,33 @@ class MarkFoodConsumedSchema(Schema):
     )
 
 
+class ConsumeIngredientItemSchema(Schema):
+    """Schema para un ingrediente a descontar del inventario (FIFO)"""
+
+    name = fields.Str(required=True, validate=validate.Length(min=1))
+    quantity = fields.Float(
+        required=True,
+        validate=validate.Range(min=0.01, error="Quantity must be greater than 0"),
+        error_messages={'invalid': 'Quantity must be a valid number'}
+    )
+    type_unit = fields.Str(required=False, allow_none=True, missing=None)
+
+
+class ConsumeIngredientsSchema(Schema):
+    """Schema para descontar varios ingredientes (o los de una receta) en una sola llamada"""
+
+    ingredients = fields.List(fields.Nested(ConsumeIngredientItemSchema), required=False, missing=None)
+    recipe_uid = fields.Str(required=False, allow_none=True, missing=None)
+    allow_partial = fields.Bool(required=False, missing=False)
+
+    @validates_schema
+    def validate_source(self, data, **kwargs):
+        if not data.get('ingredients') and not data.get('recipe_uid'):
+            raise ValidationError("Either 'ingredients' or 'recipe_uid' is required")
+        if data.get('ingredients') and data.get('recipe_uid'):
+            raise ValidationError("Use either 'ingredients' or 'recipe_uid', not both")
+
+
 class ConsumedResponseSchema(Schema):
     """Schema para la respuesta de items consumidos"""
     
@@ -36,6 +63,9 @@ class ConsumedResponseSchema(Schema):
     ingredient = fields.Str(missing=None, allow_none=True)
     food = fields.Str(missing=None, allow_none=True)
     
+    stack_id = fields.Int(missing=None, allow_none=True)
+    food_id = fields.Int(missing=None, allow_none=True)
+    
     consumed_quantity = fields.Float(missing=None, allow_none=True)
     consumed_portions = fields.Float(missing=None, allow_none=True)
     
@@ -1,4 +1,4 @@
-from marshmallow import Schema, fields, validate
+from marshmallow import Schema, fields, validate, EXCLUDE
 from .recipe_serializers import SaveRecipeRequestSchema, RecipeSchema
 
 class SaveMealPlanRequestSchema(Schema):
@@ -9,4 +9,26 @@ class MealPlanSchema(Schema):
     breakfast = fields.Nested(RecipeSchema, allow_none=True)
     lunch = fields.Nested(RecipeSchema, allow_none=True)
     dinner = fields.Nested(RecipeSchema, allow_none=True)
-    dessert = fields.Nested(RecipeSchema, allow_none=True)
\ No newline at end of file
+    dessert = fields.Nested(RecipeSchema, allow_none=True)
+
+class MealPlanRangeQuerySchema(Schema):
+    """Query params de /planning/range"""
+    class Meta:
+        unknown = EXCLUDE
+
+    start_date = fields.Date(required=True, data_key="from")
+    end_date = fields.Date(required=True, data_key="to")
+
+class BulkMealPlanItemSchema(Schema):
+    """Un día de /planning/bulk: UID de receta por comida (null o ausente = sin receta)"""
+    class Meta:
+        unknown = EXCLUDE
+
+    date = fields.Date(required=True)
+    breakfast = fields.String(allow_none=True, missing=None)
+    lunch = fields.String(allow_none=True, missing=None)
+    dinner = fields.String(allow_none=True, missing=None)
+    dessert = fields.String(allow_none=True, missing=None)
+
+class BulkMealPlanRequestSchema(Schema):
+    plans = fields.List(fields.Nested(BulkMealPlanItemSchema), required=True, validate=validate.Length(min=1, max=366))
@@ -46,3 +46,41 @@ class RecipeSchema(Schema):
     image_path = fields.String(allow_none=True, missing=None)
     image_status = fields.String(missing="generating")
     generated_at = fields.DateTime(allow_none=True)
+
+
+class RecipeListQuerySchema(Schema):
+    """Query params de /recipes/saved y /recipes/all (paginación por cursor y vista)"""
+    class Meta:
+        unknown = EXCLUDE
+
+    limit = fields.Integer(required=False, missing=None, validate=validate.Range(min=1, max=100))
+    cursor = fields.String(required=False, missing=None)
+    view = fields.String(required=False, missing="full", validate=validate.OneOf(["full", "summary"]))
+
+class RecipeSummarySchema(Schema):
+    """Vista resumida de una receta para listados (sin ingredientes ni pasos)"""
+    uid = fields.String()
+    title = fields.String()
+    category = fields.String()
+    duration = fields.String()
+    difficulty = fields.String()
+    image_path = fields.String(allow_none=True)
+    saved_at = fields.DateTime()
+
+class RecipeSearchQuerySchema(Schema):
+    """Query params de /recipes/search"""
+    class Meta:
+        unknown = EXCLUDE
+
+    q = fields.String(required=True, validate=validate.Length(min=1, max=100))
+    scope = fields.String(required=False, missing="all", validate=validate.OneOf(["all", "saved"]))
+    limit = fields.Integer(required=False, missing=20, validate=validate.Range(min=1, max=50))
+    cursor = fields.String(required=False, missing=None)
+
+class RecipeRecommendationQuerySchema(Schema):
+    """Query params de /recipes/recommendations"""
+    class Meta:
+        unknown = EXCLUDE
+
+    limit = fields.Integer(required=False, missing=10, validate=validate.Range(min=1, max=50))
+    min_coverage = fields.Float(required=False, missing=0.5, validate=validate.Range(min=0, max=1))
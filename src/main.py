@@ -1,4 +1,5 @@
 import time
+import click
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.sql import text
 from flasgger import Swagger
@@ -24,6 +25,7 @@ from src.interface.controllers.environmental_savings_controller import environme
 from src.shared.exceptions.base import AppException
 from src.infrastructure.auth.jwt_callbacks import configure_jwt_callbacks
 from src.infrastructure.security.security_headers import add_security_headers
+from src.infrastructure.firebase.firebase_token_verifier import get_firebase_token_verifier
 
 # Importar modelos ORM para que se creen las tablas
 from src.infrastructure.db.models.recipe_orm import RecipeORM
@@ -31,12 +33,16 @@ from src.infrastructure.db.models.inventory_orm import InventoryORM
 from src.infrastructure.db.models.ingredient_orm import IngredientORM
 from src.infrastructure.db.models.ingredient_stack_orm import IngredientStackORM
 from src.infrastructure.db.models.food_item_orm import FoodItemORM
+from src.infrastructure.db.models.inventory_change_orm import InventoryChangeORM
 from src.infrastructure.db.models.image_reference_orm import ImageReferenceORM
 from src.infrastructure.db.models.recognition_orm import RecognitionORM
 from src.infrastructure.db.models.async_task_orm import AsyncTaskORM
 from src.infrastructure.db.models.daily_meal_plan_orm import DailyMealPlanORM
 from src.infrastructure.db.models.generation_orm import GenerationORM
 from src.infrastructure.db.models.environmental_savings_orm import EnvironmentalSavingsORM
+from src.infrastructure.db.models.environmental_savings_rollup_orm import EnvironmentalSavingsRollupORM
+from src.infrastructure.db.models.ingredient_impact_factor_orm import IngredientImpactFactorORM
+from src.infrastructure.db.models.sustainability_ranking_sketch_orm import SustainabilityRankingSketchORM
 
 def create_app():
     application = Flask(__name__)
@@ -53,6 +59,12 @@ def create_app():
     jwt_manager = JWTManager(application)
     configure_jwt_callbacks(jwt_manager)
 
+    # Claves públicas de Google para verificar ID tokens de Firebase: se descargan en segundo plano
+    try:
+        get_firebase_token_verifier().public_keys.prefetch()
+    except Exception as e:
+        print(f"⚠️ Firebase token verifier not configured: {e}")
+
     # Registrar blueprints de API
     application.register_blueprint(auth_bp, url_prefix='/api/auth')
     application.register_blueprint(user_bp, url_prefix='/api/user')
@@ -65,6 +77,21 @@ def create_app():
     application.register_blueprint(generation_bp, url_prefix='/api/generation')
     application.register_blueprint(environmental_savings_bp, url_prefix='/api/environmental_savings')
 
+    @application.cli.command("backfill-savings-rollups")
+    @click.option("--user-uid", default=None, help="Solo este usuario (por defecto, todos)")
+    def backfill_savings_rollups(user_uid):
+        """Recalcula los buckets diarios/mensuales de environmental_savings_rollups desde el historial"""
+        from src.application.factories.environmental_savings_factory import make_environmental_savings_repository
+        buckets = make_environmental_savings_repository().rebuild_rollups(user_uid=user_uid)
+        print(f"🌱 Rollups de ahorro ambiental reconstruidos: {buckets} buckets")
+
+    @application.cli.command("build-sustainability-ranking")
+    def build_sustainability_ranking():
+        """Reconstruye los resúmenes de percentiles del ranking de sostenibilidad (pensado para un cron periódico)"""
+        from src.application.factories.environmental_savings_factory import make_build_sustainability_ranking
+        result = make_build_sustainability_ranking().execute()
+        print(f"🏆 Ranking de sostenibilidad: {result['population']} usuarios, construido {result['built_at']}")
+
     @application.errorhandler(AppException)
     def handle_app_exception(error):
         response = jsonify(error.to_dict())
@@ -0,0 +1,28 @@
+from typing import Optional
+
+
+def resolve_fields(requested: Optional[list], available: tuple, default: tuple, always: tuple = ()) -> tuple:
+    """
+    Resuelve el parámetro `fields=` de un listado.
+
+    Args:
+        requested: Campos pedidos por el cliente (None = proyección por defecto, ["*"] = todos)
+        available: Todos los campos que el listado sabe devolver
+        default: Proyección compacta usada cuando no se pide nada
+        always: Campos que se devuelven siempre (identificadores)
+
+    Returns:
+        tuple: Campos a devolver, en el orden de `available`
+    """
+    if requested is None:
+        wanted = set(default)
+    elif requested == ["*"]:
+        wanted = set(available)
+    else:
+        unknown = [field for field in requested if field not in available]
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)}. Available: {', '.join(available)}")
+        wanted = set(requested)
+
+    wanted.update(always)
+    return tuple(field for field in available if field in wanted)
@@ -0,0 +1,177 @@
+import threading
+import time
+import unicodedata
+from collections import Counter
+from typing import Any, Callable, Optional
+
+from rapidfuzz import process
+
+
+def normalize_name(name: str) -> str:
+    """Minúsculas, sin acentos y con los espacios colapsados"""
+    nfkd_form = unicodedata.normalize('NFKD', name)
+    return ' '.join(''.join(c for c in nfkd_form if not unicodedata.combining(c)).lower().split())
+
+
+def trigrams(normalized: str) -> set:
+    """Trigramas por palabra, con relleno como pg_trgm ("  pa", " pas", ..., "ta ")"""
+    grams = set()
+    for word in normalized.split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def _stamp_key(stamp):
+    # None (índice vacío) queda por debajo de cualquier marca real
+    return (stamp is not None, stamp)
+
+
+class FuzzyNameIndex:
+    """
+    Índice en memoria para buscar el nombre más parecido sin recorrer toda la tabla.
+
+    La búsqueda filtra candidatos por trigramas compartidos con la consulta y solo
+    sobre esos candidatos corre rapidfuzz (mismo scorer que process.extractOne).
+    Cada entrada puede pertenecer a un ámbito (p. ej. el usuario dueño) para búsquedas acotadas.
+
+    El índice no conoce la base de datos: el repositorio lo carga y le agrega/quita
+    entradas, y guarda en `watermark` hasta dónde está sincronizado.
+    """
+
+    def __init__(self, max_candidates: int = 256, common_gram_ratio: float = 0.1):
+        self.max_candidates = max_candidates
+        self.common_gram_ratio = common_gram_ratio
+        self._lock = threading.RLock()
+        self._sync_lock = threading.Lock()
+        self._names: dict = {}
+        self._grams: dict = {}
+        self._scopes: dict = {}
+        self._postings: dict = {}
+        self._scope_keys: dict = {}
+        self.loaded = False
+        self.watermark: Any = None
+        self.checked_at = 0.0
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def add(self, key: str, name: str, scope: Optional[str] = None) -> None:
+        normalized = normalize_name(name)
+        with self._lock:
+            if key in self._names:
+                if self._names[key] == normalized and self._scopes[key] == scope:
+                    return
+                self.discard(key)
+            grams = trigrams(normalized)
+            self._names[key] = normalized
+            self._grams[key] = grams
+            self._scopes[key] = scope
+            for gram in grams:
+                self._postings.setdefault(gram, set()).add(key)
+            self._scope_keys.setdefault(scope, set()).add(key)
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            if key not in self._names:
+                return
+            for gram in self._grams.pop(key):
+                postings = self._postings[gram]
+                postings.discard(key)
+                if not postings:
+                    del self._postings[gram]
+            scope = self._scopes.pop(key)
+            self._scope_keys[scope].discard(key)
+            if not self._scope_keys[scope]:
+                del self._scope_keys[scope]
+            del self._names[key]
+
+    def replace_all(self, entries, watermark: Any = None) -> None:
+        """Recarga completa desde (key, name, scope). Se arma aparte y se intercambia, sin bloquear búsquedas"""
+        fresh = FuzzyNameIndex()
+        for key, name, scope in entries:
+            fresh.add(key, name, scope)
+        with self._lock:
+            self._names, self._grams, self._scopes = fresh._names, fresh._grams, fresh._scopes
+            self._postings, self._scope_keys = fresh._postings, fresh._scope_keys
+            self.watermark = watermark
+            self.loaded = True
+
+    def sync(self, load_since: Callable[[Any], list], count_rows: Callable[[], int], refresh_seconds: float) -> None:
+        """
+        Sincroniza el índice con la tabla, como mucho cada `refresh_seconds`.
+
+        Args:
+            load_since: Devuelve [(key, name, scope, stamp)] con stamp >= watermark (None = todas las filas)
+            count_rows: Devuelve la cantidad de filas de la tabla
+            refresh_seconds: Intervalo mínimo entre consultas a la base de datos
+        """
+        if self.loaded and time.monotonic() - self.checked_at < refresh_seconds:
+            return
+
+        with self._sync_lock:
+            if self.loaded and time.monotonic() - self.checked_at < refresh_seconds:
+                return
+
+            if self.loaded:
+                # Incremental: solo las filas nuevas desde la marca de agua
+                rows = load_since(self.watermark)
+                for key, name, scope, _ in rows:
+                    self.add(key, name, scope)
+                self.watermark = max([self.watermark] + [stamp for *_, stamp in rows if stamp is not None], key=_stamp_key)
+
+            # Un conteo distinto indica bajas (o filas sin marca): recarga completa
+            if not self.loaded or count_rows() != len(self):
+                rows = load_since(None)
+                stamps = [stamp for *_, stamp in rows if stamp is not None]
+                self.replace_all([(key, name, scope) for key, name, scope, _ in rows], max(stamps) if stamps else None)
+                print(f"🔎 [FUZZY INDEX] Full reload: {len(self)} names")
+
+            self.checked_at = time.monotonic()
+
+    def keys(self) -> set:
+        with self._lock:
+            return set(self._names)
+
+    def best_match(self, query: str, scope: Optional[str] = None, score_cutoff: float = 80) -> Optional[tuple]:
+        """
+        Devuelve (key, nombre normalizado, score) del nombre más parecido, o None si ninguno llega a `score_cutoff`.
+
+        Args:
+            query: Nombre buscado
+            scope: Ámbito al que restringir la búsqueda (None = todas las entradas)
+            score_cutoff: Score mínimo (0-100)
+        """
+        normalized = normalize_name(query)
+        query_grams = trigrams(normalized)
+        if not query_grams:
+            return None
+
+        with self._lock:
+            allowed = self._scope_keys.get(scope, set()) if scope is not None else None
+            if allowed is not None and len(allowed) <= self.max_candidates:
+                # Ámbito chico (p. ej. las recetas de un usuario): se puntúa entero
+                candidates = {key: self._names[key] for key in allowed}
+            else:
+                candidates = self._candidates(query_grams, allowed)
+
+        if not candidates:
+            return None
+        match = process.extractOne(normalized, candidates, score_cutoff=score_cutoff)
+        if match is None:
+            return None
+        name, score, key = match
+        return key, name, score
+
+    def _candidates(self, query_grams: set, allowed: Optional[set]) -> dict:
+        # Los trigramas muy frecuentes ("de ", " la") casi no discriminan y son los más caros de contar:
+        # se usan los más raros primero y los frecuentes solo hasta cubrir un tercio de la consulta
+        common_limit = max(len(self._names), 1) * self.common_gram_ratio
+        postings = sorted((self._postings[gram] for gram in query_grams if gram in self._postings), key=len)
+        keep = max(sum(1 for keys in postings if len(keys) <= common_limit), (len(postings) + 1) // 3)
+        postings = postings[:keep]
+
+        overlap = Counter()
+        for keys in postings:
+            overlap.update(keys if allowed is None else keys & allowed)
+        return {key: self._names[key] for key, _ in overlap.most_common(self.max_candidates)}
@@ -0,0 +1,142 @@
+import math
+import re
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from src.shared.fuzzy_name_index import normalize_name
+
+# Palabras que no aportan a la búsqueda ("arroz con pollo" ~ "arroz pollo")
+STOPWORDS = {
+    "de", "del", "la", "el", "los", "las", "un", "una", "unos", "unas", "y", "o", "con", "sin",
+    "en", "al", "a", "para", "por", "su", "sus", "que", "se", "lo", "le", "es", "mas",
+}
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: Optional[str]) -> list:
+    """Términos de búsqueda de un texto: sin acentos, en minúsculas y sin stopwords"""
+    if not text:
+        return []
+    return [token for token in _TOKEN.findall(normalize_name(text)) if len(token) > 1 and token not in STOPWORDS]
+
+
+def _stamp_key(stamp):
+    return (stamp is not None, stamp)
+
+
+class InvertedIndex:
+    """
+    Índice invertido en memoria (término -> documentos) con ranking por campos.
+
+    Cada documento tiene varios campos de texto con su peso (p. ej. título > ingredientes > descripción).
+    El ranking ordena primero por cantidad de términos de la consulta encontrados y después por
+    la suma de idf * peso del campo, así "pollo al curry" pone arriba las recetas con ambos términos.
+
+    Como FuzzyNameIndex, no conoce la base de datos: el repositorio lo carga y lo mantiene con `sync`.
+    """
+
+    def __init__(self, field_weights: dict):
+        self.field_weights = field_weights
+        self._lock = threading.RLock()
+        self._sync_lock = threading.Lock()
+        self._postings: dict = {}
+        self._terms: dict = {}
+        self._scopes: dict = {}
+        self.loaded = False
+        self.watermark: Any = None
+        self.checked_at = 0.0
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def add(self, key: str, fields: dict, scope: Optional[str] = None) -> None:
+        weights = {}
+        for field, text in fields.items():
+            weight = self.field_weights.get(field, 1.0)
+            values = text if isinstance(text, (list, tuple)) else [text]
+            for term in {token for value in values for token in tokenize(value)}:
+                weights[term] = weights.get(term, 0.0) + weight
+
+        with self._lock:
+            self.discard(key)
+            for term, weight in weights.items():
+                self._postings.setdefault(term, {})[key] = weight
+            self._terms[key] = tuple(weights)
+            self._scopes[key] = scope
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            for term in self._terms.pop(key, ()):
+                postings = self._postings[term]
+                postings.pop(key, None)
+                if not postings:
+                    del self._postings[term]
+            self._scopes.pop(key, None)
+
+    def replace_all(self, entries, watermark: Any = None) -> None:
+        """Recarga completa desde (key, fields, scope). Se arma aparte y se intercambia, sin bloquear búsquedas"""
+        fresh = InvertedIndex(self.field_weights)
+        for key, fields, scope in entries:
+            fresh.add(key, fields, scope)
+        with self._lock:
+            self._postings, self._terms, self._scopes = fresh._postings, fresh._terms, fresh._scopes
+            self.watermark = watermark
+            self.loaded = True
+
+    def sync(self, load_since: Callable[[Any], list], count_rows: Callable[[], int], refresh_seconds: float) -> None:
+        """
+        Sincroniza el índice con la tabla, como mucho cada `refresh_seconds` (misma estrategia que FuzzyNameIndex).
+
+        Args:
+            load_since: Devuelve [(key, fields, scope, stamp)] con stamp >= watermark (None = todas las filas)
+            count_rows: Devuelve la cantidad de filas de la tabla
+            refresh_seconds: Intervalo mínimo entre consultas a la base de datos
+        """
+        if self.loaded and time.monotonic() - self.checked_at < refresh_seconds:
+            return
+
+        with self._sync_lock:
+            if self.loaded and time.monotonic() - self.checked_at < refresh_seconds:
+                return
+
+            if self.loaded:
+                rows = load_since(self.watermark)
+                for key, fields, scope, _ in rows:
+                    self.add(key, fields, scope)
+                self.watermark = max([self.watermark] + [stamp for *_, stamp in rows if stamp is not None], key=_stamp_key)
+
+            if not self.loaded or count_rows() != len(self):
+                rows = load_since(None)
+                stamps = [stamp for *_, stamp in rows if stamp is not None]
+                self.replace_all([(key, fields, scope) for key, fields, scope, _ in rows], max(stamps) if stamps else None)
+                print(f"🔎 [INVERTED INDEX] Full reload: {len(self)} documents")
+
+            self.checked_at = time.monotonic()
+
+    def search(self, query: str, scope: Optional[str] = None) -> list:
+        """
+        Devuelve [(key, score)] de los documentos con algún término de la consulta, del más relevante al menos.
+
+        Args:
+            query: Texto buscado
+            scope: Ámbito al que restringir la búsqueda (None = todos los documentos)
+        """
+        terms = set(tokenize(query))
+        with self._lock:
+            total = max(len(self._terms), 1)
+            matched, scores = {}, {}
+            for term in terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + total / len(postings))
+                for key, weight in postings.items():
+                    if scope is not None and self._scopes.get(key) != scope:
+                        continue
+                    matched[key] = matched.get(key, 0) + 1
+                    scores[key] = scores.get(key, 0.0) + idf * weight
+
+        ranked = sorted(scores, key=lambda key: (-matched[key], -scores[key], key))
+        return [(key, round(scores[key], 4)) for key in ranked]
@@ -0,0 +1,60 @@
+import base64
+import json
+from datetime import datetime
+from typing import Optional, Sequence
+
+from src.shared.exceptions.custom import InvalidRequestDataException
+
+
+def encode_cursor(sort: str, key: list) -> str:
+    """
+    Codifica la clave del último elemento de una página como cursor opaco (base64 url-safe).
+    Las fechas se guardan en formato ISO.
+    """
+    values = [value.isoformat() if isinstance(value, datetime) else value for value in key]
+    payload = json.dumps({"s": sort, "k": values}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str, key_types: Optional[Sequence[type]] = None) -> list:
+    """
+    Decodifica un cursor generado por encode_cursor.
+    Falla si el cursor está corrupto, fue generado con otro orden o, si se indica `key_types`
+    (p. ej. (datetime, str); una tupla de tipos admite cualquiera de ellos), si la clave no tiene
+    esa cantidad y tipo de valores.
+    Las fechas se validan pero se devuelven como texto ISO.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        key = payload["k"]
+        cursor_sort = payload["s"]
+    except (ValueError, KeyError, TypeError):
+        raise InvalidRequestDataException(details={"cursor": "Cursor inválido."})
+
+    if cursor_sort != sort or not isinstance(key, list):
+        raise InvalidRequestDataException(details={"cursor": "El cursor no corresponde al orden solicitado."})
+    if key_types is not None and not _key_matches(key, key_types):
+        raise InvalidRequestDataException(details={"cursor": "Cursor inválido."})
+    return key
+
+
+def _key_matches(key: list, key_types: Sequence) -> bool:
+    if len(key) != len(key_types):
+        return False
+    return all(
+        any(_value_matches(value, key_type) for key_type in (types if isinstance(types, tuple) else (types,)))
+        for value, types in zip(key, key_types)
+    )
+
+
+def _value_matches(value, key_type: type) -> bool:
+    if key_type is datetime:
+        if not isinstance(value, str):
+            return False
+        try:
+            datetime.fromisoformat(value)
+        except ValueError:
+            return False
+        return True
+    return not isinstance(value, bool) and isinstance(value, key_type)
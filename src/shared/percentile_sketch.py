@@ -0,0 +1,58 @@
+from bisect import bisect_left, bisect_right
+from typing import Iterable, Optional
+
+
+class PercentileSketch:
+    """
+    Resumen compacto de una distribución: los valores en los cuantiles 0, 1/k, ..., 1 (k + 1 puntos de corte).
+
+    Se arma una vez a partir de todos los valores y después ubicar un valor cuesta una búsqueda
+    binaria sobre los puntos de corte (O(log k)), sin importar cuántos valores se resumieron.
+    No guarda los valores originales ni a quién pertenecen.
+    """
+
+    def __init__(self, cutpoints: list, population: int):
+        self.cutpoints = [float(value) for value in cutpoints]
+        self.population = population
+
+    @classmethod
+    def build(cls, values: Iterable[float], k: int = 100) -> "PercentileSketch":
+        ordered = sorted(float(value) for value in values)
+        if not ordered:
+            return cls([], 0)
+        last = len(ordered) - 1
+        # Cuantil por rango más cercano: el punto i es el valor en la posición i/k del orden
+        return cls([ordered[round(i * last / k)] for i in range(k + 1)], len(ordered))
+
+    def percentile(self, value: float) -> Optional[float]:
+        """
+        Porcentaje (0-100) de la población con un valor menor a `value`; los empates cuentan a medias.
+        Devuelve None si el resumen está vacío.
+        """
+        cutpoints = self.cutpoints
+        if not cutpoints:
+            return None
+        k = len(cutpoints) - 1
+        if k == 0:
+            return 50.0
+
+        low, high = bisect_left(cutpoints, value), bisect_right(cutpoints, value)
+        if low < high:
+            # Igual a uno o más puntos de corte: el centro de ese tramo
+            position = (low + high - 1) / 2
+        elif low == 0:
+            position = 0.0
+        elif low > k:
+            position = float(k)
+        else:
+            # Entre dos puntos de corte: interpolación lineal
+            below, above = cutpoints[low - 1], cutpoints[low]
+            position = low - 1 + (value - below) / (above - below)
+        return round(position / k * 100, 1)
+
+    def to_dict(self) -> dict:
+        return {"cutpoints": self.cutpoints, "population": self.population}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "PercentileSketch":
+        return cls(data.get("cutpoints") or [], data.get("population") or 0)
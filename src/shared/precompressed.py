@@ -0,0 +1,68 @@
+import gzip
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Optional
+
+from flask import Response, request
+
+try:
+    import brotli  # type: ignore
+except ImportError:  # brotli es opcional: sin él se sirve gzip
+    brotli = None
+
+
+@dataclass(frozen=True)
+class PrecompressedPayload:
+    """Respuesta JSON serializada y comprimida una sola vez, lista para servirse tal cual"""
+    status: int
+    identity: bytes
+    gzip: bytes
+    br: Optional[bytes]
+    etag: str
+
+
+def build_payload(body: dict, status: int = 200) -> PrecompressedPayload:
+    """
+    Serializa `body` y precalcula sus variantes gzip y brotli.
+    El ETag es el hash del JSON, así que dos construcciones del mismo contenido comparten ETag.
+    """
+    identity = json.dumps(body, ensure_ascii=False, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    return PrecompressedPayload(
+        status=status,
+        identity=identity,
+        gzip=gzip.compress(identity, compresslevel=9, mtime=0),
+        br=brotli.compress(identity, quality=11) if brotli else None,
+        etag=hashlib.sha256(identity).hexdigest()[:32]
+    )
+
+
+def make_precompressed_response(payload: PrecompressedPayload, cache_control: str) -> Response:
+    """
+    Sirve un PrecompressedPayload negociando Content-Encoding con Accept-Encoding
+    y respondiendo 304 si el cliente ya tiene la versión actual (If-None-Match).
+    """
+    if payload.br is not None and request.accept_encodings["br"]:
+        body, encoding = payload.br, "br"
+    elif request.accept_encodings["gzip"]:
+        body, encoding = payload.gzip, "gzip"
+    else:
+        body, encoding = payload.identity, None
+
+    # ETag fuerte por representación: cada codificación tiene bytes distintos
+    etag = f"{payload.etag}-{encoding}" if encoding else payload.etag
+
+    headers = {
+        "ETag": f'"{etag}"',
+        "Cache-Control": cache_control,
+        "Vary": "Accept-Encoding"
+    }
+
+    # Cualquier variante del mismo contenido vale como validador
+    client_etags = {tag.split("-")[0] for tag in request.if_none_match.as_set()}
+    if payload.status == 200 and (payload.etag in client_etags or request.if_none_match.star_tag):
+        return Response(status=304, headers=headers)
+
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return Response(body, status=payload.status, headers=headers, mimetype="application/json")
@@ -0,0 +1,65 @@
+from unittest.mock import MagicMock
+
+from src.application.services.environmental_impact_calculator import EnvironmentalImpactCalculator
+from src.application.services.impact_factors import CachedImpactFactorTable, ImpactFactorTable, factor_from_row
+
+
+def _table():
+    return ImpactFactorTable({
+        "pollo": factor_from_row((6.0, 4000, 20, 5, 1.5, 1.0)),
+        "pechuga de pollo": factor_from_row((7.0, 4000, 20, 8, 0.25, 1.0)),
+        "aceite": factor_from_row((4.0, 4000, 10, 3, 0.014, 0.9)),
+        "ajo": factor_from_row((1.0, 500, 2, 5, 0.05, 1.0)),
+    })
+
+
+class TestImpactFactorTable:
+    """Tests para el cálculo local del impacto ambiental de una receta"""
+
+    def test_resolves_most_specific_factor(self):
+        """Test: Sin clave exacta se usa el factor con más palabras en común"""
+        table = _table()
+
+        assert table.resolve("Pechugas de Pollo deshuesadas") == "pechuga de pollo"
+        assert table.resolve("Muslos de pollo") == "pollo"
+        assert table.resolve("Kion") is None
+
+    def test_quantities_are_converted_to_kilograms(self):
+        """Test: Gramos, cucharadas (densidad), dientes y unidades se pasan a kg antes de aplicar el factor"""
+        result = _table().compute([
+            {"name": "Pollo", "quantity": 500, "type_unit": "gramos"},
+            {"name": "Aceite", "quantity": 2, "type_unit": "cucharadas"},
+            {"name": "Ajos", "quantity": 2, "type_unit": "dientes"},
+            {"name": "Pechuga de pollo", "quantity": "1/2", "type_unit": "unidades"},
+            {"name": "Kion", "quantity": 1, "type_unit": "unidad"},
+        ])
+
+        # 0.5 * 6 + 0.027 * 4 + 0.01 * 1 + 0.125 * 7
+        assert result["totals"]["carbon_footprint"] == 3.993
+        assert result["unresolved"] == ["Kion"]
+
+
+class TestEnvironmentalImpactCalculator:
+    """Tests para el respaldo con IA de los ingredientes sin factor"""
+
+    def test_unknown_ingredients_are_learned_once(self):
+        """Test: La IA solo se consulta por lo desconocido y lo aprendido se guarda"""
+        repo = MagicMock()
+        repo.find_all.return_value = {}
+        adapter = MagicMock()
+        adapter.estimate_ingredient_impact_factors.return_value = {
+            "Kion": {"carbon_footprint": 1, "water_footprint": 100, "energy_footprint": 1, "economic_cost": 2, "kg_per_unit": 0.1},
+            "Inventado": {"carbon_footprint": -1, "water_footprint": 1, "energy_footprint": 1, "economic_cost": 1},
+        }
+        calculator = EnvironmentalImpactCalculator(repo, adapter, CachedImpactFactorTable())
+        ingredients = [{"name": "Kion", "quantity": 2, "type_unit": "unidades"}, {"name": "Tomate", "quantity": 1, "type_unit": "kg"}]
+
+        first = calculator.estimate(ingredients)
+        second = calculator.estimate(ingredients)
+
+        adapter.estimate_ingredient_impact_factors.assert_called_once_with(["Kion"])
+        [saved], _ = repo.save_many.call_args
+        assert list(saved) == ["kion"]
+        assert first == second
+        assert first["carbon_footprint"] == 2.3  # 0.2 kg de kion * 1 + 1 kg de tomate * 2.1
+        assert first["unit_carbon"] == "kg CO2e"
@@ -0,0 +1,61 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.application.use_cases.recipes.calculate_environmental_savings_batch import EstimateEnvironmentalSavingsBatch
+from src.domain.models.environmental_savings import EnvironmentalSavings
+from src.shared.exceptions.custom import InvalidRequestDataException
+
+
+def _use_case(existing=None):
+    recipe_repo = MagicMock()
+    recipe_repo.get_ingredients_by_uids.return_value = {
+        uid: {"uid": uid, "user_uid": "u1", "title": f"Receta {uid}", "ingredients": [{"name": "Arroz", "quantity": 1, "type_unit": "kg"}]}
+        for uid in ("r1", "r2")
+    }
+    calculator = MagicMock()
+    calculator.estimate.return_value = {
+        "carbon_footprint": 4.5, "water_footprint": 2500.0, "energy_footprint": 10.0, "economic_cost": 1.5,
+        "unit_carbon": "kg CO2e", "unit_water": "litros", "unit_energy": "MJ", "unit_cost": "USD"
+    }
+    savings_repo = MagicMock()
+    savings_repo.find_by_user_and_recipes.return_value = existing or {}
+    return EstimateEnvironmentalSavingsBatch(recipe_repo, calculator, savings_repo, "system"), recipe_repo, savings_repo
+
+
+def _saved(recipe_uid, is_cooked):
+    return EnvironmentalSavings("u1", recipe_uid, "Guardada", 1.0, 2.0, 3.0, 4.0, "kg CO2e", "litros", "MJ", "USD", is_cooked)
+
+
+class TestEnvironmentalSavingsBatch:
+    """Tests para /api/environmental_savings/calculate/batch"""
+
+    def test_only_missing_calculations_are_computed_in_one_upsert(self):
+        """Test: Lo ya calculado se reutiliza, lo nuevo se guarda con un solo save_many y se informan los no encontrados"""
+        use_case, recipe_repo, savings_repo = _use_case(existing={"r2": _saved("r2", True)})
+
+        result = use_case.execute("u1", ["r1", "r2", "r1", "zz"])
+
+        recipe_repo.get_ingredients_by_uids.assert_called_once_with(["r1", "r2", "zz"], owner_uids=["u1", "system"])
+        [saved], _ = savings_repo.save_many.call_args
+        assert [savings.recipe_uid for savings in saved] == ["r1"]
+        assert [(item["recipe_uid"], item["cached"]) for item in result["calculations"]] == [("r1", False), ("r2", True)]
+        assert result["not_found"] == ["zz"]
+
+    def test_recompute_keeps_cooked_status(self):
+        """Test: Con recompute se recalcula todo y se conserva is_cooked"""
+        use_case, _, savings_repo = _use_case(existing={"r2": _saved("r2", True)})
+
+        result = use_case.execute("u1", ["r1", "r2"], recompute=True)
+
+        assert result["computed"] == 2
+        assert result["cached"] == 0
+        assert [item["is_cooked"] for item in result["calculations"]] == [False, True]
+        assert result["calculations"][1]["carbon_footprint"] == 4.5
+
+    def test_too_many_recipes_is_rejected(self):
+        """Test: Más de MAX_RECIPES recetas se rechaza"""
+        use_case, _, _ = _use_case()
+
+        with pytest.raises(InvalidRequestDataException):
+            use_case.execute("u1", [f"r{i}" for i in range(EstimateEnvironmentalSavingsBatch.MAX_RECIPES + 1)])
@@ -0,0 +1,86 @@
+from datetime import date
+from unittest.mock import MagicMock
+
+from src.application.use_cases.recipes.sum_environmental_calculations_by_user import SumEnvironmentalCalculationsByUser
+from src.application.use_cases.recipes.summarize_environmental_savings_by_period import SummarizeEnvironmentalSavingsByPeriod
+
+
+def _group(is_cooked, source, count, carbon, water=0.0, energy=0.0, cost=0.0):
+    return {
+        "is_cooked": is_cooked, "recipe_source_type": source, "count": count,
+        "carbon_footprint": carbon, "water_footprint": water, "energy_footprint": energy, "economic_cost": cost,
+        "unit_carbon": "kg CO2e", "unit_water": "litros", "unit_energy": "MJ", "unit_cost": "USD"
+    }
+
+
+class TestEnvironmentalSavingsSummary:
+    """Tests para el resumen de ahorro ambiental a partir de totales agrupados (/api/environmental_savings/summary)"""
+
+    def test_groups_are_combined_into_totals_and_breakdowns(self):
+        """Test: Los grupos (is_cooked, tipo de receta) se suman en totales y desgloses"""
+        repo = MagicMock()
+        repo.get_totals_by_user.return_value = [
+            _group(True, "manual", 2, 1.25, water=10.04),
+            _group(True, "generated", 3, 2.5, water=20.0),
+            _group(False, "generated", 1, 0.5, cost=3.333),
+        ]
+
+        result = SumEnvironmentalCalculationsByUser(repo).execute("u1")
+
+        repo.get_totals_by_user.assert_called_once_with("u1", is_cooked=None)
+        assert result["total_carbon_footprint"] == 4.25
+        assert result["total_water_footprint"] == 30.0
+        assert result["total_economic_cost"] == 3.33
+        assert result["total_calculations"] == 6
+        assert result["by_status"]["cooked"]["count"] == 5
+        assert result["by_status"]["not_cooked"]["carbon_footprint"] == 0.5
+        assert result["by_source_type"]["generated"]["count"] == 4
+        assert result["unit_energy"] == "MJ"
+
+    def test_user_without_calculations_gets_zeros_and_default_units(self):
+        """Test: Sin cálculos se devuelven ceros y las unidades por defecto"""
+        result = SumEnvironmentalCalculationsByUser.summarize([])
+
+        assert result["total_carbon_footprint"] == 0.0
+        assert result["total_calculations"] == 0
+        assert result["by_source_type"] == {}
+        assert result["unit_cost"] == "S/"
+
+
+class TestEnvironmentalSavingsRollupSummary:
+    """Tests para el resumen por períodos leído de environmental_savings_rollups"""
+
+    @staticmethod
+    def _bucket(period, bucket_start, is_cooked, count, carbon):
+        return {"period": period, "bucket_start": bucket_start, **_group(is_cooked, "generated", count, carbon)}
+
+    def test_trends_weeks_and_comparison_come_from_buckets(self):
+        """Test: Meses y semanas sin actividad aparecen en cero y la comparación es contra el mes anterior"""
+        repo = MagicMock()
+        repo.get_rollups.return_value = [
+            self._bucket("month", date(2026, 9, 1), False, 2, 4.0),
+            self._bucket("month", date(2026, 10, 1), True, 3, 6.0),
+            self._bucket("day", date(2026, 10, 13), True, 1, 2.0),
+            self._bucket("day", date(2026, 10, 18), True, 2, 4.0),
+        ]
+
+        result = SummarizeEnvironmentalSavingsByPeriod(repo).execute("u1", today=date(2026, 10, 18))
+
+        repo.get_rollups.assert_called_once_with("u1", days_since=date(2026, 8, 24))
+        assert result["total_carbon_footprint"] == 10.0
+        assert len(result["monthly_trends"]) == 12
+        assert result["monthly_trends"][-1]["month"] == "2026-10"
+        assert result["monthly_trends"][-1]["cooked_count"] == 3
+        assert result["monthly_trends"][0]["count"] == 0
+        assert result["weekly_breakdown"][-1]["week"] == "2026-W42"
+        assert result["weekly_breakdown"][-1]["count"] == 3
+        assert result["period_comparison"]["change_pct"]["carbon_footprint"] == 50.0
+
+    def test_comparison_without_previous_month_is_none(self):
+        """Test: Sin datos el mes anterior el cambio porcentual es None"""
+        repo = MagicMock()
+        repo.get_rollups.return_value = [self._bucket("month", date(2026, 10, 1), True, 1, 1.0)]
+
+        result = SummarizeEnvironmentalSavingsByPeriod(repo).execute("u1", today=date(2026, 10, 1))
+
+        assert result["period_comparison"]["change_pct"]["count"] is None
@@ -0,0 +1,102 @@
+import time
+from datetime import datetime, timedelta, timezone
+
+import firebase_admin.auth
+import jwt
+import pytest
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.x509.oid import NameOID
+
+from src.infrastructure.firebase.firebase_token_verifier import (
+    ISSUER_PREFIX, FirebaseTokenVerifier, GooglePublicKeys
+)
+
+PROJECT_ID = "demo-project"
+
+
+def self_signed_cert(key) -> str:
+    """Certificado autofirmado con el mismo formato que publica Google"""
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "securetoken.test")])
+    now = datetime.now(timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name).issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - timedelta(days=1)).not_valid_after(now + timedelta(days=1))
+        .sign(key, hashes.SHA256())
+    )
+    return cert.public_bytes(serialization.Encoding.PEM).decode()
+
+
+@pytest.fixture(scope="module")
+def signing_key():
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+@pytest.fixture
+def fetches(signing_key):
+    calls = []
+
+    def fetcher():
+        calls.append(time.monotonic())
+        return {"kid-1": self_signed_cert(signing_key)}, 3600
+    fetcher.calls = calls
+    return fetcher
+
+
+def make_token(key, kid="kid-1", **overrides):
+    now = int(time.time())
+    claims = {
+        "iss": ISSUER_PREFIX + PROJECT_ID, "aud": PROJECT_ID, "sub": "user-123",
+        "iat": now - 10, "exp": now + 3600, "auth_time": now - 10, "email": "a@b.com",
+        **overrides
+    }
+    return jwt.encode(claims, key, algorithm="RS256", headers={"kid": kid})
+
+
+class TestFirebaseTokenVerifier:
+    """Tests para la verificación local de ID tokens de Firebase con claves autofirmadas"""
+
+    def test_valid_token_is_verified_once(self, signing_key, fetches, monkeypatch):
+        """Test: El token válido devuelve sus claims con uid y un segundo uso sale de la caché"""
+        keys = GooglePublicKeys(fetches, background_refresh=False)
+        verifier = FirebaseTokenVerifier(PROJECT_ID, keys)
+        token = make_token(signing_key)
+
+        claims = verifier.verify(token)
+        assert claims["uid"] == "user-123" and claims["email"] == "a@b.com"
+
+        monkeypatch.setattr(verifier, "_decode", lambda _: pytest.fail("token verified twice"))
+        assert verifier.verify(token)["uid"] == "user-123"
+        assert len(fetches.calls) == 1
+
+    @pytest.mark.parametrize("overrides, error", [
+        ({"exp": int(time.time()) - 60}, firebase_admin.auth.ExpiredIdTokenError),
+        ({"aud": "other-project"}, firebase_admin.auth.InvalidIdTokenError),
+        ({"iss": ISSUER_PREFIX + "other-project"}, firebase_admin.auth.InvalidIdTokenError),
+        ({"sub": ""}, firebase_admin.auth.InvalidIdTokenError),
+        ({"auth_time": int(time.time()) + 3600}, firebase_admin.auth.InvalidIdTokenError),
+    ])
+    def test_rejects_invalid_claims(self, signing_key, fetches, overrides, error):
+        """Test: Se rechazan tokens vencidos, de otro proyecto o con sujeto inválido"""
+        keys = GooglePublicKeys(fetches, background_refresh=False)
+        verifier = FirebaseTokenVerifier(PROJECT_ID, keys)
+
+        with pytest.raises(error):
+            verifier.verify(make_token(signing_key, **overrides))
+
+    def test_rejects_foreign_signature_and_unknown_kid(self, signing_key, fetches):
+        """Test: Una firma con otra clave o un kid no publicado no se aceptan"""
+        keys = GooglePublicKeys(fetches, background_refresh=False)
+        verifier = FirebaseTokenVerifier(PROJECT_ID, keys)
+        other_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+        with pytest.raises(firebase_admin.auth.InvalidIdTokenError):
+            verifier.verify(make_token(other_key))
+        with pytest.raises(firebase_admin.auth.InvalidIdTokenError):
+            verifier.verify(make_token(signing_key, kid="kid-unknown"))
+        # El kid desconocido no vuelve a descargar antes de min_refetch_seconds
+        assert len(fetches.calls) == 1
@@ -0,0 +1,147 @@
+from types import SimpleNamespace
+
+import pytest
+
+import src.infrastructure.firebase.firestore_profile_service as service_module
+from src.infrastructure.firebase.firestore_profile_service import FirestoreProfileService
+from src.infrastructure.firebase.profile_cache import ProfileCache
+
+
+class FakeDocument:
+    def __init__(self, store, uid):
+        self.store, self.uid = store, uid
+
+    def get(self):
+        self.store.reads += 1
+        if self.store.fail:
+            raise ConnectionError("firestore unavailable")
+        data = self.store.docs.get(self.uid)
+        return SimpleNamespace(exists=data is not None, to_dict=lambda: dict(data))
+
+    def update(self, data):
+        self.store.docs[self.uid].update(data)
+
+    def set(self, data):
+        self.store.docs[self.uid] = dict(data)
+
+
+class FakeFirestore:
+    """Colección 'users' en memoria que cuenta lecturas"""
+
+    def __init__(self):
+        self.docs = {}
+        self.reads = 0
+        self.fail = False
+
+    def collection(self, name):
+        return SimpleNamespace(document=lambda uid: FakeDocument(self, uid))
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value, ex=None):
+        self.values[key] = value
+
+    def delete(self, key):
+        self.values.pop(key, None)
+
+
+@pytest.fixture
+def firestore(monkeypatch):
+    fake = FakeFirestore()
+    monkeypatch.setattr(service_module.firebase_admin, "_apps", {"[DEFAULT]": object()})
+    monkeypatch.setattr(service_module.firestore, "client", lambda: fake)
+    return fake
+
+
+class TestFirestoreProfileCache:
+    """Tests para la caché de perfiles de Firestore"""
+
+    def test_reads_firestore_once_per_user(self, firestore):
+        """Test: Las lecturas siguientes del mismo perfil salen de la caché"""
+        firestore.docs["u1"] = {"displayName": "Ana", "allergies": ["maní"]}
+        service = FirestoreProfileService(cache=ProfileCache())
+
+        first = service.get_profile("u1")
+        first["allergies"].append("modificado")
+        second = FirestoreProfileService(cache=service.cache).get_profile("u1")
+
+        assert second["allergies"] == ["maní"]
+        assert firestore.reads == 1
+
+    def test_writes_refresh_cache_without_rereading(self, firestore):
+        """Test: Crear y actualizar el perfil dejan la caché al día sin volver a leer Firestore"""
+        service = FirestoreProfileService(cache=ProfileCache())
+
+        created = service.create_profile("u1", {"displayName": "Ana", "email": "a@b.com"})
+        updated = service.update_profile("u1", {"allergies": ["gluten"], "cookingLevel": "expert"})
+
+        assert created["displayName"] == "Ana" and created["createdAt"] is not None
+        assert updated["allergies"] == ["gluten"] and updated["cookingLevel"] == "expert"
+        assert service.get_profile("u1") == updated
+        assert firestore.reads == 0
+
+    def test_mysql_mirror_is_fallback(self, firestore):
+        """Test: Si Firestore falla se responde con la réplica de profile_users"""
+        firestore.fail = True
+        mirror = SimpleNamespace(name="Ana", photo_url="", prefs={"allergies": ["gluten"], "language": None})
+        repo = SimpleNamespace(find_by_uid=lambda uid: mirror if uid == "u1" else None)
+        service = FirestoreProfileService(cache=ProfileCache(), mysql_profile_repo=repo)
+
+        profile = service.get_profile("u1")
+
+        assert profile["displayName"] == "Ana" and profile["allergies"] == ["gluten"]
+        assert profile["language"] == "es"
+        assert profile["source"] == "mysql_mirror"
+        with pytest.raises(ConnectionError):
+            service.get_profile("u2")
+
+    def test_allergy_checks_refuse_mirror_profile(self, firestore):
+        """Test: Con allow_partial=False una caída de Firestore falla en lugar de servir un perfil incompleto"""
+        firestore.fail = True
+        mirror = SimpleNamespace(name="Ana", photo_url="", prefs={"allergies": ["gluten"]})
+        repo = SimpleNamespace(find_by_uid=lambda uid: mirror)
+        service = FirestoreProfileService(cache=ProfileCache(), mysql_profile_repo=repo)
+
+        with pytest.raises(ConnectionError):
+            service.get_profile("u1", allow_partial=False)
+
+    def test_sync_mirrors_allergy_items(self, firestore):
+        """Test: La réplica de MySQL guarda también allergyItems"""
+        firestore.docs["u1"] = {"displayName": "Ana", "allergyItems": [{"name": "maní"}]}
+        written = {}
+        repo = SimpleNamespace(find_by_uid=lambda uid: None, create=written.update)
+        service = FirestoreProfileService(cache=ProfileCache())
+
+        service.sync_with_mysql("u1", repo)
+
+        assert written["prefs"]["allergyItems"] == [{"name": "maní"}]
+
+
+class TestProfileCache:
+    """Tests para los dos niveles de la caché"""
+
+    def test_redis_is_shared_between_processes(self):
+        """Test: Lo que un worker guarda en Redis lo lee otro con su memoria vacía"""
+        redis = FakeRedis()
+        ProfileCache(redis).set("u1", {"uid": "u1"})
+
+        other_worker = ProfileCache(redis)
+        assert other_worker.get("u1") == {"uid": "u1"}
+
+        other_worker.invalidate("u1")
+        assert ProfileCache(redis).get("u1") is None
+
+    def test_local_entries_are_bounded(self):
+        """Test: El primer nivel descarta los perfiles menos usados"""
+        cache = ProfileCache(max_entries=2)
+        for uid in ("a", "b", "c"):
+            cache.set(uid, {"uid": uid})
+
+        assert cache.get("a") is None
+        assert cache.get("c") == {"uid": "c"}
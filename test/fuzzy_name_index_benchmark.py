@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Benchmark del índice difuso de nombres (FuzzyNameIndex) contra el escaneo completo
+con rapidfuzz.process.extractOne que hacían antes los repositorios.
+
+Uso:
+    python test/fuzzy_name_index_benchmark.py [--sizes 10000 100000] [--queries 200]
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from rapidfuzz import process  # noqa: E402
+from src.shared.fuzzy_name_index import FuzzyNameIndex, normalize_name  # noqa: E402
+
+BASES = [
+    "pasta", "arroz", "pollo", "ensalada", "sopa", "tortilla", "crema", "guiso", "tarta", "pan",
+    "lentejas", "garbanzos", "quinoa", "salmon", "atun", "cerdo", "ternera", "pure", "risotto", "curry",
+]
+INGREDIENTS = [
+    "tomate", "cebolla", "ajo", "espinaca", "champinones", "calabaza", "zanahoria", "brocoli", "queso",
+    "limon", "albahaca", "pimiento", "berenjena", "patata", "maiz", "manzana", "platano", "coco", "mango",
+    "aguacate", "jengibre", "cilantro", "romero", "mostaza", "miel", "almendras", "nueces", "yogur",
+]
+STYLES = ["al horno", "casero", "rapido", "mediterraneo", "picante", "cremoso", "a la plancha", "light", "express", "tradicional"]
+
+
+def make_names(size: int, rng: random.Random) -> list:
+    names = set()
+    while len(names) < size:
+        name = f"{rng.choice(BASES)} de {rng.choice(INGREDIENTS)} y {rng.choice(INGREDIENTS)} {rng.choice(STYLES)}"
+        names.add(f"{name} {rng.randint(1, size // 100 + 1)}")
+    return list(names)
+
+
+def add_typo(name: str, rng: random.Random) -> str:
+    chars = list(name)
+    position = rng.randrange(len(chars))
+    operation = rng.choice(["drop", "swap", "replace"])
+    if operation == "drop":
+        del chars[position]
+    elif operation == "swap" and position < len(chars) - 1:
+        chars[position], chars[position + 1] = chars[position + 1], chars[position]
+    else:
+        chars[position] = rng.choice("abcdefghijklmnopqrstuvwxyz")
+    return "".join(chars)
+
+
+def run(size: int, query_count: int, seed: int) -> None:
+    rng = random.Random(seed)
+    names = make_names(size, rng)
+    choices = {str(i): normalize_name(name) for i, name in enumerate(names)}
+    queries = [add_typo(rng.choice(names), rng) for _ in range(query_count)]
+
+    started = time.perf_counter()
+    index = FuzzyNameIndex()
+    index.replace_all((key, name, None) for key, name in choices.items())
+    build_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    full_results = [process.extractOne(normalize_name(q), choices, score_cutoff=80) for q in queries]
+    full_ms = (time.perf_counter() - started) * 1000 / query_count
+
+    started = time.perf_counter()
+    index_results = [index.best_match(q, score_cutoff=80) for q in queries]
+    index_ms = (time.perf_counter() - started) * 1000 / query_count
+
+    # Misma receta o, si difiere, empate de score con la del escaneo completo
+    agree = sum(
+        1 for full, indexed in zip(full_results, index_results)
+        if (full is None and indexed is None) or (full and indexed and abs(full[1] - indexed[2]) < 1e-9)
+    )
+
+    print(f"📊 {size:>7} names | build {build_seconds:6.2f}s | full scan {full_ms:8.2f} ms/query | "
+          f"index {index_ms:6.2f} ms/query | x{full_ms / index_ms:6.1f} | same best score {agree}/{query_count}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de FuzzyNameIndex")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        run(size, args.queries, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+import pytest
+
+from src.shared.fuzzy_name_index import FuzzyNameIndex
+
+
+class TestFuzzyNameIndex:
+    """Tests para el índice difuso de nombres usado por recetas e imágenes"""
+
+    @pytest.fixture
+    def index(self):
+        index = FuzzyNameIndex()
+        index.replace_all([
+            ("r1", "Pasta Carbonara", "user-1"),
+            ("r2", "Ensalada César", "user-2"),
+            ("r3", "Tortilla de patatas", "user-1"),
+        ])
+        return index
+
+    def test_matches_ignoring_case_and_accents(self, index):
+        """Test: La búsqueda normaliza mayúsculas y acentos"""
+        key, name, score = index.best_match("PASTA CARBONÁRA")
+
+        assert key == "r1"
+        assert name == "pasta carbonara"
+        assert score == 100
+
+    def test_scope_limits_search_to_owner(self, index):
+        """Test: Con ámbito solo se consideran las entradas de ese usuario"""
+        assert index.best_match("ensalada cesar", scope="user-1") is None
+        assert index.best_match("ensalada cesar", scope="user-2")[0] == "r2"
+
+    def test_below_cutoff_returns_none(self, index):
+        """Test: Sin coincidencia suficiente no se devuelve nada"""
+        assert index.best_match("helado de chocolate") is None
+
+    def test_discard_removes_entry(self, index):
+        """Test: Una entrada borrada deja de encontrarse"""
+        index.discard("r3")
+
+        assert index.best_match("tortilla de patatas") is None
+        assert len(index) == 2
+
+    def test_sync_loads_incrementally_and_reloads_on_deletions(self):
+        """Test: sync agrega filas nuevas por marca de agua y recarga si faltan filas"""
+        rows = [("a", "Tomate", None, 1), ("b", "Cebolla", None, 2)]
+        loads = []
+
+        def load_since(watermark):
+            loads.append(watermark)
+            return [row for row in rows if watermark is None or row[3] >= watermark]
+
+        index = FuzzyNameIndex()
+        index.sync(load_since, lambda: len(rows), refresh_seconds=0)
+        assert index.watermark == 2
+
+        rows.append(("c", "Zanahoria", None, 3))
+        index.sync(load_since, lambda: len(rows), refresh_seconds=0)
+        assert index.best_match("zanahorias")[0] == "c"
+        assert loads == [None, 2]
+
+        rows.pop(0)
+        index.sync(load_since, lambda: len(rows), refresh_seconds=0)
+        assert index.best_match("tomate") is None
+        assert loads[-1] is None
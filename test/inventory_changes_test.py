@@ -0,0 +1,68 @@
+from datetime import datetime
+from unittest.mock import MagicMock
+
+from src.application.use_cases.inventory.get_inventory_changes_use_case import GetInventoryChangesUseCase
+
+
+def make_repository(changes=(), current_seq=10, complete=True, entities=None):
+    repository = MagicMock()
+    repository.get_changes_since.return_value = {
+        'changes': list(changes), 'current_seq': current_seq, 'complete': complete
+    }
+    repository.get_sync_entities.return_value = entities or {'ingredients': [], 'ingredient_stacks': [], 'food_items': []}
+    return repository
+
+
+def change(seq, entity_type, entity_key, op):
+    return {'seq': seq, 'entity_type': entity_type, 'entity_key': entity_key, 'op': op}
+
+
+class TestInventoryChanges:
+    """Tests para el delta sync del inventario (GET /api/inventory/changes)"""
+
+    def test_first_sync_returns_snapshot(self):
+        """Test: Sin cursor se devuelve un snapshot completo con su seq"""
+        stack = {'id': 7, 'quantity': 2, 'expiration_date': datetime(2026, 1, 8), 'added_at': datetime(2026, 1, 1)}
+        repository = make_repository(entities={'ingredients': [], 'ingredient_stacks': [stack], 'food_items': []})
+
+        data = GetInventoryChangesUseCase(repository).execute('u1')
+
+        assert data['mode'] == 'snapshot'
+        assert data['seq'] == 10
+        assert data['upserts']['ingredient_stacks'][0]['expiration_date'] == '2026-01-08T00:00:00'
+        repository.get_sync_entities.assert_called_once_with('u1')
+
+    def test_sync_with_current_cursor_is_empty_delta(self):
+        """Test: Con el cursor actual no hay cambios pendientes ni lecturas de entidades"""
+        repository = make_repository()
+
+        data = GetInventoryChangesUseCase(repository).execute('u1', since=10)
+
+        assert data['mode'] == 'delta'
+        assert data['seq'] == 10
+        assert data['upserts']['ingredient_stacks'] == []
+        assert data['tombstones']['ingredient_stacks'] == []
+        repository.get_sync_entities.assert_not_called()
+
+    def test_only_latest_operation_per_entity_is_sent(self):
+        """Test: Un stack modificado y luego borrado llega solo como tombstone; un upsert ya inexistente también"""
+        repository = make_repository(changes=[
+            change(4, 'ingredient_stack', '7', 'upsert'),
+            change(5, 'ingredient_stack', '7', 'delete'),
+            change(6, 'ingredient_stack', '8', 'upsert'),
+            change(7, 'ingredient', 'Tomate', 'upsert'),
+        ], current_seq=9)
+
+        data = GetInventoryChangesUseCase(repository).execute('u1', since=3)
+
+        repository.get_sync_entities.assert_called_once_with('u1', ingredient_names=['Tomate'], stack_ids=[8], food_ids=[])
+        assert sorted(data['tombstones']['ingredient_stacks']) == [7, 8]
+        assert data['tombstones']['ingredients'] == ['Tomate']
+        assert data['seq'] == 7
+        assert data['has_more'] is True
+
+    def test_pruned_cursor_falls_back_to_snapshot(self):
+        """Test: Un cursor que el registro ya no cubre devuelve snapshot en lugar de error"""
+        repository = make_repository(complete=False)
+
+        assert GetInventoryChangesUseCase(repository).execute('u1', since=1)['mode'] == 'snapshot'
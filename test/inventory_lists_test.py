@@ -221,6 +221,65 @@ def test_compare_with_general_inventory():
         print(f"❌ Some endpoints failed")
         return False
 
+def test_paginated_lists_walk_cursor():
+    """
+    Test para recorrer las listas con paginación por cursor (limit + next_cursor).
+    Las páginas no deben repetir elementos y deben coincidir con la lista completa.
+    """
+    print(f"\n📄 Testing keyset pagination with next_cursor")
+    
+    all_ok = True
+    for path, key, sort in [("ingredients/list", "ingredients", "expiration"), ("foods/list", "foods", "name")]:
+        full_response = requests.get(f"{BASE_URL}/inventory/{path}?sort={sort}", headers=headers)
+        if full_response.status_code != 200:
+            print(f"❌ Error: {full_response.status_code}")
+            return False
+        full_items = full_response.json().get(key, [])
+        
+        paged_items = []
+        cursor = None
+        while True:
+            url = f"{BASE_URL}/inventory/{path}?sort={sort}&limit=2" + (f"&cursor={cursor}" if cursor else "")
+            page = requests.get(url, headers=headers).json()
+            paged_items.extend(page.get(key, []))
+            cursor = page.get('next_cursor')
+            if not cursor:
+                break
+        
+        full_ids = [item.get('id', item.get('name')) for item in full_items]
+        paged_ids = [item.get('id', item.get('name')) for item in paged_items]
+        same_order = full_ids == paged_ids
+        print(f"   • {path} ({sort}): {len(paged_items)} items in pages, same order as full list: {same_order}")
+        all_ok = all_ok and same_order
+    
+    # Un cursor corrupto debe rechazarse
+    bad_response = requests.get(f"{BASE_URL}/inventory/foods/list?cursor=not-a-cursor", headers=headers)
+    print(f"   • Invalid cursor status: {bad_response.status_code}")
+    
+    return all_ok and bad_response.status_code == 400
+
+def test_sparse_fieldsets():
+    """
+    Test para el parámetro fields= (proyección compacta por defecto y campos a pedido).
+    """
+    print(f"\n🪶 Testing sparse fieldsets")
+    
+    compact = requests.get(f"{BASE_URL}/inventory/foods/list", headers=headers).json()
+    sparse = requests.get(f"{BASE_URL}/inventory/foods/list?fields=name,expiration_date", headers=headers).json()
+    full = requests.get(f"{BASE_URL}/inventory/foods/list?fields=*", headers=headers).json()
+    invalid = requests.get(f"{BASE_URL}/inventory/foods/list?fields=not_a_field", headers=headers)
+    
+    compact_ok = all('description' not in food and 'main_ingredients' not in food for food in compact.get('foods', []))
+    sparse_ok = all(set(food) <= {'id', 'name', 'expiration_date'} for food in sparse.get('foods', []))
+    full_ok = all('description' in food for food in full.get('foods', []))
+    
+    print(f"   • Compact default without heavy columns: {compact_ok}")
+    print(f"   • Sparse projection only returns requested fields: {sparse_ok}")
+    print(f"   • fields=* returns every field: {full_ok}")
+    print(f"   • Unknown field status: {invalid.status_code}")
+    
+    return compact_ok and sparse_ok and full_ok and invalid.status_code == 400
+
 def run_all_tests():
     """
     Ejecuta todos los tests de listas específicas del inventario.
@@ -238,6 +297,8 @@ def run_all_tests():
     # Tests de comparación
     results.append(("Separation Verification", test_ingredients_vs_foods_separation()))
     results.append(("Consistency Check", test_compare_with_general_inventory()))
+    results.append(("Cursor Pagination", test_paginated_lists_walk_cursor()))
+    results.append(("Sparse Fieldsets", test_sparse_fieldsets()))
     
     # Resumen
     print("\n" + "=" * 60)
@@ -270,6 +331,8 @@ if __name__ == "__main__":
     print("   • Endpoint de lista solo de food items") 
     print("   • Separación correcta entre tipos")
     print("   • Consistencia con el inventario general")
+    print("   • Paginación por cursor (limit + next_cursor)")
+    print("   • Proyecciones con fields=")
     print("   • Estructura y contenido de las respuestas")
     print()
     print("🚨 IMPORTANTE:")
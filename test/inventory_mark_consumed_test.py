@@ -1,6 +1,13 @@
 import pytest
 import json
 from datetime import datetime, timezone, timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from marshmallow import ValidationError
+
+from src.application.use_cases.inventory.consume_ingredients_fifo_use_case import ConsumeIngredientsFifoUseCase
+from src.interface.serializers.mark_consumed_serializer import ConsumeIngredientsSchema
 
 
 class TestMarkInventoryItemsConsumed:
@@ -299,4 +306,76 @@ class TestMarkInventoryItemsConsumed:
             assert time_diff.total_seconds() < 60  # Menos de 1 minuto
             
             # Verificar que original_added_at coincide con el URL
-            assert data['original_added_at'] == '2025-01-01T10:00:00Z' 
\ No newline at end of file
+            assert data['original_added_at'] == '2025-01-01T10:00:00Z'
+
+
+def fifo_result(ingredient, status, consumed, requested, available=0.0):
+    return {
+        'ingredient': ingredient, 'status': status, 'consumed_quantity': consumed,
+        'requested_quantity': requested, 'available_quantity': available, 'type_unit': 'unidades',
+        'stacks': [], 'ingredient_removed': False
+    }
+
+
+class TestConsumeIngredientsFifo:
+    """Tests para el descuento FIFO de varios ingredientes (/api/inventory/ingredients/consume)"""
+
+    def test_requires_source(self):
+        """Test: El descuento FIFO requiere 'ingredients' o 'recipe_uid'"""
+        with pytest.raises(ValidationError):
+            ConsumeIngredientsSchema().load({})
+
+    def test_all_or_nothing(self):
+        """Test: Sin allow_partial falla (409) si un ingrediente no alcanza"""
+        repository = MagicMock()
+        repository.consume_ingredients_fifo.return_value = {'success': False, 'ingredients': [
+            fifo_result('Tomate', 'skipped', 0.0, 0.5, 3.0),
+            fifo_result('IngredienteInexistente', 'not_found', 0.0, 1.0)
+        ]}
+        ingredients = [{'name': 'Tomate', 'quantity': 0.5}, {'name': 'IngredienteInexistente', 'quantity': 1}]
+
+        with pytest.raises(ValueError, match='IngredienteInexistente'):
+            ConsumeIngredientsFifoUseCase(repository).execute('u1', ingredients, allow_partial=False)
+
+        repository.consume_ingredients_fifo.assert_called_once_with('u1', ingredients, False)
+
+    def test_partial(self):
+        """Test: Con allow_partial se informa el estado de cada ingrediente"""
+        repository = MagicMock()
+        repository.consume_ingredients_fifo.return_value = {'success': False, 'ingredients': [
+            fifo_result('IngredienteInexistente', 'not_found', 0.0, 1.0)
+        ]}
+
+        result = ConsumeIngredientsFifoUseCase(repository).execute(
+            'u1', [{'name': 'IngredienteInexistente', 'quantity': 1}], allow_partial=True
+        )
+
+        assert result['complete'] is False
+        assert result['ingredients'][0]['status'] == 'not_found'
+
+    def test_recipe_of_another_user_is_not_found(self):
+        """Test: No se puede descontar a partir de la receta de otro usuario ni ver su título"""
+        repository, recipes = MagicMock(), MagicMock()
+        recipes.find_by_uid.return_value = SimpleNamespace(user_uid='u2', title='Secreta', ingredients=[])
+
+        with pytest.raises(ValueError, match='not found'):
+            ConsumeIngredientsFifoUseCase(repository, recipes, 'system').execute_for_recipe('u1', 'r1')
+
+        repository.consume_ingredients_fifo.assert_not_called()
+
+    def test_own_and_default_recipes_are_consumed(self):
+        """Test: Las recetas propias y las por defecto descuentan sus ingredientes"""
+        repository, recipes = MagicMock(), MagicMock()
+        repository.consume_ingredients_fifo.return_value = {'success': True, 'ingredients': []}
+        use_case = ConsumeIngredientsFifoUseCase(repository, recipes, 'system')
+
+        for owner in ('u1', 'system'):
+            recipes.find_by_uid.return_value = SimpleNamespace(user_uid=owner, title='Sopa', ingredients=[
+                SimpleNamespace(name='tomate', quantity=2, type_unit='unidades')
+            ])
+            result = use_case.execute_for_recipe('u1', 'r1')
+            assert result['recipe_title'] == 'Sopa'
+
+        repository.consume_ingredients_fifo.assert_called_with(
+            'u1', [{'name': 'tomate', 'quantity': 2, 'type_unit': 'unidades'}], True
+        )
@@ -0,0 +1,115 @@
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.application.use_cases.inventory.delete_food_item_use_case import DeleteFoodItemUseCase
+from src.application.use_cases.inventory.delete_ingredient_status_use_case import DeleteIngredientStackUseCase
+from src.application.use_cases.inventory.mark_food_item_consumed_use_case import MarkFoodItemConsumedUseCase
+from src.application.use_cases.inventory.mark_ingredient_stack_consumed_use_case import MarkIngredientStackConsumedUseCase
+from src.application.use_cases.inventory.update_ingredient_quantity_use_case import UpdateIngredientQuantityUseCase
+from src.application.use_cases.inventory.update_ingredient_stack_use_case import UpdateIngredientStackUseCase
+from src.shared.exceptions.custom import InvalidRequestDataException
+
+
+def make_stack(**overrides):
+    stack = {
+        'id': 42,
+        'ingredient_name': 'Tomate',
+        'quantity': 3.0,
+        'type_unit': 'unidades',
+        'storage_type': 'refrigerado',
+        'tips': 'tip',
+        'image_path': 'img',
+        'added_at': datetime(2025, 1, 1, 10, 0),
+        'expiration_date': datetime(2025, 1, 8, 10, 0)
+    }
+    stack.update(overrides)
+    return stack
+
+
+class TestInventoryRoutesById:
+    """Tests para los casos de uso del inventario direccionados por ID (stacks y food items)"""
+
+    def test_consume_stack_by_id_partial(self):
+        """Test: El consumo parcial por ID es un único UPDATE condicional, sin lectura previa"""
+        repository = MagicMock()
+        repository.consume_ingredient_stack_by_id.return_value = {
+            'ingredient_name': 'Tomate', 'consumed_quantity': 0.5, 'remaining_quantity': 2.5,
+            'type_unit': 'unidades', 'stack_removed': False, 'added_at': datetime(2025, 1, 1, 10, 0)
+        }
+
+        result = MarkIngredientStackConsumedUseCase(repository).execute_by_id('u1', 42, 0.5)
+
+        repository.consume_ingredient_stack_by_id.assert_called_once_with('u1', 42, 0.5)
+        repository.get_ingredient_stack_by_id.assert_not_called()
+        assert result['stack_id'] == 42
+        assert result['action'] == 'partial_consumption'
+        assert result['original_added_at'] == '2025-01-01T10:00:00'
+
+    def test_consume_stack_by_id_insufficient(self):
+        """Test: Si no alcanza la cantidad el error informa lo disponible"""
+        repository = MagicMock()
+        repository.consume_ingredient_stack_by_id.return_value = None
+        repository.get_ingredient_stack_by_id.return_value = make_stack(quantity=1.0)
+
+        with pytest.raises(ValueError, match="only 1.0 unidades available"):
+            MarkIngredientStackConsumedUseCase(repository).execute_by_id('u1', 42, 5.0)
+
+    def test_update_stack_quantity_by_id(self):
+        """Test: Actualizar la cantidad conserva el resto de los datos del stack"""
+        repository = MagicMock()
+        repository.get_ingredient_stack_by_id.return_value = make_stack()
+
+        UpdateIngredientQuantityUseCase(repository).execute_by_id('u1', 42, 4)
+
+        kwargs = repository.update_ingredient_stack_by_id.call_args.kwargs
+        assert kwargs['stack_id'] == 42
+        assert kwargs['new_stack'].quantity == 4
+        assert kwargs['new_stack'].expiration_date == datetime(2025, 1, 8, 10, 0)
+        assert kwargs['new_meta'].name == 'Tomate'
+
+    def test_update_stack_without_expiration_is_bad_request(self):
+        """Test: Una actualización sin datos de vencimiento es un 400, no un 404"""
+        repository = MagicMock()
+        repository.get_ingredient_stack_by_id.return_value = make_stack()
+        updated_data = {'quantity': 2, 'type_unit': 'unidades', 'storage_type': 'refrigerado',
+                        'tips': '', 'image_path': '', 'added_at': datetime(2025, 1, 1, 10, 0)}
+
+        with pytest.raises(InvalidRequestDataException):
+            UpdateIngredientStackUseCase(repository, MagicMock()).execute_by_id('u1', 42, updated_data)
+
+        repository.update_ingredient_stack_by_id.assert_not_called()
+
+    def test_stack_by_id_not_found(self):
+        """Test: Un stack inexistente (o de otro usuario) no se elimina"""
+        repository = MagicMock()
+        repository.get_ingredient_stack_by_id.return_value = None
+
+        with pytest.raises(ValueError, match="not found"):
+            DeleteIngredientStackUseCase(repository).execute_by_id('u1', 999999)
+
+        repository.delete_ingredient_stack_by_id.assert_not_called()
+
+    def test_food_item_by_id_not_found(self):
+        """Test: Un food item inexistente no se consume ni se elimina"""
+        repository = MagicMock()
+        repository.get_food_item_by_id.return_value = None
+
+        with pytest.raises(ValueError, match="not found"):
+            MarkFoodItemConsumedUseCase(repository).execute_by_id('u1', 999999)
+        with pytest.raises(ValueError, match="not found"):
+            DeleteFoodItemUseCase(repository).execute_by_id('u1', 999999)
+
+        repository.delete_food_item_by_id.assert_not_called()
+
+    def test_legacy_route_resolves_id(self):
+        """Test: La ruta legacy (nombre + added_at) resuelve el ID y delega en el camino por ID"""
+        repository = MagicMock()
+        repository.find_ingredient_stack_id.return_value = 42
+        repository.get_ingredient_stack_by_id.return_value = make_stack()
+
+        DeleteIngredientStackUseCase(repository).execute('u1', 'Tomate', '2025-01-01T10:00:00Z')
+
+        repository.find_ingredient_stack_id.assert_called_once_with('u1', 'Tomate', '2025-01-01T10:00:00Z')
+        repository.delete_ingredient_stack_by_id.assert_called_once_with('u1', 42)
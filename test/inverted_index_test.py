@@ -0,0 +1,40 @@
+from src.shared.inverted_index import InvertedIndex, tokenize
+
+
+def make_index():
+    index = InvertedIndex({"title": 3.0, "ingredients": 2.0, "description": 1.0})
+    index.replace_all([
+        ("r1", {"title": "Pollo al curry", "description": "Con arroz", "ingredients": ["Pollo", "Curry"]}, "u1"),
+        ("r2", {"title": "Arroz con pollo", "description": "Clásico", "ingredients": ["Arroz", "Pollo"]}, "u2"),
+        ("r3", {"title": "Ensalada de limón", "description": "Fresca", "ingredients": ["Lechuga"]}, "u2"),
+    ])
+    return index
+
+
+class TestInvertedIndex:
+    """Tests para el índice invertido de la búsqueda de recetas"""
+
+    def test_tokenize_ignores_accents_case_and_stopwords(self):
+        """Test: Los términos se normalizan y se descartan las stopwords"""
+        assert tokenize("Ensalada de LIMÓN y  Menta") == ["ensalada", "limon", "menta"]
+
+    def test_more_matched_terms_rank_first(self):
+        """Test: Las recetas con todos los términos de la consulta van primero"""
+        ranked = make_index().search("pollo curry")
+
+        assert [key for key, _ in ranked] == ["r1", "r2"]
+
+    def test_accent_insensitive_and_scoped(self):
+        """Test: La búsqueda ignora acentos y respeta el ámbito"""
+        index = make_index()
+
+        assert [key for key, _ in index.search("limon")] == ["r3"]
+        assert index.search("limon", scope="u1") == []
+
+    def test_discard_removes_document(self):
+        """Test: Un documento quitado deja de aparecer y no deja términos huérfanos"""
+        index = make_index()
+        index.discard("r3")
+
+        assert index.search("ensalada") == []
+        assert len(index) == 2
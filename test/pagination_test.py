@@ -0,0 +1,40 @@
+from datetime import datetime
+
+import pytest
+
+from src.shared.exceptions.custom import InvalidRequestDataException
+from src.shared.pagination import encode_cursor, decode_cursor
+
+
+class TestCursorPagination:
+    """Tests para los cursores opacos de paginación por clave"""
+
+    def test_round_trip(self):
+        """Test: Un cursor generado con encode_cursor se decodifica con las fechas en ISO"""
+        cursor = encode_cursor("expiration", [datetime(2026, 1, 2, 10, 0), 7])
+
+        assert decode_cursor(cursor, "expiration", (datetime, int)) == ["2026-01-02T10:00:00", 7]
+
+    def test_other_sort_is_rejected(self):
+        """Test: Un cursor de otro orden es inválido"""
+        with pytest.raises(InvalidRequestDataException):
+            decode_cursor(encode_cursor("name", ["ajo"]), "expiration")
+
+    @pytest.mark.parametrize("key", [["nope", "x"], [1, 2], [], ["2026-01-02T10:00:00"], ["2026-01-02T10:00:00", True]])
+    def test_malformed_key_is_rejected(self, key):
+        """Test: Una clave con otra cantidad o tipo de valores es un 400, no un error interno"""
+        with pytest.raises(InvalidRequestDataException):
+            decode_cursor(encode_cursor("expiration", key), "expiration", (datetime, int))
+
+    def test_corrupt_cursor_is_rejected(self):
+        """Test: Un cursor que no es base64/JSON es inválido"""
+        with pytest.raises(InvalidRequestDataException):
+            decode_cursor("%%%", "name")
+
+    def test_optional_key_values(self):
+        """Test: Una tupla de tipos admite cualquiera de ellos (p. ej. vencimiento nulo)"""
+        key_types = ((datetime, type(None)), str)
+
+        assert decode_cursor(encode_cursor("expiration", [None, "ajo"]), "expiration", key_types) == [None, "ajo"]
+        with pytest.raises(InvalidRequestDataException):
+            decode_cursor(encode_cursor("expiration", [None, None]), "expiration", key_types)
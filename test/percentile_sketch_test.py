@@ -0,0 +1,59 @@
+from datetime import datetime, timedelta
+
+from src.application.services.sustainability_ranking import STALE_AFTER_SECONDS, rank_totals
+from src.shared.percentile_sketch import PercentileSketch
+
+
+class TestPercentileSketch:
+    """Tests para el resumen de percentiles del ranking de sostenibilidad"""
+
+    def test_percentile_matches_rank_of_uniform_values(self):
+        """Test: Sobre 0..999 el percentil coincide con la posición del valor"""
+        sketch = PercentileSketch.build(range(1000), k=100)
+
+        assert len(sketch.cutpoints) == 101
+        assert sketch.population == 1000
+        assert sketch.percentile(500) == 50.0
+        assert sketch.percentile(250.5) == 25.1
+        assert sketch.percentile(-1) == 0.0
+        assert sketch.percentile(10 ** 6) == 100.0
+
+    def test_ties_count_half(self):
+        """Test: Con muchos usuarios en cero, un total cero queda en el medio de ese grupo"""
+        sketch = PercentileSketch.build([0] * 50 + list(range(1, 51)))
+
+        assert sketch.percentile(0) == 24.5
+        assert PercentileSketch.build([]).percentile(1) is None
+
+    def test_round_trip_through_dict(self):
+        """Test: El resumen se guarda y se recupera como JSON sin perder información"""
+        sketch = PercentileSketch.build([3.5, 1.0, 2.0], k=4)
+        restored = PercentileSketch.from_dict(sketch.to_dict())
+
+        assert restored.cutpoints == sketch.cutpoints
+        assert restored.percentile(2.0) == sketch.percentile(2.0)
+
+
+class TestRankTotals:
+    """Tests para la respuesta de ranking del resumen ambiental"""
+
+    def test_reports_freshness(self):
+        """Test: Se informa la antigüedad del resumen y si está desactualizado"""
+        built_at = datetime(2026, 10, 18, 12, 0)
+        sketches = {"carbon_footprint": PercentileSketch.build(range(100)), "water_footprint": PercentileSketch.build(range(100))}
+
+        fresh = rank_totals({"carbon_footprint": 75, "water_footprint": 0}, sketches, built_at, built_at + timedelta(minutes=5))
+        stale = rank_totals({}, sketches, built_at, built_at + timedelta(seconds=STALE_AFTER_SECONDS + 1))
+
+        assert fresh["available"] is True
+        assert fresh["age_seconds"] == 300
+        assert fresh["stale"] is False
+        assert abs(fresh["carbon_footprint_percentile"] - 75.5) <= 1  # resolución de 1/k
+        assert stale["stale"] is True
+
+    def test_without_sketch_ranking_is_unavailable(self):
+        """Test: Si el job nunca corrió, el ranking no está disponible"""
+        result = rank_totals({"carbon_footprint": 1.0}, {}, None, datetime(2026, 10, 18))
+
+        assert result["available"] is False
+        assert result["built_at"] is None
@@ -0,0 +1,53 @@
+from datetime import date
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.application.use_cases.planning.bulk_upsert_meal_plans_use_case import BulkUpsertMealPlansUseCase
+from src.shared.exceptions.custom import InvalidRequestDataException
+
+
+def make_use_case(existing_uids):
+    meal_plan_repository = MagicMock()
+    meal_plan_repository.get_range_by_user.return_value = []
+    recipe_repository = MagicMock()
+    recipe_repository.find_existing_uids.return_value = set(existing_uids)
+    return BulkUpsertMealPlansUseCase(meal_plan_repository, recipe_repository, "system"), meal_plan_repository, recipe_repository
+
+
+class TestBulkMealPlans:
+    """Tests para el guardado en bloque de planes (/api/planning/bulk)"""
+
+    def test_validates_recipes_in_one_lookup_and_upserts_once(self):
+        """Test: Las recetas se validan con una sola consulta y los días se guardan con un solo upsert"""
+        use_case, meal_plans, recipes = make_use_case({"r1", "r2"})
+        plans = [
+            {"date": date(2026, 1, 5), "breakfast": "r1", "lunch": "r2"},
+            {"date": date(2026, 1, 6), "breakfast": "r1", "lunch": None},
+        ]
+
+        use_case.execute("u1", plans)
+
+        recipes.find_existing_uids.assert_called_once()
+        assert set(recipes.find_existing_uids.call_args.args[0]) == {"r1", "r2"}
+        assert recipes.find_existing_uids.call_args.args[1] == ["u1", "system"]
+        meal_plans.upsert_many.assert_called_once_with("u1", plans)
+        meal_plans.get_range_by_user.assert_called_once_with("u1", date(2026, 1, 5), date(2026, 1, 6))
+
+    def test_unknown_recipe_saves_nothing(self):
+        """Test: Si una receta no existe no se guarda ningún día"""
+        use_case, meal_plans, _ = make_use_case({"r1"})
+
+        with pytest.raises(InvalidRequestDataException) as error:
+            use_case.execute("u1", [{"date": date(2026, 1, 5), "breakfast": "r1", "dinner": "otra"}])
+
+        assert error.value.details == {"recipe_uids": ["otra"]}
+        meal_plans.upsert_many.assert_not_called()
+
+    def test_repeated_dates_are_rejected(self):
+        """Test: Dos planes para la misma fecha son inválidos"""
+        use_case, meal_plans, _ = make_use_case(set())
+
+        with pytest.raises(InvalidRequestDataException):
+            use_case.execute("u1", [{"date": date(2026, 1, 5)}, {"date": date(2026, 1, 5)}])
+        meal_plans.upsert_many.assert_not_called()
@@ -0,0 +1,42 @@
+from datetime import date
+from unittest.mock import MagicMock
+
+import pytest
+from marshmallow import ValidationError
+
+from src.application.use_cases.planning.get_meal_plans_in_range_use_case import GetMealPlansInRangeUseCase
+from src.interface.serializers.planning_serializers import MealPlanRangeQuerySchema
+from src.shared.exceptions.custom import InvalidRequestDataException
+
+
+class TestMealPlanRange:
+    """Tests para la consulta de planes por rango de fechas (/api/planning/range)"""
+
+    def test_invalid_ranges_are_rejected(self):
+        """Test: Un rango invertido o de más de un año es inválido"""
+        use_case = GetMealPlansInRangeUseCase(MagicMock())
+
+        with pytest.raises(InvalidRequestDataException):
+            use_case.execute("u1", date(2026, 2, 1), date(2026, 1, 1))
+        with pytest.raises(InvalidRequestDataException):
+            use_case.execute("u1", date(2026, 1, 1), date(2027, 1, 2))
+
+    def test_range_is_a_single_repository_query(self):
+        """Test: El rango se resuelve con una sola consulta al repositorio, incluyendo ambos extremos"""
+        meal_plan_repository = MagicMock()
+        meal_plan_repository.get_range_by_user.return_value = ["plan-1", "plan-2"]
+
+        plans = GetMealPlansInRangeUseCase(meal_plan_repository).execute("u1", date(2026, 1, 1), date(2026, 12, 31))
+
+        assert plans == ["plan-1", "plan-2"]
+        meal_plan_repository.get_range_by_user.assert_called_once_with("u1", date(2026, 1, 1), date(2026, 12, 31))
+
+    def test_missing_dates_are_rejected(self):
+        """Test: Sin 'from' o 'to' la petición es inválida"""
+        with pytest.raises(ValidationError) as error:
+            MealPlanRangeQuerySchema().load({"from": "2024-01-01"})
+
+        assert "to" in error.value.messages
+        assert MealPlanRangeQuerySchema().load({"from": "2024-01-01", "to": "2024-01-31"}) == {
+            "start_date": date(2024, 1, 1), "end_date": date(2024, 1, 31)
+        }
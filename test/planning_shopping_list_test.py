@@ -0,0 +1,44 @@
+from datetime import date, datetime
+
+from src.application.services.unit_conversion import to_base_units, unit_dimension
+from src.application.use_cases.planning.get_shopping_list_use_case import GetShoppingListUseCase
+
+
+class TestShoppingList:
+    """Tests para el cálculo de la lista de compras (/api/planning/shopping-list)"""
+
+    def test_units_are_converted_to_base(self):
+        """Test: Kilos, tazas y docenas se pasan a g, ml y unidades; lo desconocido queda aparte"""
+        dimensions, values, units = to_base_units([0.5, 2, 1, 3], ["Kilos", "tazas", "docena", "dientes"])
+
+        assert dimensions[:3] == ["mass", "volume", "count"]
+        assert values == [500.0, 480.0, 12.0, 3.0]
+        assert units == ["g", "ml", "unidades", "dientes"]
+        assert unit_dimension("gr.")[0] == "mass"
+
+    def test_deficit_honors_expiration_per_day(self):
+        """Test: Un stack solo cubre los días hasta su vencimiento y se consume primero el que vence antes"""
+        demand = [
+            {"date": date(2026, 3, 1), "name": "Tomates", "type_unit": "unidades", "quantity": 3},
+            {"date": date(2026, 3, 5), "name": "tomate", "type_unit": "unid", "quantity": 4},
+        ]
+        supply = [
+            {"name": "Tomate", "type_unit": "unidades", "expiration_date": datetime(2026, 3, 2), "quantity": 2},
+            {"name": "Tomate", "type_unit": "unidades", "expiration_date": datetime(2026, 3, 10), "quantity": 3},
+        ]
+
+        [item] = GetShoppingListUseCase.compute_deficit(demand, supply)
+
+        assert item["required"] == 7
+        assert item["available"] == 5
+        assert item["deficit"] == 2
+        assert item["needed_from"] == "2026-03-05"
+
+    def test_mass_and_volume_are_not_mixed(self):
+        """Test: Inventario en litros no cubre una receta en gramos"""
+        demand = [{"date": date(2026, 3, 1), "name": "Leche", "type_unit": "g", "quantity": 100}]
+        supply = [{"name": "Leche", "type_unit": "litros", "expiration_date": datetime(2026, 4, 1), "quantity": 1}]
+
+        [item] = GetShoppingListUseCase.compute_deficit(demand, supply)
+
+        assert (item["unit"], item["deficit"]) == ("g", 100)
@@ -0,0 +1,112 @@
+from flask import Flask
+
+from src.infrastructure.security.rate_limiter import (
+    InMemoryRateLimitBackend, RateLimiter, RedisRateLimitBackend, rate_limit
+)
+import src.infrastructure.security.rate_limiter as rate_limiter_module
+
+
+class TestInMemoryRateLimitBackend:
+    """Tests para los contadores de ventana deslizante en memoria"""
+
+    def test_limit_then_block(self):
+        """Test: Al exceder el límite se bloquea la IP y los requests siguientes no se cuentan"""
+        backend = InMemoryRateLimitBackend()
+
+        results = [backend.hit("ip:1", "1", limit=3, window=60, block_duration=300, now=1000.0) for _ in range(3)]
+        assert [r.allowed for r in results] == [True, True, True]
+        assert [r.remaining for r in results] == [2, 1, 0]
+
+        exceeded = backend.hit("ip:1", "1", limit=3, window=60, block_duration=300, now=1001.0)
+        assert not exceeded.allowed and not exceeded.blocked
+        assert exceeded.retry_after == 300
+
+        blocked = backend.hit("ip:1", "1", limit=3, window=60, block_duration=300, now=1100.0)
+        assert blocked.blocked and blocked.retry_after == 201
+
+    def test_previous_window_is_weighted(self):
+        """Test: El conteo de la ventana anterior pesa según cuánto de ella sigue dentro de la ventana"""
+        backend = InMemoryRateLimitBackend()
+        for _ in range(10):
+            backend.hit("k", "1", limit=10, window=60, block_duration=1, now=60.0)
+
+        # A mitad de la ventana siguiente la anterior cuenta como 5
+        result = backend.hit("k", "1", limit=10, window=60, block_duration=1, now=150.0)
+        assert result.allowed and result.remaining == 4
+        assert result.reset_after == 30
+
+        # Dos ventanas después ya no cuenta
+        assert backend.hit("k", "1", limit=10, window=60, block_duration=1, now=300.0).remaining == 9
+
+    def test_idle_keys_are_evicted(self):
+        """Test: Las claves sin actividad se descartan y la memoria no crece con cada IP vista"""
+        backend = InMemoryRateLimitBackend(sweep_seconds=0)
+        for ip in range(100):
+            backend.hit(f"ip:{ip}", str(ip), limit=5, window=60, block_duration=1, now=1000.0)
+        assert len(backend) == 100
+
+        backend.hit("ip:new", "new", limit=5, window=60, block_duration=1, now=1200.0)
+        assert len(backend) == 1
+
+
+class TestRedisRateLimitBackend:
+    """Tests para el backend Redis sin servidor real"""
+
+    class FakeRedis:
+        def __init__(self, reply=None):
+            self.reply = reply
+            self.calls = []
+
+        def register_script(self, script):
+            def run(keys, args):
+                self.calls.append((keys, args))
+                if self.reply is None:
+                    raise ConnectionError("redis down")
+                return self.reply
+            return run
+
+    def test_one_script_call_per_request(self):
+        """Test: Bloqueo y conteo viajan en una sola llamada al script"""
+        client = self.FakeRedis(reply=[1, 4, 30, 0, 0])
+        result = RedisRateLimitBackend(client).hit("user:u1", "1.2.3.4", 5, 60, 60)
+
+        assert result.allowed and result.remaining == 4 and result.reset_after == 30
+        assert client.calls == [(["rate_limit:user:u1", "rate_limit:block:1.2.3.4"], [5, 60, 60])]
+
+    def test_falls_back_to_memory_when_redis_fails(self):
+        """Test: Si Redis falla el request se limita con los contadores del proceso"""
+        backend = RedisRateLimitBackend(self.FakeRedis(), fallback=InMemoryRateLimitBackend())
+
+        assert backend.hit("ip:1", "1", 1, 60, 60).allowed
+        assert not backend.hit("ip:1", "1", 1, 60, 60).allowed
+
+
+class TestRateLimitDecorator:
+    """Tests para el decorador y sus headers"""
+
+    def test_sets_rate_limit_headers(self, monkeypatch):
+        """Test: Las respuestas informan límite, restantes y reinicio; el 429 agrega Retry-After"""
+        monkeypatch.setattr(rate_limiter_module, "rate_limiter", RateLimiter(InMemoryRateLimitBackend()))
+        app = Flask(__name__)
+
+        @app.route("/limited")
+        @rate_limit(limit=2, window=60, per='ip', block_duration=120)
+        def limited():
+            return {"ok": True}, 201
+
+        client = app.test_client()
+        first = client.get("/limited")
+        assert first.status_code == 201
+        assert first.headers["X-RateLimit-Limit"] == "2"
+        assert first.headers["X-RateLimit-Remaining"] == "1"
+        assert "X-RateLimit-Reset" in first.headers
+
+        client.get("/limited")
+        exceeded = client.get("/limited")
+        assert exceeded.status_code == 429
+        assert exceeded.headers["Retry-After"] == "120"
+        assert exceeded.get_json()["error"] == "Rate limit exceeded"
+
+        blocked = client.get("/limited")
+        assert blocked.status_code == 429
+        assert blocked.get_json()["error"] == "Too many requests - IP temporarily blocked"
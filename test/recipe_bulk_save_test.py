@@ -0,0 +1,49 @@
+from unittest.mock import MagicMock
+
+from src.application.use_cases.recipes.save_generated_recipes_use_case import SaveGeneratedRecipesUseCase
+from src.infrastructure.db.recipe_generated_repository_impl import RecipeGeneratedRepositoryImpl
+
+
+def make_recipe_data(title):
+    return {
+        "title": title,
+        "duration": "20 min",
+        "difficulty": "Fácil",
+        "category": "almuerzo",
+        "ingredients": [{"name": "tomate", "quantity": 2, "type_unit": "unid"}],
+        "steps": [{"step_order": 1, "description": "Cortar"}]
+    }
+
+
+class TestSaveGeneratedRecipes:
+    """Tests para el guardado en bloque de una generación"""
+
+    def test_single_bulk_write_with_generation(self):
+        """Test: Todas las recetas, la generación y recipes_generated van en una sola llamada a save_many"""
+        recipe_repository = MagicMock()
+        use_case = SaveGeneratedRecipesUseCase(recipe_repository, RecipeGeneratedRepositoryImpl())
+        result = {"generated_recipes": [make_recipe_data("Ensalada"), make_recipe_data("Sopa")]}
+
+        saved = use_case.execute("u1", result)
+
+        recipe_repository.save_many.assert_called_once()
+        recipe_repository.save.assert_not_called()
+        recipes = recipe_repository.save_many.call_args.args[0]
+        generation = recipe_repository.save_many.call_args.kwargs["generation"]
+        generated_rows = recipe_repository.save_many.call_args.kwargs["generated_rows"]
+
+        assert [recipe.title for recipe in recipes] == ["Ensalada", "Sopa"]
+        assert generation.uid == saved["generation_id"]
+        assert generation.recipes_ids == [recipe.uid for recipe in recipes]
+        assert generation.generation_type == "inventory"
+        assert {row["generation_id"] for row in generated_rows} == {saved["generation_id"]}
+        assert saved["generated_recipe_uids"] == [row["uid"] for row in generated_rows]
+
+    def test_generated_row_matches_single_save(self):
+        """Test: La fila de recipes_generated se arma igual que en save_generated_recipe"""
+        row = RecipeGeneratedRepositoryImpl.build_generated_row("u1", "g1", {"name": "Tarta", "prep_time": 30}, "custom")
+
+        assert row["title"] == "Tarta"
+        assert row["duration"] == "30"
+        assert row["image_status"] == "generating"
+        assert row["generation_type"] == "custom"
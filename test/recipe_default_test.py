@@ -0,0 +1,74 @@
+import gzip
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from flask import Flask
+
+from src.infrastructure.db.default_recipes_cache import DefaultRecipesCache
+from src.shared.precompressed import build_payload, make_precompressed_response
+
+
+@pytest.fixture
+def app():
+    return Flask(__name__)
+
+
+class TestDefaultRecipes:
+    """Tests para la respuesta cacheada de /api/recipes/default"""
+
+    def test_response_has_etag_and_cache_control(self, app):
+        """Test: La respuesta pública lleva ETag fuerte y Cache-Control"""
+        payload = build_payload({"default_recipes": [{"uid": "r1"}]})
+
+        with app.test_request_context(headers={'Accept-Encoding': 'identity'}):
+            response = make_precompressed_response(payload, "public, max-age=300")
+
+        assert response.status_code == 200
+        assert response.headers['ETag'] == f'"{payload.etag}"'
+        assert 'public' in response.headers['Cache-Control']
+        assert response.headers['Vary'] == 'Accept-Encoding'
+
+    def test_if_none_match_returns_304(self, app):
+        """Test: Con el ETag vigente (de cualquier codificación) no se reenvía el cuerpo"""
+        payload = build_payload({"default_recipes": [{"uid": "r1"}]})
+
+        with app.test_request_context(headers={'If-None-Match': f'"{payload.etag}-gzip"'}):
+            response = make_precompressed_response(payload, "public, max-age=300")
+
+        assert response.status_code == 304
+        assert response.get_data() == b''
+
+    def test_gzip_variant_matches_plain_body(self, app):
+        """Test: La variante gzip precomprimida tiene el mismo contenido"""
+        payload = build_payload({"default_recipes": [{"uid": "r1", "title": "Flan"}]})
+
+        with app.test_request_context(headers={'Accept-Encoding': 'gzip'}):
+            response = make_precompressed_response(payload, "public, max-age=300")
+
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert json.loads(gzip.decompress(response.get_data())) == json.loads(payload.identity)
+
+
+class TestDefaultRecipesCache:
+    """Tests para la invalidación del cache de recetas por defecto"""
+
+    def test_rebuilds_only_when_version_changes(self):
+        """Test: Mientras la huella no cambia se reutilizan las entradas"""
+        cache = DefaultRecipesCache(revalidate_seconds=0)
+        builder = MagicMock(return_value=({None: "payload"}, {"r1"}))
+
+        assert cache.get(None, lambda: (1, "a"), builder) == "payload"
+        assert cache.get(None, lambda: (1, "a"), builder) == "payload"
+        cache.get(None, lambda: (2, "b"), builder)
+
+        assert builder.call_count == 2
+        assert cache.owns_recipe("r1")
+
+    def test_max_age_bounds_in_place_edits(self):
+        """Test: Una edición en otro proceso no cambia la huella, pero el cache se reconstruye al vencer max_age"""
+        cache = DefaultRecipesCache(revalidate_seconds=0, max_age_seconds=0)
+        builder = MagicMock(side_effect=[({None: "viejo"}, set()), ({None: "editado"}, set())])
+
+        assert cache.get(None, lambda: (1, "a"), builder) == "viejo"
+        assert cache.get(None, lambda: (1, "a"), builder) == "editado"
@@ -0,0 +1,58 @@
+import pytest
+
+from src.infrastructure.ai.cache_service import AIResponseCacheService
+
+
+def make_signature(items, required=(), preferences=("sin mani",), details=None):
+    return {
+        "context": {"preferences": list(preferences), "categories": [], "num_recipes": 2, "language": "es"},
+        "items": sorted(items),
+        "required": sorted(required),
+        "details": details or [[item, "g", "2^8"] for item in sorted(items)]
+    }
+
+
+class TestRecipeGenerationSignatureCache:
+    """Tests para el cache de generación por firma de inventario"""
+
+    @pytest.fixture
+    def cache(self):
+        service = AIResponseCacheService()
+        service.cache = {}  # Siempre en memoria para las pruebas
+        return service
+
+    def test_exact_signature_hit(self, cache):
+        """Test: La misma firma devuelve la respuesta guardada"""
+        signature = make_signature({"tomate", "cebolla", "ajo"})
+        cache.cache_generation("recipe_generation", signature, "[]", user_uid="u1")
+
+        assert cache.get_cached_generation("recipe_generation", make_signature({"ajo", "cebolla", "tomate"}), "u1") == ("[]", "exact")
+
+    def test_similar_pantry_same_user_hits(self, cache):
+        """Test: Un inventario casi igual del mismo usuario reutiliza la generación"""
+        cache.cache_generation("recipe_generation", make_signature({"a", "b", "c", "d", "e"}), "[1]", user_uid="u1")
+
+        response, match = cache.get_cached_generation("recipe_generation", make_signature({"a", "b", "c", "d", "e", "f"}), "u1")
+
+        assert (response, match) == ("[1]", "similar")
+        assert cache.get_cache_stats()["by_operation"]["recipe_generation"]["similar_hits"] == 1
+
+    def test_other_users_need_stricter_similarity(self, cache):
+        """Test: Para otros usuarios el umbral de similitud es más alto"""
+        cache.cache_generation("recipe_generation", make_signature({"a", "b", "c", "d", "e"}), "[1]", user_uid="u1")
+
+        assert cache.get_cached_generation("recipe_generation", make_signature({"a", "b", "c", "d", "e", "f"}), "u2") == (None, None)
+
+    def test_context_and_priorities_must_match(self, cache):
+        """Test: Cambiar preferencias o priorizar algo ausente es un miss"""
+        cache.cache_generation("recipe_generation", make_signature({"a", "b", "c", "d", "e"}), "[1]", user_uid="u1")
+
+        assert cache.get_cached_generation("recipe_generation", make_signature({"a", "b", "c", "d", "e"}, preferences=()), "u1") == (None, None)
+        assert cache.get_cached_generation("recipe_generation", make_signature({"a", "b", "c", "d", "e", "f"}, required={"f"}), "u1") == (None, None)
+
+    def test_similar_entry_with_missing_ingredients_is_not_reused(self, cache):
+        """Test: No se reutiliza una generación con ingredientes que el usuario no tiene (p. ej. alérgenos quitados)"""
+        cache.cache_generation("recipe_generation", make_signature({"a", "b", "c", "d", "e", "camaron"}), "[1]", user_uid="u1")
+
+        assert cache.get_cached_generation("recipe_generation", make_signature({"a", "b", "c", "d", "e"}), "u1") == (None, None)
+        assert cache.get_cached_generation("recipe_generation", make_signature({"a", "b", "c", "d", "e"}), "u2") == (None, None)
@@ -0,0 +1,53 @@
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.application.use_cases.recipes.get_all_recipes_use_case import GetAllRecipesUseCase
+from src.application.use_cases.recipes.get_saved_recipes_use_case import GetSavedRecipesUseCase
+from src.shared.exceptions.custom import InvalidRequestDataException
+from src.shared.pagination import encode_cursor
+
+
+class TestRecipeLists:
+    """Tests para los listados paginados de recetas (/api/recipes/saved y /api/recipes/all)"""
+
+    def test_saved_recipes_cursor_round_trip(self):
+        """Test: El next_cursor de una página se traduce en la clave [saved_at, uid] de la siguiente"""
+        repository = MagicMock()
+        repository.get_page.return_value = {'recipes': ['r2'], 'next_key': [datetime(2026, 1, 2, 10, 0), 'r2']}
+        use_case = GetSavedRecipesUseCase(repository)
+
+        first = use_case.execute('u1', limit=1)
+        repository.get_page.return_value = {'recipes': ['r1'], 'next_key': None}
+        second = use_case.execute('u1', cursor=first['next_cursor'], limit=1)
+
+        assert repository.get_page.call_args.kwargs == {
+            'user_uid': 'u1', 'after': ['2026-01-02T10:00:00', 'r2'], 'limit': 1, 'summary': False
+        }
+        assert second == {'recipes': ['r1'], 'next_cursor': None}
+
+    def test_summary_view_is_passed_to_repository(self):
+        """Test: view=summary pide al repositorio solo las columnas de listado"""
+        repository = MagicMock()
+        repository.get_page.return_value = {'recipes': [], 'next_key': None}
+
+        GetAllRecipesUseCase(repository).execute(limit=5, summary=True)
+
+        repository.get_page.assert_called_once_with(after=None, limit=5, summary=True)
+
+    @pytest.mark.parametrize("cursor", [
+        "not-a-cursor",
+        encode_cursor("saved_at", ["nope", "x"]),
+        encode_cursor("saved_at", [1, 2]),
+        encode_cursor("saved_at", []),
+        encode_cursor("name", ["Tomate"]),
+    ])
+    def test_invalid_cursor_is_rejected(self, cursor):
+        """Test: Un cursor corrupto o con otra clave es un error de validación (400) y no llega al repositorio"""
+        repository = MagicMock()
+
+        with pytest.raises(InvalidRequestDataException):
+            GetAllRecipesUseCase(repository).execute(cursor=cursor)
+
+        repository.get_page.assert_not_called()
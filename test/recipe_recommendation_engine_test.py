@@ -0,0 +1,88 @@
+import pytest
+
+from src.application.services.recipe_recommendation_engine import RecipeMatchMatrix, ingredient_key
+
+
+class TestRecipeRecommendationEngine:
+    """Tests para el ranking local de recetas por cobertura del inventario"""
+
+    @pytest.fixture
+    def matrix(self):
+        return RecipeMatchMatrix([
+            {"uid": "tortilla", "title": "Tortilla de patatas", "ingredients": ["Huevos", "Patatas", "Cebolla", "Aceite"]},
+            {"uid": "pollo", "title": "Pollo al ajillo", "ingredients": ["Pechuga de pollo", "Ajo", "Aceite"]},
+            {"uid": "salsa", "title": "Salsa de maní", "ingredients": ["Maní tostado", "Ajo"]},
+        ])
+
+    def test_ingredient_key_normalizes_plurals_and_accents(self):
+        """Test: Singular, sin acentos y en minúsculas"""
+        assert ingredient_key("Tomates") == "tomate"
+        assert ingredient_key("Limones") == "limon"
+        assert ingredient_key("Limón") == "limon"
+
+    def test_ranks_by_coverage(self, matrix):
+        """Test: La receta con más ingredientes cubiertos va primero"""
+        results = matrix.score({"Huevo": False, "Patata": False, "Cebolla": False, "Ajo": False}, [], 0.5, 10, 0.5)
+
+        assert [r["uid"] for r in results] == ["tortilla", "salsa"]
+        assert results[0]["coverage"] == 0.75
+        assert results[0]["missing_ingredients"] == ["Aceite"]
+
+    def test_expiring_ingredients_raise_score(self, matrix):
+        """Test: Con igual cobertura gana la receta que usa lo que vence pronto"""
+        results = matrix.score({"Pollo": True, "Ajo": False, "Aceite": False, "Huevo": False,
+                                "Patata": False, "Cebolla": False}, [], 0.5, 10, 0.5)
+
+        assert results[0]["uid"] == "pollo"
+        assert results[0]["priority_ingredients"] == ["Pollo"]
+
+    def test_allergies_exclude_recipes(self, matrix):
+        """Test: Una receta con un ingrediente alergénico no se recomienda"""
+        results = matrix.score({"Ajo": False, "Maní": False}, ["maní"], 0.5, 10, 0.5)
+
+        assert "salsa" not in [r["uid"] for r in results]
+
+    def test_plural_allergy_excludes_recipes(self):
+        """Test: Una alergia escrita en plural excluye las recetas con ese ingrediente"""
+        matrix = RecipeMatchMatrix([
+            {"uid": "arroz", "title": "Arroz con camarones", "ingredients": ["Arroz", "Camarones", "Ajo"]},
+            {"uid": "ensalada", "title": "Ensalada con nueces", "ingredients": ["Lechuga", "Nueces"]},
+        ])
+
+        results = matrix.score({"Arroz": False, "Ajo": False, "Lechuga": False}, ["camarones", "Nueces"], 0.5, 10, 0.5)
+
+        assert results == []
+        assert matrix.excluded_rows(["Camarón"]) == {0}
+
+
+class TestCachedRecipeMatrix:
+    """Tests para las matrices compartidas por alcance"""
+
+    def test_one_matrix_per_scope(self):
+        """Test: Cada usuario ve solo el catálogo de su alcance y se reutiliza mientras no cambie la versión"""
+        from src.application.services.recipe_recommendation_engine import CachedRecipeMatrix
+        cache = CachedRecipeMatrix(revalidate_seconds=0, max_scopes=1)
+        catalogs = {
+            "u1": [{"uid": "propia-u1", "title": "A", "ingredients": ["Ajo"]}],
+            "u2": [{"uid": "propia-u2", "title": "B", "ingredients": ["Ajo"]}],
+        }
+        builds = []
+
+        def get(scope):
+            return cache.get(scope, lambda: (1,), lambda: builds.append(scope) or catalogs[scope])
+
+        assert [r["uid"] for r in get("u1").score({"Ajo": False}, [], 0.5, 10, 0.5)] == ["propia-u1"]
+        assert get("u1") is get("u1")
+        assert [r["uid"] for r in get("u2").score({"Ajo": False}, [], 0.5, 10, 0.5)] == ["propia-u2"]
+        get("u1")
+        assert builds == ["u1", "u2", "u1"]
+
+    def test_max_age_picks_up_in_place_edits(self):
+        """Test: Editar los ingredientes de una receta no cambia la versión, pero la matriz se reconstruye al vencer max_age"""
+        from src.application.services.recipe_recommendation_engine import CachedRecipeMatrix
+        cache = CachedRecipeMatrix(revalidate_seconds=0, max_age_seconds=0)
+        catalog = [{"uid": "sopa", "title": "Sopa", "ingredients": ["Ajo"]}]
+
+        assert cache.get("u1", lambda: (1,), lambda: catalog).excluded_rows(["camarones"]) == set()
+        catalog = [{"uid": "sopa", "title": "Sopa", "ingredients": ["Ajo", "Camarones"]}]
+        assert cache.get("u1", lambda: (1,), lambda: catalog).excluded_rows(["camarones"]) == {0}
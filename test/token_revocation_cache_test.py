@@ -0,0 +1,99 @@
+from datetime import datetime, timedelta, timezone
+
+from src.infrastructure.auth.token_revocation_cache import TokenRevocationCache
+
+
+class FakeBlacklist:
+    """token_blacklist en memoria que registra cada lectura"""
+
+    def __init__(self):
+        self.rows = []
+        self.calls = []
+
+    def add(self, jti, expires_at):
+        self.rows.append((len(self.rows) + 1, jti, expires_at))
+
+    def load(self, last_id):
+        self.calls.append(last_id)
+        now = datetime.now(timezone.utc)
+        return [row for row in self.rows if row[0] > last_id and row[2] > now]
+
+
+class TestTokenRevocationCache:
+    """Tests para la caché de JTIs revocados"""
+
+    def test_negative_results_are_cached_until_next_sync(self):
+        """Test: Entre sincronizaciones las consultas no leen la tabla"""
+        table = FakeBlacklist()
+        table.add("revoked", datetime.now(timezone.utc) + timedelta(minutes=30))
+        cache = TokenRevocationCache(sync_seconds=60)
+
+        assert cache.is_revoked("revoked", table.load) is True
+        assert cache.is_revoked("active", table.load) is False
+        assert cache.is_revoked("active", table.load) is False
+        assert table.calls == [0]
+
+    def test_sync_reads_only_new_rows(self):
+        """Test: Cada sincronización parte de la marca de agua y ve lo revocado por otros procesos"""
+        table = FakeBlacklist()
+        for i in range(150):
+            table.add(f"jti-{i}", datetime.now(timezone.utc) + timedelta(minutes=30))
+        cache = TokenRevocationCache(sync_seconds=0)
+
+        assert cache.is_revoked("other-worker", table.load) is False
+        table.add("other-worker", datetime.now(timezone.utc) + timedelta(minutes=30))
+
+        assert cache.is_revoked("other-worker", table.load) is True
+        assert table.calls == [0, 50]
+
+    def test_publish_is_visible_immediately(self):
+        """Test: Una revocación del propio proceso no espera a la sincronización"""
+        table = FakeBlacklist()
+        cache = TokenRevocationCache(sync_seconds=60)
+        cache.is_revoked("x", table.load)
+
+        cache.publish("logout", datetime.now(timezone.utc) + timedelta(minutes=30))
+
+        assert cache.is_revoked("logout", table.load) is True
+        assert table.calls == [0]
+
+    def test_full_reload_drops_expired_entries(self):
+        """Test: La recarga completa descarta los JTIs ya vencidos y la memoria no crece sin límite"""
+        table = FakeBlacklist()
+        cache = TokenRevocationCache(sync_seconds=0, reload_seconds=0)
+        cache.publish("old", datetime.now(timezone.utc) - timedelta(minutes=1))
+        table.add("current", datetime.now(timezone.utc) + timedelta(minutes=30))
+
+        cache.sync(table.load)
+
+        assert len(cache) == 1
+        assert cache.is_revoked("current", table.load) is True
+
+    def test_full_reload_finds_rows_committed_late(self):
+        """Test: Una fila con id muy por debajo de la marca de agua aparece en la próxima recarga completa"""
+        table = FakeBlacklist()
+        expires_at = datetime.now(timezone.utc) + timedelta(minutes=30)
+        table.add("first", expires_at)
+        cache = TokenRevocationCache(sync_seconds=0, reload_seconds=3600)
+        cache.sync(table.load)
+        for i in range(200):
+            table.add(f"jti-{i}", expires_at)
+        cache.sync(table.load)
+
+        # Transacción larga: reservó el id 2 y confirma después de que la marca pasó de 200
+        table.rows.append((2, "late", expires_at))
+        assert cache.is_revoked("late", table.load) is False
+
+        cache.reload_seconds = 0
+        assert cache.is_revoked("late", table.load) is True
+
+    def test_publish_many_for_bulk_revocation(self):
+        """Test: La revocación de todas las sesiones se publica de una vez"""
+        table = FakeBlacklist()
+        cache = TokenRevocationCache(sync_seconds=60)
+        expires_at = datetime.now(timezone.utc) + timedelta(days=30)
+
+        cache.publish_many((f"refresh-{i}", expires_at) for i in range(20))
+
+        assert len(cache) == 20
+        assert cache.is_revoked("refresh-19", table.load) is True